@@ -18,8 +18,9 @@ from .seeds import GenerationContext, stable_u32, input_fingerprint
 from .extract import extract_from_image, ExtractionResult
 from .generate import generate_candidates, CandidateGenerator, GenerationPool
 from .render import render_candidates, NRTRenderer, RenderResult, BatchRenderResult
+from .cache import RenderCache
 from .safety import check_safety, check_safety_batch
-from .analyze import extract_features, extract_features_batch
+from .analyze import extract_features, extract_features_batch, analyze_audio, analyze_batch
 from .score import compute_fit, score_candidates, filter_by_fit
 from .select import select_diverse, candidate_distance
 from .export import export_pack
@@ -55,6 +56,7 @@ __all__ = [
     "NRTRenderer",
     "RenderResult",
     "BatchRenderResult",
+    "RenderCache",
     # Config
     "FAMILIES",
     "PHASE1_CONSTRAINTS",
@@ -9,40 +9,42 @@ Extracts normalized features from rendered audio:
 - crest: peak-to-RMS ratio (dynamics)
 - width: stereo correlation
 - harmonicity: harmonic content ratio
+
+Each file is decoded once and one STFT is shared by every spectral feature
+(centroid, flatness, onset envelope, HPSS). analyze_audio() also runs the
+safety gates on the same decoded samples, so the render -> safety ->
+features pipeline reads each WAV exactly once.
 """
 
-import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional
 import logging
 
-from .config import NORMALIZATION_V1, RENDER_CONFIG
-from .models import CandidateFeatures
+import numpy as np
+
+from .config import NORMALIZATION_V1, RENDER_CONFIG, SAFETY_CONFIG
+from .models import CandidateFeatures, SafetyResult, SafetyStatus
+from .safety import load_audio, evaluate_safety
 
 logger = logging.getLogger(__name__)
 
+# Shared STFT parameters (librosa defaults, so features match per-call librosa)
+N_FFT = 2048
+HOP_LENGTH = 512
 
-def load_audio(path: Path) -> Tuple[np.ndarray, int]:
-    """Load audio file, returns (samples, sample_rate)."""
-    try:
-        import soundfile as sf
-        data, sr = sf.read(path, dtype='float32')
-        return data, sr
-    except ImportError:
-        pass
-    
-    try:
-        import librosa
-        data, sr = librosa.load(path, sr=None, mono=False)
-        if data.ndim == 1:
-            data = data.reshape(-1, 1)
-        else:
-            data = data.T
-        return data.astype(np.float32), sr
-    except ImportError:
-        pass
-    
-    raise ImportError("Install soundfile or librosa for audio loading")
+# Below this many files a process pool costs more than it saves
+MIN_PARALLEL_BATCH = 4
+
+
+@dataclass
+class AnalysisResult:
+    """Safety gates + features from a single decode of one audio file."""
+    safety: SafetyResult
+    features: Optional[CandidateFeatures] = None
+    error: Optional[str] = None
 
 
 def normalize_value(value: float, feature_name: str) -> float:
@@ -79,6 +81,23 @@ def extract_features(
         audio_path: Path to WAV file
         sample_rate: Override sample rate (uses file's rate if None)
         
+    Returns:
+        CandidateFeatures with all values normalized 0-1
+    """
+    samples, sr = load_audio(audio_path)
+    return features_from_samples(samples, sample_rate or sr)
+
+
+def features_from_samples(samples: np.ndarray, sr: int) -> CandidateFeatures:
+    """
+    Extract acoustic features from decoded samples.
+    
+    One complex STFT feeds centroid, flatness, onset strength and HPSS.
+    
+    Args:
+        samples: Float samples, [n] or [n, channels]
+        sr: Sample rate
+        
     Returns:
         CandidateFeatures with all values normalized 0-1
     """
@@ -87,9 +106,6 @@ def extract_features(
     except ImportError:
         raise ImportError("librosa required for feature extraction: pip install librosa")
     
-    # Load audio
-    samples, sr = load_audio(audio_path)
-    
     # Convert to mono for most features
     if samples.ndim > 1:
         mono = np.mean(samples, axis=1)
@@ -98,19 +114,25 @@ def extract_features(
         mono = samples
         stereo = None
     
+    # === Shared spectrogram ===
+    stft = librosa.stft(mono, n_fft=N_FFT, hop_length=HOP_LENGTH)
+    magnitude = np.abs(stft)
+    power = magnitude ** 2
+    
     # === Spectral Centroid (brightness) ===
-    centroid = librosa.feature.spectral_centroid(y=mono, sr=sr)[0]
+    centroid = librosa.feature.spectral_centroid(S=magnitude, sr=sr, n_fft=N_FFT, hop_length=HOP_LENGTH)[0]
     centroid_mean = float(np.mean(centroid))
     centroid_norm = normalize_value(centroid_mean, "centroid")
     
     # === Spectral Flatness (noisiness) ===
-    flatness = librosa.feature.spectral_flatness(y=mono)[0]
+    flatness = librosa.feature.spectral_flatness(S=magnitude, n_fft=N_FFT, hop_length=HOP_LENGTH)[0]
     flatness_mean = float(np.mean(flatness))
     flatness_norm = normalize_value(flatness_mean, "flatness")
     
     # === Onset Density (transients per second) ===
-    onset_env = librosa.onset.onset_strength(y=mono, sr=sr)
-    onsets = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr)
+    mel_db = librosa.power_to_db(librosa.feature.melspectrogram(S=power, sr=sr))
+    onset_env = librosa.onset.onset_strength(S=mel_db, sr=sr, hop_length=HOP_LENGTH)
+    onsets = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr, hop_length=HOP_LENGTH)
     duration = len(mono) / sr
     onset_rate = len(onsets) / max(duration, 0.1)
     onset_norm = normalize_value(onset_rate, "onset_density")
@@ -142,9 +164,12 @@ def extract_features(
     width_norm = normalize_value(width, "width")
     
     # === Harmonicity ===
-    # Use harmonic-percussive separation ratio
+    # Harmonic-percussive separation on the shared STFT, energies measured
+    # on the reconstructed signals (as librosa.effects.hpss does)
     try:
-        harmonic, percussive = librosa.effects.hpss(mono)
+        stft_harm, stft_perc = librosa.decompose.hpss(stft)
+        harmonic = librosa.istft(stft_harm, hop_length=HOP_LENGTH, dtype=mono.dtype, length=len(mono))
+        percussive = librosa.istft(stft_perc, hop_length=HOP_LENGTH, dtype=mono.dtype, length=len(mono))
         harm_energy = np.sum(harmonic ** 2)
         perc_energy = np.sum(percussive ** 2)
         total_energy = harm_energy + perc_energy
@@ -164,35 +189,129 @@ def extract_features(
         crest=crest_norm,
         width=width_norm,
         harmonicity=harmonicity_norm,
-        rms_db=rms_db,  # ADD THIS
+        rms_db=rms_db,
     )
 
 
+def analyze_audio(
+    audio_path: Path,
+    safety_config: Optional[SAFETY_CONFIG.__class__] = None,
+    features_if_unsafe: bool = False,
+) -> AnalysisResult:
+    """
+    Decode once, run safety gates, then extract features.
+    
+    Args:
+        audio_path: Path to WAV file
+        safety_config: Safety configuration (uses default if None)
+        features_if_unsafe: Also extract features when safety fails
+        
+    Returns:
+        AnalysisResult (features None if safety failed or extraction errored)
+    """
+    try:
+        samples, sr = load_audio(audio_path)
+    except Exception as e:
+        return AnalysisResult(
+            safety=SafetyResult(
+                passed=False,
+                status=SafetyStatus.SILENCE,
+                details={"error": str(e)},
+            ),
+            error=str(e),
+        )
+    
+    safety = evaluate_safety(samples, safety_config)
+    if not safety.passed and not features_if_unsafe:
+        return AnalysisResult(safety=safety)
+    
+    try:
+        features = features_from_samples(samples, sr)
+    except Exception as e:
+        return AnalysisResult(safety=safety, error=str(e))
+    
+    return AnalysisResult(safety=safety, features=features)
+
+
+def _default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def analyze_batch(
+    audio_paths: List[Path],
+    safety_config: Optional[SAFETY_CONFIG.__class__] = None,
+    features_if_unsafe: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[AnalysisResult]:
+    """
+    Run analyze_audio() over many files on a process pool.
+    
+    Args:
+        audio_paths: List of paths
+        safety_config: Safety configuration
+        features_if_unsafe: Also extract features when safety fails
+        max_workers: Worker processes (CPU count if None; 1 = serial)
+        
+    Returns:
+        List of AnalysisResults in same order
+    """
+    n = len(audio_paths)
+    workers = min(max_workers or _default_workers(), n)
+    
+    if workers <= 1 or n < MIN_PARALLEL_BATCH:
+        return [analyze_audio(p, safety_config, features_if_unsafe) for p in audio_paths]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            analyze_audio,
+            audio_paths,
+            [safety_config] * n,
+            [features_if_unsafe] * n,
+            chunksize=max(1, n // (workers * 4)),
+        ))
+
+
+def _extract_features_or_default(path: Path) -> CandidateFeatures:
+    try:
+        return extract_features(path)
+    except Exception as e:
+        logger.warning(f"Feature extraction failed for {path}: {e}")
+        # Return default features on failure
+        return CandidateFeatures()
+
+
 def extract_features_batch(
     audio_paths: list[Path],
     progress_callback=None,
+    max_workers: Optional[int] = None,
 ) -> list[CandidateFeatures]:
     """
     Extract features from multiple audio files.
     
     Args:
         audio_paths: List of paths
-        progress_callback: Optional callback(current, total, path)
+        progress_callback: Optional callback(current, total, path),
+            called as each result is collected
+        max_workers: Worker processes (CPU count if None; 1 = serial)
         
     Returns:
-        List of CandidateFeatures
+        List of CandidateFeatures in same order
     """
+    n = len(audio_paths)
+    workers = min(max_workers or _default_workers(), n)
+    
+    if workers <= 1 or n < MIN_PARALLEL_BATCH:
+        results = []
+        for i, path in enumerate(audio_paths):
+            if progress_callback:
+                progress_callback(i, n, path)
+            results.append(_extract_features_or_default(path))
+        return results
+    
     results = []
-    for i, path in enumerate(audio_paths):
-        if progress_callback:
-            progress_callback(i, len(audio_paths), path)
-        
-        try:
-            features = extract_features(path)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for i, features in enumerate(pool.map(_extract_features_or_default, audio_paths)):
+            if progress_callback:
+                progress_callback(i, n, audio_paths[i])
             results.append(features)
-        except Exception as e:
-            logger.warning(f"Feature extraction failed for {path}: {e}")
-            # Return default features on failure
-            results.append(CandidateFeatures())
-    
     return results
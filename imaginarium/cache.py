@@ -0,0 +1,264 @@
+"""
+imaginarium/cache.py
+Content-addressed render + analysis cache
+
+Rendering and analysis are pure functions of the generated SynthDef text
+and the render settings, so repeat runs can reuse previous results.
+
+Layout (one directory per entry):
+    <cache_dir>/<key[:2]>/<key>/audio.wav   - rendered preview
+    <cache_dir>/<key[:2]>/<key>/meta.json   - SafetyResult + CandidateFeatures
+
+Keys are SHA-256 over the NRT SynthDef + the RENDER_CONFIG fields that shape
+the audio + cache version.
+Eviction is least-recently-used by meta.json mtime (touched on every hit),
+bounded by CACHE_CONFIG.max_mb.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+
+from .config import CACHE_CONFIG, RENDER_CONFIG
+from .models import CandidateFeatures, SafetyResult, SafetyStatus
+
+logger = logging.getLogger(__name__)
+
+AUDIO_FILE = "audio.wav"
+META_FILE = "meta.json"
+
+# RenderConfig fields that change the rendered audio (not jobs / timeout_sec)
+KEY_FIELDS = ("duration_sec", "sample_rate", "channels", "format", "sample_format")
+
+
+def render_cache_key(synthdef_code: str) -> str:
+    """
+    Hash a SynthDef + current render config into a cache key.
+
+    Args:
+        synthdef_code: NRT SynthDef text (as sent to sclang)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    config = json.dumps({name: getattr(RENDER_CONFIG, name) for name in KEY_FIELDS},
+                        sort_keys=True)
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_CONFIG.version}\n".encode("utf-8"))
+    h.update(config.encode("utf-8"))
+    h.update(b"\n")
+    h.update(synthdef_code.encode("utf-8"))
+    return h.hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """A cached render and whatever analysis has been stored for it."""
+    key: str
+    audio_path: Path
+    safety: Optional[SafetyResult] = None
+    features: Optional[CandidateFeatures] = None
+
+
+@dataclass
+class CacheStats:
+    """Cache size summary."""
+    path: Path
+    entries: int
+    total_bytes: int
+    max_bytes: int
+
+
+def _safety_to_dict(safety: SafetyResult) -> dict:
+    return {
+        "passed": bool(safety.passed),
+        "status": safety.status.value,
+        "details": {k: v if isinstance(v, str) else float(v) for k, v in safety.details.items()},
+    }
+
+
+def _safety_from_dict(d: dict) -> SafetyResult:
+    return SafetyResult(
+        passed=d["passed"],
+        status=SafetyStatus(d["status"]),
+        details=d.get("details", {}),
+    )
+
+
+def _features_to_dict(features: CandidateFeatures) -> dict:
+    return {f.name: float(getattr(features, f.name)) for f in fields(CandidateFeatures)}
+
+
+def _features_from_dict(d: dict) -> CandidateFeatures:
+    known = {f.name for f in fields(CandidateFeatures)}
+    return CandidateFeatures(**{k: v for k, v in d.items() if k in known})
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered audio, safety results and features.
+
+    Not safe for concurrent writers across processes; the generate
+    pipeline only touches it from the main thread.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Cache root (CACHE_CONFIG.cache_dir if None)
+            max_bytes: Size bound for prune() (CACHE_CONFIG.max_mb if None)
+        """
+        root = cache_dir if cache_dir is not None else Path(CACHE_CONFIG.cache_dir)
+        self.cache_dir = Path(os.path.expanduser(str(root)))
+        self.max_bytes = max_bytes if max_bytes is not None else CACHE_CONFIG.max_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def _read_meta(self, key: str) -> Optional[dict]:
+        meta_path = self._entry_dir(key) / META_FILE
+        try:
+            return json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key: str, meta: dict) -> None:
+        meta_path = self._entry_dir(key) / META_FILE
+        tmp_path = meta_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(meta, indent=2))
+        os.replace(tmp_path, meta_path)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a cached render.
+
+        Returns:
+            CacheEntry, or None on miss (or a damaged entry)
+        """
+        entry_dir = self._entry_dir(key)
+        audio_path = entry_dir / AUDIO_FILE
+        meta = self._read_meta(key)
+
+        if meta is None or not audio_path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            safety = _safety_from_dict(meta["safety"]) if meta.get("safety") else None
+            features = _features_from_dict(meta["features"]) if meta.get("features") else None
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding damaged cache entry {key[:12]}: {e}")
+            self.remove(key)
+            self.misses += 1
+            return None
+
+        # LRU clock
+        os.utime(entry_dir / META_FILE)
+        self.hits += 1
+
+        return CacheEntry(key=key, audio_path=audio_path, safety=safety, features=features)
+
+    def put_audio(self, key: str, audio_path: Path) -> Path:
+        """
+        Store a rendered WAV.
+
+        Returns:
+            Path of the cached copy
+        """
+        entry_dir = self._entry_dir(key)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+
+        cached = entry_dir / AUDIO_FILE
+        tmp_path = entry_dir / (AUDIO_FILE + ".tmp")
+        shutil.copyfile(audio_path, tmp_path)
+        os.replace(tmp_path, cached)
+
+        self._write_meta(key, {"created": time.time(), "safety": None, "features": None})
+        return cached
+
+    def put_analysis(
+        self,
+        key: str,
+        safety: Optional[SafetyResult] = None,
+        features: Optional[CandidateFeatures] = None,
+    ) -> None:
+        """Attach safety and/or features to an existing entry."""
+        meta = self._read_meta(key)
+        if meta is None:
+            return
+        if safety is not None:
+            meta["safety"] = _safety_to_dict(safety)
+        if features is not None:
+            meta["features"] = _features_to_dict(features)
+        self._write_meta(key, meta)
+
+    def remove(self, key: str) -> None:
+        """Delete one entry."""
+        shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """List (last_used, size_bytes, key) for every entry."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for shard in self.cache_dir.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry_dir in shard.iterdir():
+                meta_path = entry_dir / META_FILE
+                try:
+                    last_used = meta_path.stat().st_mtime
+                except OSError:
+                    # Incomplete entry (interrupted write) - oldest possible
+                    last_used = 0.0
+                size = sum(p.stat().st_size for p in entry_dir.iterdir() if p.is_file())
+                entries.append((last_used, size, entry_dir.name))
+        return entries
+
+    def stats(self) -> CacheStats:
+        """Summarize entry count and disk usage."""
+        entries = self._scan()
+        return CacheStats(
+            path=self.cache_dir,
+            entries=len(entries),
+            total_bytes=sum(size for _, size, _ in entries),
+            max_bytes=self.max_bytes,
+        )
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Evict least-recently-used entries until under the size bound.
+
+        Args:
+            max_bytes: Size bound (self.max_bytes if None)
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+
+        removed = 0
+        for _, size, key in entries:
+            if total <= limit:
+                break
+            self.remove(key)
+            total -= size
+            removed += 1
+
+        return removed
@@ -6,6 +6,7 @@ Usage:
     python -m imaginarium generate --image input.png --name my_pack --seed 42
     python -m imaginarium list-methods
     python -m imaginarium verify --pack packs/my_pack
+    python -m imaginarium cache stats
 """
 
 import argparse
@@ -105,49 +106,75 @@ def cmd_generate(args: argparse.Namespace) -> int:
         print("[4-8] Remaining steps skipped (no audio)")
         return 0
     
-    print(f"[3/8] Rendering previews...")
-    
     # Render all candidates
-    renderer = NRTRenderer(sclang_path=sclang)
+    renderer = NRTRenderer(sclang_path=sclang, max_workers=args.jobs)
     
-    def render_progress(i, total, cid):
-        print(f"  [{i+1}/{total}] {cid.split(':')[0]}...")
+    print(f"[3/8] Rendering previews ({renderer.max_workers} parallel jobs)...")
     
-    render_result = renderer.render_batch(pool.candidates, progress_callback=render_progress)
-    
-    print(f"  Rendered: {render_result.successful}/{len(pool.candidates)}")
-    print()
+    # Content-addressed cache: hits skip render, safety and feature extraction
+    cache = None
+    cache_keys = {}
+    to_render = pool.candidates
+    if not args.no_cache:
+        from .cache import RenderCache
+        
+        cache = RenderCache()
+        to_render = []
+        for c in pool.candidates:
+            key = renderer.cache_key(c)
+            cache_keys[c.candidate_id] = key
+            entry = cache.get(key)
+            if entry is None:
+                to_render.append(c)
+                continue
+            c.audio_path = entry.audio_path
+            c.safety = entry.safety
+            c.features = entry.features
+        print(f"  Cache: {cache.hits} hit(s), {cache.misses} miss(es) ({cache.cache_dir})")
     
-    # === STEP 4: Safety gates ===
-    from .safety import check_safety
+    def render_progress(i, total, cid):
+        print(f"  [{i+1}/{total}] {cid.split(':')[0]}...")
     
-    print("[4/8] Running safety gates...")
+    render_result = renderer.render_batch(to_render, progress_callback=render_progress)
     
-    safe_count = 0
-    for c in pool.candidates:
-        if c.audio_path and c.audio_path.exists():
-            c.safety = check_safety(c.audio_path)
-            if c.safety.passed:
-                safe_count += 1
+    if cache is not None:
+        for c, r in zip(to_render, render_result.results):
+            if r.success:
+                c.audio_path = cache.put_audio(cache_keys[c.candidate_id], r.audio_path)
     
-    print(f"  Passed: {safe_count}/{render_result.successful}")
+    rendered_count = sum(1 for c in pool.candidates if c.audio_path)
+    print(f"  Rendered: {rendered_count}/{len(pool.candidates)}")
     print()
     
-    # === STEP 5: Analyze features ===
-    from .analyze import extract_features
+    # === STEPS 4-5: Safety gates + features (single decode per WAV) ===
+    from .analyze import analyze_batch
     
+    print("[4/8] Running safety gates...")
     print("[5/8] Extracting features...")
     
-    feature_count = 0
-    for c in pool.candidates:
-        if c.safety and c.safety.passed and c.audio_path:
-            try:
-                c.features = extract_features(c.audio_path)
-                feature_count += 1
-            except Exception as e:
-                if args.verbose:
-                    print(f"  Warning: {c.candidate_id}: {e}")
+    # Cache hits may already carry safety and/or features
+    pending = [
+        c for c in pool.candidates
+        if c.audio_path and c.audio_path.exists()
+        and (c.safety is None or (c.safety.passed and c.features is None))
+    ]
+    analyses = analyze_batch([c.audio_path for c in pending], max_workers=args.jobs)
+    
+    for c, analysis in zip(pending, analyses):
+        c.safety = analysis.safety
+        c.features = analysis.features
+        if analysis.error and args.verbose:
+            print(f"  Warning: {c.candidate_id}: {analysis.error}")
+        if cache is not None:
+            cache.put_analysis(cache_keys[c.candidate_id], safety=c.safety, features=c.features)
+    
+    safe_count = sum(1 for c in pool.candidates if c.safety and c.safety.passed)
+    feature_count = sum(
+        1 for c in pool.candidates
+        if c.safety and c.safety.passed and c.features is not None
+    )
     
+    print(f"  Passed: {safe_count}/{rendered_count}")
     print(f"  Extracted: {feature_count}/{safe_count}")
     print()
     
@@ -279,6 +306,11 @@ def cmd_generate(args: argparse.Namespace) -> int:
     print(f"  Generators: {len(selection.selected)}")
     print()
     
+    if cache is not None:
+        evicted = cache.prune()
+        if evicted and args.verbose:
+            print(f"  Cache: evicted {evicted} least-recently-used entries")
+    
     # Summary
     print("=" * 50)
     print("COMPLETE")
@@ -537,6 +569,25 @@ def cmd_spatial_preview(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_cache(args: argparse.Namespace) -> int:
+    """Inspect or prune the render/analysis cache."""
+    from .cache import RenderCache
+    
+    cache = RenderCache()
+    
+    if args.cache_command == "prune":
+        max_bytes = None if args.max_mb is None else args.max_mb * 1024 * 1024
+        removed = cache.prune(max_bytes)
+        print(f"Removed {removed} cache entries")
+    
+    stats = cache.stats()
+    print(f"Cache: {stats.path}")
+    print(f"  Entries: {stats.entries}")
+    print(f"  Size:    {stats.total_bytes / (1024 * 1024):.1f} MB / {stats.max_bytes / (1024 * 1024):.0f} MB")
+    
+    return 0
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -557,6 +608,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     gen_parser.add_argument("--seed", "-s", type=int, default=42, help="Run seed")
     gen_parser.add_argument("--output", "-o", type=str, help="Output directory")
     gen_parser.add_argument("--verbose", "-v", action="store_true", help="Show debug info")
+    gen_parser.add_argument("--jobs", type=int, default=None,
+                            help="Concurrent NRT render jobs (default: CPU count)")
+    gen_parser.add_argument("--no-cache", action="store_true",
+                            help="Ignore the render cache (always re-render and re-analyze)")
     gen_parser.add_argument("--spatial", action="store_true", default=True,
                             help="Use spatial role-based selection (default)")
     gen_parser.add_argument("--no-spatial", action="store_false", dest="spatial",
@@ -597,6 +652,15 @@ def main(argv: Optional[list[str]] = None) -> int:
     spatial_parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
     spatial_parser.set_defaults(func=cmd_spatial_preview)
     
+    # cache command
+    cache_parser = subparsers.add_parser("cache", help="Render cache maintenance")
+    cache_sub = cache_parser.add_subparsers(dest="cache_command", required=True)
+    cache_sub.add_parser("stats", help="Show cache size")
+    prune_parser = cache_sub.add_parser("prune", help="Evict least-recently-used entries")
+    prune_parser.add_argument("--max-mb", type=int, default=None,
+                              help="Size bound in MB (default: NE_RENDER_CACHE_MB)")
+    cache_parser.set_defaults(func=cmd_cache)
+    
     args = parser.parse_args(argv)
     return args.func(args)
 
@@ -140,10 +140,25 @@ class RenderConfig:
     format: str = "WAV"
     sample_format: str = "int16"
     timeout_sec: int = int(os.environ.get('NE_RENDER_TIMEOUT', 45))
+    jobs: int = int(os.environ.get('NE_RENDER_JOBS', 0))  # Concurrent NRT jobs (0 = one per CPU core)
 
 
 RENDER_CONFIG = RenderConfig()
 
+# =============================================================================
+# Render Cache
+# =============================================================================
+
+@dataclass
+class CacheConfig:
+    """On-disk render/analysis cache settings."""
+    cache_dir: str = os.environ.get('NE_RENDER_CACHE', '~/.cache/imaginarium')
+    max_mb: int = int(os.environ.get('NE_RENDER_CACHE_MB', 2048))  # LRU eviction bound
+    version: int = 1  # Bump to invalidate all entries (e.g. NRT script changes)
+
+
+CACHE_CONFIG = CacheConfig()
+
 # =============================================================================
 # Paths
 # =============================================================================
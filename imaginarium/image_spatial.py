@@ -170,18 +170,76 @@ def extract_tile_features(
       - np.uint8 [H,W,3] in RGB
       - or float32 [H,W,3] in 0..1 RGB
     """
-    img = _to_float01_rgb(img_rgb)
-    img = _resize_square_nn(img, resize_to)  # deterministic, dependency-free
+    return extract_tile_features_batch(
+        [img_rgb],
+        grid=grid,
+        resize_to=resize_to,
+        hue_bins=hue_bins,
+        orient_bins=orient_bins,
+        sobel_thresh=sobel_thresh,
+        hf_log_max=hf_log_max,
+    )[0]
+
+
+def extract_tile_features_batch(
+    images: List[np.ndarray],
+    *,
+    grid: Tuple[int, int] = (4, 4),
+    resize_to: int = 512,
+    hue_bins: int = 24,
+    orient_bins: int = 12,
+    sobel_thresh: float = 0.20,
+    hf_log_max: float = 5.0,
+) -> List[List[TileFeatures]]:
+    """
+    Extract per-tile features for several images at once.
 
+    All images are resized to the same working size, so the Sobel/Laplacian
+    filter bank runs once over the stacked [N,H,W] luminance batch.
+    Returns one tile list per input image, in input order.
+    """
+    if not images:
+        return []
+
+    # deterministic, dependency-free
+    imgs = [_resize_square_nn(_to_float01_rgb(im), resize_to) for im in images]
+
+    # Precompute global luminance + gradients on full images (cheaper and consistent)
+    lum = np.stack([_luminance(im) for im in imgs])  # 0..1
+    gx, gy, lap = _filter_bank(lum)
+
+    return [
+        _tile_features(
+            imgs[i], lum[i], gx[i], gy[i], lap[i],
+            grid=grid,
+            hue_bins=hue_bins,
+            orient_bins=orient_bins,
+            sobel_thresh=sobel_thresh,
+            hf_log_max=hf_log_max,
+        )
+        for i in range(len(imgs))
+    ]
+
+
+def _tile_features(
+    img: np.ndarray,
+    lum: np.ndarray,
+    gx: np.ndarray,
+    gy: np.ndarray,
+    lap: np.ndarray,
+    *,
+    grid: Tuple[int, int],
+    hue_bins: int,
+    orient_bins: int,
+    sobel_thresh: float,
+    hf_log_max: float,
+) -> List[TileFeatures]:
+    """Per-tile statistics from a working image and its filter responses."""
     H, W, _ = img.shape
     rows, cols = grid
     tile_h = H // rows
     tile_w = W // cols
 
-    # Precompute global luminance + gradients on full image (cheaper and consistent)
-    lum = _luminance(img)  # 0..1
-
-    gx, gy = _sobel(lum)
     mag = np.sqrt(gx * gx + gy * gy)
 
     # Edge mask uses fixed threshold in "mag" units (lum is 0..1)
@@ -190,9 +248,6 @@ def extract_tile_features(
     # Orientation histogram uses gradient angle (0..pi)
     ang = np.arctan2(np.abs(gy), np.abs(gx) + EPS)  # 0..pi/2, stable for entropy
 
-    # High-frequency proxy: Laplacian variance per tile, mapped to 0..1
-    lap = _laplacian(lum)
-
     tiles: List[TileFeatures] = []
 
     for r in range(rows):
@@ -952,8 +1007,61 @@ def analyze_image_spatial(
         - quality_score, quality_checks, fallback flag
         - spec_tokens (empty if fallback)
     """
-    # Phase A: Extract tile features
     tiles = extract_tile_features(img_rgb, grid=grid, resize_to=resize_to)
+    return _analyze_tiles(
+        tiles,
+        grid=grid,
+        quality_threshold=quality_threshold,
+        foreground_thresh=foreground_thresh,
+        motion_thresh=motion_thresh,
+        foreground_max=foreground_max,
+        motion_max=motion_max,
+    )
+
+
+def analyze_image_spatial_batch(
+    images: List[np.ndarray],
+    *,
+    grid: Tuple[int, int] = (4, 4),
+    resize_to: int = 512,
+    quality_threshold: float = QUALITY_THRESHOLD,
+    foreground_thresh: float = FOREGROUND_THRESH,
+    motion_thresh: float = MOTION_THRESH,
+    foreground_max: int = FOREGROUND_MAX,
+    motion_max: int = MOTION_MAX,
+) -> List[Dict[str, Any]]:
+    """
+    Full spatial analysis for several images, sharing one Phase A filter pass.
+
+    Returns one analysis dict per image (same shape as analyze_image_spatial).
+    """
+    tile_sets = extract_tile_features_batch(images, grid=grid, resize_to=resize_to)
+    return [
+        _analyze_tiles(
+            tiles,
+            grid=grid,
+            quality_threshold=quality_threshold,
+            foreground_thresh=foreground_thresh,
+            motion_thresh=motion_thresh,
+            foreground_max=foreground_max,
+            motion_max=motion_max,
+        )
+        for tiles in tile_sets
+    ]
+
+
+def _analyze_tiles(
+    tiles: List[TileFeatures],
+    *,
+    grid: Tuple[int, int],
+    quality_threshold: float,
+    foreground_thresh: float,
+    motion_thresh: float,
+    foreground_max: int,
+    motion_max: int,
+) -> Dict[str, Any]:
+    """Phases A (hints) through D on already-extracted tile features."""
+    # Phase A: Hints
     compute_hints(tiles)
     
     # Phase B: Assign roles
@@ -1060,44 +1168,43 @@ def _luminance(rgb: np.ndarray) -> np.ndarray:
     return np.clip(0.2126 * r + 0.7152 * g + 0.0722 * b, 0.0, 1.0).astype(np.float32)
 
 
-def _sobel(lum: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    # 3x3 Sobel kernels
-    kx = np.array([[-1, 0, 1],
-                   [-2, 0, 2],
-                   [-1, 0, 1]], dtype=np.float32)
-    ky = np.array([[-1, -2, -1],
-                   [ 0,  0,  0],
-                   [ 1,  2,  1]], dtype=np.float32)
-    gx = _conv2(lum, kx)
-    gy = _conv2(lum, ky)
-    return gx, gy
-
-
-def _laplacian(lum: np.ndarray) -> np.ndarray:
-    k = np.array([[0,  1, 0],
-                  [1, -4, 1],
-                  [0,  1, 0]], dtype=np.float32)
-    return _conv2(lum, k)
-
-
-def _conv2(img: np.ndarray, kernel: np.ndarray) -> np.ndarray:
-    # Simple zero-padded convolution (deterministic)
-    kh, kw = kernel.shape
-    pad_h = kh // 2
-    pad_w = kw // 2
-    padded = np.pad(img, ((pad_h, pad_h), (pad_w, pad_w)), mode="edge")
-    out = np.zeros_like(img, dtype=np.float32)
-
-    # Unrolled loops kept small (512² * 9 ops) – fine for spike
-    for y in range(out.shape[0]):
-        y0 = y
-        y1 = y0 + kh
-        for x in range(out.shape[1]):
-            x0 = x
-            x1 = x0 + kw
-            patch = padded[y0:y1, x0:x1]
-            out[y, x] = float(np.sum(patch * kernel))
-    return out
+def _filter_bank(lum: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sobel X, Sobel Y and Laplacian responses in one vectorized pass.
+
+    lum is [H,W] or a batch [N,H,W]. Borders use edge padding. Kernels are
+    applied as correlation (no flip):
+
+      Sobel X        Sobel Y          Laplacian
+      -1  0  1       -1 -2 -1          0  1  0
+      -2  0  2        0  0  0          1 -4  1
+      -1  0  1        1  2  1          0  1  0
+
+    Both Sobel kernels are separable ([1,2,1] smoothing x [-1,0,1] difference),
+    so they are built from shared row/column passes over the padded image.
+    """
+    lum = np.asarray(lum, dtype=np.float32)
+    pad = [(0, 0)] * (lum.ndim - 2) + [(1, 1), (1, 1)]
+    p = np.pad(lum, pad, mode="edge")
+
+    left = p[..., :, :-2]
+    mid = p[..., :, 1:-1]
+    right = p[..., :, 2:]
+
+    # Horizontal passes on all padded rows: [.., H+2, W]
+    diff_x = right - left
+    smooth_x = left + 2.0 * mid + right
+
+    # Vertical passes
+    gx = diff_x[..., :-2, :] + 2.0 * diff_x[..., 1:-1, :] + diff_x[..., 2:, :]
+    gy = smooth_x[..., 2:, :] - smooth_x[..., :-2, :]
+
+    center = mid[..., 1:-1, :]
+    lap = (mid[..., :-2, :] + mid[..., 2:, :]
+           + left[..., 1:-1, :] + right[..., 1:-1, :]
+           - 4.0 * center)
+
+    return gx.astype(np.float32), gy.astype(np.float32), lap.astype(np.float32)
 
 
 def _rgb_to_hs(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
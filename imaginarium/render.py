@@ -12,6 +12,10 @@ Per IMAGINARIUM_SPEC v10:
 - 3 second previews
 - 48kHz sample rate
 - Stereo output
+
+Batches render through a worker pool: up to max_workers sclang NRT jobs
+run concurrently (default = CPU count, NE_RENDER_JOBS overrides), each
+with its own timeout.
 """
 
 import os
@@ -19,11 +23,13 @@ import re
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from .cache import render_cache_key
 from .config import RENDER_CONFIG
 from .models import Candidate
 from .methods import get_method
@@ -106,6 +112,7 @@ class NRTRenderer:
         sclang_path: Optional[Path] = None,
         output_dir: Optional[Path] = None,
         timeout_s: int = RENDER_CONFIG.timeout_sec,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize renderer.
@@ -113,10 +120,13 @@ class NRTRenderer:
         Args:
             sclang_path: Path to sclang (auto-detected if None)
             output_dir: Directory for rendered audio (temp dir if None)
+            timeout_s: Per-job sclang timeout in seconds
+            max_workers: Concurrent NRT jobs in render_batch (CPU count if None)
         """
         self.sclang_path = sclang_path or find_sclang()
         self.output_dir = output_dir
         self.timeout_s = timeout_s
+        self.max_workers = max_workers or RENDER_CONFIG.jobs or os.cpu_count() or 1
         self._temp_dir: Optional[Path] = None
     
     @property
@@ -272,37 +282,66 @@ class NRTRenderer:
         
         return code
     
+    @staticmethod
+    def _synthdef_name(candidate: Candidate) -> str:
+        """Unique synthdef name for a candidate (alphanumeric only)."""
+        return f"imag_{abs(candidate.seed) % 1000000}"
+    
+    def _nrt_synthdef(self, candidate: Candidate, synthdef_name: str) -> str:
+        """
+        Build the NRT SynthDef code for a candidate.
+        
+        Uses the method's generate_synthdef() as single source of truth.
+        """
+        # Get the method and generate REAL SynthDef (single source of truth!)
+        method = get_method(candidate.method_id)
+        if method is None:
+            raise ValueError(f"Unknown method: {candidate.method_id}")
+        
+        original_synthdef = method.generate_synthdef(
+            synthdef_name=f"original_{synthdef_name}",  # Placeholder name, will be replaced
+            params=candidate.params,
+            seed=candidate.seed,
+        )
+        
+        # Transform for NRT
+        return self._transform_for_nrt(original_synthdef, synthdef_name)
+    
+    def cache_key(self, candidate: Candidate) -> str:
+        """
+        Content-addressed cache key for a candidate's render.
+        
+        Identical SynthDef text + render config -> identical audio, so the
+        key is independent of candidate_id and run.
+        """
+        synthdef_code = self._nrt_synthdef(candidate, self._synthdef_name(candidate))
+        return render_cache_key(synthdef_code)
+    
     def _generate_nrt_script(
         self,
         candidate: Candidate,
         output_path: Path,
         synthdef_name: str,
+        osc_path: Path,
     ) -> str:
         """
         Generate sclang script for NRT rendering.
         
         Uses the method's generate_synthdef() as single source of truth,
         then transforms it for NRT compatibility.
+        
+        osc_path is where scsynth reads the binary score. With nil, SC picks
+        temp_oscscore<UniqueID>, which starts at the same value in every
+        sclang process, so concurrent jobs would share one file.
         """
         duration = RENDER_CONFIG.duration_sec
         sample_rate = RENDER_CONFIG.sample_rate
         
         # Escape path for SC string
         output_path_str = str(output_path).replace("\\", "\\\\").replace('"', '\\"')
+        osc_path_str = str(osc_path).replace("\\", "\\\\").replace('"', '\\"')
         
-        # Get the method and generate REAL SynthDef (single source of truth!)
-        method = get_method(candidate.method_id)
-        if method is None:
-            raise ValueError(f"Unknown method: {candidate.method_id}")
-        
-        original_synthdef = method.generate_synthdef(
-            synthdef_name=f"original_{synthdef_name}",  # Placeholder name, will be replaced
-            params=candidate.params,
-            seed=candidate.seed,
-        )
-        
-        # Transform for NRT
-        synthdef_code = self._transform_for_nrt(original_synthdef, synthdef_name)
+        synthdef_code = self._nrt_synthdef(candidate, synthdef_name)
         
         return f'''
 // Imaginarium NRT Render: {candidate.candidate_id}
@@ -332,7 +371,7 @@ options.sampleRate = {sample_rate};
 
 // Render
 score.recordNRT(
-    nil,
+    "{osc_path_str}",
     "{output_path_str}",
     sampleRate: {sample_rate},
     headerFormat: "WAV",
@@ -368,20 +407,22 @@ score.recordNRT(
         
         work_dir = self._get_work_dir()
         
-        # Generate unique synthdef name (alphanumeric only)
-        synthdef_name = f"imag_{abs(candidate.seed) % 1000000}"
+        synthdef_name = self._synthdef_name(candidate)
         
         # Output path
         if output_path is None:
             safe_id = candidate.candidate_id.replace('/', '_').replace(':', '_')
             output_path = work_dir / f"{safe_id}.wav"
         
+        # Script and binary score are named per output so concurrent jobs never share them
+        script_path = work_dir / f"{output_path.stem}_{synthdef_name}_render.scd"
+        osc_path = work_dir / f"{output_path.stem}_{synthdef_name}.osc"
+        
         try:
             # Generate SC script
-            script = self._generate_nrt_script(candidate, output_path, synthdef_name)
+            script = self._generate_nrt_script(candidate, output_path, synthdef_name, osc_path)
             
             # Write to temp file
-            script_path = work_dir / f"{synthdef_name}_render.scd"
             script_path.write_text(script)
             
             # Run sclang
@@ -437,33 +478,62 @@ score.recordNRT(
                 success=False,
                 error=str(e),
             )
+        finally:
+            try:
+                osc_path.unlink(missing_ok=True)
+            except OSError:
+                pass
     
     def render_batch(
         self,
         candidates: List[Candidate],
         progress_callback=None,
+        max_workers: Optional[int] = None,
     ) -> BatchRenderResult:
         """
         Render multiple candidates.
         
+        Keeps up to max_workers sclang jobs in flight. Results are returned
+        in candidate order regardless of completion order.
+        
         Args:
             candidates: List of candidates to render
-            progress_callback: Optional callback(current, total, candidate_id)
+            progress_callback: Optional callback(current, total, candidate_id),
+                called on the calling thread as each job is dispatched (serial)
+                or completes (parallel)
+            max_workers: Override the renderer's worker count for this batch
             
         Returns:
             BatchRenderResult with all results
         """
-        results = []
+        workers = max(1, min(max_workers or self.max_workers, len(candidates) or 1))
+        total = len(candidates)
+        results: List[Optional[RenderResult]] = [None] * total
+        
+        # Resolve the work dir once, before any worker threads start
+        work_dir = self._get_work_dir()
+        
+        if workers == 1:
+            for i, candidate in enumerate(candidates):
+                if progress_callback:
+                    progress_callback(i, total, candidate.candidate_id)
+                results[i] = self.render_candidate(candidate)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nrt") as pool:
+                futures = {
+                    pool.submit(self.render_candidate, candidate): i
+                    for i, candidate in enumerate(candidates)
+                }
+                for done, future in enumerate(as_completed(futures)):
+                    i = futures[future]
+                    results[i] = future.result()
+                    if progress_callback:
+                        progress_callback(done, total, candidates[i].candidate_id)
+        
         successful = 0
         failed = 0
         
-        for i, candidate in enumerate(candidates):
-            if progress_callback:
-                progress_callback(i, len(candidates), candidate.candidate_id)
-            
-            result = self.render_candidate(candidate)
-            results.append(result)
-            
+        for candidate, result in zip(candidates, results):
             if result.success:
                 successful += 1
                 candidate.audio_path = result.audio_path
@@ -475,7 +545,7 @@ score.recordNRT(
             results=results,
             successful=successful,
             failed=failed,
-            output_dir=self._get_work_dir(),
+            output_dir=work_dir,
         )
     
     def cleanup(self):
@@ -489,6 +559,7 @@ def render_candidates(
     candidates: List[Candidate],
     output_dir: Optional[Path] = None,
     sclang_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> BatchRenderResult:
     """
     Convenience function for batch rendering.
@@ -497,6 +568,7 @@ def render_candidates(
         candidates: Candidates to render
         output_dir: Output directory (temp if None)
         sclang_path: Path to sclang (auto-detected if None)
+        max_workers: Concurrent NRT jobs (CPU count if None)
         
     Returns:
         BatchRenderResult
@@ -504,6 +576,7 @@ def render_candidates(
     renderer = NRTRenderer(
         sclang_path=sclang_path,
         output_dir=output_dir,
+        max_workers=max_workers,
     )
     
     try:
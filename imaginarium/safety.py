@@ -71,9 +71,6 @@ def check_safety(
     Returns:
         SafetyResult with pass/fail status and details
     """
-    if config is None:
-        config = SAFETY_CONFIG
-    
     try:
         samples, sr = load_audio(audio_path)
     except Exception as e:
@@ -83,6 +80,26 @@ def check_safety(
             details={"error": str(e)},
         )
     
+    return evaluate_safety(samples, config)
+
+
+def evaluate_safety(
+    samples: np.ndarray,
+    config: Optional[SAFETY_CONFIG.__class__] = None,
+) -> SafetyResult:
+    """
+    Run all safety gate checks on already-decoded samples.
+    
+    Args:
+        samples: Float samples, [n] or [n, channels]
+        config: Safety configuration (uses default if None)
+        
+    Returns:
+        SafetyResult with pass/fail status and details
+    """
+    if config is None:
+        config = SAFETY_CONFIG
+    
     # Convert to mono for analysis
     if samples.ndim > 1:
         mono = np.mean(samples, axis=1)
@@ -109,13 +126,17 @@ def check_safety(
     n_frames = 1 + (len(mono) - frame_length) // hop_length
     active_frames = 0
     
-    for i in range(n_frames):
-        start = i * hop_length
-        end = start + frame_length
-        frame = mono[start:end]
-        frame_rms = rms_db(frame)
-        if frame_rms > config.active_threshold_db:
-            active_frames += 1
+    if n_frames > 0:
+        # Strided frame view: [n_frames, frame_length], no copy
+        frames = np.lib.stride_tricks.sliding_window_view(mono, frame_length)[::hop_length]
+        frame_rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+        # rms_db() floors at -100 dB below 1e-10
+        frame_db = np.where(
+            frame_rms < 1e-10,
+            -100.0,
+            20 * np.log10(np.maximum(frame_rms, 1e-10)),
+        )
+        active_frames = int(np.count_nonzero(frame_db > config.active_threshold_db))
     
     active_pct = active_frames / max(n_frames, 1)
     details["active_frames_pct"] = active_pct
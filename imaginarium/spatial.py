@@ -15,7 +15,7 @@ import json
 
 import numpy as np
 
-from .image_spatial import analyze_image_spatial
+from .image_spatial import analyze_image_spatial, analyze_image_spatial_batch
 from .selection import (
     SelectionCandidate,
     CandidateFeatures as SelectionFeatures,
@@ -131,17 +131,50 @@ def analyze_for_spatial(
             image,
             quality_threshold=quality_threshold,
         )
-        
-        use_spatial = not analysis["fallback"]
-        slot_allocation = analysis["slot_allocation"] if use_spatial else {}
-        
-        return use_spatial, slot_allocation, analysis
+        return _spatial_decision(analysis)
         
     except Exception as e:
         log.warning("Spatial analysis failed: %s", e)
         return False, {}, {"error": str(e)}
 
 
+def analyze_for_spatial_batch(
+    images: List[np.ndarray],
+    quality_threshold: float = 0.7,
+) -> List[Tuple[bool, Dict[str, int], Dict[str, Any]]]:
+    """
+    Run spatial analysis over several images in one filter-bank pass.
+    
+    Args:
+        images: RGB images as numpy arrays
+        quality_threshold: Minimum quality score to use spatial
+    
+    Returns:
+        One (use_spatial, slot_allocation, full_analysis) tuple per image
+    """
+    try:
+        analyses = analyze_image_spatial_batch(
+            images,
+            quality_threshold=quality_threshold,
+        )
+        return [_spatial_decision(analysis) for analysis in analyses]
+        
+    except Exception as e:
+        log.warning("Spatial batch analysis failed: %s", e)
+        return [(False, {}, {"error": str(e)}) for _ in images]
+
+
+def _spatial_decision(
+    analysis: Dict[str, Any],
+) -> Tuple[bool, Dict[str, int], Dict[str, Any]]:
+    """Derive (use_spatial, slot_allocation, analysis) from a spatial analysis."""
+    if "error" in analysis:
+        return False, {}, analysis
+    use_spatial = not analysis["fallback"]
+    slot_allocation = analysis["slot_allocation"] if use_spatial else {}
+    return use_spatial, slot_allocation, analysis
+
+
 def select_with_spatial(
     candidates: List[Any],
     slot_allocation: Dict[str, int],
@@ -211,6 +244,7 @@ def generate_spatial_pack(
     select_diverse_fn=None,
     export_fn=None,
     global_spec_fn=None,
+    spatial_analysis: Optional[Dict[str, Any]] = None,
 ) -> SpatialPackResult:
     """
     Spatial-aware pack generation.
@@ -232,6 +266,8 @@ def generate_spatial_pack(
         use_spatial: Enable spatial analysis
         quality_threshold: Minimum quality score for spatial
         *_fn: Callback functions from existing pipeline (for dependency injection)
+        spatial_analysis: Precomputed analysis for this image (e.g. one entry
+            of analyze_for_spatial_batch); skips re-running Phases A-D
     
     Returns:
         SpatialPackResult with success status and debug info
@@ -247,10 +283,15 @@ def generate_spatial_pack(
         
         # Spatial analysis
         if use_spatial:
-            use_spatial_selection, slot_allocation, spatial_analysis = analyze_for_spatial(
-                image,
-                quality_threshold=quality_threshold,
-            )
+            if spatial_analysis is not None:
+                use_spatial_selection, slot_allocation, spatial_analysis = _spatial_decision(
+                    spatial_analysis
+                )
+            else:
+                use_spatial_selection, slot_allocation, spatial_analysis = analyze_for_spatial(
+                    image,
+                    quality_threshold=quality_threshold,
+                )
             
             result.quality_score = spatial_analysis.get("quality_score", 0.0)
             
@@ -0,0 +1,125 @@
+# tests/test_analyze.py
+"""
+Tests for imaginarium/analyze.py single-decode analysis stage.
+
+Synthetic WAVs are written per test; librosa + soundfile are required.
+"""
+import numpy as np
+import pytest
+
+librosa = pytest.importorskip("librosa")
+sf = pytest.importorskip("soundfile")
+
+from imaginarium.analyze import (
+    analyze_audio,
+    analyze_batch,
+    extract_features,
+    extract_features_batch,
+    normalize_value,
+)
+from imaginarium.config import SAFETY_CONFIG
+from imaginarium.models import CandidateFeatures, SafetyStatus
+from imaginarium.safety import check_safety, evaluate_safety, rms_db
+
+SR = 48000
+
+
+def _write(tmp_path, name, samples):
+    path = tmp_path / name
+    sf.write(path, samples, SR, subtype="PCM_16")
+    return path
+
+
+def _tone(seconds=1.5, freq=220.0, noise=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SR)) / SR
+    # Pulsed tone so onsets/HPSS have something to find
+    env = 0.5 + 0.5 * (np.sin(2 * np.pi * 3 * t) > 0)
+    left = 0.3 * env * np.sin(2 * np.pi * freq * t) + noise * rng.standard_normal(len(t))
+    right = 0.3 * env * np.sin(2 * np.pi * freq * 1.01 * t) + noise * rng.standard_normal(len(t))
+    return np.stack([left, right], axis=1).astype(np.float32)
+
+
+def _reference_features(path):
+    """Per-call librosa features (one STFT per feature, as before)."""
+    samples, sr = sf.read(path, dtype="float32")
+    mono = np.mean(samples, axis=1)
+    centroid = float(np.mean(librosa.feature.spectral_centroid(y=mono, sr=sr)[0]))
+    flatness = float(np.mean(librosa.feature.spectral_flatness(y=mono)[0]))
+    onset_env = librosa.onset.onset_strength(y=mono, sr=sr)
+    onsets = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr)
+    harmonic, percussive = librosa.effects.hpss(mono)
+    h, p = np.sum(harmonic ** 2), np.sum(percussive ** 2)
+    return {
+        "centroid": normalize_value(centroid, "centroid"),
+        "flatness": normalize_value(flatness, "flatness"),
+        "onset_density": normalize_value(len(onsets) / (len(mono) / sr), "onset_density"),
+        "harmonicity": normalize_value(h / (h + p), "harmonicity"),
+    }
+
+
+def _reference_active_frames(mono, config):
+    n_frames = 1 + (len(mono) - config.frame_length) // config.hop_length
+    active = 0
+    for i in range(n_frames):
+        frame = mono[i * config.hop_length:i * config.hop_length + config.frame_length]
+        if rms_db(frame) > config.active_threshold_db:
+            active += 1
+    return active / max(n_frames, 1)
+
+
+def test_shared_stft_matches_per_call_librosa(tmp_path):
+    path = _write(tmp_path, "tone.wav", _tone())
+    features = extract_features(path)
+    expected = _reference_features(path)
+    for name, value in expected.items():
+        assert getattr(features, name) == pytest.approx(value, abs=1e-5), name
+
+
+def test_vectorized_active_frames_match_loop():
+    samples = _tone(seconds=2.0)
+    # Silence the middle so some frames are inactive
+    samples[SR // 2:SR] = 0.0
+    result = evaluate_safety(samples)
+    expected = _reference_active_frames(np.mean(samples, axis=1), SAFETY_CONFIG)
+    assert result.details["active_frames_pct"] == pytest.approx(expected)
+
+
+def test_analyze_audio_matches_separate_stages(tmp_path):
+    path = _write(tmp_path, "tone.wav", _tone())
+    result = analyze_audio(path)
+    assert result.safety == check_safety(path)
+    assert result.features == extract_features(path)
+
+
+def test_analyze_audio_unsafe_skips_features(tmp_path):
+    path = _write(tmp_path, "silence.wav", np.zeros((SR, 2), dtype=np.float32))
+    result = analyze_audio(path)
+    assert result.safety.status == SafetyStatus.SILENCE
+    assert result.features is None
+
+
+def test_analyze_audio_missing_file(tmp_path):
+    result = analyze_audio(tmp_path / "missing.wav")
+    assert result.safety.passed is False
+    assert result.error
+
+
+def test_analyze_batch_parallel_matches_serial(tmp_path):
+    paths = [_write(tmp_path, f"t{i}.wav", _tone(freq=110.0 * (i + 1), seed=i)) for i in range(5)]
+    serial = analyze_batch(paths, max_workers=1)
+    parallel = analyze_batch(paths, max_workers=2)
+    assert serial == parallel
+
+
+def test_extract_features_batch_order_and_failures(tmp_path):
+    paths = [_write(tmp_path, f"t{i}.wav", _tone(freq=110.0 * (i + 1), seed=i)) for i in range(4)]
+    paths.insert(2, tmp_path / "missing.wav")
+    calls = []
+
+    results = extract_features_batch(paths, progress_callback=lambda i, n, p: calls.append(i), max_workers=2)
+
+    assert len(results) == 5
+    assert results[2] == CandidateFeatures()
+    assert results[0] == extract_features(paths[0])
+    assert calls == list(range(5))
@@ -0,0 +1,162 @@
+# tests/test_cache.py
+"""
+Tests for imaginarium/cache.py (content-addressed render cache).
+"""
+import os
+
+import pytest
+
+from imaginarium import cache as cache_mod
+from imaginarium.cache import RenderCache, render_cache_key
+from imaginarium.cli import main
+from imaginarium.models import Candidate, CandidateFeatures, SafetyResult, SafetyStatus
+from imaginarium.render import NRTRenderer
+
+
+def _wav(tmp_path, name="src.wav", size=2000):
+    path = tmp_path / name
+    path.write_bytes(b"RIFF" + b"\0" * size)
+    return path
+
+
+def _candidate(seed=1, params=None):
+    return Candidate(
+        candidate_id=f"subtractive/bright_saw:test:{seed}:v1",
+        seed=seed,
+        method_id="subtractive/bright_saw",
+        family="subtractive",
+        params=params or {},
+    )
+
+
+# -----------------------------------------------------------------------------
+# Keys
+# -----------------------------------------------------------------------------
+
+def test_key_is_deterministic():
+    assert render_cache_key("SynthDef(\\a)") == render_cache_key("SynthDef(\\a)")
+
+
+def test_key_depends_on_synthdef():
+    assert render_cache_key("SynthDef(\\a)") != render_cache_key("SynthDef(\\b)")
+
+
+def test_key_depends_on_render_config(monkeypatch):
+    before = render_cache_key("x")
+    monkeypatch.setattr(cache_mod.RENDER_CONFIG, "duration_sec", 5.0)
+    assert render_cache_key("x") != before
+
+
+@pytest.mark.parametrize("field,value", [("jobs", 7), ("timeout_sec", 999)])
+def test_key_ignores_execution_settings(monkeypatch, field, value):
+    before = render_cache_key("x")
+    monkeypatch.setattr(cache_mod.RENDER_CONFIG, field, value)
+    assert render_cache_key("x") == before
+
+
+def test_renderer_cache_key_ignores_candidate_id():
+    """Key follows generated SynthDef, not the candidate label."""
+    renderer = NRTRenderer(sclang_path=None)
+    a = _candidate(seed=7)
+    b = _candidate(seed=7)
+    b.candidate_id = "other:label"
+    assert renderer.cache_key(a) == renderer.cache_key(b)
+    assert renderer.cache_key(a) != renderer.cache_key(_candidate(seed=8))
+
+
+# -----------------------------------------------------------------------------
+# Storage
+# -----------------------------------------------------------------------------
+
+def test_miss_then_hit(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    assert cache.get("ab" * 32) is None
+
+    cached = cache.put_audio("ab" * 32, _wav(tmp_path))
+    entry = cache.get("ab" * 32)
+
+    assert entry is not None
+    assert entry.audio_path == cached
+    assert entry.safety is None and entry.features is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_analysis_roundtrip(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    key = "cd" * 32
+    cache.put_audio(key, _wav(tmp_path))
+
+    safety = SafetyResult(passed=False, status=SafetyStatus.CLIPPING, details={"peak": 1.2})
+    features = CandidateFeatures(centroid=0.4, flatness=0.2, crest=0.7, rms_db=-18.0)
+    cache.put_analysis(key, safety=safety)
+    cache.put_analysis(key, features=features)
+
+    entry = cache.get(key)
+    assert entry.safety == safety
+    assert entry.features == features
+
+
+def test_error_safety_roundtrip(tmp_path):
+    """Unreadable-audio results carry a string detail; they cache like any other."""
+    cache = RenderCache(tmp_path / "cache")
+    key = "ef" * 32
+    cache.put_audio(key, _wav(tmp_path))
+
+    safety = SafetyResult(passed=False, status=SafetyStatus.SILENCE,
+                          details={"error": "file does not start with RIFF id"})
+    cache.put_analysis(key, safety=safety)
+
+    assert cache.get(key).safety == safety
+
+
+def test_damaged_meta_is_a_miss(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    key = "ef" * 32
+    cache.put_audio(key, _wav(tmp_path))
+    (cache.cache_dir / key[:2] / key / "meta.json").write_text("{not json")
+
+    assert cache.get(key) is None
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put_audio(key, _wav(tmp_path, size=1000))
+        meta = cache.cache_dir / key[:2] / key / "meta.json"
+        os.utime(meta, (1000 + i, 1000 + i))
+
+    # Touch the oldest so the middle one becomes LRU
+    cache.get(keys[0])
+
+    # One byte over budget -> exactly one eviction
+    removed = cache.prune(max_bytes=cache.stats().total_bytes - 1)
+
+    assert removed == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_stats_empty(tmp_path):
+    stats = RenderCache(tmp_path / "missing", max_bytes=10).stats()
+    assert stats.entries == 0
+    assert stats.total_bytes == 0
+    assert stats.max_bytes == 10
+
+
+# -----------------------------------------------------------------------------
+# CLI
+# -----------------------------------------------------------------------------
+
+def test_cli_cache_stats_and_prune(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(cache_mod.CACHE_CONFIG, "cache_dir", str(tmp_path / "cache"))
+    RenderCache().put_audio("aa" * 32, _wav(tmp_path))
+
+    assert main(["cache", "stats"]) == 0
+    assert "Entries: 1" in capsys.readouterr().out
+
+    assert main(["cache", "prune", "--max-mb", "0"]) == 0
+    out = capsys.readouterr().out
+    assert "Removed 1" in out
+    assert "Entries: 0" in out
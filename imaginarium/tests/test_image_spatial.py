@@ -25,6 +25,10 @@ from imaginarium.image_spatial import (
     build_spec_tokens,
     analyze_image_spatial,
     QUALITY_THRESHOLD,
+    # Filter bank / batch
+    extract_tile_features_batch,
+    analyze_image_spatial_batch,
+    _filter_bank,
 )
 
 
@@ -702,3 +706,72 @@ def test_analyze_image_spatial_complete_structure():
     # Config should include Phase D constants
     assert "QUALITY_THRESHOLD" in result["config"]
     assert "WEIGHT_FLOOR" in result["config"]
+
+
+# =============================================================================
+# Filter Bank + Batch Tests
+# =============================================================================
+
+def _conv2_reference(img, kernel):
+    """Per-pixel edge-padded correlation (the original scalar implementation)."""
+    kh, kw = kernel.shape
+    padded = np.pad(img, ((kh // 2, kh // 2), (kw // 2, kw // 2)), mode="edge")
+    out = np.zeros_like(img, dtype=np.float32)
+    for y in range(out.shape[0]):
+        for x in range(out.shape[1]):
+            out[y, x] = float(np.sum(padded[y:y + kh, x:x + kw] * kernel))
+    return out
+
+
+def test_filter_bank_matches_reference_conv():
+    """Vectorized Sobel/Laplacian match the scalar convolution."""
+    rng = np.random.default_rng(0)
+    lum = rng.random((48, 40)).astype(np.float32)
+    kx = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
+    ky = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
+    kl = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32)
+
+    gx, gy, lap = _filter_bank(lum)
+
+    assert gx.dtype == np.float32
+    np.testing.assert_allclose(gx, _conv2_reference(lum, kx), atol=1e-5)
+    np.testing.assert_allclose(gy, _conv2_reference(lum, ky), atol=1e-5)
+    np.testing.assert_allclose(lap, _conv2_reference(lum, kl), atol=1e-5)
+
+
+def test_filter_bank_batch_matches_single():
+    """Stacked [N,H,W] input gives the same responses as per-image calls."""
+    rng = np.random.default_rng(1)
+    batch = rng.random((3, 32, 32)).astype(np.float32)
+    gx, gy, lap = _filter_bank(batch)
+    for i in range(3):
+        sx, sy, sl = _filter_bank(batch[i])
+        np.testing.assert_array_equal(gx[i], sx)
+        np.testing.assert_array_equal(gy[i], sy)
+        np.testing.assert_array_equal(lap[i], sl)
+
+
+def test_extract_tile_features_batch_matches_single():
+    """Batch extraction returns the same tiles as per-image extraction."""
+    images = [_img_vertical_stripes_quadrant(), _img_single_bright_blob(), _img_uniform_gray()]
+    batch = extract_tile_features_batch(images, grid=(4, 4), resize_to=256)
+
+    assert len(batch) == len(images)
+    for img, tiles in zip(images, batch):
+        assert tiles == extract_tile_features(img, grid=(4, 4), resize_to=256)
+
+
+def test_extract_tile_features_batch_empty():
+    assert extract_tile_features_batch([]) == []
+
+
+def test_analyze_image_spatial_batch_matches_single():
+    images = [_img_vertical_stripes_quadrant(), _img_uniform_gray()]
+    results = analyze_image_spatial_batch(images, resize_to=256)
+
+    assert len(results) == 2
+    for img, result in zip(images, results):
+        single = analyze_image_spatial(img, resize_to=256)
+        assert result["fallback"] == single["fallback"]
+        assert result["quality_score"] == single["quality_score"]
+        assert result["slot_allocation"] == single["slot_allocation"]
@@ -0,0 +1,166 @@
+# tests/test_render.py
+"""
+Tests for imaginarium/render.py batch rendering.
+
+Uses a fake sclang stub (a small Python script) so the worker pool can be
+exercised without SuperCollider installed.
+"""
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+from imaginarium.models import Candidate
+from imaginarium.render import NRTRenderer
+
+FAKE_SCLANG = '''#!{python}
+"""Fake sclang: writes the score and a dummy WAV to the recordNRT paths in the script."""
+import re
+import sys
+import time
+
+script = open(sys.argv[1]).read()
+cid = re.search(r"// Imaginarium NRT Render: (\\S+)", script).group(1)
+osc, out = re.search(r'recordNRT\\(\\s*"([^"]+)",\\s*"([^"]+)"', script).groups()
+with open(osc, "x") as f:  # like scsynth's score file; fails if another job holds it
+    f.write(cid)
+
+if "slow" in cid:
+    time.sleep(float(cid.rsplit(":", 1)[-1]))
+if "fail" in cid:
+    sys.stderr.write("ERROR: fake failure")
+    sys.exit(1)
+
+with open(out, "wb") as f:
+    f.write(b"RIFF" + b"\\0" * 4000)
+print("RENDER_COMPLETE")
+'''
+
+
+@pytest.fixture
+def fake_sclang(tmp_path):
+    path = tmp_path / "sclang"
+    path.write_text(FAKE_SCLANG.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+def _candidate(tag: str, i: int, arg: str = "v1") -> Candidate:
+    return Candidate(
+        candidate_id=f"subtractive/bright_saw:{tag}:{i}:{arg}",
+        seed=1000 + i,
+        method_id="subtractive/bright_saw",
+        family="subtractive",
+    )
+
+
+def test_render_batch_parallel_success(fake_sclang, tmp_path):
+    """All candidates render and get audio paths."""
+    candidates = [_candidate("ok", i) for i in range(6)]
+    renderer = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path / "out", max_workers=3)
+
+    batch = renderer.render_batch(candidates)
+
+    assert batch.successful == 6
+    assert batch.failed == 0
+    for c in candidates:
+        assert c.audio_path is not None and c.audio_path.exists()
+
+
+def test_render_batch_results_in_candidate_order(fake_sclang, tmp_path):
+    """Results follow input order even when earlier jobs finish last."""
+    candidates = [
+        _candidate("slow", 0, "0.6"),
+        _candidate("slow", 1, "0.3"),
+        _candidate("ok", 2),
+    ]
+    renderer = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path, max_workers=3)
+
+    batch = renderer.render_batch(candidates)
+
+    assert [r.candidate_id for r in batch.results] == [c.candidate_id for c in candidates]
+    assert all(r.success for r in batch.results)
+
+
+def test_render_batch_runs_concurrently(fake_sclang, tmp_path):
+    """N workers overlap N slow jobs."""
+    candidates = [_candidate("slow", i, "0.5") for i in range(4)]
+    renderer = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path, max_workers=4)
+
+    start = time.monotonic()
+    batch = renderer.render_batch(candidates)
+    elapsed = time.monotonic() - start
+
+    assert batch.successful == 4
+    assert elapsed < 4 * 0.5
+
+
+def test_render_batch_score_files_per_job(fake_sclang, tmp_path):
+    """Each job gets its own score (.osc) path, removed after the render."""
+    candidates = [_candidate("slow", i, "0.2") for i in range(4)]
+    renderer = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path, max_workers=4)
+
+    batch = renderer.render_batch(candidates)
+
+    assert batch.successful == 4
+    scripts = [p.read_text() for p in tmp_path.glob("*_render.scd")]
+    osc_paths = {s.split("recordNRT(")[1].split('"')[1] for s in scripts}
+    assert len(osc_paths) == 4
+    assert not list(tmp_path.glob("*.osc"))
+
+
+def test_render_batch_progress_callback(fake_sclang, tmp_path):
+    """Progress is reported once per candidate with a running count."""
+    candidates = [_candidate("ok", i) for i in range(5)]
+    renderer = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path, max_workers=2)
+    calls = []
+
+    renderer.render_batch(candidates, progress_callback=lambda i, n, cid: calls.append((i, n, cid)))
+
+    assert [c[0] for c in calls] == list(range(5))
+    assert all(c[1] == 5 for c in calls)
+    assert sorted(c[2] for c in calls) == sorted(c.candidate_id for c in candidates)
+
+
+def test_render_batch_per_job_timeout(fake_sclang, tmp_path):
+    """A hung job times out without failing the rest of the batch."""
+    candidates = [_candidate("slow", 0, "5"), _candidate("ok", 1)]
+    renderer = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path, timeout_s=1, max_workers=2)
+
+    batch = renderer.render_batch(candidates)
+
+    assert batch.results[0].success is False
+    assert "timeout" in batch.results[0].error.lower()
+    assert batch.results[1].success is True
+
+
+def test_render_batch_failure_reported(fake_sclang, tmp_path):
+    candidates = [_candidate("fail", 0), _candidate("ok", 1)]
+    renderer = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path, max_workers=2)
+
+    batch = renderer.render_batch(candidates)
+
+    assert batch.successful == 1
+    assert batch.failed == 1
+    assert "fake failure" in batch.results[0].error
+
+
+def test_render_batch_serial_matches_parallel(fake_sclang, tmp_path):
+    """max_workers=1 keeps the serial path with identical results."""
+    serial = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path / "a", max_workers=1)
+    parallel = NRTRenderer(sclang_path=fake_sclang, output_dir=tmp_path / "b", max_workers=4)
+
+    a = serial.render_batch([_candidate("ok", i) for i in range(4)])
+    b = parallel.render_batch([_candidate("ok", i) for i in range(4)])
+
+    assert [(r.candidate_id, r.success) for r in a.results] == \
+        [(r.candidate_id, r.success) for r in b.results]
+
+
+def test_max_workers_defaults_to_cpu_count(fake_sclang, monkeypatch):
+    from imaginarium import render
+    monkeypatch.setattr(render.RENDER_CONFIG, "jobs", 0)
+    renderer = NRTRenderer(sclang_path=fake_sclang)
+    assert renderer.max_workers == (os.cpu_count() or 1)
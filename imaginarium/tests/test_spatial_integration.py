@@ -11,6 +11,7 @@ import numpy as np
 
 from imaginarium.spatial import (
     analyze_for_spatial,
+    analyze_for_spatial_batch,
     select_with_spatial,
     map_candidate_features,
     wrap_pipeline_candidate,
@@ -215,6 +216,27 @@ def test_analyze_for_spatial_handles_errors():
     assert "error" in analysis
 
 
+def test_analyze_for_spatial_batch_matches_single():
+    """Batch analysis gives the same decision per image as single analysis."""
+    images = [_img_uniform_gray(), _img_structured()]
+    
+    results = analyze_for_spatial_batch(images)
+    
+    assert len(results) == 2
+    for img, (use_spatial, slot_allocation, _) in zip(images, results):
+        expected_use, expected_alloc, _ = analyze_for_spatial(img)
+        assert use_spatial == expected_use
+        assert slot_allocation == expected_alloc
+
+
+def test_analyze_for_spatial_batch_handles_errors():
+    """Batch errors fall back for every image."""
+    results = analyze_for_spatial_batch([np.array([1, 2, 3]), _img_structured()])
+    
+    assert len(results) == 2
+    assert all(use is False and "error" in analysis for use, _, analysis in results)
+
+
 # -----------------------------------------------------------------------------
 # Selection Integration Tests
 # -----------------------------------------------------------------------------
@@ -365,6 +387,39 @@ def test_generate_spatial_pack_fallback():
         image_path.unlink()
 
 
+def test_generate_spatial_pack_precomputed_analysis():
+    """Precomputed batch analysis is used instead of re-analyzing."""
+    import tempfile
+    from PIL import Image
+    
+    img = _img_structured()
+    
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+        Image.fromarray(img).save(f.name)
+        image_path = Path(f.name)
+    
+    try:
+        _, _, analysis = analyze_for_spatial_batch([_img_uniform_gray()])[0]
+        candidates = _mock_candidates(20)
+        
+        result = generate_spatial_pack(
+            image_path=image_path,
+            output_dir=Path("/tmp"),
+            seed=42,
+            use_spatial=True,
+            generate_candidates_fn=lambda seed, spec: candidates,
+            score_fn=lambda c, s: None,
+            spatial_analysis=analysis,
+        )
+        
+        # Uniform-image analysis forces fallback even though the file is structured
+        assert result.used_spatial == False
+        assert result.quality_score == analysis["quality_score"]
+        
+    finally:
+        image_path.unlink()
+
+
 def test_preview_spatial_analysis():
     """Test the standalone pipeline preview function."""
     import tempfile
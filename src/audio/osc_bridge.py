@@ -13,15 +13,19 @@ Ports:
 - Receives from SC on port 57121
 """
 
+from contextlib import contextmanager
 from pythonosc import udp_client
-from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_server import ThreadingOSCUDPServer
 from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
 from pythonosc.osc_message_builder import OscMessageBuilder
 import threading
 import time
+import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QCoreApplication
 
+from src.audio.osc_coalescer import BundleCapture, CoalescingSender
+from src.audio.osc_fast_path import FastPathDispatcher
+from src.telemetry.telemetry_profiler import STAGE_OSC_DECODE, profiler
 from src.utils.logger import logger
 
 
@@ -34,7 +38,7 @@ class OSCBridge(QObject):
     midi_cc_received = pyqtSignal(int, int, int)  # channel, cc, value
     channel_levels_received = pyqtSignal(int, float, float)  # slot_id, ampL, ampR
     comp_gr_received = pyqtSignal(float)  # compressor gain reduction in dB
-    mod_bus_value_received = pyqtSignal(int, float)  # bus_idx, value (for mod scope)
+    mod_bus_values_received = pyqtSignal(int, object)  # slot mask, (k, 16) float32 bus values (for mod scope)
     mod_values_received = pyqtSignal(list)  # [(slot, param, value), ...] for slider visualization
     extmod_values_received = pyqtSignal(list)  # [(target_str, value), ...] for extended mod visualization
     bus_values_received = pyqtSignal(list)  # [(targetKey, value), ...] for unified bus system visualization
@@ -46,7 +50,7 @@ class OSCBridge(QObject):
     scope_debug_done_received = pyqtSignal(str)  # SC csv path
     # Telemetry signals (development tool)
     telem_data_received = pyqtSignal(int, object)      # slot, data dict
-    telem_waveform_received = pyqtSignal(int, object)   # slot, samples tuple
+    telem_waveform_received = pyqtSignal(int, object)   # slot, numpy array of floats
     telem_stabilize_received = pyqtSignal()             # stabilize trigger
     # Clock tick from SC fabric
     clock_tick_received = pyqtSignal(int)  # fabric_idx
@@ -63,6 +67,7 @@ class OSCBridge(QObject):
     PING_TIMEOUT_MS = 1000  # Wait 1 second for ping response
     HEARTBEAT_INTERVAL_MS = 2000  # Send heartbeat every 2 seconds
     HEARTBEAT_MISS_LIMIT = 3  # Connection lost after 3 missed heartbeats
+    SEND_FLUSH_INTERVAL_MS = 16  # Coalesced control traffic flushed at ~60 Hz
 
     def __init__(self):
         super().__init__()
@@ -85,6 +90,12 @@ class OSCBridge(QObject):
         self._heartbeat_timer = QTimer()
         self._heartbeat_timer.timeout.connect(self._check_heartbeat)
 
+        # Coalesced outbound control traffic (last-value-wins per target)
+        self.coalescer = CoalescingSender(self.send_bundle)
+        self._capture = None  # BundleCapture while inside bundled()
+        self._flush_timer = QTimer()
+        self._flush_timer.timeout.connect(self.flush_coalesced)
+
         # Store connection params for reconnect
         self._host = None
         self._port = None
@@ -162,6 +173,7 @@ class OSCBridge(QObject):
 
             # Start heartbeat monitoring
             self._heartbeat_timer.start(self.HEARTBEAT_INTERVAL_MS)
+            self._flush_timer.start(self.SEND_FLUSH_INTERVAL_MS)
 
             logger.info(f"Connected to SuperCollider at {self._host}:{self._port}", component="OSC")
             logger.debug(f"Listening for SC messages on port 57121", component="OSC")
@@ -260,7 +272,7 @@ class OSCBridge(QObject):
         ):
             return True
 
-        dispatcher = Dispatcher()
+        dispatcher = FastPathDispatcher()
 
         # Connection management
         dispatcher.map(OSC_PATHS['pong'], self._handle_pong)
@@ -289,8 +301,10 @@ class OSCBridge(QObject):
         dispatcher.map(OSC_PATHS['audio_device_ready'], self._handle_audio_device_ready)
         dispatcher.map(OSC_PATHS['audio_device_error'], self._handle_audio_device_error)
 
-        # Handle mod bus values from SC (for scope display)
-        dispatcher.map(OSC_PATHS['mod_bus_value'], self._handle_mod_bus_value)
+        # Handle batched mod bus values from SC (for scope display)
+        dispatcher.map_float_array(OSC_PATHS['mod_bus_values'], self._handle_mod_bus_values_array,
+                                   n_head=1)
+        dispatcher.map(OSC_PATHS['mod_bus_values'], self._handle_mod_bus_values)
         dispatcher.map(OSC_PATHS['extmod_values'], self._handle_extmod_values)
 
         # Handle batched mod values from SC (for slider visualization) (SSOT: use OSC_PATHS)
@@ -300,6 +314,9 @@ class OSCBridge(QObject):
         dispatcher.map(OSC_PATHS['bus_values'], self._handle_bus_values)
 
         # Handle scope tap waveform data from SC
+        # Float-array fast path decodes straight into numpy; the generic
+        # mapping stays as fallback for payloads the fast path declines.
+        dispatcher.map_float_array(OSC_PATHS['scope_data'], self._handle_scope_array)
         dispatcher.map(OSC_PATHS['scope_data'], self._handle_scope_data)
 
         # Handle scope debug capture completion from SC
@@ -313,8 +330,12 @@ class OSCBridge(QObject):
 
         # Telemetry (development tool)
         dispatcher.map(OSC_PATHS['telem_gen'], self._handle_telem_gen)
+        dispatcher.map_float_array(OSC_PATHS['telem_wave'], self._handle_telem_wave_array, n_head=1,
+                                   stage=STAGE_OSC_DECODE)
         dispatcher.map(OSC_PATHS['telem_wave'], self._handle_telem_wave)
         # R1: Alias for hw_profile_tap waveform path (MorphMapper v6.2)
+        dispatcher.map_float_array('/noise/telem/hw_wave', self._handle_telem_wave_array, n_head=1,
+                                   stage=STAGE_OSC_DECODE)
         dispatcher.map('/noise/telem/hw_wave', self._handle_telem_wave)
         dispatcher.map(OSC_PATHS['telem_stabilize'], self._handle_telem_stabilize)
 
@@ -398,14 +419,22 @@ class OSCBridge(QObject):
             gr_db = float(args[0])
             self.comp_gr_received.emit(gr_db)
 
-    def _handle_mod_bus_value(self, address, *args):
-        """Handle mod bus value from SC (for scope display)."""
+    def _handle_mod_bus_values(self, address, *args):
+        """Handle batched mod bus values from SC - generic path.
+
+        Args: [slotMask, v0 .. v15] (one or more 16-value frames)
+        """
+        if len(args) > 1:
+            self._handle_mod_bus_values_array(address, args[0],
+                                              np.asarray(args[1:], dtype=np.float32))
+
+    def _handle_mod_bus_values_array(self, address, slot_mask, values):
+        """Handle batched mod bus values as mask + float32 array (fast path)."""
         if self._shutdown or self._deleted:
             return
-        if len(args) >= 2:
-            bus_idx = int(args[0])
-            value = float(args[1])
-            self.mod_bus_value_received.emit(bus_idx, value)
+        if len(values) == 0 or len(values) % 16:
+            return
+        self.mod_bus_values_received.emit(int(slot_mask), values.reshape(-1, 16))
 
     def _handle_mod_values(self, address, *args):
         """Handle batched modulated parameter values from SC (for slider visualization).
@@ -544,11 +573,15 @@ class OSCBridge(QObject):
             self.bus_values_received.emit(values)
 
     def _handle_scope_data(self, address, *args):
-        """Handle scope waveform data from SC (1024 floats)."""
+        """Handle scope waveform data from SC (1024 floats) - generic path."""
+        if len(args) > 0:
+            self._handle_scope_array(address, np.asarray(args, dtype=np.float32))
+
+    def _handle_scope_array(self, address, samples):
+        """Handle scope waveform data as a float32 array (fast path)."""
         if self._shutdown or self._deleted:
             return
-        if len(args) > 0:
-            self.scope_data_received.emit(args)
+        self.scope_data_received.emit(samples)
 
     def _handle_scope_debug_done(self, address, *args):
         """Handle scope debug capture completion from SC."""
@@ -601,8 +634,16 @@ class OSCBridge(QObject):
             return
         if len(args) < 2:
             return
-        slot = int(args[0])
-        self.telem_waveform_received.emit(slot, args[1:])
+        t0 = profiler.start()
+        samples = np.asarray(args[1:], dtype=np.float32)
+        profiler.stop(STAGE_OSC_DECODE, t0)
+        self._handle_telem_wave_array(address, args[0], samples)
+
+    def _handle_telem_wave_array(self, address, slot, samples):
+        """Handle telemetry waveform as slot + float32 array (fast path)."""
+        if self._shutdown or self._deleted:
+            return
+        self.telem_waveform_received.emit(int(slot), samples)
 
     def _handle_clock_tick(self, address, *args):
         """Handle clock fabric tick from SC (for ARP clock unification)."""
@@ -682,6 +723,10 @@ class OSCBridge(QObject):
             logger.warning("OSC bundle ignored: not connected", component="OSC")
             return
 
+        if self._capture is not None:
+            self._capture.messages.extend((path, list(args)) for path, args in messages)
+            return
+
         try:
             bundle = OscBundleBuilder(IMMEDIATELY)
             for path, args in messages:
@@ -693,6 +738,69 @@ class OSCBridge(QObject):
         except Exception as e:
             logger.warning(f"OSC bundle send failed: {e}", component="OSC")
 
+    @contextmanager
+    def bundled(self):
+        """Collect every send made inside the block and emit it as bundles.
+
+        client.send_message(), send(), send_bundle() and coalesced values are
+        captured in order and sent on exit as bundles of at most
+        coalescer.max_bundle_messages, so a burst such as a preset switch
+        reaches SC in a few packets instead of hundreds. Values already
+        queued in the coalescer are flushed first so they cannot land after
+        the batch. Nested or disconnected blocks send as usual.
+
+        Yields:
+            BundleCapture; .sent and .bundles are final once the block exits
+        """
+        if self._capture is not None or not self.client or not self.connected:
+            yield BundleCapture(None)
+            return
+
+        self.flush_coalesced()
+        client = self.client
+        capture = BundleCapture(client)
+        self._capture = capture
+        self.client = capture
+        try:
+            yield capture
+        finally:
+            self.coalescer.flush()  # lands in the capture via send_bundle
+            self._capture = None
+            if self.client is capture:  # not torn down mid-block
+                self.client = client
+                step = self.coalescer.max_bundle_messages
+                for i in range(0, capture.sent, step):
+                    self.send_bundle(capture.messages[i:i + step])
+                    capture.bundles += 1
+
+    def send_coalesced(self, path, args, target=None):
+        """Queue a control-rate message; only the latest per target is sent.
+
+        Flushed as a bundle every SEND_FLUSH_INTERVAL_MS. Use for continuous
+        "set" controls (sliders, CC-driven params); see CoalescingSender.
+
+        Args:
+            path: OSC address
+            args: List of arguments
+            target: Coalescing id (default: all args but the last)
+        """
+        if self._shutdown or self._deleted or self._connecting:
+            return
+        if not self.client or not self.connected:
+            return
+        self.coalescer.submit(path, args, target)
+
+    def flush_coalesced(self):
+        """Send pending coalesced messages now (called by the flush timer).
+
+        Call before a direct send that must not be overtaken by a pending
+        coalesced value, e.g. removing a route that has a queued update.
+        """
+        if self._shutdown or self._deleted:
+            self.coalescer.clear()
+            return
+        self.coalescer.flush()
+
     def _cleanup(self, join_thread=True):
         """Clean up connection resources.
 
@@ -701,6 +809,8 @@ class OSCBridge(QObject):
                          Use False during reconnect to avoid visible hiccup.
         """
         self._heartbeat_timer.stop()
+        self._flush_timer.stop()
+        self.coalescer.clear()
 
         # Reset protocol state to avoid stale flags on reconnect
         self._ping_received = False
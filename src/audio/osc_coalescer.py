@@ -0,0 +1,133 @@
+"""
+OSC Coalescer
+Last-value-wins outbound queue for control-rate OSC traffic
+
+A fast knob sweep (or MIDI CC stream) produces one message per slider
+step. SC only needs the latest value per target, so continuous controls
+submit here instead of sending directly; OSCBridge flushes the queue as
+bundles on a fixed timer, bounding packet rate regardless of input rate.
+
+Coalescing key is (address, target). By default target is every argument
+except the last, which fits the usual [slot, value] / [slot, param, value]
+/ [value] layouts; pass target explicitly for anything else.
+
+Only use this for idempotent "set" messages - anything whose effect
+depends on ordering against direct sends (add/remove, start/stop) should
+flush first or bypass it.
+"""
+
+import threading
+from collections.abc import Iterable
+
+
+class CoalescingSender:
+    """Pending (address, target) -> args map, flushed as OSC bundles."""
+
+    # Keep bundles well under a UDP datagram
+    MAX_BUNDLE_MESSAGES = 64
+
+    def __init__(self, send_bundle, max_bundle_messages=None):
+        """
+        Args:
+            send_bundle: Callable taking [(path, args), ...] (OSCBridge.send_bundle)
+            max_bundle_messages: Messages per bundle before splitting
+        """
+        self._send_bundle = send_bundle
+        self.max_bundle_messages = max_bundle_messages or self.MAX_BUNDLE_MESSAGES
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        # Counters
+        self.submitted = 0
+        self.coalesced = 0
+        self.sent = 0
+        self.bundles = 0
+
+    def submit(self, path, args, target=None):
+        """Queue a message, replacing any pending one for the same target.
+
+        Args:
+            path: OSC address
+            args: Argument list
+            target: Hashable target id (default: tuple(args[:-1]))
+        """
+        if target is None:
+            target = tuple(args[:-1])
+        key = (path, target)
+        with self._lock:
+            if key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = (path, list(args))
+            self.submitted += 1
+
+    def flush(self):
+        """Send everything pending. Returns number of messages sent."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            messages = list(self._pending.values())
+            self._pending = {}
+
+        step = self.max_bundle_messages
+        for i in range(0, len(messages), step):
+            self._send_bundle(messages[i:i + step])
+            self.bundles += 1
+        self.sent += len(messages)
+        return len(messages)
+
+    def clear(self):
+        """Drop pending messages without sending."""
+        with self._lock:
+            self._pending = {}
+
+    @property
+    def pending(self):
+        """Number of messages waiting for the next flush."""
+        return len(self._pending)
+
+    def stats(self):
+        """Counters for diagnostics: submitted vs sent."""
+        return {
+            'submitted': self.submitted,
+            'sent': self.sent,
+            'bundles': self.bundles,
+            'coalesced': self.coalesced,
+            'pending': self.pending,
+        }
+
+    def reset_stats(self):
+        self.submitted = 0
+        self.coalesced = 0
+        self.sent = 0
+        self.bundles = 0
+
+
+class BundleCapture:
+    """Client stand-in that records send_message() calls in order.
+
+    OSCBridge.bundled() swaps this in for the UDP client, so code that sends
+    through osc.client directly is batched along with send()/send_bundle().
+    Any other client attribute is forwarded to the real client.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.messages = []   # [(path, args), ...] in send order
+        self.bundles = 0     # bundles used to send them (set on exit)
+
+    def send_message(self, address, value):
+        """Same argument handling as SimpleUDPClient.send_message."""
+        if value is None:
+            args = []
+        elif isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            args = [value]
+        else:
+            args = list(value)
+        self.messages.append((address, args))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    @property
+    def sent(self):
+        return len(self.messages)
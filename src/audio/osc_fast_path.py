@@ -0,0 +1,123 @@
+"""
+OSC Fast Path
+Zero-parse receive path for high-rate float-array messages from SC
+
+python-osc decodes every argument into a Python float and hands handlers a
+tuple. For /noise/scope/data (1024 floats at ~30 Hz) and telemetry
+waveforms that per-float work dominates the receive thread, so these
+addresses are decoded here straight off the datagram with np.frombuffer.
+
+Message layout (OSC 1.0):
+    address  - null-terminated, padded to 4 bytes
+    typetags - ',' + tags, null-terminated, padded to 4 bytes
+    args     - big-endian int32/float32 for 'i'/'f'
+
+A message is taken by the fast path only when it is a plain (non-bundle)
+message whose tags are `n_head` scalars ('i' or 'f') followed by a run of
+'f'. Anything else falls through to the regular Dispatcher unchanged.
+"""
+
+import struct
+
+import numpy as np
+from pythonosc.dispatcher import Dispatcher
+
+from src.telemetry.telemetry_profiler import profiler
+
+_OSC_FLOAT = np.dtype('>f4')
+_HEAD_FORMATS = {ord('i'): '>i', ord('f'): '>f'}
+
+
+def _padded_end(dgram, start):
+    """Index just past the 4-byte padded, null-terminated string at start."""
+    end = dgram.index(b'\0', start)
+    return (end + 4) & ~3
+
+
+def decode_float_message(dgram, n_head=0):
+    """Decode a message of n_head scalars followed by a float32 array.
+
+    Args:
+        dgram: Raw OSC datagram (bytes)
+        n_head: Number of leading scalar args to decode separately
+
+    Returns:
+        (address, head_tuple, float32 ndarray), or None if the datagram is
+        not of that shape (the caller should use the generic path).
+    """
+    if not dgram or dgram[0] != 0x2F:  # '/' - bundles start with '#'
+        return None
+    try:
+        tag_start = _padded_end(dgram, 0)
+        if dgram[tag_start] != 0x2C:  # ','
+            return None
+        tag_end = dgram.index(b'\0', tag_start)
+        data_start = (tag_end + 4) & ~3
+    except (ValueError, IndexError):
+        return None
+
+    tags = dgram[tag_start + 1:tag_end]
+    n_floats = len(tags) - n_head
+    if n_floats < 1:
+        return None
+    if tags[n_head:] != b'f' * n_floats:
+        return None
+    if len(dgram) < data_start + 4 * len(tags):
+        return None
+
+    head = []
+    offset = data_start
+    for tag in tags[:n_head]:
+        fmt = _HEAD_FORMATS.get(tag)
+        if fmt is None:
+            return None
+        head.append(struct.unpack_from(fmt, dgram, offset)[0])
+        offset += 4
+
+    # One vectorized byteswap into a fresh native buffer. The array is handed
+    # to a queued Qt signal, so it must not alias anything reused later.
+    samples = np.frombuffer(dgram, dtype=_OSC_FLOAT, count=n_floats, offset=offset)
+    samples = samples.astype(np.float32)
+
+    address = dgram[:dgram.index(b'\0')].decode('ascii')
+    return address, tuple(head), samples
+
+
+class FastPathDispatcher(Dispatcher):
+    """Dispatcher with a direct-decode route for float-array addresses.
+
+    Routes registered with map_float_array() are matched on the raw address
+    bytes and bypass OscPacket parsing entirely; their handlers receive
+    (address, *head, samples) where samples is a float32 ndarray.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._float_routes = {}
+
+    def map_float_array(self, address, handler, n_head=0, stage=None):
+        """Register a fast-path handler for a float-array address.
+
+        Args:
+            address: Exact OSC address (no patterns)
+            handler: Called as handler(address, *head, samples)
+            n_head: Scalar args preceding the float run (e.g. slot index)
+            stage: Telemetry profiler stage timing the decode, if any
+        """
+        prefix = address.encode('ascii') + b'\0'
+        self._float_routes[prefix] = (handler, n_head, stage)
+
+    def call_handlers_for_packet(self, data, client_address):
+        if data[:1] == b'/':
+            end = data.find(b'\0')
+            route = self._float_routes.get(data[:end + 1]) if end > 0 else None
+            if route is not None:
+                handler, n_head, stage = route
+                t0 = profiler.start() if stage else 0
+                decoded = decode_float_message(data, n_head)
+                profiler.stop(stage, t0)
+                if decoded is not None:
+                    address, head, samples = decoded
+                    handler(address, *head, samples)
+                    return []
+        return super().call_handlers_for_packet(data, client_address)
@@ -63,7 +63,7 @@ class ScopeController(QObject):
     def decode_scope_payload(self, args):
         """Decode OSC scope data payload.
 
-        Accepts either:
+        Accepts a float32 array (OSC fast path) or any float sequence, either:
           - [s0..s1023]         (len=1024) — current protocol, samples only
           - [phase, s0..s1023]  (len=1025) — future protocol with phase prefix
 
@@ -14,16 +14,24 @@ References:
 
 import json
 import subprocess
+import threading
 import time
 from collections import deque
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-from scipy.optimize import minimize
-from PyQt5.QtCore import QObject
+from scipy.optimize import differential_evolution, minimize
+from scipy.signal import lfilter
+from PyQt5.QtCore import QObject, pyqtSignal
 
 from src.telemetry.stabilizer import WaveformStabilizer
+from src.telemetry.telemetry_history import TelemetryHistory
+from src.telemetry.telemetry_profiler import (
+    STAGE_IDEAL, STAGE_ON_WAVEFORM, STAGE_PROCESS, STAGE_STABILIZER, profiler,
+)
+from src.telemetry.telemetry_worker import LatestWinsWorker, TelemetryResult
 from src.utils.logger import logger
 
 
@@ -146,15 +154,11 @@ class IdealOverlay:
         For single-cycle ideal waveforms, this mainly removes DC offset
         introduced by symmetry/bias operations. The coefficient 0.995
         matches SC's default.
+
+        Filters along the last axis, so a 2-D (batch, samples) array is
+        processed row by row in one call. Zero initial state.
         """
-        out = np.zeros_like(sig)
-        xm1 = 0.0
-        ym1 = 0.0
-        for i in range(len(sig)):
-            out[i] = sig[i] - xm1 + coeff * ym1
-            xm1 = sig[i]
-            ym1 = out[i]
-        return out
+        return lfilter([1.0, -1.0], [1.0, -coeff], sig, axis=-1)
 
     @staticmethod
     def _xfade2(a, b, pan):
@@ -174,13 +178,40 @@ class IdealOverlay:
 
         Difference equation: y[n] = (1 - |coef|) * x[n] + coef * y[n-1]
         coef near 1.0 = heavy filtering, coef 0.0 = no filtering.
+
+        Filters along the last axis (accepts a 2-D batch). Zero initial state.
+        """
+        return lfilter([1.0 - abs(coef)], [1.0, -coef], sig, axis=-1)
+
+    @staticmethod
+    def _slew(sig, rate):
+        """
+        SC Slew.ar with equal up/down rate, on a piecewise-constant input.
+
+        y[0] = x[0]; y[n] = y[n-1] + clip(x[n] - y[n-1], -rate, rate)
+
+        Walks the constant runs of x (two per cycle for a square) and
+        writes each run's ramp toward its target in one step, instead of
+        looping per sample.
         """
-        out = np.zeros_like(sig)
-        abs_coef = abs(coef)
-        b0 = 1.0 - abs_coef
-        out[0] = b0 * sig[0]
-        for i in range(1, len(sig)):
-            out[i] = b0 * sig[i] + coef * out[i - 1]
+        sig = np.asarray(sig, dtype=np.float64)
+        out = np.empty_like(sig)
+        if len(sig) == 0:
+            return out
+        out[0] = sig[0]
+        starts = np.flatnonzero(np.diff(sig)) + 1
+        bounds = np.concatenate(([1], starts, [len(sig)]))
+        prev = out[0]
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if start >= end:
+                continue
+            target = sig[start]
+            steps = np.arange(1, end - start + 1) * rate
+            if target >= prev:
+                out[start:end] = np.minimum(prev + steps, target)
+            else:
+                out[start:end] = np.maximum(prev - steps, target)
+            prev = out[end - 1]
         return out
 
     # -----------------------------------------------------------------
@@ -220,12 +251,7 @@ class IdealOverlay:
         square = np.where(np.sin(self.t) > pw_thresh, 1.0, -1.0)
         # B. Linear Slew (emulate Slew.ar in Python)
         slew_rate = 0.05 + (p4_sat * 1.95)
-        slewed = np.empty_like(square)
-        slewed[0] = square[0]
-        for n in range(1, len(square)):
-            diff = square[n] - slewed[n - 1]
-            slewed[n] = slewed[n - 1] + np.clip(diff, -slew_rate, slew_rate)
-        square = slewed
+        square = self._slew(square, slew_rate)
 
         # Morph: Sine -> Square
         branchSqr = self._xfade2(sine, square, self._linlin(p1_sqr, 0, 1, -1, 1))
@@ -397,6 +423,294 @@ class IdealOverlay:
         }
 
 
+# =============================================================================
+# DIGITAL TWIN MODEL
+# =============================================================================
+
+class TwinModel:
+    """
+    Digital Twin reference for one telemetry frame, evaluated in batches.
+
+    Captures everything TelemetryController.get_ideal_waveform() reads
+    from the frame (reference shape, measured body amplitude / DC bias,
+    inversion) once, so any number of trial parameter rows
+
+        [phase, sym, sat, body_gain, v_offset]
+
+    render in one call without touching controller state. The base shape
+    depends only on (sym, sat) and is memoized; gain, offset, inversion
+    and phase rotation are applied to the whole batch with array ops.
+    """
+
+    BOUNDS = [(-0.5, 0.5), (0.0, 1.0), (0.0, 1.0), (0.25, 1.0), (-0.2, 0.2)]
+
+    # SYM/SAT step for the optimizer's shape cache: the generator sliders'
+    # own 1/1000 resolution, so no fit is lost that the UI could show.
+    # About 40% of evaluations hit the cache; at 1e-5 it was under 10%.
+    QUANTUM = 1e-3
+    MAX_CACHED_SHAPES = 1024
+
+    # Optimizer budget: vectorized differential evolution over the bounds,
+    # then a Nelder-Mead polish from the best member.
+    DE_POPSIZE = 12
+    DE_MAXITER = 60
+    POLISH_MAXITER = 200
+
+    def __init__(self, ideal: IdealOverlay, data: dict, hw_mode: bool,
+                 synthdef_name: str = "", phase_inverted: bool = False):
+        self.ideal = ideal
+        self.data = data
+        self.hw_mode = hw_mode
+        self.synthdef_name = synthdef_name
+        self.phase_inverted = phase_inverted
+        self.n_samples = len(ideal.t)
+        self._shapes = {}
+
+        # Optimizer bookkeeping
+        self.evaluations = 0
+        self.renders = 0
+        self.best_cost = np.inf
+        self.best_params = None
+
+        if not hw_mode:
+            self.ref_name = "B258"
+            return
+
+        # QUANTIZATION (Snapping) — eliminates dead-zone ambiguity
+        raw_ref = data.get('p2', 1.0)
+        if raw_ref < 0.33:
+            self.ref_name = "SINE"
+        elif raw_ref < 0.66:
+            self.ref_name = "SQUARE"
+        else:
+            self.ref_name = "SAW"
+
+        # =================================================================
+        # AMPLITUDE STAGING — Forensic Body Matching
+        # =================================================================
+        # The 'peak' metric includes transient spikes from slew/ringing and
+        # does NOT represent the steady-state plateau voltage. We measure
+        # the true body amplitude using 10th/90th percentile plateau
+        # detection from the captured waveform, ignoring transient spikes.
+        # =================================================================
+        p3_peak = data.get('peak3')
+        peak_ref = p3_peak if p3_peak is not None else data.get('peak', 0.66)
+        hw_wave = data.get('waveform')
+        if hw_wave is not None:
+            hw_arr = np.asarray(hw_wave, dtype=np.float64)
+            # Percentile-based plateau detection: 10th/90th ignores transient
+            # spikes that inflate peak (e.g. 0.68V peak vs 0.375V plateau)
+            hi = float(np.percentile(hw_arr, 90))
+            lo = float(np.percentile(hw_arr, 10))
+            self.body_amp = 0.5 * (hi - lo)
+            self.dc_bias = 0.5 * (hi + lo)
+        elif self.ref_name == "SQUARE":
+            # Fallback when no waveform data (buffer not ready / monitor-only).
+            # RMS of a perfect square equals its amplitude, avoiding
+            # overshoot inflation from peak.
+            self.body_amp = data.get('rms_stage3', peak_ref * 0.707)
+            self.dc_bias = 0.0
+        else:
+            self.body_amp = peak_ref
+            self.dc_bias = 0.0
+        # SINE / SAW: use peak3 from SC when available, else legacy peak
+        self.hw_peak = peak_ref
+
+    @property
+    def dims(self) -> int:
+        """Free parameters: square also fits body gain and vertical offset."""
+        return 5 if self.ref_name == "SQUARE" else 3
+
+    # -----------------------------------------------------------------
+    # Rendering
+    # -----------------------------------------------------------------
+
+    def shape(self, sym: float, sat: float) -> np.ndarray:
+        """Base waveform for (sym, sat) before gain/offset/phase (memoized)."""
+        key = (sym, sat)
+        cached = self._shapes.get(key)
+        if cached is not None:
+            return cached
+
+        if not self.hw_mode:
+            p0 = self.data.get('p0', 0.0)
+            p1 = self.data.get('p1', 0.0)
+            p2 = self.data.get('p2', 0.5)
+            if self.synthdef_name == 'forge_core_b258_osc':
+                wave = self.ideal.ideal_b258_osc(p0, p1, p2, sym, sat)
+            else:
+                wave = self.ideal.ideal_b258_dual_morph(p0, p1, p2, sym, sat)
+        elif self.ref_name == "SQUARE":
+            # MODE: GENERIC SQUARE — SYM (P3) controls Pulse Width (duty cycle)
+            # Trigonometric duty cycle mapping: SYM 0→10%, SYM 1→90%
+            duty = 0.1 + (sym * 0.8)
+            pw_threshold = float(np.sin((0.5 - duty) * np.pi))
+            square = np.where(np.sin(self.ideal.t) > pw_threshold, 1.0, -1.0)
+            # Slew limiter: models slow op-amp rise/fall time (SAT/P4 controls rate).
+            # Linear mapping decoupled from body gain: 0.05 (slow) to 2.0 (fast).
+            wave = IdealOverlay._slew(square, 0.05 + (sat * 1.95))
+        else:
+            if self.ref_name == "SINE":
+                # MODE: PURE SINE — gentle SYM sensitivity
+                base = np.sin(self.ideal.t) * 1.0 + (sym - 0.5) * 0.3
+            else:
+                # MODE: PURE SAWTOOTH — SYM tilts the ramp slope (x5 for
+                # Buchla's curved ramp, x1.2 aggressive DC tilt)
+                base = self.ideal.ideal_saw_sc() + (sym - 0.5) * 5.0 * 1.2
+            # Saturation: tanh curve (square uses the slew limiter instead)
+            sat_drive = 1.0 + (sat ** 2 * 6.0)
+            wave = np.tanh(base * sat_drive)
+            comp = np.tanh(sat_drive) if sat_drive > 1.0 else 1.0
+            wave = wave / comp
+
+        if len(self._shapes) >= self.MAX_CACHED_SHAPES:
+            self._shapes.clear()
+        self._shapes[key] = wave
+        self.renders += 1
+        return wave
+
+    def render(self, params) -> np.ndarray:
+        """
+        Ideal waveforms for a batch of parameter rows.
+
+        Args:
+            params: (M, 5) array-like of [phase, sym, sat, body_gain, v_offset]
+
+        Returns:
+            (M, n_samples) float64 array
+        """
+        params = np.atleast_2d(np.asarray(params, dtype=np.float64))
+        phase, sym, sat, body, vofs = params.T
+        waves = np.stack([self.shape(float(a), float(b)) for a, b in zip(sym, sat)])
+        waves = waves.astype(np.float64, copy=False)
+
+        if self.hw_mode:
+            if self.ref_name == "SQUARE":
+                # Scale to measured body amplitude, not transient peak;
+                # match hardware DC bias, then manual offset as trim
+                waves = waves * self.body_amp * body[:, None]
+                waves = waves + self.dc_bias + vofs[:, None]
+            else:
+                # DC null: remove mean to prevent SYM from biasing ERR
+                waves = waves * self.hw_peak * body[:, None]
+                waves = waves - waves.mean(axis=1, keepdims=True)
+                waves = waves + vofs[:, None]
+
+        # Phase inversion toggle for 180° correction
+        if self.phase_inverted:
+            waves = -waves
+
+        # Manual phase offset: np.roll(row, int(phase * n)) for every row
+        n = self.n_samples
+        shifts = (phase * n).astype(np.int64)
+        idx = (np.arange(n)[None, :] - shifts[:, None]) % n
+        return np.take_along_axis(waves, idx, axis=1)
+
+    # -----------------------------------------------------------------
+    # Optimizer
+    # -----------------------------------------------------------------
+
+    def _full_params(self, x) -> np.ndarray:
+        """Clip trial rows to BOUNDS, pad 3-D rows, quantize SYM/SAT."""
+        x = np.atleast_2d(np.asarray(x, dtype=np.float64))
+        params = np.tile([0.0, 0.5, 0.0, 1.0, 0.0], (len(x), 1))
+        params[:, :x.shape[1]] = x
+        lo, hi = np.array(self.BOUNDS).T
+        params = np.clip(params, lo, hi)
+        params[:, 1:3] = np.round(params[:, 1:3] / self.QUANTUM) * self.QUANTUM
+        return params
+
+    def cost(self, target: np.ndarray, x) -> np.ndarray:
+        """RMS error (std of clipped diff) for each trial row of x."""
+        params = self._full_params(x)
+        self.evaluations += len(params)
+        if len(target) != self.n_samples:
+            self.best_cost = min(self.best_cost, 10.0)
+            return np.full(len(params), 10.0)  # Penalty for invalid
+
+        diff = np.clip(target[None, :] - self.render(params), -5.0, 5.0)
+        costs = np.std(diff, axis=1)
+        best = int(np.argmin(costs))
+        if costs[best] < self.best_cost:
+            self.best_cost = float(costs[best])
+            self.best_params = params[best]
+        return costs
+
+    def optimize(self, target, x0, method: str = "batched",
+                 cancel: threading.Event = None, progress=None) -> dict:
+        """
+        Fit twin parameters to a captured waveform.
+
+        Args:
+            target: Captured waveform (same length as the ideal)
+            x0: Starting point, first self.dims entries of [phase, sym, sat, body, vofs]
+            method: "batched" (vectorized differential evolution + polish)
+                    or "nelder-mead" (single-point search from x0)
+            cancel: Event checked once per iteration; stops early when set
+            progress: Callable(iteration, best_error) once per iteration
+
+        Returns:
+            Dict with best parameters and error ('cancelled' True if stopped)
+        """
+        target = np.asarray(target, dtype=np.float64)
+        bounds = self.BOUNDS[:self.dims]
+        x0 = np.clip(x0[:self.dims], *np.array(bounds).T)
+        iterations = 0
+        success = False
+
+        def step(*_args, **_kwargs):
+            nonlocal iterations
+            iterations += 1
+            if progress is not None:
+                progress(iterations, self.best_cost)
+            return cancel is not None and cancel.is_set()
+
+        def nm_step(_xk):
+            if step():
+                raise StopIteration
+
+        # Seeded with the start point so there is a result even when no trial
+        # can be scored (target length differs from the ideal)
+        self.best_params = self._full_params(x0)[0]
+        self.cost(target, x0)
+        if len(target) != self.n_samples:
+            method = None
+
+        if method == "batched":
+            result = differential_evolution(
+                lambda x: self.cost(target, x.T), bounds,
+                x0=x0, vectorized=True, updating='deferred',
+                popsize=self.DE_POPSIZE, maxiter=self.DE_MAXITER, tol=1e-4,
+                polish=False, seed=0, callback=step,
+            )
+            start, maxiter = result.x, self.POLISH_MAXITER
+        else:
+            start, maxiter = x0, 500
+
+        if method is not None and not (cancel is not None and cancel.is_set()):
+            result = minimize(
+                lambda x: float(self.cost(target, x)[0]), start,
+                method='Nelder-Mead', callback=nm_step,
+                options={'maxiter': maxiter, 'xatol': 1e-4, 'fatol': 1e-5, 'adaptive': True},
+            )
+            success = bool(result.success)
+
+        phase, sym, sat, body, vofs = (float(v) for v in self.best_params)
+        return {
+            'phase': phase,
+            'sym': sym,
+            'sat': sat,
+            'body_gain': body,
+            'v_offset': vofs,
+            'error': self.best_cost,
+            'iterations': iterations,
+            'evaluations': self.evaluations,
+            'success': success,
+            'cancelled': cancel is not None and cancel.is_set(),
+            'shape': self.ref_name,
+        }
+
+
 # =============================================================================
 # TELEMETRY CONTROLLER
 # =============================================================================
@@ -417,6 +731,10 @@ class TelemetryController(QObject):
     - CAPTURE_RATE (30Hz): Higher rate when waveform capture is active
     """
 
+    # Auto-Twin worker (optimize_twin_async)
+    twin_progress = pyqtSignal(int, float)  # iteration, best error so far
+    twin_finished = pyqtSignal(object)      # result dict, or None on failure
+
     MONITOR_RATE = 5    # Hz — info-only: meters, params, peak
     CAPTURE_RATE = 30   # Hz — active waveform capture mode
 
@@ -430,6 +748,11 @@ class TelemetryController(QObject):
     CAPTURE_INTERNAL = 'internal'  # forge_telemetry_wave_capture synth reads ~intermediateBus
     CAPTURE_EXTERNAL = 'external'  # hw_profile_tap embeds its own capture (no action needed)
 
+    # History ring buffers: one hour of scalar frames at CAPTURE_RATE
+    # (~15 MB preallocated), one minute of waveforms.
+    HISTORY_CAPACITY = 3600 * 30
+    WAVEFORM_HISTORY_CAPACITY = 60 * 30
+
     # Persistence buffer: holds recent frames for visual overlay.
     # At ~10 Hz frame rate, 30 frames ~ 3 seconds of waveform history.
     PERSISTENCE_BUFFER_SIZE = 30
@@ -446,8 +769,8 @@ class TelemetryController(QObject):
         self._capture_type = self.CAPTURE_INTERNAL  # Set by set_generator_context()
         self.cal_gain = 1.0  # Calibration gain for internal tap (1.0 = raw)
 
-        # History buffer (rolling)
-        self.history = deque(maxlen=300)  # ~10 seconds at 30fps
+        # History buffer (rolling, fixed memory)
+        self.history = TelemetryHistory(self.HISTORY_CAPACITY, self.WAVEFORM_HISTORY_CAPACITY)
 
         # Waveform buffer
         self.current_waveform = None
@@ -480,12 +803,26 @@ class TelemetryController(QObject):
         self._last_poison_reason = None
         self._poison_log_skip = 0
 
+        # Waveform analysis worker (started by enable()); UI reads latest_result
+        self.latest_result = None
+        self._worker = LatestWinsWorker(self._process_waveform)
+        # The worker appends to history's waveform ring, persistence_buffer and
+        # _err_history while the UI thread clears and exports them; both sides
+        # hold _state_lock for those mutations. Clears and stabilize bump
+        # _generation; a frame captured before that is dropped, not published.
+        self._state_lock = threading.RLock()
+        self._generation = 0
+
         # Hardware send tracking (slot -> {output_pair, level_db})
         self.hardware_sends = {}
 
         # Ideal overlay generator
         self.ideal = IdealOverlay(1024)
 
+        # Auto-Twin worker
+        self._twin_thread = None
+        self._twin_cancel = None
+
     # -----------------------------------------------------------------
     # Enable / disable
     # -----------------------------------------------------------------
@@ -502,8 +839,8 @@ class TelemetryController(QObject):
         self.target_slot = slot
         self.current_rate = rate
         self.enabled = True
-        self.history.clear()
-        self.current_waveform = None
+        self._clear_history()
+        self._worker.start()
 
         slot_idx = slot + 1
 
@@ -533,7 +870,8 @@ class TelemetryController(QObject):
 
             self.waveform_active = False
             self.enabled = False
-            self.current_waveform = None
+            self._worker.stop()
+            self.clear_waveform()
             logger.info("[Telemetry] Disabled")
 
     def set_rate(self, rate: int):
@@ -590,8 +928,7 @@ class TelemetryController(QObject):
             # We let set_generator_context() handle that once it determines the
             # correct capture type (Internal vs External) to avoid unnecessary synth churn.
 
-            self.history.clear()
-            self.current_waveform = None
+            self._clear_history()
         else:
             self.target_slot = slot
 
@@ -648,8 +985,7 @@ class TelemetryController(QObject):
         if source_id == self.selected_source_id:
             return
         self.selected_source_id = source_id
-        self.history.clear()
-        self.current_waveform = None
+        self._clear_history()
 
         if self.enabled:
             slot_idx = self.target_slot + 1
@@ -710,9 +1046,13 @@ class TelemetryController(QObject):
         """
         if not self.enabled:
             return
-        self.stabilizer.trigger_scrub()
-        self.persistence_buffer.clear()
-        self.last_stabilizer_result = None
+        with self._state_lock:
+            self._generation += 1
+            self.stabilizer.trigger_scrub()
+            self.persistence_buffer.clear()
+            self.last_stabilizer_result = None
+            if self.latest_result is not None:
+                self.latest_result = replace(self.latest_result, stabilizer=None, persistence_frames=())
         logger.info("[Telemetry] Stabilize triggered via OSC")
 
     # -----------------------------------------------------------------
@@ -733,47 +1073,83 @@ class TelemetryController(QObject):
         # Living Proof: crest factor is computed from waveform in on_waveform()
 
     def on_waveform(self, slot: int, samples):
-        """Handle incoming waveform data from OSCBridge signal."""
+        """Handle incoming waveform data from OSCBridge signal.
+
+        Only snapshots the latest frame on the Qt thread; the analysis
+        pipeline runs in _process_waveform() on the worker when it is
+        running (see enable()), inline otherwise.
+        """
         if slot != self.target_slot:
             return
 
-        self.current_waveform = np.asarray(samples, dtype=np.float64)  # Use float64 to avoid overflow
+        t0 = profiler.start()
+        item = (samples, self.get_latest(), time.time(), self._generation)
+        if self._worker.running:
+            self._worker.submit(item)
+        else:
+            self._process_waveform(item)
+        profiler.stop(STAGE_ON_WAVEFORM, t0)
+
+    def _process_waveform(self, item):
+        """Run _analyze_waveform(item), timed as the profiler's process stage."""
+        t0 = profiler.start()
+        try:
+            self._analyze_waveform(item)
+        finally:
+            profiler.stop(STAGE_PROCESS, t0)
+
+    def _analyze_waveform(self, item):
+        """Stabilizer, Living Proof metrics and RMS error for one waveform.
+
+        Publishes the outcome as self.latest_result (plus the legacy
+        current_* attributes).
+        """
+        samples, latest, now, generation = item
+        waveform = np.array(samples, dtype=np.float64)  # Use float64 to avoid overflow
 
         # Guard against non-finite samples from upstream glitches
-        if not np.isfinite(self.current_waveform).all():
+        if not np.isfinite(waveform).all():
             logger.warning("[Telemetry] Waveform contains non-finite values, discarding")
-            self.current_waveform = None
+            self.clear_waveform()
             return
 
         # Check for corrupted data (garbage from uninitialized buffer)
-        max_abs = np.max(np.abs(self.current_waveform))
+        max_abs = np.max(np.abs(waveform))
         if max_abs > 100:
             logger.warning(f"[Telemetry] Waveform values out of range (max={max_abs:.2e}), discarding")
-            self.current_waveform = None
+            self.clear_waveform()
             return
 
-        # --- Stabilizer: tag frame with stability decisions ---
-        self.last_stabilizer_result = self.stabilizer.observe(
-            self.current_waveform, time.time()
-        )
+        waveform.setflags(write=False)  # shared with the UI via TelemetryResult
+        with self._state_lock:
+            if generation != self._generation:
+                return  # captured before a clear / stabilize
+            self.history.append_waveform(waveform, now)
 
-        if self.last_stabilizer_result.clear_history:
-            self.persistence_buffer.clear()
-
-        if self.last_stabilizer_result.admissible_for_visual_history:
-            self.persistence_buffer.append(self.current_waveform.copy())
+        # --- Stabilizer: tag frame with stability decisions ---
+        t0 = profiler.start()
+        stab = self.stabilizer.observe(waveform, now)
+        profiler.stop(STAGE_STABILIZER, t0)
+
+        with self._state_lock:
+            if generation != self._generation:
+                return
+            if stab.clear_history:
+                self.persistence_buffer.clear()
+            if stab.admissible_for_visual_history:
+                self.persistence_buffer.append(waveform)
+            persistence_frames = tuple(self.persistence_buffer)
 
         # Rate-limited poison diagnostics
-        res = self.last_stabilizer_result
-        if res.poisoned:
-            if (res.poison_reason != self._last_poison_reason) or (self._poison_log_skip <= 0):
+        if stab.poisoned:
+            if (stab.poison_reason != self._last_poison_reason) or (self._poison_log_skip <= 0):
                 logger.warning(
                     "Telemetry poison: reason=%s state=%s sim=%.3f stable=%d/%d"
-                    % (res.poison_reason, res.stability_state.name,
-                       res.similarity, res.stable_count, res.required_count),
+                    % (stab.poison_reason, stab.stability_state.name,
+                       stab.similarity, stab.stable_count, stab.required_count),
                     component="STAB",
                 )
-                self._last_poison_reason = res.poison_reason
+                self._last_poison_reason = stab.poison_reason
                 self._poison_log_skip = 20  # ~2 seconds at 10Hz
             else:
                 self._poison_log_skip -= 1
@@ -783,43 +1159,91 @@ class TelemetryController(QObject):
 
         # Living Proof: source-agnostic metrics computed from the captured waveform
         # (always reflects the current tap point, not fixed SC fields)
-        sig_rms = float(np.sqrt(np.mean(self.current_waveform ** 2)))
+        sig_rms = float(np.sqrt(np.mean(waveform ** 2)))
 
         # Crest Factor: peak / RMS of the captured waveform
-        sig_peak = float(np.max(np.abs(self.current_waveform)))
-        if sig_rms > 0.001:
-            self.current_crest_factor = sig_peak / sig_rms
-        else:
-            self.current_crest_factor = 0.0
+        sig_peak = float(max_abs)
+        crest_factor = sig_peak / sig_rms if sig_rms > 0.001 else 0.0
 
         # HF Energy proxy: first-difference RMS normalized by signal RMS
         # Amplitude-independent — measures edge sharpness, not volume
-        if len(self.current_waveform) > 1 and sig_rms > 0.001:
-            hf_diff = np.diff(self.current_waveform)
-            hf_raw = float(np.sqrt(np.mean(hf_diff ** 2)))
-            self.current_hf_energy = hf_raw / sig_rms
+        if len(waveform) > 1 and sig_rms > 0.001:
+            hf_diff = np.diff(waveform)
+            hf_energy = float(np.sqrt(np.mean(hf_diff ** 2))) / sig_rms
         else:
-            self.current_hf_energy = 0.0
+            hf_energy = 0.0
 
         # DC shift (mean of waveform — TAPE sag micro-fluctuation)
-        self.current_dc_shift = float(np.mean(self.current_waveform))
+        dc_shift = float(np.mean(waveform))
 
         # Live RMS error against the Digital Twin ideal (10-frame rolling average)
         # Use a shallow copy to avoid mutating history frames with large numpy arrays
-        latest = self.get_latest()
+        t0 = profiler.start()
         if latest is not None:
             data_for_ideal = latest.copy()
-            data_for_ideal['waveform'] = self.current_waveform
+            data_for_ideal['waveform'] = waveform
+            ideal = self.get_ideal_waveform(data_for_ideal)
         else:
-            data_for_ideal = None
-        ideal = self.get_ideal_waveform(data_for_ideal)
-        if ideal is not None and self.current_waveform is not None and len(ideal) == len(self.current_waveform):
-            diff = np.clip(self.current_waveform - ideal, -5.0, 5.0)
-            frame_err = float(np.std(diff))
-            self._err_history.append(frame_err)
-            self.current_rms_error = sum(self._err_history) / len(self._err_history)
+            ideal = None
+        delta = None
+        if ideal is not None and len(ideal) == len(waveform):
+            diff = np.clip(waveform - ideal, -5.0, 5.0)
+            with self._state_lock:
+                self._err_history.append(float(np.std(diff)))
+                rms_error = sum(self._err_history) / len(self._err_history)
+            delta = np.abs(waveform - ideal).astype(np.float32)
+            delta.setflags(write=False)
         else:
-            self.current_rms_error = 0.0
+            rms_error = 0.0
+        if ideal is not None:
+            ideal.setflags(write=False)
+        profiler.stop(STAGE_IDEAL, t0)
+
+        self._publish(TelemetryResult(
+            timestamp=now,
+            waveform=waveform,
+            stabilizer=stab,
+            persistence_frames=persistence_frames,
+            crest_factor=crest_factor,
+            hf_energy=hf_energy,
+            dc_shift=dc_shift,
+            rms_error=rms_error,
+            ideal=ideal,
+            delta=delta,
+        ), generation)
+
+    def _publish(self, result: TelemetryResult, generation: int):
+        """Make a processed result visible (latest_result is assigned last).
+
+        Dropped if a clear or stabilize happened since the frame was taken.
+        """
+        with self._state_lock:
+            if generation != self._generation:
+                return
+            self.current_waveform = result.waveform
+            self.last_stabilizer_result = result.stabilizer
+            self.current_crest_factor = result.crest_factor
+            self.current_hf_energy = result.hf_energy
+            self.current_dc_shift = result.dc_shift
+            self.current_rms_error = result.rms_error
+            self.latest_result = result
+
+    def clear_waveform(self):
+        """Drop the current waveform, keeping the last metrics.
+
+        Used for bad frames and when capture stops or the source changes.
+        """
+        with self._state_lock:
+            self._generation += 1
+            self.current_waveform = None
+            if self.latest_result is not None:
+                self.latest_result = replace(self.latest_result, waveform=None, delta=None)
+
+    def _clear_history(self):
+        """Empty history (scalar and waveform rings) and the current waveform."""
+        with self._state_lock:
+            self.history.clear()
+            self.clear_waveform()
 
     # -----------------------------------------------------------------
     # Ideal overlay generation from current telemetry
@@ -873,128 +1297,17 @@ class TelemetryController(QObject):
         if not self.is_hw_mode:
             return self._get_ideal_internal(data)
 
-        raw_ref = data.get('p2', 1.0)
-
-        # 1. QUANTIZATION (Snapping) — eliminates dead-zone ambiguity
-        if raw_ref < 0.33:
-            ref_val = 0.0
-            self.active_ref_name = "SINE"
-        elif raw_ref < 0.66:
-            ref_val = 0.5
-            self.active_ref_name = "SQUARE"
-        else:
-            ref_val = 1.0
-            self.active_ref_name = "SAW"
-
-        sym = data.get('p3', 0.5)
-
-        # 2. DYNAMIC SCALING: shape-specific SYM sensitivity
-        if ref_val == 0.0:
-            sym_mult = 0.3   # Sine: gentle — preserve existing match
-            tilt_mult = 0.0
-        elif ref_val == 0.5:
-            sym_mult = 3.5   # Square: wide pulse-width range
-            tilt_mult = 0.0
-        else:
-            sym_mult = 5.0   # Saw: handle Buchla's curved ramp
-            tilt_mult = 1.2  # Aggressive DC tilt for slope matching
-
-        sym_offset = (sym - 0.5) * sym_mult
-
-        if ref_val == 0.0:
-            # MODE: PURE SINE
-            base_wave = np.sin(self.ideal.t) * 1.0 + sym_offset
-        elif ref_val == 0.5:
-            # MODE: GENERIC SQUARE — SYM (P3) controls Pulse Width (duty cycle)
-            # Trigonometric duty cycle mapping: SYM 0→10%, SYM 1→90%
-            duty = 0.1 + (sym * 0.8)
-            pw_threshold = float(np.sin((0.5 - duty) * np.pi))
-            base_wave = np.where(np.sin(self.ideal.t) > pw_threshold, 1.0, -1.0)
-
-            # Slew limiter: models slow op-amp rise/fall time (SAT/P4 controls rate).
-            # Linear mapping decoupled from body gain: 0.05 (slow) to 2.0 (fast).
-            sat_raw = data.get('p4', 0.0)
-            slew_rate = 0.05 + (sat_raw * 1.95)
-            slewed = np.empty_like(base_wave)
-            slewed[0] = base_wave[0]
-            for n in range(1, len(base_wave)):
-                diff = base_wave[n] - slewed[n - 1]
-                slewed[n] = slewed[n - 1] + np.clip(diff, -slew_rate, slew_rate)
-
-            base_wave = slewed
-        else:
-            # MODE: PURE SAWTOOTH — SYM tilts the ramp slope
-            saw = self.ideal.ideal_saw_sc()
-            base_wave = saw + sym_offset * tilt_mult
-
-        # Saturation: Square uses slew limiter (above), Sine/Saw use tanh curve
-        if ref_val != 0.5:
-            sat_raw = data.get('p4', 0.0)
-            sat_drive = 1.0 + (sat_raw ** 2 * 6.0)
-            shaped = np.tanh(base_wave * sat_drive)
-            comp = np.tanh(sat_drive) if sat_drive > 1.0 else 1.0
-            shaped = shaped / comp
-        else:
-            shaped = base_wave  # Square already slew-limited + RC filtered
-
-        # =================================================================
-        # AMPLITUDE STAGING — Forensic Body Matching
-        # =================================================================
-        # The 'peak' metric includes transient spikes from slew/ringing and
-        # does NOT represent the steady-state plateau voltage. We measure
-        # the true body amplitude using 10th/90th percentile plateau
-        # detection from the captured waveform, ignoring transient spikes.
-        # =================================================================
-
-        hw_wave = data.get('waveform')
-        if hw_wave is not None:
-            hw_arr = np.asarray(hw_wave, dtype=np.float64)
-            # Percentile-based plateau detection: 10th/90th ignores transient
-            # spikes that inflate peak (e.g. 0.68V peak vs 0.375V plateau)
-            hi = float(np.percentile(hw_arr, 90))
-            lo = float(np.percentile(hw_arr, 10))
-            hw_body_amp = 0.5 * (hi - lo)
-            hw_dc_bias = 0.5 * (hi + lo)
-        else:
-            # Fallback when no waveform data (buffer not ready / monitor-only).
-            # For Square, use rms_stage3 as body proxy — RMS of a perfect square
-            # equals its amplitude, avoiding overshoot inflation from peak.
-            # For Sine/Saw, peak is appropriate.
-            p3_peak = data.get('peak3')
-            peak_ref = p3_peak if p3_peak is not None else data.get('peak', 0.66)
-
-            if ref_val == 0.5:
-                hw_body_amp = data.get('rms_stage3', peak_ref * 0.707)
-            else:
-                hw_body_amp = peak_ref
-            hw_dc_bias = 0.0
-
-        if ref_val == 0.5:
-            # SQUARE: scale to measured body amplitude, not transient peak.
-            # body_gain is a fine-tune multiplier around 1.0.
-            ideal = shaped * hw_body_amp * self.body_gain
-            # Match hardware DC bias first, then add manual offset as trim
-            ideal = ideal + hw_dc_bias + self.v_offset
-        else:
-            # SINE / SAW: use peak3 from SC when available, else legacy peak
-            p3_peak = data.get('peak3')
-            hw_peak = p3_peak if p3_peak is not None else data.get('peak', 0.66)
-            ideal = shaped * hw_peak * self.body_gain
-            # DC null: remove mean to prevent SYM from biasing ERR
-            ideal = ideal - np.mean(ideal)
-            # Vertical offset as manual trim
-            if self.v_offset != 0.0:
-                ideal = ideal + self.v_offset
-
-        # Phase inversion toggle for 180° correction
-        if self.phase_inverted:
-            ideal = -ideal
-
-        # Manual phase offset — horizontal slide of ideal over actual
-        if self.phase_offset != 0.0:
-            shift = int(self.phase_offset * len(ideal))
-            ideal = np.roll(ideal, shift)
-
+        # HW MODE: snapped reference shape scaled to the measured body
+        # (shape, amplitude staging and DC handling live in TwinModel)
+        model = self._twin_model(data)
+        self.active_ref_name = model.ref_name
+        ideal = model.render([[
+            self.phase_offset,
+            data.get('p3', 0.5),
+            data.get('p4', 0.0),
+            self.body_gain,
+            self.v_offset,
+        ]])[0]
         return ideal.astype(np.float32)
 
     def get_delta_waveform(self) -> np.ndarray:
@@ -1069,17 +1382,17 @@ class TelemetryController(QObject):
     # Auto-Twin optimizer
     # -----------------------------------------------------------------
 
-    def optimize_twin(self) -> dict:
-        """Run Nelder-Mead minimization to auto-lock the Digital Twin.
-
-        Searches the parameter space to minimize RMS error between the
-        current hardware waveform and the ideal overlay. Shape-aware:
-          - Square: 5D (phase, SYM, SAT, body_gain, v_offset)
-          - Sine/Saw: 3D (phase, SYM, SAT)
+    def _twin_model(self, data: dict) -> TwinModel:
+        """TwinModel snapshot of a telemetry frame with current controller settings."""
+        return TwinModel(
+            self.ideal, data,
+            hw_mode=self.is_hw_mode,
+            synthdef_name=self.current_synthdef_name,
+            phase_inverted=self.phase_inverted,
+        )
 
-        Returns dict with optimized values and final error, or None if
-        no waveform data is available.
-        """
+    def _prepare_twin(self):
+        """Snapshot model, target and start point, or None without data."""
         if self.current_waveform is None:
             logger.warning("[Telemetry] optimize_twin: no waveform data")
             return None
@@ -1089,117 +1402,101 @@ class TelemetryController(QObject):
             logger.warning("[Telemetry] optimize_twin: no telemetry data")
             return None
 
+        # Inject waveform so the model can measure body amplitude
         target = self.current_waveform.copy()
-        is_square = self.active_ref_name == "SQUARE"
-
-        # Inject waveform into data so get_ideal_waveform can measure body amplitude
-        data['waveform'] = target
-
-        # Snapshot current values as starting point
-        current_phase = self.phase_offset
-        current_sym = data.get('p3', 0.5)
-        current_sat = data.get('p4', 0.0)
-        current_body = self.body_gain
-        current_vofs = self.v_offset
-
-        def cost(params):
-            """RMS error between ideal waveform with trial params and actual."""
-            if is_square:
-                phase, sym, sat, body, vofs = params
-            else:
-                phase, sym, sat = params
-                body = 1.0
-                vofs = 0.0
-
-            # Clamp to valid ranges
-            phase = float(np.clip(phase, -0.5, 0.5))
-            sym = float(np.clip(sym, 0.0, 1.0))
-            sat = float(np.clip(sat, 0.0, 1.0))
-            body = float(np.clip(body, 0.25, 1.0))
-            vofs = float(np.clip(vofs, -0.2, 0.2))
-
-            # Build trial data dict with overridden SYM/SAT
-            trial_data = data.copy()
-            trial_data['p3'] = sym
-            trial_data['p4'] = sat
-
-            # Temporarily set controller state for the trial
-            orig_phase = self.phase_offset
-            orig_body = self.body_gain
-            orig_vofs = self.v_offset
-            self.phase_offset = phase
-            self.body_gain = body
-            self.v_offset = vofs
-
-            ideal = self.get_ideal_waveform(trial_data)
-
-            # Restore
-            self.phase_offset = orig_phase
-            self.body_gain = orig_body
-            self.v_offset = orig_vofs
-
-            if ideal is None or len(ideal) != len(target):
-                return 10.0  # Penalty for invalid
-
-            diff = np.clip(target - ideal, -5.0, 5.0)
-            return float(np.std(diff))
-
-        # Initial guess and bounds
-        if is_square:
-            x0 = [current_phase, current_sym, current_sat, current_body, current_vofs]
-            bounds = [(-0.5, 0.5), (0.0, 1.0), (0.0, 1.0), (0.25, 1.0), (-0.2, 0.2)]
-        else:
-            x0 = [current_phase, current_sym, current_sat]
-            bounds = [(-0.5, 0.5), (0.0, 1.0), (0.0, 1.0)]
+        data = dict(data, waveform=target)
+        model = self._twin_model(data)
+
+        # Current values as starting point
+        x0 = [self.phase_offset, data.get('p3', 0.5), data.get('p4', 0.0),
+              self.body_gain, self.v_offset]
+        return model, target, x0
+
+    def _run_twin(self, model, target, x0, method, cancel=None, progress=None) -> dict:
+        logger.info(f"[Telemetry] optimize_twin: starting {method} ({model.dims}D, {model.ref_name})")
+        t0 = time.perf_counter()
+        result = model.optimize(target, x0, method=method, cancel=cancel, progress=progress)
+        logger.info(
+            f"[Telemetry] optimize_twin: {'cancelled' if result['cancelled'] else 'done'} — "
+            f"ERR={result['error']:.4f} phase={result['phase']:.4f} "
+            f"SYM={result['sym']:.3f} SAT={result['sat']:.3f} "
+            f"BODY={result['body_gain']:.3f} OFS={result['v_offset']:.4f} "
+            f"(iters={result['iterations']}, evals={result['evaluations']}, "
+            f"renders={model.renders}, {(time.perf_counter() - t0) * 1000:.0f}ms)"
+        )
+        return result
 
-        logger.info(f"[Telemetry] optimize_twin: starting Nelder-Mead ({len(x0)}D, {self.active_ref_name})")
+    def optimize_twin(self, method: str = "batched") -> dict:
+        """Fit the Digital Twin to the current hardware waveform (blocking).
 
-        result = minimize(
-            cost, x0,
-            method='Nelder-Mead',
-            options={'maxiter': 500, 'xatol': 1e-4, 'fatol': 1e-5, 'adaptive': True},
-        )
+        Searches the parameter space to minimize RMS error between the
+        current hardware waveform and the ideal overlay. Shape-aware:
+          - Square: 5D (phase, SYM, SAT, body_gain, v_offset)
+          - Sine/Saw: 3D (phase, SYM, SAT)
 
-        # Apply optimized values
-        if is_square:
-            opt_phase, opt_sym, opt_sat, opt_body, opt_vofs = result.x
-        else:
-            opt_phase, opt_sym, opt_sat = result.x
-            opt_body = 1.0
-            opt_vofs = 0.0
-
-        opt_phase = float(np.clip(opt_phase, -0.5, 0.5))
-        opt_sym = float(np.clip(opt_sym, 0.0, 1.0))
-        opt_sat = float(np.clip(opt_sat, 0.0, 1.0))
-        opt_body = float(np.clip(opt_body, 0.25, 1.0))
-        opt_vofs = float(np.clip(opt_vofs, -0.2, 0.2))
-
-        # Commit to controller state
-        self.phase_offset = opt_phase
-        self.body_gain = opt_body
-        self.v_offset = opt_vofs
-        self._err_history.clear()
-
-        final_err = result.fun
-        logger.info(
-            f"[Telemetry] optimize_twin: done — ERR={final_err:.4f} "
-            f"phase={opt_phase:.4f} SYM={opt_sym:.3f} SAT={opt_sat:.3f} "
-            f"BODY={opt_body:.3f} OFS={opt_vofs:.4f} "
-            f"(iters={result.nit}, evals={result.nfev})"
-        )
+        Args:
+            method: "batched" (population evaluated per call) or
+                    "nelder-mead" (classic single-point search)
 
-        return {
-            'phase': opt_phase,
-            'sym': opt_sym,
-            'sat': opt_sat,
-            'body_gain': opt_body,
-            'v_offset': opt_vofs,
-            'error': final_err,
-            'iterations': result.nit,
-            'evaluations': result.nfev,
-            'success': result.success,
-            'shape': self.active_ref_name,
-        }
+        Returns dict with optimized values and final error (already
+        applied to phase_offset / body_gain / v_offset), or None if no
+        waveform data is available.
+        """
+        prepared = self._prepare_twin()
+        if prepared is None:
+            return None
+        result = self._run_twin(*prepared, method)
+        self.apply_twin_result(result)
+        return result
+
+    def optimize_twin_async(self, method: str = "batched") -> bool:
+        """Start optimize_twin on a worker thread.
+
+        Emits twin_progress(iteration, error) while running and
+        twin_finished(result) at the end (None if nothing to fit). The
+        result is NOT applied; the receiver calls apply_twin_result() on
+        the Qt thread unless result['cancelled'] is set.
+
+        Returns False if a run is already active or there is no data.
+        """
+        if self.twin_running:
+            return False
+        prepared = self._prepare_twin()
+        if prepared is None:
+            return False
+
+        cancel = threading.Event()
+
+        def run():
+            result = None
+            try:
+                result = self._run_twin(*prepared, method, cancel=cancel,
+                                        progress=self.twin_progress.emit)
+            except Exception as e:
+                logger.error(f"[Telemetry] optimize_twin failed: {e}")
+            self.twin_finished.emit(result)
+
+        self._twin_cancel = cancel
+        self._twin_thread = threading.Thread(target=run, daemon=True)
+        self._twin_thread.start()
+        return True
+
+    def cancel_twin(self):
+        """Ask a running optimize_twin_async to stop at the next iteration."""
+        if self._twin_cancel is not None:
+            self._twin_cancel.set()
+
+    @property
+    def twin_running(self) -> bool:
+        return self._twin_thread is not None and self._twin_thread.is_alive()
+
+    def apply_twin_result(self, result: dict):
+        """Commit optimized phase / body / offset to controller state."""
+        self.phase_offset = result['phase']
+        self.body_gain = result['body_gain']
+        self.v_offset = result['v_offset']
+        with self._state_lock:
+            self._err_history.clear()
 
     # -----------------------------------------------------------------
     # Preset state
@@ -1222,7 +1519,8 @@ class TelemetryController(QObject):
         self.body_gain = state.get('body_gain', 1.0)
         self.v_offset = state.get('v_offset', 0.0)
         self.cal_gain = state.get('cal_gain', 1.0)
-        self._err_history.clear()
+        with self._state_lock:
+            self._err_history.clear()
 
     # -----------------------------------------------------------------
     # Query
@@ -1305,29 +1603,33 @@ class TelemetryController(QObject):
         return result
 
     def export_history(self, path: str):
-        """Export full telemetry history to JSON."""
-        # Strip injected numpy arrays only; preserve list-based waveform data
-        clean_history = []
-        for frame in self.history:
-            f = frame.copy()
-            if isinstance(f.get('waveform'), np.ndarray):
-                del f['waveform']
-            clean_history.append(f)
-        data = {
-            'history': clean_history,
-            'provenance': {
-                'generator_id': self.current_generator_id,
-                'synthdef': self.current_synthdef_name,
-                'git_hash': self._get_git_hash(),
-                'exported_at': datetime.now().isoformat(),
-                'source_id': self.selected_source_id,
-                'source_name': self._source_names[self.selected_source_id],
-            }
+        """Export telemetry history.
+
+        .npz (default): columnar arrays for every scalar field plus the
+        waveform ring, loadable with telemetry_history.load_history().
+        .json: legacy per-frame dict document (scalar fields only).
+        """
+        provenance = {
+            'generator_id': self.current_generator_id,
+            'synthdef': self.current_synthdef_name,
+            'git_hash': self._get_git_hash(),
+            'exported_at': datetime.now().isoformat(),
+            'source_id': self.selected_source_id,
+            'source_name': self._source_names[self.selected_source_id],
         }
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+        if Path(path).suffix == '.json':
+            data = {
+                'history': list(self.history),
+                'provenance': provenance,
+            }
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+        else:
+            with self._state_lock:
+                self.history.save_npz(path, provenance)
         logger.info(
-            f"[Telemetry] Exported {len(self.history)} frames to {path}"
+            f"[Telemetry] Exported {len(self.history)} frames "
+            f"({self.history.waveform_count} waveforms) to {path}"
         )
 
     def _compute_hw_dna(self, ideal_wave) -> dict:
@@ -11,14 +11,32 @@ Key behaviors:
 - Boundary bounce (not wrap)
 - Zone filtering (respects enabled target zones)
 - Fading contributions when boid leaves cell
+
+Simulation state is stored struct-of-arrays (x, y, vx, vy). Each tick is a
+synchronous update: every boid steers from the previous tick's state.
+Neighbor lookup uses a uniform spatial grid whose cell size is at least the
+neighbor radius, so only the 3x3 surrounding buckets are searched.
+
+Two interchangeable kernels implement the step:
+- NumPy (vectorized, used when numpy is importable)
+- Pure Python (fallback)
+Both visit neighbors in the same order and consume the XorShift32 stream
+identically, so a given seed produces bit-for-bit identical output.
 """
 
 import math
-from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Callable
 
 from src.config import MOD_MATRIX_COLS
 
+# Vectorized kernel when numpy is available, pure Python otherwise
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 # Grid layout per spec (SSOT: matches unified bus target key count)
 GRID_COLS = MOD_MATRIX_COLS  # SSOT: matches unified bus target key count
 GRID_ROWS = 16   # 0-15 (4 mod slots x 4 outputs)
@@ -33,6 +51,13 @@ SIM_HZ = 20
 SIM_DT = 1.0 / SIM_HZ
 EPS = 1e-6
 
+# Position clamp (keeps int(x * cols) inside the grid)
+POS_MAX = 0.9999
+
+# Spatial grid neighbor offsets (dx, dy) - order is part of the determinism
+# contract shared by both kernels
+_NEIGHBOR_OFFSETS = tuple((ox, oy) for oy in (-1, 0, 1) for ox in (-1, 0, 1))
+
 
 class XorShift32:
     """Deterministic PRNG using xorshift32 algorithm."""
@@ -57,13 +82,282 @@ class XorShift32:
         return lo + self.next_float() * (hi - lo)
 
 
-@dataclass
-class Boid:
-    """Single boid with position and velocity in [0,1) x [0,1) space."""
-    x: float = 0.5
-    y: float = 0.5
-    vx: float = 0.0
-    vy: float = 0.0
+def _flock_params(dispersion: float, energy: float) -> Dict[str, float]:
+    """Derive flocking weights and limits from normalized parameters."""
+    return {
+        # Dispersion affects separation strength (inverse relationship)
+        'sep_weight': 1.5 * (1.0 - dispersion * 0.8),
+        'align_weight': 1.0,
+        'cohesion_weight': 0.8 * (1.0 - dispersion * 0.5),
+        # Energy affects max speed and acceleration
+        'max_speed': 0.005 + energy * 0.025,
+        'max_force': 0.001 + energy * 0.004,
+        'neighbor_radius': 0.15 + dispersion * 0.1,
+    }
+
+
+def _grid_size(neighbor_radius: float) -> int:
+    """Buckets per axis so that each bucket spans >= neighbor_radius."""
+    return max(1, int(1.0 / neighbor_radius))
+
+
+def _flock_step_python(px: List[float], py: List[float],
+                       vx: List[float], vy: List[float],
+                       jitter_x: List[float], jitter_y: List[float],
+                       params: Dict[str, float]):
+    """
+    Advance all boids one tick (pure Python kernel).
+
+    Returns:
+        New (px, py, vx, vy) lists
+    """
+    n = len(px)
+    radius = params['neighbor_radius']
+    sep_radius = radius * 0.5
+    sep_weight = params['sep_weight']
+    align_weight = params['align_weight']
+    cohesion_weight = params['cohesion_weight']
+    max_force = params['max_force']
+    max_speed = params['max_speed']
+
+    # Bucket boids into the spatial grid (ascending index within a bucket)
+    m = _grid_size(radius)
+    cell_x = [min(int(x * m), m - 1) for x in px]
+    cell_y = [min(int(y * m), m - 1) for y in py]
+    buckets: Dict[int, List[int]] = {}
+    for i in range(n):
+        buckets.setdefault(cell_y[i] * m + cell_x[i], []).append(i)
+
+    out_px = [0.0] * n
+    out_py = [0.0] * n
+    out_vx = [0.0] * n
+    out_vy = [0.0] * n
+
+    for i in range(n):
+        bx, by = px[i], py[i]
+        bvx, bvy = vx[i], vy[i]
+        cx, cy = cell_x[i], cell_y[i]
+
+        # Accumulate steering forces
+        sep_x, sep_y = 0.0, 0.0
+        align_x, align_y = 0.0, 0.0
+        coh_x, coh_y = 0.0, 0.0
+        neighbor_count = 0
+
+        for ox, oy in _NEIGHBOR_OFFSETS:
+            ncx = cx + ox
+            ncy = cy + oy
+            if ncx < 0 or ncx >= m or ncy < 0 or ncy >= m:
+                continue
+            for j in buckets.get(ncy * m + ncx, ()):
+                if i == j:
+                    continue
+
+                dx = px[j] - bx
+                dy = py[j] - by
+                dist = math.sqrt(dx * dx + dy * dy)
+
+                if dist < radius and dist > EPS:
+                    neighbor_count += 1
+
+                    # Separation: steer away from close neighbors
+                    if dist < sep_radius:
+                        sep_x -= dx / dist
+                        sep_y -= dy / dist
+
+                    # Alignment: match velocity
+                    align_x += vx[j]
+                    align_y += vy[j]
+
+                    # Cohesion: steer toward center
+                    coh_x += px[j]
+                    coh_y += py[j]
+
+        # Apply steering
+        ax, ay = 0.0, 0.0
+
+        if neighbor_count > 0:
+            ax += sep_x * sep_weight
+            ay += sep_y * sep_weight
+
+            ax += (align_x / neighbor_count - bvx) * align_weight
+            ay += (align_y / neighbor_count - bvy) * align_weight
+
+            ax += (coh_x / neighbor_count - bx) * cohesion_weight
+            ay += (coh_y / neighbor_count - by) * cohesion_weight
+
+        # Random jitter (pre-drawn by the engine)
+        ax += jitter_x[i]
+        ay += jitter_y[i]
+
+        # Limit acceleration
+        a_mag = math.sqrt(ax * ax + ay * ay)
+        if a_mag > max_force:
+            ax = ax / a_mag * max_force
+            ay = ay / a_mag * max_force
+
+        # Update velocity
+        bvx += ax
+        bvy += ay
+
+        # Limit speed
+        v_mag = math.sqrt(bvx * bvx + bvy * bvy)
+        if v_mag > max_speed:
+            bvx = bvx / v_mag * max_speed
+            bvy = bvy / v_mag * max_speed
+
+        # Update position
+        bx += bvx
+        by += bvy
+
+        # Bounce at boundaries
+        if bx < 0:
+            bx = -bx
+            bvx = abs(bvx)
+        elif bx >= 1:
+            bx = 2 - bx
+            bvx = -abs(bvx)
+
+        if by < 0:
+            by = -by
+            bvy = abs(bvy)
+        elif by >= 1:
+            by = 2 - by
+            bvy = -abs(bvy)
+
+        # Clamp to valid range
+        out_px[i] = max(0.0, min(POS_MAX, bx))
+        out_py[i] = max(0.0, min(POS_MAX, by))
+        out_vx[i] = bvx
+        out_vy[i] = bvy
+
+    return out_px, out_py, out_vx, out_vy
+
+
+def _grid_pairs(px, py, m: int):
+    """
+    Candidate (i, j) pairs from the 3x3 spatial grid neighborhood (NumPy).
+
+    Pairs are emitted offset-major in _NEIGHBOR_OFFSETS order, ascending j
+    within a bucket - the same per-boid order the Python kernel visits.
+    """
+    n = px.shape[0]
+    cell_x = np.minimum((px * m).astype(np.intp), m - 1)
+    cell_y = np.minimum((py * m).astype(np.intp), m - 1)
+    cell = cell_y * m + cell_x
+
+    order = np.argsort(cell, kind='stable')
+    sorted_cells = cell[order]
+    all_cells = np.arange(m * m)
+    starts = np.searchsorted(sorted_cells, all_cells, side='left')
+    ends = np.searchsorted(sorted_cells, all_cells, side='right')
+
+    boid_idx = np.arange(n)
+    pair_i = []
+    pair_j = []
+    for ox, oy in _NEIGHBOR_OFFSETS:
+        ncx = cell_x + ox
+        ncy = cell_y + oy
+        valid = (ncx >= 0) & (ncx < m) & (ncy >= 0) & (ncy < m)
+        ncell = np.where(valid, ncy * m + ncx, 0)
+        start = starts[ncell]
+        count = np.where(valid, ends[ncell] - start, 0)
+        total = int(count.sum())
+        if total == 0:
+            continue
+        first = np.cumsum(count) - count
+        within = np.arange(total) - np.repeat(first, count)
+        pair_i.append(np.repeat(boid_idx, count))
+        pair_j.append(order[np.repeat(start, count) + within])
+
+    if not pair_i:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    return np.concatenate(pair_i), np.concatenate(pair_j)
+
+
+def _flock_step_numpy(px, py, vx, vy, jitter_x, jitter_y,
+                      params: Dict[str, float]):
+    """
+    Advance all boids one tick (vectorized NumPy kernel).
+
+    Returns:
+        New (px, py, vx, vy) float64 arrays
+    """
+    n = px.shape[0]
+    radius = params['neighbor_radius']
+    max_force = params['max_force']
+    max_speed = params['max_speed']
+
+    pi, pj = _grid_pairs(px, py, _grid_size(radius))
+    dx = px[pj] - px[pi]
+    dy = py[pj] - py[pi]
+    dist = np.sqrt(dx * dx + dy * dy)
+
+    keep = (pi != pj) & (dist < radius) & (dist > EPS)
+    pi, pj = pi[keep], pj[keep]
+    dx, dy, dist = dx[keep], dy[keep], dist[keep]
+
+    # Neighbor sums (bincount accumulates in pair order, matching Python)
+    neighbor_count = np.bincount(pi, minlength=n)
+    close = dist < radius * 0.5
+    sep_x = -np.bincount(pi[close], weights=dx[close] / dist[close], minlength=n)
+    sep_y = -np.bincount(pi[close], weights=dy[close] / dist[close], minlength=n)
+    align_x = np.bincount(pi, weights=vx[pj], minlength=n)
+    align_y = np.bincount(pi, weights=vy[pj], minlength=n)
+    coh_x = np.bincount(pi, weights=px[pj], minlength=n)
+    coh_y = np.bincount(pi, weights=py[pj], minlength=n)
+
+    # Apply steering
+    has_neighbors = neighbor_count > 0
+    safe_count = np.maximum(neighbor_count, 1)
+    steer_x = (sep_x * params['sep_weight']
+               + (align_x / safe_count - vx) * params['align_weight']
+               + (coh_x / safe_count - px) * params['cohesion_weight'])
+    steer_y = (sep_y * params['sep_weight']
+               + (align_y / safe_count - vy) * params['align_weight']
+               + (coh_y / safe_count - py) * params['cohesion_weight'])
+    ax = np.where(has_neighbors, steer_x, 0.0) + jitter_x
+    ay = np.where(has_neighbors, steer_y, 0.0) + jitter_y
+
+    # Limit acceleration
+    a_mag = np.sqrt(ax * ax + ay * ay)
+    over = a_mag > max_force
+    a_div = np.where(over, a_mag, 1.0)
+    ax = np.where(over, ax / a_div * max_force, ax)
+    ay = np.where(over, ay / a_div * max_force, ay)
+
+    # Update velocity
+    new_vx = vx + ax
+    new_vy = vy + ay
+
+    # Limit speed
+    v_mag = np.sqrt(new_vx * new_vx + new_vy * new_vy)
+    over = v_mag > max_speed
+    v_div = np.where(over, v_mag, 1.0)
+    new_vx = np.where(over, new_vx / v_div * max_speed, new_vx)
+    new_vy = np.where(over, new_vy / v_div * max_speed, new_vy)
+
+    # Update position
+    new_px = px + new_vx
+    new_py = py + new_vy
+
+    # Bounce at boundaries
+    low = new_px < 0
+    high = new_px >= 1
+    new_px = np.where(low, -new_px, np.where(high, 2 - new_px, new_px))
+    new_vx = np.where(low, np.abs(new_vx), np.where(high, -np.abs(new_vx), new_vx))
+
+    low = new_py < 0
+    high = new_py >= 1
+    new_py = np.where(low, -new_py, np.where(high, 2 - new_py, new_py))
+    new_vy = np.where(low, np.abs(new_vy), np.where(high, -np.abs(new_vy), new_vy))
+
+    # Clamp to valid range
+    new_px = np.minimum(np.maximum(new_px, 0.0), POS_MAX)
+    new_py = np.minimum(np.maximum(new_py, 0.0), POS_MAX)
+
+    return new_px, new_py, new_vx, new_vy
 
 
 class BoidEngine:
@@ -74,12 +368,22 @@ class BoidEngine:
     mod matrix cells get temporary modulation contributions.
     """
 
-    def __init__(self):
+    def __init__(self, use_numpy: Optional[bool] = None):
         self._grid_cols = GRID_COLS
         self._grid_rows = GRID_ROWS
 
-        # Boid list
-        self._boids: List[Boid] = []
+        # Kernel selection (defaults to numpy when available)
+        if use_numpy is None:
+            use_numpy = HAS_NUMPY
+        if use_numpy and not HAS_NUMPY:
+            raise ImportError("numpy is required for the vectorized boid kernel")
+        self._use_numpy = use_numpy
+
+        # Boid state (struct-of-arrays)
+        self._px = self._to_array([])
+        self._py = self._to_array([])
+        self._vx = self._to_array([])
+        self._vy = self._to_array([])
         self._boid_count = DEFAULT_BOID_COUNT
 
         # Parameters (normalized 0-1)
@@ -101,22 +405,43 @@ class BoidEngine:
         self._rng: Optional[XorShift32] = None
         self._initialized = False
 
+    def _to_array(self, values: List[float]):
+        """Convert a list to the active kernel's array type."""
+        if self._use_numpy:
+            return np.array(values, dtype=np.float64)
+        return list(values)
+
+    def _spawn_boids(self, count: int) -> None:
+        """Append boids with random positions/velocities."""
+        xs, ys, vxs, vys = [], [], [], []
+        for _ in range(count):
+            xs.append(self._rng.next_float())
+            ys.append(self._rng.next_float())
+            vxs.append(self._rng.next_float_range(-0.01, 0.01))
+            vys.append(self._rng.next_float_range(-0.01, 0.01))
+
+        if self._use_numpy:
+            self._px = np.concatenate([self._px, xs])
+            self._py = np.concatenate([self._py, ys])
+            self._vx = np.concatenate([self._vx, vxs])
+            self._vy = np.concatenate([self._vy, vys])
+        else:
+            self._px = self._px + xs
+            self._py = self._py + ys
+            self._vx = self._vx + vxs
+            self._vy = self._vy + vys
+
     def initialize(self, seed: int) -> None:
         """Initialize simulation with given seed."""
         self._rng = XorShift32(seed)
-        self._boids = []
+        self._px = self._to_array([])
+        self._py = self._to_array([])
+        self._vx = self._to_array([])
+        self._vy = self._to_array([])
         self._cell_values.clear()
         self._boid_cells.clear()
 
-        # Create boids with random positions/velocities
-        for _ in range(self._boid_count):
-            b = Boid(
-                x=self._rng.next_float(),
-                y=self._rng.next_float(),
-                vx=self._rng.next_float_range(-0.01, 0.01),
-                vy=self._rng.next_float_range(-0.01, 0.01),
-            )
-            self._boids.append(b)
+        self._spawn_boids(self._boid_count)
 
         self._initialized = True
 
@@ -137,21 +462,16 @@ class BoidEngine:
             return
 
         if count > old_count:
-            # Add new boids
-            for _ in range(count - old_count):
-                b = Boid(
-                    x=self._rng.next_float(),
-                    y=self._rng.next_float(),
-                    vx=self._rng.next_float_range(-0.01, 0.01),
-                    vy=self._rng.next_float_range(-0.01, 0.01),
-                )
-                self._boids.append(b)
+            self._spawn_boids(count - old_count)
         else:
             # Remove excess boids and clear their cells
             for i in range(count, old_count):
                 if i in self._boid_cells:
                     del self._boid_cells[i]
-            self._boids = self._boids[:count]
+            self._px = self._px[:count]
+            self._py = self._py[:count]
+            self._vx = self._vx[:count]
+            self._vy = self._vy[:count]
 
     def set_dispersion(self, value: float) -> None:
         """Set dispersion (0=tight flock, 1=scattered)."""
@@ -182,118 +502,29 @@ class BoidEngine:
 
     def _update_boids(self) -> None:
         """Apply flocking rules and update positions."""
-        n = len(self._boids)
+        n = len(self._px)
         if n == 0:
             return
 
-        # Compute derived parameters
-        # Dispersion affects separation strength (inverse relationship)
-        sep_weight = 1.5 * (1.0 - self._dispersion * 0.8)
-        align_weight = 1.0
-        cohesion_weight = 0.8 * (1.0 - self._dispersion * 0.5)
-
-        # Energy affects max speed and acceleration
-        base_speed = 0.005
-        max_speed = base_speed + self._energy * 0.025
-        max_force = 0.001 + self._energy * 0.004
-
-        # Neighbor radius
-        neighbor_radius = 0.15 + self._dispersion * 0.1
-
-        for i, boid in enumerate(self._boids):
-            # Accumulate steering forces
-            sep_x, sep_y = 0.0, 0.0
-            align_x, align_y = 0.0, 0.0
-            coh_x, coh_y = 0.0, 0.0
-            neighbor_count = 0
-
-            for j, other in enumerate(self._boids):
-                if i == j:
-                    continue
-
-                dx = other.x - boid.x
-                dy = other.y - boid.y
-                dist = math.sqrt(dx * dx + dy * dy)
-
-                if dist < neighbor_radius and dist > EPS:
-                    neighbor_count += 1
-
-                    # Separation: steer away from close neighbors
-                    if dist < neighbor_radius * 0.5:
-                        sep_x -= dx / dist
-                        sep_y -= dy / dist
-
-                    # Alignment: match velocity
-                    align_x += other.vx
-                    align_y += other.vy
+        # Jitter drawn up front in boid order (x then y per boid)
+        jitter = self._energy * 0.002
+        jitter_x = [0.0] * n
+        jitter_y = [0.0] * n
+        for i in range(n):
+            jitter_x[i] = self._rng.next_float_range(-jitter, jitter)
+            jitter_y[i] = self._rng.next_float_range(-jitter, jitter)
+
+        params = _flock_params(self._dispersion, self._energy)
+        if self._use_numpy:
+            step = _flock_step_numpy
+            jitter_x = np.array(jitter_x, dtype=np.float64)
+            jitter_y = np.array(jitter_y, dtype=np.float64)
+        else:
+            step = _flock_step_python
 
-                    # Cohesion: steer toward center
-                    coh_x += other.x
-                    coh_y += other.y
-
-            # Apply steering
-            ax, ay = 0.0, 0.0
-
-            if neighbor_count > 0:
-                # Separation
-                ax += sep_x * sep_weight
-                ay += sep_y * sep_weight
-
-                # Alignment
-                align_x /= neighbor_count
-                align_y /= neighbor_count
-                ax += (align_x - boid.vx) * align_weight
-                ay += (align_y - boid.vy) * align_weight
-
-                # Cohesion
-                coh_x = coh_x / neighbor_count - boid.x
-                coh_y = coh_y / neighbor_count - boid.y
-                ax += coh_x * cohesion_weight
-                ay += coh_y * cohesion_weight
-
-            # Add slight random jitter based on energy
-            jitter = self._energy * 0.002
-            ax += self._rng.next_float_range(-jitter, jitter)
-            ay += self._rng.next_float_range(-jitter, jitter)
-
-            # Limit acceleration
-            a_mag = math.sqrt(ax * ax + ay * ay)
-            if a_mag > max_force:
-                ax = ax / a_mag * max_force
-                ay = ay / a_mag * max_force
-
-            # Update velocity
-            boid.vx += ax
-            boid.vy += ay
-
-            # Limit speed
-            v_mag = math.sqrt(boid.vx * boid.vx + boid.vy * boid.vy)
-            if v_mag > max_speed:
-                boid.vx = boid.vx / v_mag * max_speed
-                boid.vy = boid.vy / v_mag * max_speed
-
-            # Update position
-            boid.x += boid.vx
-            boid.y += boid.vy
-
-            # Bounce at boundaries
-            if boid.x < 0:
-                boid.x = -boid.x
-                boid.vx = abs(boid.vx)
-            elif boid.x >= 1:
-                boid.x = 2 - boid.x
-                boid.vx = -abs(boid.vx)
-
-            if boid.y < 0:
-                boid.y = -boid.y
-                boid.vy = abs(boid.vy)
-            elif boid.y >= 1:
-                boid.y = 2 - boid.y
-                boid.vy = -abs(boid.vy)
-
-            # Clamp to valid range
-            boid.x = max(0.0, min(0.9999, boid.x))
-            boid.y = max(0.0, min(0.9999, boid.y))
+        self._px, self._py, self._vx, self._vy = step(
+            self._px, self._py, self._vx, self._vy, jitter_x, jitter_y, params
+        )
 
     def _update_cells(self) -> None:
         """Update cell contributions based on boid positions."""
@@ -314,9 +545,9 @@ class BoidEngine:
             del self._cell_values[cell]
 
         # Update cells for current boid positions
-        for i, boid in enumerate(self._boids):
-            col = int(boid.x * self._grid_cols)
-            row = int(boid.y * self._grid_rows)
+        for i, (x, y) in enumerate(self.get_positions()):
+            col = int(x * self._grid_cols)
+            row = int(y * self._grid_rows)
 
             # Clamp to grid bounds
             col = max(0, min(self._grid_cols - 1, col))
@@ -346,7 +577,15 @@ class BoidEngine:
 
     def get_positions(self) -> List[Tuple[float, float]]:
         """Get current boid positions for visualization."""
-        return [(b.x, b.y) for b in self._boids]
+        if self._use_numpy:
+            return list(zip(self._px.tolist(), self._py.tolist()))
+        return list(zip(self._px, self._py))
+
+    def get_velocities(self) -> List[Tuple[float, float]]:
+        """Get current boid velocities."""
+        if self._use_numpy:
+            return list(zip(self._vx.tolist(), self._vy.tolist()))
+        return list(zip(self._vx, self._vy))
 
     def get_cell_values(self) -> Dict[Tuple[int, int], float]:
         """Get cell values for visualization."""
@@ -360,9 +599,17 @@ class BoidEngine:
     def initialized(self) -> bool:
         return self._initialized
 
+    @property
+    def uses_numpy(self) -> bool:
+        """True when the vectorized NumPy kernel is active."""
+        return self._use_numpy
+
     def reset(self) -> None:
         """Reset simulation state."""
-        self._boids.clear()
+        self._px = self._to_array([])
+        self._py = self._to_array([])
+        self._vx = self._to_array([])
+        self._vy = self._to_array([])
         self._cell_values.clear()
         self._boid_cells.clear()
         self._initialized = False
@@ -340,6 +340,11 @@ _PACK_CONFIGS = {}
 # Maps generator_name -> pack_id (None for core generators)
 _GENERATOR_SOURCES = {}
 
+# JSON file each generator was loaded from (custom_params are read from it
+# on first use when the config came from the startup cache)
+# Maps generator_name -> absolute path
+_GENERATOR_CONFIG_PATHS = {}
+
 
 def _discover_packs():
     """
@@ -582,6 +587,7 @@ def _load_generator_configs():
     _GENERATOR_CONFIGS["Empty"] = {"synthdef": None, "custom_params": [], "pitch_target": None, "output_trim_db": 0.0}
     _GENERATOR_SOURCES.clear()
     _GENERATOR_SOURCES["Empty"] = None  # None = core generator
+    _GENERATOR_CONFIG_PATHS.clear()
     _LOADED_SYNTHDEFS = set()  # Track SynthDef symbols across core + packs
     
     # === LOAD CORE GENERATORS ===
@@ -612,6 +618,7 @@ def _load_generator_configs():
                             "synthesis_method": config.get('synthesis_method', '')  # For SynthesisIcon display
                         }
                         _GENERATOR_SOURCES[name] = None  # Mark as core
+                        _GENERATOR_CONFIG_PATHS[name] = filepath
                         if synthdef:
                             _LOADED_SYNTHDEFS.add(synthdef)
             except UnicodeDecodeError as e:
@@ -716,6 +723,7 @@ def _load_generator_configs():
                 "pack_path": pack['path'],
             }
             _GENERATOR_SOURCES[gen_name] = pack['id']
+            _GENERATOR_CONFIG_PATHS[gen_name] = json_file
             _LOADED_SYNTHDEFS.add(synthdef)
             loaded_from_pack.append(gen_name)
         
@@ -790,9 +798,171 @@ def _finalize_config():
                 logger.warning(f"'{name}' in _CORE_GENERATOR_ORDER but no JSON found", component="CONFIG")
 
 
+# === CONFIG CACHE ===
+# A pack scan opens and parses every manifest and generator JSON. Its result
+# is cached in one file next to packs/, keyed by the mtimes of packs/, each
+# pack and generators/ directory and the JSON files in them, so an unchanged
+# install starts from a single small read. custom_params (the bulk of each
+# config) are left out and read from the generator's JSON on first use.
+CONFIG_CACHE_FILENAME = ".config_cache"
+CONFIG_CACHE_VERSION = 1
+
+
+def _config_cache_paths():
+    """(packs_dir, cache_path) relative to this file."""
+    config_dir = os.path.dirname(os.path.abspath(__file__))
+    project_dir = os.path.dirname(os.path.dirname(config_dir))
+    return os.path.join(project_dir, 'packs'), os.path.join(project_dir, CONFIG_CACHE_FILENAME)
+
+
+def _stamp(path):
+    """[path, mtime_ns], mtime None if path is missing."""
+    try:
+        return [path, os.stat(path).st_mtime_ns]
+    except OSError:
+        return [path, None]
+
+
+def _packs_fingerprint(packs_dir):
+    """
+    mtimes of everything a pack scan reads.
+
+    Directory mtimes catch packs and generators being added, removed or
+    renamed; file mtimes catch manifests and generator JSON edited in place.
+
+    Returns:
+        list: [[name, mtime_ns], ...], or None if packs_dir is unreadable
+    """
+    try:
+        stamps = [[packs_dir, os.stat(packs_dir).st_mtime_ns]]
+        with os.scandir(packs_dir) as entries:
+            pack_dirs = sorted(e.path for e in entries if e.is_dir())
+    except OSError:
+        return None
+    for pack_dir in pack_dirs:
+        generators_dir = os.path.join(pack_dir, 'generators')
+        stamps += [_stamp(pack_dir), _stamp(os.path.join(pack_dir, 'manifest.json')),
+                   _stamp(generators_dir)]
+        try:
+            with os.scandir(generators_dir) as entries:
+                stamps += sorted([e.name, e.stat().st_mtime_ns]
+                                 for e in entries if e.name.endswith('.json'))
+        except OSError:
+            pass
+    return stamps
+
+
+def _load_config_cache(cache_path, fingerprint):
+    """
+    Restore pack and generator state from the cache file.
+
+    Returns:
+        bool: False if the cache is missing, unreadable or stale
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') != CONFIG_CACHE_VERSION or cache.get('fingerprint') != fingerprint:
+            return False
+        packs = dict(cache['packs'])
+        generators = dict(cache['generators'])
+        sources = dict(cache['sources'])
+        paths = dict(cache['paths'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+    # Update in place to preserve external references (important for tests)
+    for target, data in ((_PACK_CONFIGS, packs), (_GENERATOR_CONFIGS, generators),
+                         (_GENERATOR_SOURCES, sources), (_GENERATOR_CONFIG_PATHS, paths)):
+        target.clear()
+        target.update(data)
+    return True
+
+
+def _save_config_cache(cache_path, fingerprint):
+    """Write the current pack and generator state; failures only cost the next startup."""
+    generators = {
+        name: {k: v for k, v in config.items() if k != 'custom_params' or name not in _GENERATOR_CONFIG_PATHS}
+        for name, config in _GENERATOR_CONFIGS.items()
+    }
+    cache = {
+        'version': CONFIG_CACHE_VERSION,
+        'fingerprint': fingerprint,
+        'packs': _PACK_CONFIGS,
+        'generators': generators,
+        'sources': _GENERATOR_SOURCES,
+        'paths': _GENERATOR_CONFIG_PATHS,
+    }
+    temp_path = cache_path + '.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, separators=(',', ':'))
+        os.replace(temp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def _load_config():
+    """
+    Discover packs and load generator configs, from the cache when it is current.
+
+    Returns:
+        bool: True if state came from the cache, False if packs were scanned
+    """
+    packs_dir, cache_path = _config_cache_paths()
+    fingerprint = _packs_fingerprint(packs_dir)
+
+    if fingerprint and _load_config_cache(cache_path, fingerprint):
+        try:
+            from src.utils.logger import logger
+        except ImportError:
+            logger = None
+        if logger:
+            logger.info(
+                f"Loaded {len(_GENERATOR_CONFIGS) - 1} generators from "
+                f"{len(get_enabled_packs())} packs (cached)",
+                component="PACKS"
+            )
+        return True
+
+    _discover_packs()
+    _load_generator_configs()
+    if fingerprint:
+        _save_config_cache(cache_path, fingerprint)
+    return False
+
+
+def _generator_config(name):
+    """Config for a generator display name, reading custom_params on first use."""
+    config = _GENERATOR_CONFIGS.get(name)
+    if config is None:
+        return {}
+    if 'custom_params' not in config:
+        config['custom_params'] = _read_custom_params(name)
+    return config
+
+
+def _read_custom_params(name):
+    """custom_params from a generator's JSON file ([] if it cannot be read)."""
+    filepath = _GENERATOR_CONFIG_PATHS.get(name)
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f).get('custom_params', [])[:MAX_CUSTOM_PARAMS]
+    except (OSError, TypeError, ValueError, AttributeError) as e:
+        try:
+            from src.utils.logger import logger
+            logger.warning(f"Failed to load custom params for '{name}' from {filepath}: {e}",
+                           component="CONFIG")
+        except ImportError:
+            pass
+        return []
+
+
 # Load on import - ORDER MATTERS
-_discover_packs()           # 1. Find packs
-_load_generator_configs()   # 2. Load core + pack generators
+_load_config()              # 1-2. Find packs, load core + pack generators (cached)
 _finalize_config()          # 3. Build GENERATOR_CYCLE
 
 def get_generator_synthdef(name):
@@ -802,7 +972,7 @@ def get_generator_synthdef(name):
 
 def get_generator_custom_params(name):
     """Get custom params list for a generator display name."""
-    config = _GENERATOR_CONFIGS.get(name, {})
+    config = _generator_config(name)
     return config.get('custom_params', [])
 
 def get_generator_pitch_target(name):
@@ -833,7 +1003,7 @@ def get_generator_retrig_param_index(name):
     Returns:
         int or None: Index (0-4) of retrig param, or None if not found
     """
-    config = _GENERATOR_CONFIGS.get(name, {})
+    config = _generator_config(name)
     params = config.get('custom_params', [])
     for i, param in enumerate(params):
         if param.get('key') == 'retrig_rate':
@@ -1576,7 +1746,7 @@ OSC_PATHS = {
     'mod_output_wave': '/noise/mod/out/wave',       # /noise/mod/out/wave/{slot}/{output}
     'mod_output_phase': '/noise/mod/out/phase',     # /noise/mod/out/phase/{slot}/{output}
     'mod_output_polarity': '/noise/mod/out/pol',    # /noise/mod/out/pol/{slot}/{output}
-    'mod_bus_value': '/noise/mod/bus/value',        # /noise/mod/bus/value/{bus} (SC → Python)
+    'mod_bus_values': '/noise/mod/bus/values',      # slotMask, 16 bus values per scope tick (SC → Python)
     'mod_values': '/noise/mod/values',
     'mod_scope_enable': '/noise/mod/scope/enable',  # /noise/mod/scope/enable/{slot} (Python → SC)
     
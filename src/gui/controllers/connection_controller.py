@@ -60,7 +60,7 @@ class ConnectionController:
             self.main.osc.audio_device_changing.connect(self.main.master.on_audio_device_changing)
             self.main.osc.audio_device_ready.connect(self.main.master.on_audio_device_ready)
             self.main.osc.comp_gr_received.connect(self.main.master.on_comp_gr_received)
-            self.main.osc.mod_bus_value_received.connect(self.main.modulation.on_mod_bus_value)
+            self.main.osc.mod_bus_values_received.connect(self.main.modulation.on_mod_bus_values)
             self.main.osc.mod_values_received.connect(self.main.modulation.on_mod_values_received)
             self.main.osc.extmod_values_received.connect(self.main.modulation.on_extmod_values_received)
             self.main.osc.bus_values_received.connect(self.main.modulation.on_bus_values_received)
@@ -133,7 +133,7 @@ class ConnectionController:
                 self.main.osc.audio_device_changing.disconnect(self.main.master.on_audio_device_changing)
                 self.main.osc.audio_device_ready.disconnect(self.main.master.on_audio_device_ready)
                 self.main.osc.comp_gr_received.disconnect(self.main.master.on_comp_gr_received)
-                self.main.osc.mod_bus_value_received.disconnect(self.main.modulation.on_mod_bus_value)
+                self.main.osc.mod_bus_values_received.disconnect(self.main.modulation.on_mod_bus_values)
                 self.main.osc.mod_values_received.disconnect(self.main.modulation.on_mod_values_received)
                 self.main.osc.extmod_values_received.disconnect(self.main.modulation.on_extmod_values_received)
                 self.main.osc.bus_values_received.disconnect(self.main.modulation.on_bus_values_received)
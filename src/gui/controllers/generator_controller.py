@@ -65,11 +65,11 @@ class GeneratorController:
                 param_config = GENERATOR_PARAMS_BY_KEY.get(param_name)
                 if param_config:
                     norm_value = unmap_value(value, param_config)
-                    self.main.osc.client.send_message('/noise/bus/base', [target_key, norm_value])
+                    self.main.osc.send_coalesced('/noise/bus/base', [target_key, norm_value])
             else:
                 # Legacy path for non-unified slots
                 path = OSC_PATHS.get(f'gen_{param_name}', f'/noise/gen/{param_name}')
-                self.main.osc.client.send_message(path, [slot_id, value])
+                self.main.osc.send_coalesced(path, [slot_id, value])
         self.main._mark_dirty()
     
     def on_generator_custom_param_changed(self, slot_id, param_index, value):
@@ -83,11 +83,11 @@ class GeneratorController:
             if slot_id in GEN_UNIFIED_SLOTS:
                 # Unified bus system - custom params are already 0-1
                 target_key = f"gen_{slot_id}_custom{param_index}"
-                self.main.osc.client.send_message('/noise/bus/base', [target_key, value])
+                self.main.osc.send_coalesced('/noise/bus/base', [target_key, value])
             else:
                 # Legacy path for non-unified slots
                 path = f"{OSC_PATHS['gen_custom']}/{slot_id}/{param_index}"
-                self.main.osc.client.send_message(path, [value])
+                self.main.osc.send_coalesced(path, [value])
         self.main._mark_dirty()
 
     def on_generator_filter_changed(self, slot_id, filter_type):
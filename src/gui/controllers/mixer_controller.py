@@ -19,7 +19,7 @@ class MixerController:
     def on_generator_volume_changed(self, gen_id, volume):
         """Handle generator volume change from mixer."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['gen_volume'], [gen_id, volume])
+            self.main.osc.send_coalesced(OSC_PATHS['gen_volume'], [gen_id, volume])
         logger.debug(f"Gen {gen_id} volume: {volume:.2f}", component="OSC")
         self.main._mark_dirty()
 
@@ -38,13 +38,13 @@ class MixerController:
     def on_generator_gain_changed(self, gen_id, gain_db):
         """Handle generator gain stage change from mixer."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['gen_gain'], [gen_id, gain_db])
+            self.main.osc.send_coalesced(OSC_PATHS['gen_gain'], [gen_id, gain_db])
         logger.debug(f"Gen {gen_id} gain: +{gain_db}dB", component="OSC")
     
     def on_generator_pan_changed(self, gen_id, pan):
         """Handle generator pan change from mixer."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['gen_pan'], [gen_id, pan])
+            self.main.osc.send_coalesced(OSC_PATHS['gen_pan'], [gen_id, pan])
         logger.debug(f"Gen {gen_id} pan: {pan:.2f}", component="OSC")
         self.main._mark_dirty()
 
@@ -52,32 +52,32 @@ class MixerController:
         """Handle generator EQ change from mixer. band: 'lo'/'mid'/'hi', value: 0-2 linear."""
         if self.main.osc_connected:
             osc_path = f"{OSC_PATHS['gen_strip_eq_base']}/{band}"
-            self.main.osc.client.send_message(osc_path, [gen_id, value])
+            self.main.osc.send_coalesced(osc_path, [gen_id, value])
         logger.debug(f"Gen {gen_id} EQ {band}: {value:.2f}", component="OSC")
         self.main._mark_dirty()
 
     def on_generator_fx1_send(self, gen_id, value):
         """Handle generator FX1 send change from mixer. value: 0-1."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['strip_fx1_send'], [gen_id, value])
+            self.main.osc.send_coalesced(OSC_PATHS['strip_fx1_send'], [gen_id, value])
         logger.debug(f"Gen {gen_id} FX1 send: {value:.2f}", component="OSC")
 
     def on_generator_fx2_send(self, gen_id, value):
         """Handle generator FX2 send change from mixer. value: 0-1."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['strip_fx2_send'], [gen_id, value])
+            self.main.osc.send_coalesced(OSC_PATHS['strip_fx2_send'], [gen_id, value])
         logger.debug(f"Gen {gen_id} FX2 send: {value:.2f}", component="OSC")
 
     def on_generator_fx3_send(self, gen_id, value):
         """Handle generator FX3 send change from mixer. value: 0-1."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['strip_fx3_send'], [gen_id, value])
+            self.main.osc.send_coalesced(OSC_PATHS['strip_fx3_send'], [gen_id, value])
         logger.debug(f"Gen {gen_id} FX3 send: {value:.2f}", component="OSC")
 
     def on_generator_fx4_send(self, gen_id, value):
         """Handle generator FX4 send change from mixer. value: 0-1."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['strip_fx4_send'], [gen_id, value])
+            self.main.osc.send_coalesced(OSC_PATHS['strip_fx4_send'], [gen_id, value])
         logger.debug(f"Gen {gen_id} FX4 send: {value:.2f}", component="OSC")
 
     # Legacy aliases for backward compatibility
@@ -15,7 +15,6 @@ from PyQt5.QtGui import QColor
 
 from src.config import OSC_PATHS, get_param_config, unmap_value, MOD_CLOCK_RATE_INDEX
 from src.gui.crossmod_osc_bridge import CrossmodOSCBridge
-from src.gui.mod_routing_state import Polarity
 from src.utils.logger import logger
 
 
@@ -35,6 +34,12 @@ _PARAM_KEY_MAP = {
     'p5': 'custom4',
 }
 
+# Reverse of _PARAM_KEY_MAP: unified bus param key -> slider param name
+_BUS_PARAM_TO_SLIDER = {bus: param for param, bus in _PARAM_KEY_MAP.items()}
+
+# Marks a wire key not yet looked up in ModulationController._value_targets
+_UNCOMPILED = object()
+
 
 def _build_source_key(source_bus: int) -> str:
     """Convert mod bus index (0-15) to unified source key."""
@@ -53,6 +58,13 @@ class ModulationController:
     def __init__(self, main_frame):
         self.main = main_frame
 
+        # Modulated-value visualization: wire key -> (setter, transform),
+        # compiled lazily and dropped whenever routes or generators change.
+        # Incoming values are coalesced and applied by _flush_mod_values().
+        self._value_targets = {}
+        self._pending_values = {}
+        self._applied_values = {}
+
     def _sync_mod_slot_state(self, slot_id, send_generator=True):
         """Push full UI state for one mod slot to SC (SSOT)."""
         if not self.main.osc_connected:
@@ -119,7 +131,7 @@ class ModulationController:
     def on_mod_param_changed(self, slot_id, key, value):
         """Handle mod source parameter change."""
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, key, value])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, key, value])
         logger.debug(f"Mod {slot_id} {key}: {value:.3f}", component="OSC")
         
     def on_mod_output_wave(self, slot_id, output_idx, wave_index):
@@ -152,60 +164,55 @@ class ModulationController:
         """Handle ARSEq+ envelope attack change."""
         param_name = ["atkA", "atkB", "atkC", "atkD"][env_idx]
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, param_name, value])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, param_name, value])
         logger.debug(f"Mod {slot_id} env {env_idx} attack: {value:.3f}", component="OSC")
 
     def on_mod_env_release(self, slot_id, env_idx, value):
         """Handle ARSEq+ envelope release change."""
         param_name = ["relA", "relB", "relC", "relD"][env_idx]
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, param_name, value])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, param_name, value])
         logger.debug(f"Mod {slot_id} env {env_idx} release: {value:.3f}", component="OSC")
 
     def on_mod_env_curve(self, slot_id, env_idx, value):
         """Handle ARSEq+ envelope curve change."""
         param_name = ["curveA", "curveB", "curveC", "curveD"][env_idx]
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, param_name, value])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, param_name, value])
         logger.debug(f"Mod {slot_id} env {env_idx} curve: {value:.3f}", component="OSC")
 
     def on_mod_env_sync_mode(self, slot_id, env_idx, mode):
         """Handle ARSEq+ envelope sync mode change."""
         param_name = ["syncModeA", "syncModeB", "syncModeC", "syncModeD"][env_idx]
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, param_name, float(mode)])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, param_name, float(mode)])
         logger.debug(f"Mod {slot_id} env {env_idx} sync_mode: {mode}", component="OSC")
 
     def on_mod_env_loop_rate(self, slot_id, env_idx, rate_idx):
         """Handle ARSEq+ envelope loop rate change."""
         param_name = ["loopRateA", "loopRateB", "loopRateC", "loopRateD"][env_idx]
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, param_name, float(rate_idx)])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, param_name, float(rate_idx)])
         logger.debug(f"Mod {slot_id} env {env_idx} loop_rate: {rate_idx}", component="OSC")
 
     def on_mod_tension(self, slot_id, output_idx, normalized):
         """Handle SauceOfGrav tension change."""
         param_name = f"tension{output_idx + 1}"
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, param_name, normalized])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, param_name, normalized])
         logger.debug(f"Mod {slot_id} tension{output_idx + 1}: {normalized:.3f}", component="OSC")
 
     def on_mod_mass(self, slot_id, output_idx, normalized):
         """Handle SauceOfGrav mass change."""
         param_name = f"mass{output_idx + 1}"
         if self.main.osc_connected:
-            self.main.osc.client.send_message(OSC_PATHS['mod_param'], [slot_id, param_name, normalized])
+            self.main.osc.send_coalesced(OSC_PATHS['mod_param'], [slot_id, param_name, normalized])
         logger.debug(f"Mod {slot_id} mass{output_idx + 1}: {normalized:.3f}", component="OSC")
 
-    def on_mod_bus_value(self, bus_idx, value):
-        """Handle mod bus value from SC - route to appropriate scope."""
-        slot_id = (bus_idx // 4) + 1
-        output_idx = bus_idx % 4
-        
-        slot = self.main.modulator_grid.get_slot(slot_id)
-        if slot and hasattr(slot, 'scope') and slot.scope.isEnabled():
-            slot.scope.push_value(output_idx, value)
-            self.main._mod_scope_dirty.add(slot_id)
+    def on_mod_bus_values(self, slot_mask, frames):
+        """Handle batched mod bus values from SC - store in the shared scope ring."""
+        updated = self.main.mod_scope_controller.push_frames(slot_mask, frames)
+        self.main._mod_scope_dirty.update(updated)
     
     def on_mod_values_received(self, values):
         """Handle batched modulated parameter values from SC - update sliders."""
@@ -219,101 +226,139 @@ class ModulationController:
                     slider.set_modulated_value(norm_value)
 
     def on_extmod_values_received(self, values):
-        """Handle batched extended mod values from SC - update UI widgets."""
-        for target_str, norm_value in values:
-            parts = target_str.split(":")
-            if len(parts) < 3:
-                continue
+        """Handle batched extended mod values from SC - queue for the next flush.
 
-            target_type, identifier, param = parts[0], parts[1], parts[2]
-
-            if target_type == "mod":
-                slot_id = int(identifier)
-                slot = self.main.modulator_grid.get_slot(slot_id)
-                if not slot:
-                    continue
-
-                # Map p1-p4 to actual slider key based on generator type
-                slider_key = self._map_mod_param_to_slider(slot.generator_name, param)
-                if slider_key and slider_key in slot.param_sliders:
-                    slider = slot.param_sliders[slider_key]
-                    if hasattr(slider, "set_modulated_value"):
-                        slider.set_modulated_value(norm_value)
-
-            elif target_type == "send":
-                try:
-                    channel_id = int(identifier)
-                except ValueError:
-                    continue
-                if not hasattr(self.main, 'mixer_panel'):
-                    continue
-                channel = self.main.mixer_panel.channels.get(channel_id)
-                if not channel:
-                    continue
-                if param == "ec" and hasattr(channel.echo_send, 'set_modulated_value'):
-                    channel.echo_send.set_modulated_value(norm_value)
-                elif param == "vb" and hasattr(channel.verb_send, 'set_modulated_value'):
-                    channel.verb_send.set_modulated_value(norm_value)
-
-            elif target_type == "chan":
-                try:
-                    channel_id = int(identifier)
-                except ValueError:
-                    continue
-                if not hasattr(self.main, 'mixer_panel'):
-                    continue
-                channel = self.main.mixer_panel.channels.get(channel_id)
-                if not channel:
-                    continue
-                if param == "pan" and hasattr(channel.pan_slider, 'set_modulated_value'):
-                    channel.pan_slider.set_modulated_value(norm_value)
+        Args:
+            values: List of (targetStr, normalizedValue) tuples
+                   targetStr format: "mod:{slot}:{p}", "send:{ch}:ec|vb", "chan:{ch}:pan"
+        """
+        self._pending_values.update(values)
 
     def on_bus_values_received(self, values):
-        """Handle batched unified bus values from SC - update generator sliders.
-
-        SC sends linearly-normalized values. For exponential params (freq, cutoff),
-        we must reconstruct raw then unmap for correct slider position.
-        For custom params (p1-p5), use norm directly since they're 0-1 linear.
+        """Handle batched unified bus values from SC - queue for the next flush.
 
         Args:
             values: List of (targetKey, normalizedValue) tuples
                    targetKey format: "gen_{slot}_{param}" e.g., "gen_1_freq"
                    normalizedValue: 0.0-1.0 linearly normalized by SC
         """
-        for target_key, norm_value in values:
-            # Parse target key: "gen_{slot}_{param}"
-            parts = target_key.split("_")
-            if len(parts) < 3 or parts[0] != "gen":
-                continue
+        self._pending_values.update(values)
 
-            try:
-                slot_id = int(parts[1])
-            except ValueError:
-                continue
+    def _flush_mod_values(self):
+        """Apply the newest queued value per target (~30fps, with scope repaint).
 
-            # Map back to param name
-            param_key = "_".join(parts[2:])  # Handle multi-word like custom0
-            param = self._bus_param_to_slider_param(param_key)
-            if not param:
+        Targets whose value did not change since the last flush are skipped.
+        """
+        if not self._pending_values:
+            return
+        pending, self._pending_values = self._pending_values, {}
+        targets = self._value_targets
+        applied = self._applied_values
+        for key, norm_value in pending.items():
+            if applied.get(key) == norm_value:
                 continue
-
-            slot = self.main.generator_grid.get_slot(slot_id)
-            if not slot:
+            target = targets.get(key, _UNCOMPILED)
+            if target is _UNCOMPILED:
+                target = targets[key] = self._compile_value_target(key)
+            if target is None:
                 continue
+            setter, transform = target
+            setter(transform(norm_value) if transform else norm_value)
+            applied[key] = norm_value
 
-            slider = self._get_slot_slider(slot, param)
-            if slider and hasattr(slider, 'set_modulated_value'):
-                # Custom params (p1-p5): use norm directly (0-1 linear)
-                if param.startswith('p') and len(param) == 2 and param[1].isdigit():
-                    slider.set_modulated_value(norm_value)
-                else:
-                    # Standard params: reconstruct raw then unmap for curve-awareness
-                    param_config = get_param_config(param)
-                    min_val = param_config.get('min', 0.0)
-                    max_val = param_config.get('max', 1.0)
-                    raw_value = min_val + norm_value * (max_val - min_val)
-                    slider_norm = unmap_value(raw_value, param_config)
-                    slider.set_modulated_value(slider_norm)
+    def _invalidate_value_targets(self, *_args):
+        """Drop compiled value targets (routes, generators or sliders changed)."""
+        self._value_targets = {}
+        self._applied_values = {}
+
+    def _compile_value_target(self, key: str):
+        """Resolve a wire key to (slider setter, value transform).
+
+        Returns None when the key has no visualized slider.
+        """
+        if key.startswith("gen_"):
+            return self._compile_gen_target(key)
+        return self._compile_ext_target(key)
+
+    def _compile_gen_target(self, target_key: str):
+        """Unified bus target "gen_{slot}_{param}" -> generator slot slider.
+
+        SC sends linearly-normalized values. For exponential params (freq, cutoff),
+        we must reconstruct raw then unmap for correct slider position.
+        For custom params (p1-p5), use norm directly since they're 0-1 linear.
+        """
+        parts = target_key.split("_")
+        if len(parts) < 3:
+            return None
+        try:
+            slot_id = int(parts[1])
+        except ValueError:
+            return None
+
+        # Map back to param name
+        param_key = "_".join(parts[2:])  # Handle multi-word like custom0
+        param = self._bus_param_to_slider_param(param_key)
+        if not param:
+            return None
+
+        slot = self.main.generator_grid.get_slot(slot_id)
+        if not slot:
+            return None
+        slider = self._get_slot_slider(slot, param)
+        if not slider or not hasattr(slider, 'set_modulated_value'):
+            return None
+
+        # Custom params (p1-p5): use norm directly (0-1 linear)
+        if param.startswith('p') and len(param) == 2 and param[1].isdigit():
+            return slider.set_modulated_value, None
+
+        # Standard params: reconstruct raw then unmap for curve-awareness
+        param_config = get_param_config(param)
+        min_val = param_config.get('min', 0.0)
+        span = param_config.get('max', 1.0) - min_val
+
+        def transform(norm_value):
+            return unmap_value(min_val + norm_value * span, param_config)
+
+        return slider.set_modulated_value, transform
+
+    def _compile_ext_target(self, target_str: str):
+        """Extended target "type:index:param" -> modulator or mixer slider."""
+        parts = target_str.split(":")
+        if len(parts) < 3:
+            return None
+        target_type, identifier, param = parts[0], parts[1], parts[2]
+        try:
+            index = int(identifier)
+        except ValueError:
+            return None
+
+        slider = None
+        if target_type == "mod":
+            slot = self.main.modulator_grid.get_slot(index)
+            if not slot:
+                return None
+            # Map p1-p4 to actual slider key based on generator type
+            slider_key = self._map_mod_param_to_slider(slot.generator_name, param)
+            if slider_key:
+                slider = slot.param_sliders.get(slider_key)
+
+        elif target_type in ("send", "chan"):
+            if not hasattr(self.main, 'mixer_panel'):
+                return None
+            channel = self.main.mixer_panel.channels.get(index)
+            if not channel:
+                return None
+            if target_type == "send" and param == "ec":
+                slider = channel.echo_send
+            elif target_type == "send" and param == "vb":
+                slider = channel.verb_send
+            elif target_type == "chan" and param == "pan":
+                slider = channel.pan_slider
+
+        if slider is None or not hasattr(slider, 'set_modulated_value'):
+            return None
+        return slider.set_modulated_value, None
 
     def _bus_param_to_slider_param(self, bus_param: str) -> str:
         """Map unified bus param key back to slider param name.
@@ -324,20 +369,7 @@ class ModulationController:
         Returns:
             Param name for slider lookup (frequency, cutoff, resonance, p1, etc.)
         """
-        # Reverse mapping from _PARAM_KEY_MAP
-        reverse_map = {
-            'freq': 'frequency',
-            'cutoff': 'cutoff',
-            'res': 'resonance',
-            'attack': 'attack',
-            'decay': 'decay',
-            'custom0': 'p1',
-            'custom1': 'p2',
-            'custom2': 'p3',
-            'custom3': 'p4',
-            'custom4': 'p5',
-        }
-        return reverse_map.get(bus_param)
+        return _BUS_PARAM_TO_SLIDER.get(bus_param)
 
     def _map_mod_param_to_slider(self, gen_name: str, param: str) -> str:
         """
@@ -381,10 +413,17 @@ class ModulationController:
         self.main.mod_routing.connection_removed.connect(self._on_mod_route_removed)
         self.main.mod_routing.connection_changed.connect(self._on_mod_route_changed)
         self.main.mod_routing.all_cleared.connect(self._on_mod_routes_cleared)
+
+        # Value visualization targets follow the route set
+        self.main.mod_routing.connection_added.connect(self._invalidate_value_targets)
+        self.main.mod_routing.connection_removed.connect(self._invalidate_value_targets)
+        self.main.mod_routing.all_cleared.connect(self._invalidate_value_targets)
     
     def _on_mod_route_added(self, conn):
         """Send new mod route to SC and update slider visualization."""
         if self.main.osc_connected:
+            # Don't let a queued depth/amount update land after this
+            self.main.osc.flush_coalesced()
             if conn.is_extended:
                 # Extended route: use /noise/extmod/add_route
                 self.main.osc.client.send_message(
@@ -416,6 +455,8 @@ class ModulationController:
     def _on_mod_route_removed(self, conn):
         """Send mod route removal to SC and update slider visualization."""
         if self.main.osc_connected:
+            # A queued route update arriving after the remove would re-create it
+            self.main.osc.flush_coalesced()
             if conn.is_extended:
                 # Extended route: use /noise/extmod/remove_route
                 self.main.osc.client.send_message(
@@ -447,10 +488,12 @@ class ModulationController:
         if self.main.osc_connected:
             if conn.is_extended:
                 # Extended route: use /noise/extmod/add_route (upsert)
-                self.main.osc.client.send_message(
+                # Coalesced: depth/amount drags send one update per flush
+                self.main.osc.send_coalesced(
                     OSC_PATHS['extmod_add_route'],
                     [conn.source_bus, conn.target_str,
-                     conn.depth, conn.amount, conn.offset, conn.polarity.value, int(conn.invert)]
+                     conn.depth, conn.amount, conn.offset, conn.polarity.value, int(conn.invert)],
+                    target=(conn.source_bus, conn.target_str)
                 )
                 # Update slider visualization for extended targets
                 if conn.target_str.startswith("mod:"):
@@ -465,10 +508,11 @@ class ModulationController:
                 # Generator route: use unified bus system /noise/bus/route/set (upsert)
                 source_key = _build_source_key(conn.source_bus)
                 target_key = _build_target_key(conn.target_slot, conn.target_param)
-                self.main.osc.client.send_message(
+                self.main.osc.send_coalesced(
                     OSC_PATHS['bus_route_set'],
                     [source_key, target_key,
-                     conn.depth, conn.amount, conn.offset, conn.polarity.value, int(conn.invert)]
+                     conn.depth, conn.amount, conn.offset, conn.polarity.value, int(conn.invert)],
+                    target=(source_key, target_key)
                 )
                 from PyQt5.QtCore import QTimer
                 QTimer.singleShot(0, lambda: self._update_slider_mod_range(conn.target_slot, conn.target_param))
@@ -513,24 +557,7 @@ class ModulationController:
         slider_norm = slider.value() / 1000.0
         base_real = map_value(slider_norm, param_config)
         
-        delta_min = 0.0
-        delta_max = 0.0
-        
-        for c in connections:
-            r = c.effective_range
-            
-            if c.polarity == Polarity.BIPOLAR:
-                mn, mx = -r, +r
-            elif c.polarity == Polarity.UNI_POS:
-                mn, mx = 0.0, +r
-            else:
-                mn, mx = -r, 0.0
-            
-            mn += c.offset
-            mx += c.offset
-            
-            delta_min += mn
-            delta_max += mx
+        delta_min, delta_max = self.main.mod_routing.get_mod_range(slot_id, param)
         
         if curve == 'exp' and oct_range > 0:
             if base_real <= 0:
@@ -591,33 +618,15 @@ class ModulationController:
             return
 
         # Get all extended connections targeting this target_str
-        connections = [c for c in self.main.mod_routing.get_extended_connections()
-                      if c.target_str == target_str]
+        connections = self.main.mod_routing.get_connections_for_target_str(target_str)
 
         if not connections:
             slider.clear_modulation()
             return
 
         # Modulator params are normalized 0-1, linear
-        # Calculate combined modulation range
-        delta_min = 0.0
-        delta_max = 0.0
-
-        for c in connections:
-            r = c.effective_range
-
-            if c.polarity == Polarity.BIPOLAR:
-                mn, mx = -r, +r
-            elif c.polarity == Polarity.UNI_POS:
-                mn, mx = 0.0, +r
-            else:  # UNI_NEG
-                mn, mx = -r, 0.0
-
-            mn += c.offset
-            mx += c.offset
-
-            delta_min += mn
-            delta_max += mx
+        # Combined modulation range (cached by the routing state)
+        delta_min, delta_max = self.main.mod_routing.get_mod_range(target_str=target_str)
 
         # Get current slider normalized value
         slider_norm = slider.value() / 1000.0
@@ -691,8 +700,7 @@ class ModulationController:
             return
 
         # Get all extended connections targeting this target_str
-        connections = [c for c in self.main.mod_routing.get_extended_connections()
-                      if c.target_str == target_str]
+        connections = self.main.mod_routing.get_connections_for_target_str(target_str)
 
         if not connections:
             control.clear_modulation()
@@ -732,6 +740,7 @@ class ModulationController:
         """Handle all routes cleared - send OSC and clear all slider brackets."""
         if self.main.osc_connected:
             # Use unified bus system clear (clears all routes)
+            self.main.osc.flush_coalesced()
             self.main.osc.client.send_message(OSC_PATHS['bus_route_clear'], [])
 
         logger.debug("All mod routes cleared", component="MOD")
@@ -906,8 +915,7 @@ class ModulationController:
         for param in ["p1", "p2", "p3", "p4"]:
             target_str = f"mod:{slot_id}:{param}"
             # Check if any routes target this
-            connections = [c for c in self.main.mod_routing.get_extended_connections()
-                          if c.target_str == target_str]
+            connections = self.main.mod_routing.get_connections_for_target_str(target_str)
             if connections:
                 # Use QTimer to let the new UI settle before updating
                 from PyQt5.QtCore import QTimer
@@ -6,9 +6,11 @@ Method names intentionally unchanged from MainFrame for wrapper compatibility.
 """
 from __future__ import annotations
 
+from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 from PyQt5.QtGui import QKeySequence
 from pathlib import Path
+import time
 
 from dataclasses import fields as dc_fields
 
@@ -17,16 +19,38 @@ from src.presets import (
     PresetManager, PresetState, SlotState, MixerState,
     ChannelState, MasterState, ModSourcesState, FXState, FXSlotsState,
 )
+from src.presets.preset_diff import (
+    PresetDiff, diff_presets, SECTIONS, SECTION_MASTER_VOLUME, SECTION_BPM, SECTION_MASTER,
+    SECTION_MOD_SOURCES, SECTION_MOD_ROUTING, SECTION_FX, SECTION_FX_SLOTS, SECTION_BOIDS,
+    SECTION_TELEMETRY, SECTION_MIDI_MAPPINGS,
+)
+from src.presets.preset_morph import (
+    MORPH_DEFAULT_SECONDS, MORPH_SWITCH_AT, PresetMorph, build_morph_plan,
+)
 from src.utils.logger import logger
 from src.gui.controllers.modulation_controller import _build_source_key, _build_target_key
 
 
+class _MorphEvents(QObject):
+    """Carries PresetMorph callbacks from its thread to the Qt thread."""
+    switched = pyqtSignal(object)  # PresetMorph
+    finished = pyqtSignal(object)  # PresetMorph
+
+
 class PresetController:
     """Handles preset save/load/apply/init operations."""
     
     def __init__(self, main_frame):
         self.main = main_frame
         self.preset_manager = PresetManager()
+        self.last_apply_stats = None  # counts/timing of the last _apply_preset
+
+        # Preset morph (one at a time; any hard load cancels it)
+        self._morph = None
+        self._morph_path = None
+        self._morph_events = _MorphEvents()
+        self._morph_events.switched.connect(self._on_morph_switched)
+        self._morph_events.finished.connect(self._on_morph_finished)
     
     def _setup_preset_menu(self):
         """Create Preset menu in menu bar."""
@@ -44,6 +68,8 @@ class PresetController:
         load_action = preset_menu.addAction("Load...", self._load_preset)
         load_action.setShortcut(QKeySequence("Ctrl+O"))
 
+        preset_menu.addAction("Morph To...", self._morph_preset)
+
         preset_menu.addSeparator()
 
         init_action = preset_menu.addAction("Init (New)", self._init_preset)
@@ -87,9 +113,25 @@ class PresetController:
 
     def _do_save_preset(self, name: str, filepath):
         """Internal: actually save the preset to the specified filepath."""
+        from datetime import datetime
+
+        state = self._collect_state(name)
+        state.created = datetime.now().isoformat()
+
+        try:
+            with open(filepath, "w") as f:
+                f.write(state.to_json(indent=2))
+            self.main.preset_name.setText(name)
+            logger.info(f"Preset saved: {filepath}", component="PRESET")
+            self.main._clear_dirty(name, filepath)
+        except Exception as e:
+            logger.error(f"Failed to save preset: {e}", component="PRESET")
+            QMessageBox.warning(self.main, "Error", f"Failed to save preset:\n{e}")
+
+    def _collect_state(self, name: str) -> PresetState:
+        """Build a PresetState from the live UI (save path and apply diff)."""
         from src.config import get_current_pack
         from src.presets.preset_schema import PRESET_VERSION
-        from datetime import datetime
 
         slots = []
         for slot_id in range(1, 9):
@@ -149,17 +191,7 @@ class PresetController:
         )
         
         state.version = PRESET_VERSION
-        state.created = datetime.now().isoformat()
-
-        try:
-            with open(filepath, "w") as f:
-                f.write(state.to_json(indent=2))
-            self.main.preset_name.setText(name)
-            logger.info(f"Preset saved: {filepath}", component="PRESET")
-            self.main._clear_dirty(name, filepath)
-        except Exception as e:
-            logger.error(f"Failed to save preset: {e}", component="PRESET")
-            QMessageBox.warning(self.main, "Error", f"Failed to save preset:\n{e}")
+        return state
 
     def _load_preset(self):
         """Load preset from file."""
@@ -183,59 +215,110 @@ class PresetController:
                 QMessageBox.warning(self.main, "Error", f"Failed to load preset:\n{e}")
 
     def _apply_preset(self, state: PresetState):
-        """Apply preset state to all components."""
+        """Apply preset state to all components (hard switch, ends any morph)."""
+        self._cancel_morph()
+        self._apply_preset_state(state)
+
+    def _apply_preset_state(self, state: PresetState):
+        """Apply state without touching a running morph.
+
+        Only what differs from the live state is applied, and every OSC
+        message this triggers is sent as a few bundles (OSCBridge.bundled)
+        rather than one datagram per setter. Counts and timing of the last
+        switch are kept in last_apply_stats.
+        """
+        t0 = time.perf_counter()
+        diff = diff_presets(self._live_state_for_diff(state), state)
+
+        with self.main.osc.bundled() as batch:
+            self._apply_preset_diff(state, diff)
+
+        stats = {
+            'full': diff.full,
+            'slots': len(state.slots) if diff.full else len(diff.slots),
+            'channels': len(state.mixer.channels) if diff.full else len(diff.channels),
+            'sections': list(SECTIONS) if diff.full else sorted(diff.sections),
+            'messages': batch.sent,
+            'bundles': batch.bundles,
+            'ms': (time.perf_counter() - t0) * 1000.0,
+        }
+        self.last_apply_stats = stats
+        logger.debug(
+            f"Preset applied in {stats['ms']:.1f} ms: {stats['messages']} OSC messages "
+            f"in {stats['bundles']} bundles ({stats['slots']} slots, {stats['channels']} "
+            f"channels, {len(stats['sections'])} sections changed)",
+            component="PRESET"
+        )
+
+    def _live_state_for_diff(self, incoming: PresetState):
+        """Live state to diff against, or None to apply incoming in full."""
+        from src.config import get_current_pack
+
+        # A pack switch reloads the generator lists, so slot state can't be trusted
+        if incoming.pack is not None and incoming.pack != get_current_pack():
+            return None
+        try:
+            return self._collect_state(incoming.name)
+        except Exception as e:
+            logger.debug(f"Live state unavailable, applying preset in full: {e}", component="PRESET")
+            return None
+
+    def _apply_preset_diff(self, state: PresetState, diff: PresetDiff):
+        """Push the changed parts of state into the UI (and so to SC)."""
         if state.pack is not None:
             if not self.main.pack_selector.set_pack(state.pack):
                 logger.warning(f"Pack '{state.pack}' not found, using Core", component="PRESET")
 
         for i, slot_state in enumerate(state.slots):
             slot_id = i + 1
-            if slot_id <= 8:
+            if slot_id <= 8 and diff.slot_changed(slot_id):
                 slot_widget = self.main.generator_grid.slots[slot_id]
                 slot_widget.apply_state(slot_state)
 
         for i, channel_state in enumerate(state.mixer.channels):
             ch_id = i + 1
-            if ch_id in self.main.mixer_panel.channels:
+            if ch_id in self.main.mixer_panel.channels and diff.channel_changed(ch_id):
                 self.main.mixer_panel.channels[ch_id].set_state(channel_state.to_dict())
 
-        self.main.master_section.set_volume(state.mixer.master_volume)
-        
-        if state.bpm != 120:
+        if diff.changed(SECTION_MASTER_VOLUME):
+            self.main.master_section.set_volume(state.mixer.master_volume)
+
+        if state.bpm != 120 and diff.changed(SECTION_BPM):
             self.main.bpm_display.set_bpm(state.bpm)
             self.main.on_bpm_changed(state.bpm)
         
-        if state.version >= 2 and hasattr(state, 'master'):
+        if state.version >= 2 and hasattr(state, 'master') and diff.changed(SECTION_MASTER):
             self.main.master_section.set_state(state.master.to_dict())
         
-        if state.version >= 2:
+        if state.version >= 2 and diff.changed(SECTION_MOD_SOURCES):
             self.main.modulator_grid.set_state(state.mod_sources.to_dict())
             self.main.modulation._sync_mod_sources()
 
         # Load mod routing with exact replacement semantics (per spec 5.2)
-        if state.mod_routing.get("connections") or state.mod_routing.get("ext_mod_routes"):
-            self._load_mod_routing_with_osc_projection(state.mod_routing)
-            if self.main.mod_matrix_window:
-                self.main.mod_matrix_window.sync_from_state()
-            # Refresh slider visualizations for loaded routes
-            self.main.modulation.refresh_all_mod_visualizations()
-        elif not state.mod_routing.get("connections"):
-            # Empty preset - clear all routes
-            self.main.mod_routing.clear()
-            if self.main.mod_matrix_window:
-                self.main.mod_matrix_window.sync_from_state()
+        if diff.changed(SECTION_MOD_ROUTING):
+            if state.mod_routing.get("connections") or state.mod_routing.get("ext_mod_routes"):
+                self._load_mod_routing_with_osc_projection(state.mod_routing)
+                if self.main.mod_matrix_window:
+                    self.main.mod_matrix_window.sync_from_state()
+                # Refresh slider visualizations for loaded routes
+                self.main.modulation.refresh_all_mod_visualizations()
+            elif not state.mod_routing.get("connections"):
+                # Empty preset - clear all routes
+                self.main.mod_routing.clear()
+                if self.main.mod_matrix_window:
+                    self.main.mod_matrix_window.sync_from_state()
         
-        if self.main.fx_window:
+        if self.main.fx_window and diff.changed(SECTION_FX):
             self.main.fx_window.set_state(state.fx)
 
         # Load FX slots state (UI Refresh Phase 6)
-        if hasattr(self.main, 'fx_grid') and hasattr(state, 'fx_slots'):
+        if hasattr(self.main, 'fx_grid') and hasattr(state, 'fx_slots') and diff.changed(SECTION_FX_SLOTS):
             self.main.fx_grid.load_state(state.fx_slots.to_dict())
             if self.main.osc_connected:
                 self.main.fx_grid.sync_to_sc()
 
         # Load boid state if present
-        if state.boids and hasattr(self.main, 'boid'):
+        if state.boids and hasattr(self.main, 'boid') and diff.changed(SECTION_BOIDS):
             self.main.boid.load_state_dict(state.boids)
             # Update panel from state
             if hasattr(self.main, 'boid_panel'):
@@ -259,7 +342,8 @@ class PresetController:
                 self.main.boid_panel.set_preset(s.behavior_preset)
 
         # Load telemetry tuning state (INV, OS, BODY, OFS)
-        if state.telemetry and getattr(self.main, 'telemetry_controller', None) is not None:
+        if (state.telemetry and getattr(self.main, 'telemetry_controller', None) is not None
+                and diff.changed(SECTION_TELEMETRY)):
             self.main.telemetry_controller.set_state(state.telemetry)
             # Sync widget UI if open
             tw = getattr(self.main, '_telemetry_widget', None)
@@ -272,7 +356,7 @@ class PresetController:
                 ofs_slider = int(state.telemetry.get('v_offset', 0.0) * 1000)
                 tw.ofs_slider.setValue(max(-200, min(200, ofs_slider)))
 
-        if state.midi_mappings:
+        if state.midi_mappings and diff.changed(SECTION_MIDI_MAPPINGS):
             for controls in self.main.cc_mapping_manager.get_all_mappings().values():
                 for control in controls:
                     if hasattr(control, 'set_midi_mapped'):
@@ -359,6 +443,79 @@ class PresetController:
             logger.error(f"Failed to load preset: {e}", component="PRESET")
             QMessageBox.warning(self.main, "Error", f"Failed to load preset:\n{e}")
 
+    def _morph_preset(self):
+        """Morph from the current patch to a preset chosen from file."""
+        filepath, _ = QFileDialog.getOpenFileName(
+            self.main,
+            "Morph To Preset",
+            str(self.preset_manager.presets_dir),
+            "Preset Files (*.json)",
+        )
+        if filepath:
+            self._morph_to_preset_from_path(Path(filepath))
+
+    def _morph_to_preset_from_path(self, filepath: Path, seconds: float = MORPH_DEFAULT_SECONDS,
+                                   switch_at: float = MORPH_SWITCH_AT):
+        """
+        Glide continuous params to a preset file; discrete ones switch at switch_at.
+
+        Falls back to a hard load when there is nothing to glide from (SC not
+        connected, pack switch, live state unavailable).
+
+        Args:
+            filepath: Path to preset file
+            seconds: Morph duration
+            switch_at: Morph progress (0..1) at which discrete fields switch
+        """
+        try:
+            state = self.preset_manager.load(filepath)
+        except Exception as e:
+            logger.error(f"Failed to load preset: {e}", component="PRESET")
+            QMessageBox.warning(self.main, "Error", f"Failed to load preset:\n{e}")
+            return
+
+        self._cancel_morph()
+        live = self._live_state_for_diff(state) if self.main.osc_connected else None
+        if live is None or seconds <= 0:
+            self._apply_preset_from_path(filepath)
+            return
+
+        events = self._morph_events
+        morph = PresetMorph(
+            build_morph_plan(live, state), self.main.osc.send_coalesced, seconds, switch_at,
+            on_switch=lambda t: events.switched.emit(morph),
+            on_finished=lambda: events.finished.emit(morph),
+        )
+        self._morph = morph
+        self._morph_path = filepath
+        morph.start()
+        logger.info(
+            f"Morphing to {state.name}: {len(morph.plan)} params over {seconds:.1f}s",
+            component="PRESET"
+        )
+
+    def _cancel_morph(self):
+        """Stop a running morph where it is."""
+        morph, self._morph = self._morph, None
+        if morph is not None:
+            morph.cancel()
+
+    def _on_morph_switched(self, morph):
+        """Switch point: take on the target's discrete fields (Qt thread)."""
+        if morph is self._morph:
+            self._apply_preset_state(morph.plan.state_at(morph.progress))
+
+    def _on_morph_finished(self, morph):
+        """Morph done: settle the UI on the target preset (Qt thread)."""
+        if morph is not self._morph:
+            return
+        self._morph = None
+        state = morph.plan.target
+        self._apply_preset_state(state)
+        self.main.preset_name.setText(state.name)
+        logger.info(f"Preset morphed: {state.name} ({morph.sent} OSC values)", component="PRESET")
+        self.main._clear_dirty(state.name, self._morph_path)
+
     def _save_preset_to_path(self, filepath: Path, name: str):
         """
         Save current state to a specific path (R1.1 - used by PresetBrowser).
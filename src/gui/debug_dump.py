@@ -3,7 +3,7 @@ UI Debug Dump - generates full widget hierarchy with sizing info.
 Run with: python -c "from src.gui.debug_dump import dump_ui; dump_ui()"
 
 Hotkeys:
-  F4  - Dump ALL + hotfix status report
+  F4  - Dump ALL + hotfix status report (includes telemetry stage timings)
   F8  - Dump generator slots
   F12 - Dump modulator slots
 """
@@ -14,6 +14,8 @@ import os
 import json
 from datetime import datetime
 
+from src.telemetry.telemetry_profiler import profiler
+
 
 def widget_info(w):
     """Get detailed sizing info for a widget."""
@@ -178,6 +180,29 @@ def dump_ui():
             return
 
 
+def dump_telemetry_profile():
+    """Dump telemetry hot-path stage timings (p50/p99 per stage).
+
+    Timings are only collected while profiling is on (Telemetry panel
+    "Profile" checkbox, or profiler.enabled = True from a console).
+    """
+    lines = ["TELEMETRY STAGE TIMINGS"
+             + ("" if profiler.enabled else " (profiler disabled)")]
+    lines.extend(profiler.format_lines() or ["  (no samples)"])
+    output = '\n'.join(lines)
+
+    outpath = os.path.expanduser('~/Downloads/telemetry_profile.json')
+    with open(outpath, 'w') as f:
+        json.dump({
+            'timestamp': datetime.now().isoformat(),
+            'enabled': profiler.enabled,
+            'stages': profiler.summary(),
+        }, f, indent=2)
+
+    print(output)
+    print(f"\n\nSaved to {outpath}")
+
+
 # === HOTFIX STATUS CHECKS ===
 
 def check_fx_widths():
@@ -335,6 +360,11 @@ def dump_all():
     lines.append(f"\nHF-10 Hardcoded Colors:")
     lines.append("  (run: grep -rln '#[0-9a-fA-F]{{6}}' src/gui/*.py | grep -v theme.py)")
 
+    lines.append("\n" + "=" * 60)
+    lines.append("TELEMETRY STAGE TIMINGS")
+    lines.append("=" * 60 + "\n")
+    lines.extend(profiler.format_lines() or ["(no samples - enable Profile in the Telemetry panel)"])
+
     lines.append("\n" + "=" * 60)
     lines.append("WIDGET HIERARCHY")
     lines.append("=" * 60 + "\n")
@@ -359,6 +389,7 @@ def dump_all():
             'HF4_total_widgets': unnamed['total'],
             'HF4_unnamed_widgets': unnamed['unnamed'],
         },
+        'telemetry_profile': profiler.summary(),
         'widgets': collect_widget_geometry(main_window)
     }
 
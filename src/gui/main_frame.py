@@ -22,6 +22,7 @@ from src.gui.master_chain import MasterChain
 from src.gui.fx_grid import FXGrid
 from src.gui.fx_window import FXWindow
 from src.gui.modulator_grid import ModulatorGrid
+from src.gui.mod_scope import ModScopeController
 from src.gui.bpm_display import BPMDisplay
 from src.gui.pack_selector import PackSelector
 from src.gui.midi_selector import MIDISelector
@@ -261,9 +262,13 @@ class MainFrame(QMainWindow):
         left_layout.setContentsMargins(0, 0, 0, 0)
         left_layout.setSpacing(5)
 
-        # Modulator grid
+        # Modulator grid (scopes paint from one shared 16-bus history ring)
         self.modulator_grid = ModulatorGrid()
+        self.mod_scope_controller = ModScopeController(history_length=100)
+        for slot_id, slot in self.modulator_grid.slots.items():
+            self.mod_scope_controller.register_scope(slot_id, slot.scope)
         self.modulator_grid.generator_changed.connect(self.modulation.on_mod_generator_changed)
+        self.modulator_grid.generator_changed.connect(self.modulation._invalidate_value_targets)
         self.modulator_grid.parameter_changed.connect(self.modulation.on_mod_param_changed)
         self.modulator_grid.output_wave_changed.connect(self.modulation.on_mod_output_wave)
         self.modulator_grid.output_phase_changed.connect(self.modulation.on_mod_output_phase)
@@ -288,12 +293,14 @@ class MainFrame(QMainWindow):
         from PyQt5.QtCore import QTimer
         self._mod_scope_timer = QTimer(self)
         self._mod_scope_timer.timeout.connect(self.modulation._flush_mod_scopes)
+        self._mod_scope_timer.timeout.connect(self.modulation._flush_mod_values)
         self._mod_scope_timer.start(33)  # ~30fps
         
         # Center - GENERATORS
         self.generator_grid = GeneratorGrid(rows=2, cols=4)
         self.generator_grid.generator_selected.connect(self.generator.on_generator_selected)  # Legacy
         self.generator_grid.generator_changed.connect(self.generator.on_generator_changed)
+        self.generator_grid.generator_changed.connect(self.modulation._invalidate_value_targets)
         self.generator_grid.generator_changed.connect(self._on_generator_changed_arp_reset)
         self.generator_grid.generator_parameter_changed.connect(self.generator.on_generator_param_changed)
         self.generator_grid.generator_custom_parameter_changed.connect(self.generator.on_generator_custom_param_changed)
@@ -15,6 +15,8 @@ Layout:
 All changes update SC in real-time via signals.
 """
 
+from dataclasses import replace
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider, 
     QPushButton, QFrame
@@ -209,8 +211,11 @@ class ModConnectionPopup(QDialog):
         """Set UI state from connection (blocks signals to avoid feedback loop)."""
         self._syncing = True
         
-        # Always ensure depth is 1.0 and polarity is bipolar (we only use amount/offset now)
-        self.connection.depth = 1.0
+        # Depth is always 1.0 now (we only use amount/offset). Don't patch the
+        # stored connection in place: emit an update so the owner pushes it
+        # through ModRoutingState.update_connection (clears the range cache).
+        if self.connection.depth != 1.0:
+            self._schedule_update()
         
         # Block signals while syncing to avoid triggering change events
         self.amount_slider.blockSignals(True)
@@ -295,7 +300,7 @@ class ModConnectionPopup(QDialog):
 
         if self._pending_update:
             self._pending_update = False
-            self.connection_changed.emit(self.connection)
+            self.connection_changed.emit(replace(self.connection, depth=1.0))
 
     def _on_amount_changed(self, value: int):
         """Handle amount slider change."""
@@ -224,6 +224,11 @@ class ModRoutingState(QObject):
     
     Supports both generator routes (existing) and extended routes (new).
     Emits signals when connections change so UI and OSC can react.
+
+    Secondary indexes (per source bus, per generator slot/param, per
+    extended target) are kept in step with _connections so lookups don't
+    scan the whole matrix. Each index maps to a key -> connection dict,
+    preserving insertion order like a scan would.
     """
     
     # Signals
@@ -235,6 +240,58 @@ class ModRoutingState(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._connections: Dict[str, ModConnection] = {}  # key -> connection
+        self._by_bus: Dict[int, Dict[str, ModConnection]] = {}
+        self._by_slot: Dict[int, Dict[str, ModConnection]] = {}
+        self._by_target: Dict[Tuple[int, str], Dict[str, ModConnection]] = {}
+        self._by_target_str: Dict[str, Dict[str, ModConnection]] = {}
+        # target (slot, param) or target_str -> (delta_min, delta_max)
+        self._range_cache: Dict[Any, Tuple[float, float]] = {}
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _store(self, conn: ModConnection) -> None:
+        """Insert conn into _connections and every index."""
+        key = conn.key
+        self._connections[key] = conn
+        self._by_bus.setdefault(conn.source_bus, {})[key] = conn
+        if conn.is_extended:
+            self._by_target_str.setdefault(conn.target_str, {})[key] = conn
+        else:
+            self._by_slot.setdefault(conn.target_slot, {})[key] = conn
+            self._by_target.setdefault((conn.target_slot, conn.target_param), {})[key] = conn
+        self._range_cache.pop(self._target_of(conn), None)
+
+    def _discard(self, key: str) -> Optional[ModConnection]:
+        """Remove key from _connections and every index; returns the connection."""
+        conn = self._connections.pop(key, None)
+        if conn is None:
+            return None
+        _drop(self._by_bus, conn.source_bus, key)
+        if conn.is_extended:
+            _drop(self._by_target_str, conn.target_str, key)
+        else:
+            _drop(self._by_slot, conn.target_slot, key)
+            _drop(self._by_target, (conn.target_slot, conn.target_param), key)
+        self._range_cache.pop(self._target_of(conn), None)
+        return conn
+
+    def _reset(self) -> None:
+        """Drop every connection and index without emitting signals."""
+        self._connections.clear()
+        self._by_bus.clear()
+        self._by_slot.clear()
+        self._by_target.clear()
+        self._by_target_str.clear()
+        self._range_cache.clear()
+
+    @staticmethod
+    def _target_of(conn: ModConnection):
+        """Range cache key for a connection's target."""
+        if conn.is_extended:
+            return conn.target_str
+        return (conn.target_slot, conn.target_param)
     
     def add_connection(self, conn: ModConnection) -> bool:
         """
@@ -245,7 +302,7 @@ class ModRoutingState(QObject):
         if conn.key in self._connections:
             return False
         
-        self._connections[conn.key] = conn
+        self._store(conn)
         self.connection_added.emit(conn)
         return True
     
@@ -265,7 +322,7 @@ class ModRoutingState(QObject):
         else:
             key = f"{source_bus}_{target_slot}_{target_param}"
         
-        conn = self._connections.pop(key, None)
+        conn = self._discard(key)
         if conn is None:
             return False
         
@@ -317,6 +374,7 @@ class ModRoutingState(QObject):
         if invert is not None:
             conn.invert = invert
         
+        self._range_cache.pop(self._target_of(conn), None)
         self.connection_changed.emit(conn)
         return True
     
@@ -352,18 +410,57 @@ class ModRoutingState(QObject):
     
     def get_connections_for_bus(self, source_bus: int) -> List[ModConnection]:
         """Get all connections from a specific mod bus."""
-        return [c for c in self._connections.values() if c.source_bus == source_bus]
+        return list(self._by_bus.get(source_bus, {}).values())
     
     def get_connections_for_target(self, target_slot: Optional[int] = None, 
                                    target_param: Optional[str] = None) -> List[ModConnection]:
         """Get all connections to a specific generator slot (and optionally param)."""
         if target_slot is None:
             return []
-        conns = [c for c in self._connections.values() 
-                if not c.is_extended and c.target_slot == target_slot]
         if target_param:
-            conns = [c for c in conns if c.target_param == target_param]
-        return conns
+            return list(self._by_target.get((target_slot, target_param), {}).values())
+        return list(self._by_slot.get(target_slot, {}).values())
+
+    def get_connections_for_target_str(self, target_str: str) -> List[ModConnection]:
+        """Get all extended connections to a target wire key ("mod:1:p1", ...)."""
+        return list(self._by_target_str.get(target_str, {}).values())
+
+    def get_mod_range(self, target_slot: Optional[int] = None,
+                      target_param: Optional[str] = None,
+                      target_str: Optional[str] = None) -> Tuple[float, float]:
+        """
+        Combined modulation offset range for one target.
+
+        Sums each connection's polarity-shaped range (plus offset) into
+        (delta_min, delta_max), normalized. Cached until a connection to
+        the target is added, removed or updated.
+        """
+        if target_str is not None:
+            target = target_str
+            conns = self._by_target_str.get(target_str)
+        else:
+            target = (target_slot, target_param)
+            conns = self._by_target.get(target)
+
+        cached = self._range_cache.get(target)
+        if cached is not None:
+            return cached
+
+        delta_min = 0.0
+        delta_max = 0.0
+        for c in (conns or {}).values():
+            r = c.effective_range
+            if c.polarity == Polarity.BIPOLAR:
+                mn, mx = -r, +r
+            elif c.polarity == Polarity.UNI_POS:
+                mn, mx = 0.0, +r
+            else:  # UNI_NEG
+                mn, mx = -r, 0.0
+            delta_min += mn + c.offset
+            delta_max += mx + c.offset
+
+        self._range_cache[target] = (delta_min, delta_max)
+        return delta_min, delta_max
     
     def get_generator_connections(self) -> List[ModConnection]:
         """Get all generator (non-extended) connections."""
@@ -382,8 +479,7 @@ class ModRoutingState(QObject):
         # Remove each connection individually to trigger OSC messages
         keys = list(self._connections.keys())
         for key in keys:
-            conn = self._connections[key]
-            del self._connections[key]
+            conn = self._discard(key)
             self.connection_removed.emit(conn)
         self.all_cleared.emit()
     
@@ -451,17 +547,17 @@ class ModRoutingState(QObject):
         # ----------------------------------------------------------------
         # 2. Clear local state (don't emit individual remove signals)
         # ----------------------------------------------------------------
-        self._connections.clear()
+        self._reset()
 
         # ----------------------------------------------------------------
         # 3. Add all desired routes
         # ----------------------------------------------------------------
         for conn in desired_gen_conns.values():
-            self._connections[conn.key] = conn
+            self._store(conn)
             self.connection_added.emit(conn)
 
         for conn in desired_ext_conns.values():
-            self._connections[conn.key] = conn
+            self._store(conn)
             self.connection_added.emit(conn)
 
         # Signal that all routes were cleared and replaced
@@ -533,13 +629,13 @@ class ModRoutingState(QObject):
         # ----------------------------------------------------------------
         # 4. Replace local state (clear then add)
         # ----------------------------------------------------------------
-        self._connections.clear()
+        self._reset()
 
         for conn in desired_gen.values():
-            self._connections[conn.key] = conn
+            self._store(conn)
 
         for conn in desired_ext.values():
-            self._connections[conn.key] = conn
+            self._store(conn)
 
         # ----------------------------------------------------------------
         # 5. Return deltas for OSC projection
@@ -562,3 +658,12 @@ class ModRoutingState(QObject):
 
     def __contains__(self, key: str) -> bool:
         return key in self._connections
+
+
+def _drop(index: Dict[Any, Dict[str, ModConnection]], bucket, key: str) -> None:
+    """Remove key from index[bucket], dropping the bucket once empty."""
+    entries = index.get(bucket)
+    if entries is not None:
+        entries.pop(key, None)
+        if not entries:
+            del index[bucket]
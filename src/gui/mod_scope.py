@@ -4,14 +4,22 @@ Real-time waveform display for mod source outputs
 
 Shows 4 traces (A/B/C/D or X/Y/Z/R) with circular buffer history.
 Receives values from SC via OSC at ~30fps.
+
+History lives in a ScopeRing: one (rows, 2 * length) float32 array where
+every column is written twice (at head and head + length), so the last
+`length` samples are always a contiguous, zero-copy view. ModScopeController
+owns one ring for all 16 mod buses and fills it from the batched
+/noise/mod/bus/values message; each registered ModScope paints from its
+slot's 4 rows.
 """
 
-from collections import deque
+import numpy as np
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath
+from PyQt5.QtGui import QPainter, QColor, QPen
 
 from .theme import COLORS
+from .trace_render import to_polygon, trace_points
 
 
 def _hex_to_qcolor(hex_str):
@@ -20,6 +28,44 @@ def _hex_to_qcolor(hex_str):
     return QColor(int(hex_str[0:2], 16), int(hex_str[2:4], 16), int(hex_str[4:6], 16))
 
 
+class ScopeRing:
+    """Fixed-length history for a block of traces, written a column at a time."""
+
+    def __init__(self, rows, length):
+        self.rows = rows
+        self.length = length
+        self._data = np.zeros((rows, 2 * length), dtype=np.float32)
+        self._head = 0  # next column to write
+
+    def push(self, frames):
+        """
+        Append samples for every row.
+
+        Args:
+            frames: (k, rows) array, oldest first (k may exceed length)
+        """
+        frames = np.asarray(frames, dtype=np.float32)[-self.length:]
+        k = len(frames)
+        if k == 0:
+            return
+        cols = (self._head + np.arange(k)) % self.length
+        self._data[:, cols] = frames.T
+        self._data[:, cols + self.length] = frames.T
+        self._head = (self._head + k) % self.length
+
+    def latest(self):
+        """(rows,) most recent column."""
+        return self._data[:, self._head - 1 + self.length]
+
+    def view(self, start=0, stop=None):
+        """(rows, length) oldest-first view of rows start:stop (no copy)."""
+        return self._data[start:stop, self._head:self._head + self.length]
+
+    def clear(self, start=0, stop=None):
+        """Zero rows start:stop."""
+        self._data[start:stop] = 0.0
+
+
 class ModScope(QWidget):
     """
     Oscilloscope-style display for mod source outputs.
@@ -35,13 +81,9 @@ class ModScope(QWidget):
         super().__init__(parent)
         self.history_length = history_length
         
-        # Circular buffers for each output (0, 1, 2, 3)
-        self.buffers = [
-            deque([0.0] * history_length, maxlen=history_length),
-            deque([0.0] * history_length, maxlen=history_length),
-            deque([0.0] * history_length, maxlen=history_length),
-            deque([0.0] * history_length, maxlen=history_length),
-        ]
+        # History for outputs 0-3: own ring until attached to a shared one
+        self._ring = ScopeRing(4, history_length)
+        self._row = 0
         
         # Display mode: 'bipolar' (-1 to +1) or 'unipolar' (0 to 1)
         self.display_mode = 'bipolar'
@@ -63,17 +105,23 @@ class ModScope(QWidget):
         self.setMinimumHeight(50)
         self.setStyleSheet(f"background-color: {COLORS['background']};")
         
-    def push_value(self, output_idx, value):
+    def attach_ring(self, ring, row):
         """
-        Add a new value to the specified output buffer.
+        Paint from rows row..row+3 of a shared ring (see ModScopeController).
         
         Args:
-            output_idx: 0, 1, 2, or 3 (A/X, B/Y, C/Z, D/R)
-            value: float, typically -1 to +1 or 0 to 1
+            ring: ScopeRing holding this scope's 4 outputs
+            row: First row of this scope's outputs
         """
-        if 0 <= output_idx < 4:
-            self.buffers[output_idx].append(value)
-            
+        self._ring = ring
+        self._row = row
+        self.history_length = ring.length
+        
+    @property
+    def buffers(self):
+        """(4, history_length) oldest-first view of the output histories."""
+        return self._ring.view(self._row, self._row + 4)
+        
     def push_values(self, values):
         """
         Add values for all 4 outputs at once.
@@ -81,14 +129,13 @@ class ModScope(QWidget):
         Args:
             values: list of 4 floats [A, B, C, D]
         """
-        for i, val in enumerate(values[:4]):
-            self.buffers[i].append(val)
+        frame = self._ring.latest().copy()  # other rows of a shared ring hold
+        frame[self._row:self._row + len(values[:4])] = values[:4]
+        self._ring.push(frame[np.newaxis])
             
     def clear(self):
         """Clear all buffers to zero."""
-        for buf in self.buffers:
-            buf.clear()
-            buf.extend([0.0] * self.history_length)
+        self._ring.clear(self._row, self._row + 4)
             
     def set_display_mode(self, mode):
         """Set display mode: 'bipolar' or 'unipolar'."""
@@ -161,7 +208,7 @@ class ModScope(QWidget):
                 
     def _draw_trace(self, painter, w, h, output_idx):
         """Draw a single trace."""
-        buf = self.buffers[output_idx]
+        buf = self._ring.view(self._row + output_idx, self._row + output_idx + 1)[0]
         if len(buf) < 2:
             return
             
@@ -169,44 +216,37 @@ class ModScope(QWidget):
         pen.setWidth(2)
         painter.setPen(pen)
         
-        path = QPainterPath()
-        
-        for i, val in enumerate(buf):
-            x = int(w * i / (len(buf) - 1))
-            
-            # Map value to y coordinate
-            if self.display_mode == 'bipolar':
-                # -1 → bottom, +1 → top
-                y = int(h * (1 - (val + 1) / 2))
-            else:
-                # 0 → bottom, 1 → top
-                y = int(h * (1 - val))
-                
-            # Clamp y to widget bounds
-            y = max(0, min(h - 1, y))
-            
-            if i == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
-                
-        painter.drawPath(path)
+        if self.display_mode == 'bipolar':
+            # -1 → bottom, +1 → top
+            points = trace_points(buf, w, h / 2, h / 2, 0, h - 1)
+        else:
+            # 0 → bottom, 1 → top
+            points = trace_points(buf, w, h, h, 0, h - 1)
+        painter.drawPolyline(to_polygon(points))
 
 
 class ModScopeController:
     """
     Manages scope updates from OSC messages.
     
-    Connects to OSC bridge and routes bus values to the correct scope.
+    Owns the shared 16-bus history ring; the OSC bridge delivers one
+    batched frame per SC scope tick and push_frames() stores it with a
+    single array write. Registered scopes paint from their slot's rows.
     """
     
-    def __init__(self):
+    NUM_SLOTS = 4
+    OUTPUTS_PER_SLOT = 4
+    NUM_BUSES = NUM_SLOTS * OUTPUTS_PER_SLOT
+    
+    def __init__(self, history_length=128):
+        self.ring = ScopeRing(self.NUM_BUSES, history_length)
         self.scopes = {}  # slot_id -> ModScope widget
         self.enabled_slots = set()
         
     def register_scope(self, slot_id, scope_widget):
-        """Register a scope widget for a slot."""
+        """Register a scope widget for a slot and point it at the shared ring."""
         self.scopes[slot_id] = scope_widget
+        scope_widget.attach_ring(self.ring, (slot_id - 1) * self.OUTPUTS_PER_SLOT)
         
     def unregister_scope(self, slot_id):
         """Remove a scope widget."""
@@ -219,20 +259,23 @@ class ModScopeController:
         else:
             self.enabled_slots.discard(slot_id)
             
-    def on_bus_value(self, bus_idx, value):
+    def push_frames(self, slot_mask, frames):
         """
-        Handle incoming bus value from OSC.
+        Store a batch of bus values from /noise/mod/bus/values.
         
         Args:
-            bus_idx: 0-15 (4 slots × 4 outputs)
-            value: float
+            slot_mask: Bit (slot_id - 1) set for each slot SC is streaming;
+                buses of other slots hold their last value
+            frames: (k, 16) bus values, oldest first
+            
+        Returns:
+            Set of slot_ids that received new values
         """
-        # Calculate slot and output from bus index
-        slot_id = (bus_idx // 4) + 1  # 1-4
-        output_idx = bus_idx % 4       # 0-3
-        
-        if slot_id in self.enabled_slots and slot_id in self.scopes:
-            self.scopes[slot_id].push_value(output_idx, value)
+        frames = np.asarray(frames, dtype=np.float32).reshape(-1, self.NUM_BUSES)
+        streaming = [(slot_mask >> i) & 1 for i in range(self.NUM_SLOTS)]
+        live = np.repeat(np.array(streaming, dtype=bool), self.OUTPUTS_PER_SLOT)
+        self.ring.push(np.where(live, frames, self.ring.latest()))
+        return {i + 1 for i, on in enumerate(streaming) if on}
             
     def update_displays(self):
         """Trigger repaint on all enabled scopes."""
@@ -172,7 +172,7 @@ class PresetBrowser(QWidget):
         self._operation_in_progress: Optional[OperationType] = None
         self._operation_ctx: Optional[OperationContext] = None
         self._selected_preset_path: Optional[str] = None
-        self._all_presets: List[tuple] = []  # [(canon_path, name, rating, updated)]
+        self._all_presets: List[tuple] = []  # [(canon_path, name, rating, updated, search_key)]
 
         self._setup_ui()
         self._refresh_lists()
@@ -371,39 +371,37 @@ class PresetBrowser(QWidget):
             self._recents_list.addItem(item)
 
     def _refresh_all_presets(self):
-        """Refresh the all presets list from disk."""
+        """Refresh the all presets list from the preset metadata index.
+
+        Only presets that are new or changed on disk since the last refresh
+        are loaded; unreadable ones are skipped (see PresetIndex).
+        """
         self._all_presets = []
 
-        # Scan preset directory
         preset_dir = self.preset_manager.presets_dir
         if not preset_dir.exists():
             return
 
-        for file_path in preset_dir.glob("*.json"):
-            try:
-                # Check for orphan placeholder (0-byte file)
-                if file_path.stat().st_size == 0:
-                    # Per spec: attempt best-effort deletion once per session
-                    canon = canonical_path(str(file_path))
-                    if not self.recents_manager.has_placeholder_deletion_failed(canon):
-                        try:
-                            file_path.unlink()
-                        except OSError:
-                            self.recents_manager.mark_placeholder_deletion_failed(canon)
-                    continue
-
-                # Load preset metadata
-                state = self.preset_manager.load(file_path)
-                canon = canonical_path(str(file_path))
-                self._all_presets.append((
-                    canon,
-                    state.name,
-                    state.rating,
-                    state.updated
-                ))
-            except (PresetError, OSError):
-                # Skip unreadable presets
-                continue
+        refreshed = self.preset_manager.index.refresh()
+
+        # Orphan placeholders (0-byte files)
+        for file_path in refreshed.placeholders:
+            # Per spec: attempt best-effort deletion once per session
+            canon = canonical_path(str(file_path))
+            if not self.recents_manager.has_placeholder_deletion_failed(canon):
+                try:
+                    file_path.unlink()
+                except OSError:
+                    self.recents_manager.mark_placeholder_deletion_failed(canon)
+
+        for entry in refreshed.entries:
+            self._all_presets.append((
+                canonical_path(str(preset_dir / entry.filename)),
+                entry.name,
+                entry.rating,
+                entry.updated,
+                entry.search_key,
+            ))
 
         # Sort by updated date descending (default DATE_DESC)
         self._all_presets.sort(key=lambda x: x[3] or "", reverse=True)
@@ -416,9 +414,8 @@ class PresetBrowser(QWidget):
         query = self._search_box.text()
         q = unicodedata.normalize("NFC", query).casefold().strip()
 
-        for canon, name, rating, updated in self._all_presets:
+        for canon, name, rating, updated, name_norm in self._all_presets:
             # Match rule: empty query or substring match
-            name_norm = unicodedata.normalize("NFC", name).casefold()
             if not q or q in name_norm:
                 item = PresetListItem(
                     path=canon,
@@ -795,8 +792,7 @@ class PresetBrowser(QWidget):
 
         try:
             # Delete file
-            if file_path.exists():
-                file_path.unlink()
+            self.preset_manager.delete(file_path)
 
             # Remove from recents
             self.recents_manager.remove(self._selected_preset_path)
@@ -11,11 +11,12 @@ from PyQt5.QtWidgets import (
     QFrame, QSizePolicy
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath, QFont
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont
 
 import numpy as np
 
 from .theme import COLORS, MONO_FONT, FONT_SIZES
+from .trace_render import TraceCache, trace_points
 
 
 # =============================================================================
@@ -51,10 +52,13 @@ class ScopeDisplay(QWidget):
         self._grid = QColor(SCOPE_GRID)
         self._trigger = QColor(SCOPE_TRIGGER)
 
+        self._traces = TraceCache()
+
     def set_waveform(self, data):
         """Update waveform data (numpy array, values -1 to +1)."""
         if data is not None and len(data) > 1:
             self.waveform = data
+            self._traces.invalidate()
             self.update()
 
     def set_threshold(self, threshold):
@@ -126,22 +130,11 @@ class ScopeDisplay(QWidget):
         pen.setWidth(2)
         painter.setPen(pen)
 
-        path = QPainterPath()
-        num_points = len(data)
-
-        for i in range(num_points):
-            x = w * i / (num_points - 1)
-            # Map -1..+1 to bottom..top
-            val = float(data[i])
-            y = h * (1.0 - (val + 1.0) / 2.0)
-            y = max(0.0, min(float(h - 1), y))
-
-            if i == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
-
-        painter.drawPath(path)
+        # Map -1..+1 to bottom..top, min/max decimated to the pixel width
+        polygon = self._traces.polygon(
+            'trace', data, (w, h),
+            lambda d: trace_points(d, w, h / 2, h / 2, 0.0, float(h - 1)))
+        painter.drawPolyline(polygon)
 
 
 # =============================================================================
@@ -26,8 +26,10 @@ from PyQt5.QtWidgets import (  # noqa: E501
 from src.audio.telemetry_controller import TelemetryController
 from src.config import get_generator_synthdef, TELEM_SOURCES
 from src.gui.theme import COLORS, FONT_FAMILY, MONO_FONT, FONT_SIZES
+from src.gui.trace_render import PersistenceLayer, TraceCache, trace_points
 from src.gui.widgets import MidiButton
 from src.telemetry.stabilizer import StabilityState
+from src.telemetry.telemetry_profiler import STAGE_PAINT, profiler
 
 
 # =============================================================================
@@ -117,6 +119,8 @@ class WaveformDisplay(QWidget):
         self._ideal = None      # np.ndarray
         self._delta = None      # np.ndarray — |actual - ideal|
         self._persistence_frames = []  # List of np.ndarray for persistence overlay
+        self._persistence = PersistenceLayer()
+        self._traces = TraceCache()   # actual / ideal / delta polygons
         self._render_mode = "persistence"  # "single" or "persistence"
         self._show_ideal = True
         self._show_delta = False
@@ -125,14 +129,19 @@ class WaveformDisplay(QWidget):
         self._peak_clipping = False  # stage1 peak > 0.90
 
     def set_waveform(self, actual, ideal=None, delta=None):
+        """Show new trace arrays; the same arrays again keep their cached polygons."""
+        if actual is self._actual and ideal is self._ideal and delta is self._delta:
+            return
         self._actual = actual
         self._ideal = ideal
         self._delta = delta
+        self._traces.retain(id(d) for d in (actual, ideal, delta) if d is not None)
         self.update()
 
     def set_persistence_frames(self, frames):
         """Set persistence buffer frames for overlay rendering."""
         self._persistence_frames = list(frames)
+        self._persistence.set_frames(self._persistence_frames)
 
     def set_render_mode(self, mode):
         """Set render mode: 'single' or 'persistence'."""
@@ -159,6 +168,7 @@ class WaveformDisplay(QWidget):
         self.update()
 
     def paintEvent(self, event):
+        t0 = profiler.start()
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
         w, h = self.width(), self.height()
@@ -192,11 +202,8 @@ class WaveformDisplay(QWidget):
                 and self._actual is not None):
             persist_color = QColor(COLORS['scope_trace_a'])
             persist_color.setAlpha(35)
-            persist_pen = QPen(persist_color, 1.0)
-            for frame in self._persistence_frames:
-                if frame is not None and len(frame) > 1:
-                    p.setPen(persist_pen)
-                    self._draw_trace_raw(p, frame)
+            self._persistence.draw(p, (w, h), self.devicePixelRatioF(),
+                                   QPen(persist_color, 1.0), self._trace_points)
 
         # Draw ideal trace (dimmer, behind actual)
         if self._show_ideal and self._ideal is not None and len(self._ideal) > 1:
@@ -227,51 +234,19 @@ class WaveformDisplay(QWidget):
                 p.drawText(0, 0, w, h, Qt.AlignCenter, "Waiting for waveform...")
 
         p.end()
+        profiler.stop(STAGE_PAINT, t0)
 
     def _draw_trace(self, painter, data, color, width):
-        w, h = self.width(), self.height()
-        n = len(data)
-        mid_y = h / 2
-        scale = mid_y * 0.9  # Leave margin
-        clamp = h * 2  # Pixel clamp to prevent int32 overflow
-
         painter.setPen(QPen(QColor(color), width))
+        size = (self.width(), self.height())
+        painter.drawPolyline(self._traces.polygon(id(data), data, size, self._trace_points))
 
-        prev_x = 0
-        val = float(data[0])
-        if not np.isfinite(val):
-            val = 0.0
-        prev_y = max(-clamp, min(clamp, mid_y - val * scale))
-        for i in range(1, n):
-            x = int(i * w / n)
-            val = float(data[i])
-            if not np.isfinite(val):
-                val = 0.0
-            y = max(-clamp, min(clamp, mid_y - val * scale))
-            painter.drawLine(int(prev_x), int(prev_y), int(x), int(y))
-            prev_x, prev_y = x, y
-
-    def _draw_trace_raw(self, painter, data):
-        """Draw trace using the painter's current pen (for persistence overlays)."""
+    def _trace_points(self, data):
         w, h = self.width(), self.height()
-        n = len(data)
         mid_y = h / 2
-        scale = mid_y * 0.9
-        clamp = h * 2
-
-        prev_x = 0
-        val = float(data[0])
-        if not np.isfinite(val):
-            val = 0.0
-        prev_y = max(-clamp, min(clamp, mid_y - val * scale))
-        for i in range(1, n):
-            x = int(i * w / n)
-            val = float(data[i])
-            if not np.isfinite(val):
-                val = 0.0
-            y = max(-clamp, min(clamp, mid_y - val * scale))
-            painter.drawLine(int(prev_x), int(prev_y), int(x), int(y))
-            prev_x, prev_y = x, y
+        scale = mid_y * 0.9  # Leave margin
+        clamp = h * 2  # Pixel clamp to prevent int32 overflow
+        return trace_points(data, w, mid_y, scale, -clamp, clamp, endpoint=False)
 
 
 # =============================================================================
@@ -405,6 +380,10 @@ class TelemetryWidget(QWidget):
         self._setup_ui()
         self._setup_refresh_timer()
 
+        self._twin_cancelling = False
+        self.controller.twin_progress.connect(self._on_twin_progress)
+        self.controller.twin_finished.connect(self._on_twin_finished)
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -779,6 +758,13 @@ class TelemetryWidget(QWidget):
 
         bottom_row.addStretch()
 
+        # Hot-path stage timings (see telemetry_profiler)
+        self.profile_cb = QCheckBox("Profile")
+        self.profile_cb.setStyleSheet(f"color: {COLORS['text']}; font-size: {FONT_SIZES['small']}px;")
+        self.profile_cb.setChecked(profiler.enabled)
+        self.profile_cb.toggled.connect(self._on_profile_toggled)
+        bottom_row.addWidget(self.profile_cb)
+
         # Frame count
         self.frame_count_label = QLabel("Frames: 0")
         self.frame_count_label.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: {FONT_SIZES['tiny']}px;")
@@ -786,6 +772,13 @@ class TelemetryWidget(QWidget):
 
         layout.addLayout(bottom_row)
 
+        self.profile_label = QLabel("")
+        self.profile_label.setStyleSheet(
+            f"color: {COLORS['text_dim']}; font-size: {FONT_SIZES['tiny']}px; font-family: {MONO_FONT};"
+        )
+        self.profile_label.setVisible(profiler.enabled)
+        layout.addWidget(self.profile_label)
+
     def _setup_refresh_timer(self):
         """Refresh UI — rate adapts to telemetry mode.
 
@@ -823,7 +816,7 @@ class TelemetryWidget(QWidget):
             self.wave_enable_cb.setChecked(False)
             self.wave_enable_cb.blockSignals(False)
             self.waveform_display.set_capture_enabled(False)
-            self.controller.current_waveform = None
+            self.controller.clear_waveform()
             self.waveform_display.set_waveform(None)
             self._timer.setInterval(125)
 
@@ -844,7 +837,7 @@ class TelemetryWidget(QWidget):
                 if self.controller._capture_type == TelemetryController.CAPTURE_INTERNAL:
                     self.controller.disable_waveform(slot)
                 self.controller.waveform_active = False
-            self.controller.current_waveform = None  # Clear stale buffer
+            self.controller.clear_waveform()  # Clear stale buffer
             self.waveform_display.set_waveform(None)
             # Drop back to monitor rate
             self.controller.set_rate(TelemetryController.MONITOR_RATE)
@@ -856,6 +849,14 @@ class TelemetryWidget(QWidget):
     def _on_delta_toggled(self, checked):
         self.waveform_display.set_show_delta(checked)
 
+    def _on_profile_toggled(self, checked):
+        """Start/stop stage timing; each run starts from empty histograms."""
+        if checked:
+            profiler.reset()
+        profiler.enabled = checked
+        self.profile_label.setText("Profiling... (waiting for frames)" if checked else "")
+        self.profile_label.setVisible(checked)
+
     def _on_inv_toggled(self, checked):
         self.controller.phase_inverted = checked
         self.controller._err_history.clear()  # Reset rolling average on flip
@@ -886,22 +887,33 @@ class TelemetryWidget(QWidget):
         self.waveform_display.update()
 
     def _on_auto_lock(self):
-        """Run Nelder-Mead optimizer and sync sliders to result."""
-        if not self.controller.enabled or self.controller.current_waveform is None:
+        """Start the Auto-Twin optimizer in the background (click again to cancel)."""
+        if self.controller.twin_running:
+            self.controller.cancel_twin()
+            self._twin_cancelling = True
+            self.auto_lock_btn.setText("CANCELLING...")
             return
 
-        self.auto_lock_btn.setText("LOCKING...")
-        self.auto_lock_btn.setEnabled(False)
-        self.auto_lock_btn.repaint()  # Force immediate visual update
+        if not self.controller.enabled or self.controller.current_waveform is None:
+            return
 
-        result = self.controller.optimize_twin()
+        if self.controller.optimize_twin_async():
+            self._twin_cancelling = False
+            self.auto_lock_btn.setText("LOCKING...")
 
-        self.auto_lock_btn.setEnabled(True)
+    def _on_twin_progress(self, iteration, error):
+        if not self._twin_cancelling:
+            self.auto_lock_btn.setText(f"LOCKING {error:.3f}")
 
-        if result is None:
+    def _on_twin_finished(self, result):
+        """Apply optimizer result and sync sliders."""
+        self._twin_cancelling = False
+        if result is None or result['cancelled']:
             self.auto_lock_btn.setText("AUTO LOCK")
             return
 
+        self.controller.apply_twin_result(result)
+
         # Sync OS slider to optimized phase
         os_val = int(result['phase'] * 1280.0)
         self.os_slider.blockSignals(True)
@@ -952,10 +964,13 @@ class TelemetryWidget(QWidget):
     def _on_export(self):
         from pathlib import Path
         home = str(Path.home())
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Export Telemetry History", home, "JSON (*.json)"
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Export Telemetry History", home,
+            "NumPy columns (*.npz);;JSON (*.json)"
         )
         if path:
+            if not Path(path).suffix:
+                path += ".json" if selected.startswith("JSON") else ".npz"
             self.controller.export_history(path)
 
     # ── Generator context ──
@@ -1026,10 +1041,15 @@ class TelemetryWidget(QWidget):
     # ── Refresh ──
 
     def _refresh(self):
-        """Update display from latest telemetry data."""
+        """Update display from latest telemetry data.
+
+        Waveform metrics come from one TelemetryResult snapshot published
+        by the controller's worker thread.
+        """
         data = self.controller.get_latest()
         if data is None:
             return
+        result = self.controller.latest_result
 
         # Parameters
         freq = data.get('freq', 0)
@@ -1064,7 +1084,7 @@ class TelemetryWidget(QWidget):
         self.square_row_widget.setVisible(ref_name == "SQUARE")
 
         # Live RMS error (Digital Twin match quality)
-        err = self.controller.current_rms_error
+        err = result.rms_error if result is not None else 0.0
         self.param_values["ERR"].setText(f"{err:.3f}")
         if err > 0 and err < 0.10:
             err_color = COLORS['meter_normal']
@@ -1100,7 +1120,7 @@ class TelemetryWidget(QWidget):
         )
 
         # Living Proof metrics
-        cf = self.controller.current_crest_factor
+        cf = result.crest_factor if result is not None else 0.0
         if cf > 0.01:
             self.crest_value.setText(f"{cf:.2f}")
             # Color: green < 1.4 (compressed), yellow 1.4-1.7, white > 1.7 (peaky)
@@ -1115,13 +1135,13 @@ class TelemetryWidget(QWidget):
         else:
             self.crest_value.setText("---")
 
-        hf = self.controller.current_hf_energy
+        hf = result.hf_energy if result is not None else 0.0
         if hf > 0.001:
             self.hf_value.setText(f"{hf:.3f}")
         else:
             self.hf_value.setText("---")
 
-        dc = self.controller.current_dc_shift
+        dc = result.dc_shift if result is not None else 0.0
         if abs(dc) > 0.0001:
             self.dc_value.setText(f"{dc:+.4f}")
             dc_color = COLORS['meter_warn'] if abs(dc) > 0.01 else COLORS['text']
@@ -1138,7 +1158,7 @@ class TelemetryWidget(QWidget):
 
         # Core Lock / Phase Inversion Warning
         bad = data.get('bad_value', 0)
-        rms_err = self.controller.current_rms_error
+        rms_err = err
         phase_locked = not self.controller.has_phase_lock_warning(data)
         if bad > 0:
             err_txt = "NaN" if bad == 1 else "∞"
@@ -1149,27 +1169,25 @@ class TelemetryWidget(QWidget):
             if self.core_lock_label.text():
                 self.core_lock_label.setText("")
 
-        # Waveform — inject actual waveform into data for forensic body measurement
-        actual = self.controller.current_waveform
+        # Waveform
+        actual = result.waveform if result is not None else None
         if actual is not None:
-            data['waveform'] = actual
             # Auto-enable capture display when receiving waveforms in external mode
             # This ensures MorphMapper sweeps show waveforms even though the UI
             # checkbox wasn't manually checked (MorphMapper controls the controller directly)
             if self.controller._capture_type == TelemetryController.CAPTURE_EXTERNAL:
                 if not self.waveform_display._capture_enabled:
                     self.waveform_display.set_capture_enabled(True)
-        ideal = self.controller.get_ideal_waveform(data) if self.ideal_cb.isChecked() else None
-        delta = self.controller.get_delta_waveform() if self.delta_cb.isChecked() else None
+        # Ideal and delta are rendered by the worker alongside the RMS error
+        ideal = result.ideal if result is not None and self.ideal_cb.isChecked() else None
+        delta = result.delta if result is not None and self.delta_cb.isChecked() else None
         self.waveform_display.set_waveform(actual, ideal, delta)
 
         # Stabilizer: update persistence display and render mode
-        stab_result = self.controller.last_stabilizer_result
+        stab_result = result.stabilizer if result is not None else None
         if stab_result is not None:
             self.waveform_display.set_render_mode(stab_result.render_mode)
-            self.waveform_display.set_persistence_frames(
-                list(self.controller.persistence_buffer)
-            )
+            self.waveform_display.set_persistence_frames(result.persistence_frames)
             # Update stabilize button to reflect state
             if stab_result.stability_state == StabilityState.REACQUIRE:
                 count = stab_result.stable_count
@@ -1181,6 +1199,11 @@ class TelemetryWidget(QWidget):
         # Frame count
         self.frame_count_label.setText(f"Frames: {len(self.controller.history)}")
 
+        if profiler.enabled:
+            lines = profiler.format_lines()
+            if lines:
+                self.profile_label.setText("\n".join(lines))
+
     def closeEvent(self, event):
         """Disable telemetry when window closes."""
         self.controller.disable()  # Also stops waveform capture
@@ -0,0 +1,162 @@
+"""
+Trace Render - vectorized waveform polylines for the scope displays.
+
+Turns a NumPy sample buffer into a QPolygonF in one pass instead of a
+per-sample QPainterPath loop:
+
+- trace_points() maps samples to pixel coordinates, min/max decimated to
+  the widget's pixel width (every column keeps its extremes, in sample order)
+- to_polygon() fills a QPolygonF straight from the (N, 2) float64 array
+- TraceCache keeps each polygon until its array or the widget size changes
+- PersistenceLayer composites persistence frames into one cached QImage,
+  drawing only frames it has not drawn yet
+"""
+
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QImage, QPainter, QPolygonF
+
+
+def trace_points(data, width, mid_y, scale, y_min, y_max, endpoint=True):
+    """
+    Map samples to (x, y) pixel coordinates.
+
+    Args:
+        data: 1-D sample buffer (non-finite values draw as 0)
+        width: Pixel width of the trace
+        mid_y: Pixel row of value 0
+        scale: Pixels per unit (positive values go up)
+        y_min, y_max: Pixel clamp for y
+        endpoint: Last sample lands on x = width (else width * (n-1) / n)
+
+    Returns:
+        (N, 2) float64 array. When there are more than two samples per
+        pixel column, only each column's min and max samples are kept.
+    """
+    values = np.asarray(data, dtype=np.float64)
+    n = len(values)
+    values = np.where(np.isfinite(values), values, 0.0)
+    y = np.clip(mid_y - values * scale, y_min, y_max)
+    step = width / (n - 1) if endpoint else width / n
+    x = np.arange(n) * step
+
+    if n > 2 * max(width, 1):
+        idx = _minmax_indices(x.astype(np.int64), y)
+        x, y = x[idx], y[idx]
+    return np.column_stack((x, y))
+
+
+def _minmax_indices(columns, y):
+    """Sample indices of each column's min and max, plus both endpoints."""
+    n = len(y)
+    order = np.lexsort((y, columns))
+    starts = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.r_[0, order[starts], order[ends], n - 1])
+
+
+def to_polygon(points):
+    """QPolygonF holding an (N, 2) float64 point array."""
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    polygon = QPolygonF()
+    polygon.fill(QPointF(), len(points))
+    if len(points):
+        ptr = polygon.data()
+        ptr.setsize(points.nbytes)
+        np.frombuffer(ptr, dtype=np.float64)[:] = points.ravel()
+    return polygon
+
+
+class TraceCache:
+    """QPolygonF per trace, rebuilt only when its array or the size changes."""
+
+    def __init__(self):
+        self._entries = {}  # key -> (data, size, polygon)
+
+    def polygon(self, key, data, size, build):
+        """
+        Cached polygon for data at size.
+
+        Args:
+            key: Trace identifier
+            data: Sample array (compared by identity)
+            size: (w, h) the points were built for
+            build: data -> (N, 2) points, called on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not data or entry[1] != size:
+            entry = (data, size, to_polygon(build(data)))
+            self._entries[key] = entry
+        return entry[2]
+
+    def invalidate(self, key=None):
+        """Drop one cached polygon, or all of them."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def retain(self, keys):
+        """Drop every cached polygon whose key is not in keys."""
+        keys = set(keys)
+        for key in [k for k in self._entries if k not in keys]:
+            del self._entries[key]
+
+
+class PersistenceLayer:
+    """Persistence traces composited into one cached QImage.
+
+    Frames are never modified once buffered, so a frame list that only
+    grows keeps the image and draws just the new frames; any other change
+    (oldest frame dropped, cleared, resized) redraws from cached polygons.
+    """
+
+    def __init__(self):
+        self._frames = []
+        self._drawn = 0
+        self._image = None
+        self._image_key = None
+        self._cache = TraceCache()
+
+    def set_frames(self, frames):
+        frames = [f for f in frames if f is not None and len(f) > 1]
+        drawn = self._frames[:self._drawn]
+        if len(frames) < len(drawn) or any(a is not b for a, b in zip(frames, drawn)):
+            self._drawn = 0
+        self._frames = frames
+        self._cache.retain(id(f) for f in frames)
+
+    def draw(self, painter, size, dpr, pen, build):
+        """
+        Draw the composited frames at (0, 0).
+
+        Args:
+            painter: Target painter
+            size: (w, h) in logical pixels
+            dpr: Device pixel ratio of the target
+            pen: Pen for every persistence trace
+            build: data -> (N, 2) points at size
+        """
+        if not self._frames:
+            return
+        key = (size, dpr)
+        if self._image is None or self._image_key != key:
+            w, h = size
+            self._image = QImage(max(1, int(w * dpr)), max(1, int(h * dpr)),
+                                 QImage.Format_ARGB32_Premultiplied)
+            self._image.setDevicePixelRatio(dpr)
+            self._image_key = key
+            self._drawn = 0
+
+        if self._drawn < len(self._frames):
+            if self._drawn == 0:
+                self._image.fill(Qt.transparent)
+            p = QPainter(self._image)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(pen)
+            for frame in self._frames[self._drawn:]:
+                p.drawPolyline(self._cache.polygon(id(frame), frame, size, build))
+            p.end()
+            self._drawn = len(self._frames)
+
+        painter.drawImage(0, 0, self._image)
@@ -0,0 +1,107 @@
+"""
+Preset diff - which parts of a preset differ from the live patch.
+
+Applying a preset used to push every slot, channel and section through its
+widget setters, and every setter sends its OSC, so switching between two
+presets that share most of their settings resent all of it. diff_presets()
+compares the incoming PresetState with one collected from the live widgets
+and reports what actually changed; PresetController applies only that.
+
+Comparison is on the serialized (to_dict) form, so anything the save path
+round-trips exactly is skipped and anything else (e.g. float noise from a
+slider's integer steps) is simply re-applied, as before.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Set
+
+from .preset_schema import PresetState
+
+
+# Whole-section keys (slots and mixer channels are diffed per index)
+SECTION_MASTER_VOLUME = "master_volume"
+SECTION_BPM = "bpm"
+SECTION_MASTER = "master"
+SECTION_MOD_SOURCES = "mod_sources"
+SECTION_MOD_ROUTING = "mod_routing"
+SECTION_FX = "fx"
+SECTION_FX_SLOTS = "fx_slots"
+SECTION_BOIDS = "boids"
+SECTION_TELEMETRY = "telemetry"
+SECTION_MIDI_MAPPINGS = "midi_mappings"
+
+SECTIONS = (
+    SECTION_MASTER_VOLUME, SECTION_BPM, SECTION_MASTER, SECTION_MOD_SOURCES,
+    SECTION_MOD_ROUTING, SECTION_FX, SECTION_FX_SLOTS, SECTION_BOIDS,
+    SECTION_TELEMETRY, SECTION_MIDI_MAPPINGS,
+)
+
+
+@dataclass
+class PresetDiff:
+    """What an incoming preset changes relative to the live state."""
+    full: bool = False                           # no live state: apply everything
+    slots: Set[int] = field(default_factory=set)     # 1-based slot ids
+    channels: Set[int] = field(default_factory=set)  # 1-based mixer channel ids
+    sections: Set[str] = field(default_factory=set)  # SECTION_* keys
+
+    def slot_changed(self, slot_id: int) -> bool:
+        return self.full or slot_id in self.slots
+
+    def channel_changed(self, ch_id: int) -> bool:
+        return self.full or ch_id in self.channels
+
+    def changed(self, section: str) -> bool:
+        return self.full or section in self.sections
+
+    @property
+    def empty(self) -> bool:
+        return not (self.full or self.slots or self.channels or self.sections)
+
+
+def diff_presets(live: Optional[PresetState], incoming: PresetState) -> PresetDiff:
+    """
+    Compare incoming against live, section by section.
+
+    Args:
+        live: State collected from the UI, or None when it is unavailable
+            (e.g. a pack switch is about to reset the slots)
+        incoming: Preset being applied
+
+    Returns:
+        PresetDiff; diff.full is set when live is None
+    """
+    if live is None:
+        return PresetDiff(full=True)
+
+    diff = PresetDiff()
+    diff.slots = _changed_indices(live.slots, incoming.slots)
+    diff.channels = _changed_indices(live.mixer.channels, incoming.mixer.channels)
+
+    pairs = {
+        SECTION_MASTER_VOLUME: (live.mixer.master_volume, incoming.mixer.master_volume),
+        SECTION_BPM: (live.bpm, incoming.bpm),
+        SECTION_MASTER: (live.master, incoming.master),
+        SECTION_MOD_SOURCES: (live.mod_sources, incoming.mod_sources),
+        SECTION_MOD_ROUTING: (live.mod_routing, incoming.mod_routing),
+        SECTION_FX: (live.fx, incoming.fx),
+        SECTION_FX_SLOTS: (live.fx_slots, incoming.fx_slots),
+        SECTION_BOIDS: (live.boids, incoming.boids),
+        SECTION_TELEMETRY: (live.telemetry, incoming.telemetry),
+        SECTION_MIDI_MAPPINGS: (live.midi_mappings, incoming.midi_mappings),
+    }
+    diff.sections = {name for name, (a, b) in pairs.items() if _as_data(a) != _as_data(b)}
+    return diff
+
+
+def _changed_indices(live_items: list, incoming_items: list) -> Set[int]:
+    """1-based indices of incoming items that differ from (or extend) live_items."""
+    return {
+        i + 1 for i, item in enumerate(incoming_items)
+        if i >= len(live_items) or _as_data(live_items[i]) != _as_data(item)
+    }
+
+
+def _as_data(value):
+    """Schema objects compare by their serialized form, plain values as-is."""
+    return value.to_dict() if hasattr(value, "to_dict") else value
@@ -0,0 +1,231 @@
+"""
+Preset metadata index for the Preset Browser.
+
+Listing a library used to fully load and validate every preset just to show
+name, rating and updated date. PresetIndex keeps those fields per file,
+keyed by (st_mtime_ns, st_size), in a small file next to the presets:
+
+- refresh() stats the directory and loads only new or changed files
+- PresetManager updates entries as it writes and deletes presets
+- The index persists between sessions, so an unchanged library opens
+  without parsing a single preset
+
+Files that fail to load are remembered as invalid (and skipped) until they
+change on disk. Zero-byte files are orphan rename placeholders; they are
+reported via refresh() results for the browser's cleanup, never indexed.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import json
+import os
+import unicodedata
+
+
+INDEX_FILENAME = ".preset_index"   # no .json suffix: stays out of *.json scans
+INDEX_VERSION = 1
+
+
+@dataclass
+class PresetIndexEntry:
+    """Browser metadata for one preset file."""
+    filename: str
+    name: str
+    rating: int
+    updated: str
+    mtime_ns: int
+    size: int
+    valid: bool = True
+
+    @property
+    def search_key(self) -> str:
+        """Normalized name for case-insensitive substring search."""
+        return unicodedata.normalize("NFC", self.name).casefold()
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "rating": self.rating,
+            "updated": self.updated,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "valid": self.valid,
+        }
+
+    @classmethod
+    def from_dict(cls, filename: str, data: dict) -> "PresetIndexEntry":
+        return cls(
+            filename=filename,
+            name=str(data["name"]),
+            rating=int(data["rating"]),
+            updated=str(data["updated"]),
+            mtime_ns=int(data["mtime_ns"]),
+            size=int(data["size"]),
+            valid=bool(data.get("valid", True)),
+        )
+
+
+@dataclass
+class IndexRefresh:
+    """Result of PresetIndex.refresh()."""
+    entries: List[PresetIndexEntry]   # valid presets, unordered
+    placeholders: List[Path]          # zero-byte *.json files
+    reloaded: int                     # files parsed during this refresh
+
+
+class PresetIndex:
+    """
+    mtime/size-keyed metadata cache for a preset directory.
+
+    Args:
+        presets_dir: Directory holding *.json presets (and the index file)
+        load_state: Full loader (PresetManager.load) used for new/changed
+            files; raises on invalid presets
+        load_errors: Exceptions from load_state that mark a file invalid
+    """
+
+    def __init__(self, presets_dir: Path, load_state: Callable, load_errors: tuple = (Exception,)):
+        self.presets_dir = Path(presets_dir)
+        self.index_path = self.presets_dir / INDEX_FILENAME
+        self._load_state = load_state
+        self._load_errors = load_errors
+        self._entries: Optional[Dict[str, PresetIndexEntry]] = None  # loaded lazily
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+
+    def refresh(self) -> IndexRefresh:
+        """Bring the index in line with the directory and return its entries."""
+        entries = self._ensure_loaded()
+        changed = False
+        reloaded = 0
+        seen = set()
+        placeholders = []
+
+        try:
+            scan = list(os.scandir(self.presets_dir))
+        except OSError:
+            scan = []
+
+        for dirent in scan:
+            filename = dirent.name
+            if not filename.endswith(".json") or not dirent.is_file():
+                continue
+            try:
+                st = dirent.stat()
+            except OSError:
+                continue
+            if st.st_size == 0:
+                placeholders.append(Path(dirent.path))
+                continue
+
+            seen.add(filename)
+            entry = entries.get(filename)
+            if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                continue
+
+            entries[filename] = self._read_entry(Path(dirent.path), st)
+            reloaded += 1
+            changed = True
+
+        for filename in [f for f in entries if f not in seen]:
+            del entries[filename]
+            changed = True
+
+        if changed:
+            self._save()
+
+        return IndexRefresh(
+            entries=[e for e in entries.values() if e.valid],
+            placeholders=placeholders,
+            reloaded=reloaded,
+        )
+
+    # -----------------------------------------------------------------
+    # Updates from PresetManager
+    # -----------------------------------------------------------------
+
+    def record(self, filepath: Path, state) -> None:
+        """Index a preset just written from state (no re-read)."""
+        filepath = Path(filepath)
+        if filepath.parent.resolve() != self.presets_dir.resolve():
+            return
+        try:
+            st = filepath.stat()
+        except OSError:
+            return
+        entries = self._ensure_loaded()
+        entries[filepath.name] = PresetIndexEntry(
+            filename=filepath.name,
+            name=state.name,
+            rating=state.rating,
+            updated=state.updated,
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+        )
+        self._save()
+
+    def discard(self, filepath: Path) -> None:
+        """Drop a deleted preset from the index."""
+        filepath = Path(filepath)
+        if filepath.parent.resolve() != self.presets_dir.resolve():
+            return
+        entries = self._ensure_loaded()
+        if entries.pop(filepath.name, None) is not None:
+            self._save()
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+
+    def _read_entry(self, filepath: Path, st) -> PresetIndexEntry:
+        """Fully load one preset file (validation + migration) for its metadata."""
+        try:
+            state = self._load_state(filepath)
+        except self._load_errors:
+            return PresetIndexEntry(filepath.name, "", 0, "", st.st_mtime_ns, st.st_size,
+                                    valid=False)
+        return PresetIndexEntry(filepath.name, state.name, state.rating, state.updated,
+                                st.st_mtime_ns, st.st_size)
+
+    def _ensure_loaded(self) -> Dict[str, PresetIndexEntry]:
+        """Read the persisted index once; a missing or corrupt one starts empty."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return self._entries
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return self._entries
+        for filename, raw in (data.get("entries") or {}).items():
+            try:
+                self._entries[filename] = PresetIndexEntry.from_dict(filename, raw)
+            except (KeyError, TypeError, ValueError):
+                continue  # re-read from the preset on refresh
+        return self._entries
+
+    def _save(self) -> bool:
+        """Persist the index atomically (best-effort; it can always be rebuilt)."""
+        data = {
+            "version": INDEX_VERSION,
+            "entries": {f: e.to_dict() for f, e in self._entries.items()},
+        }
+        temp_path = self.index_path.with_suffix(".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.index_path)
+            return True
+        except OSError:
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
@@ -19,6 +19,7 @@ from .preset_schema import (
     validate_preset,
     PRESET_VERSION,
 )
+from .preset_index import PresetIndex
 from .preset_utils import TimestampProvider, canonical_path
 from .migrations import is_v2_preset, migrate_key, migrate_boid_columns, KEY_ALIAS
 
@@ -36,6 +37,7 @@ class PresetManager:
     - Atomic writes via write_preset_file
     - Timestamp application for created/updated
     - Support for preset browser operations
+    - Metadata index (self.index) kept current by every write/delete
 
     Usage:
         manager = PresetManager()
@@ -60,6 +62,7 @@ class PresetManager:
     def __init__(self, presets_dir: Optional[Path] = None):
         self.presets_dir = presets_dir or self.DEFAULT_DIR
         self.presets_dir.mkdir(parents=True, exist_ok=True)
+        self.index = PresetIndex(self.presets_dir, self.load, (PresetError, OSError))
 
     def write_preset_file(
         self,
@@ -120,6 +123,8 @@ class PresetManager:
         except OSError as e:
             raise PresetError(f"Failed to write preset: {e}")
 
+        self.index.record(dest_path, preset_state)
+
     def apply_timestamps(
         self,
         state: PresetState,
@@ -296,6 +301,7 @@ class PresetManager:
         """
         if filepath.exists():
             filepath.unlink()
+            self.index.discard(filepath)
             return True
         return False
     
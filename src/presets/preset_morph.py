@@ -0,0 +1,239 @@
+"""
+Preset morph - glide from the live patch to another preset over time.
+
+build_morph_plan() flattens every continuous parameter that differs
+between two PresetStates into start/end vectors plus the OSC address
+each one is sent to:
+
+- slot FRQ/CUT/RES/ATK/DEC, P1-P5 and portamento
+- mixer volume, pan, EQ and FX sends
+- master volume
+
+Slot params go to /noise/bus/base as slider-normalized values and SC
+applies the GENERATOR_PARAMS curve (map_value), so interpolating in slider
+space follows each param's curve: exp params glide evenly in octaves.
+P1-P5 only glide between slots running the same generator, and never for
+stepped params; everything else (generator, filter type, clock, ARP/SEQ,
+routing, FX...) is discrete and switches once at switch_at.
+
+PresetMorph streams the plan from a daemon thread at a fixed control rate
+through OSCBridge.send_coalesced, so SC sees at most one value per param
+per coalescer flush however many slots are morphing. Progress is quantized
+to MORPH_RESOLUTION steps, which also caps the messages a long morph sends.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.config import OSC_PATHS, get_generator_custom_params
+from .preset_schema import PresetState
+
+
+MORPH_DEFAULT_SECONDS = 4.0
+MORPH_RATE_HZ = 50           # control-rate ticks per second
+MORPH_SWITCH_AT = 0.5        # progress at which discrete fields switch
+MORPH_RESOLUTION = 1000      # progress steps; a morph sends <= this per param
+
+# SlotState field -> unified bus param name
+_SLOT_BUS_PARAMS = {
+    'frequency': 'freq',
+    'cutoff': 'cutoff',
+    'resonance': 'res',
+    'attack': 'attack',
+    'decay': 'decay',
+}
+_CUSTOM_COUNT = 5
+_EQ_BANDS = ('hi', 'mid', 'lo')
+_FX_SENDS = 4
+
+
+@dataclass(frozen=True)
+class MorphParam:
+    """One morphing value: where it lives in PresetState and how it is sent."""
+    section: str          # 'slot', 'channel' or 'master'
+    index: int            # 0-based slot/channel index (0 for master)
+    field: str            # SlotState/ChannelState field, or 'master_volume'
+    path: str             # OSC address
+    head: tuple           # OSC args before the value
+    scale: float = 1.0    # state value -> OSC value: value * scale + offset
+    offset: float = 0.0
+    integer: bool = False  # state field holds an int (EQ/send knobs)
+
+
+class MorphPlan:
+    """Flat start/end vectors for the continuous params that differ."""
+
+    def __init__(self, params: List[MorphParam], start, end, target: PresetState):
+        self.params = params
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.target = target
+        self._scale = np.array([p.scale for p in params], dtype=np.float64)
+        self._offset = np.array([p.offset for p in params], dtype=np.float64)
+
+    def __len__(self):
+        return len(self.params)
+
+    def values_at(self, t: float) -> np.ndarray:
+        """State-domain values at progress t (0..1)."""
+        t = min(1.0, max(0.0, t))
+        return self.start + (self.end - self.start) * t
+
+    def osc_values_at(self, t: float) -> np.ndarray:
+        """OSC argument values at progress t."""
+        return self.values_at(t) * self._scale + self._offset
+
+    def state_at(self, t: float) -> PresetState:
+        """
+        Target preset with continuous params at progress t.
+
+        Applied at the switch point so the UI takes on the target's discrete
+        fields without jumping the params that are still gliding.
+        """
+        state = PresetState.from_dict(self.target.to_dict())
+        for param, value in zip(self.params, self.values_at(t)):
+            value = int(round(value)) if param.integer else float(value)
+            if param.section == 'slot':
+                setattr(state.slots[param.index], param.field, value)
+            elif param.section == 'channel':
+                setattr(state.mixer.channels[param.index], param.field, value)
+            else:
+                state.mixer.master_volume = value
+        return state
+
+
+def build_morph_plan(start: PresetState, target: PresetState) -> MorphPlan:
+    """Collect every continuous param whose value differs between the states."""
+    params, a, b = [], [], []
+
+    def add(param, va, vb):
+        if va != vb:
+            params.append(param)
+            a.append(float(va))
+            b.append(float(vb))
+
+    for i, (sa, sb) in enumerate(zip(start.slots, target.slots)):
+        slot_id = i + 1
+        for name, bus_param in _SLOT_BUS_PARAMS.items():
+            add(MorphParam('slot', i, name, '/noise/bus/base', (f"gen_{slot_id}_{bus_param}",)),
+                getattr(sa, name), getattr(sb, name))
+        add(MorphParam('slot', i, 'portamento', OSC_PATHS['gen_portamento'], (slot_id,)),
+            sa.portamento, sb.portamento)
+        if sa.generator == sb.generator:
+            custom = get_generator_custom_params(sb.generator) if sb.generator else []
+            for k in range(_CUSTOM_COUNT):
+                if k < len(custom) and _is_stepped(custom[k]):
+                    continue
+                add(MorphParam('slot', i, f'custom_{k}', '/noise/bus/base',
+                               (f"gen_{slot_id}_custom{k}",)),
+                    getattr(sa, f'custom_{k}'), getattr(sb, f'custom_{k}'))
+
+    for i, (ca, cb) in enumerate(zip(start.mixer.channels, target.mixer.channels)):
+        ch_id = i + 1
+        add(MorphParam('channel', i, 'volume', OSC_PATHS['gen_volume'], (ch_id,)),
+            ca.volume, cb.volume)
+        add(MorphParam('channel', i, 'pan', OSC_PATHS['gen_pan'], (ch_id,), 2.0, -1.0),
+            ca.pan, cb.pan)
+        for band in _EQ_BANDS:
+            add(MorphParam('channel', i, f'eq_{band}', f"{OSC_PATHS['gen_strip_eq_base']}/{band}",
+                           (ch_id,), 1 / 100.0, integer=True),
+                getattr(ca, f'eq_{band}'), getattr(cb, f'eq_{band}'))
+        for n in range(1, _FX_SENDS + 1):
+            add(MorphParam('channel', i, f'fx{n}_send', OSC_PATHS[f'strip_fx{n}_send'],
+                           (ch_id,), 1 / 200.0, integer=True),
+                getattr(ca, f'fx{n}_send'), getattr(cb, f'fx{n}_send'))
+
+    add(MorphParam('master', 0, 'master_volume', OSC_PATHS['master_volume'], ()),
+        start.mixer.master_volume, target.mixer.master_volume)
+
+    return MorphPlan(params, a, b, target)
+
+
+def _is_stepped(param_config: dict) -> bool:
+    """Stepped custom params (map_value quantizes them) must not glide."""
+    try:
+        return int(param_config.get('steps') or 0) > 1
+    except (TypeError, ValueError):
+        return False
+
+
+class PresetMorph:
+    """Streams a MorphPlan from a daemon thread at a fixed control rate."""
+
+    def __init__(self, plan: MorphPlan, send: Callable, seconds: float = MORPH_DEFAULT_SECONDS,
+                 switch_at: float = MORPH_SWITCH_AT, rate_hz: float = MORPH_RATE_HZ,
+                 on_switch: Optional[Callable] = None, on_finished: Optional[Callable] = None):
+        """
+        Args:
+            plan: Params to glide
+            send: Called as send(path, args) per changed value (send_coalesced)
+            seconds: Morph duration
+            switch_at: Progress (0..1) at which on_switch fires
+            rate_hz: Control-rate ticks per second
+            on_switch: Called once with the progress when switch_at is reached
+            on_finished: Called once after the final values are sent
+        """
+        self.plan = plan
+        self._send = send
+        self.seconds = max(0.0, float(seconds))
+        self.switch_at = min(1.0, max(0.0, float(switch_at)))
+        self._period = 1.0 / rate_hz
+        self._on_switch = on_switch
+        self._on_finished = on_finished
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._step = -1                       # last quantized progress sent
+        self._last = np.full(len(plan), np.nan)
+        self.switched = False
+        self.finished = False
+        self.progress = 0.0
+        self.sent = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="preset-morph", daemon=True)
+        self._thread.start()
+
+    def cancel(self, timeout: float = 1.0):
+        """Stop streaming where it is; callbacks that have not fired never will."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def step(self, t: float):
+        """Send the values for progress t and fire callbacks that are due."""
+        step = int(min(1.0, max(0.0, t)) * MORPH_RESOLUTION)
+        if step > self._step:
+            self._step = step
+            self.progress = step / MORPH_RESOLUTION
+            values = self.plan.osc_values_at(self.progress)
+            changed = np.flatnonzero(values != self._last)
+            for i in changed:
+                param = self.plan.params[i]
+                self._send(param.path, [*param.head, float(values[i])])
+            self.sent += len(changed)
+            self._last = values
+
+        if not self.switched and self.progress >= self.switch_at:
+            self.switched = True
+            if self._on_switch is not None:
+                self._on_switch(self.progress)
+        if not self.finished and step >= MORPH_RESOLUTION:
+            self.finished = True
+            if self._on_finished is not None:
+                self._on_finished()
+
+    def _run(self):
+        t0 = time.monotonic()
+        while not self._stop.is_set() and not self.finished:
+            elapsed = time.monotonic() - t0
+            self.step(elapsed / self.seconds if self.seconds > 0 else 1.0)
+            self._stop.wait(self._period)
@@ -800,6 +800,214 @@ class PresetValidationError(Exception):
     pass
 
 
+# =============================================================================
+# VALIDATION
+# =============================================================================
+#
+# Each section's scalar fields are compiled once, at import, into a table of
+# (key, kind, lo, hi, allowed, rule) rows. _check_fields() walks a table with
+# an inline fast path: a value of exactly the expected type inside its range
+# costs a dict lookup, a type test and a comparison; no function call and no
+# field-name string. Anything else falls back to _coerce_float/_coerce_int
+# for the exact legacy warnings and errors. Rows keep the order of the former
+# hand-written checks, so messages come out in the same order.
+
+_FLOAT, _INT, _BOOL, _BARE_BOOL = "float", "int", "bool", "bare_bool"
+_INF = float("inf")
+
+
+def _float(key, lo=0.0, hi=1.0, rule=None):
+    return (key, _FLOAT, lo, hi, None, rule or f"{lo:g}-{hi:g}")
+
+
+def _int(key, lo, hi, rule=None, allowed=None):
+    return (key, _INT, lo, hi, allowed, rule or f"{lo}-{hi}")
+
+
+def _bool(key):
+    """Must be bool; message names the offending type."""
+    return (key, _BOOL, None, None, None, None)
+
+
+def _bare_bool(key):
+    """Must be bool; message without the type (fx bypass flags)."""
+    return (key, _BARE_BOOL, None, None, None, None)
+
+
+_SLOT_PARAMS_TABLE = tuple(
+    _float(key) for key in ["frequency", "cutoff", "resonance", "attack", "decay",
+                            "custom_0", "custom_1", "custom_2", "custom_3", "custom_4"]
+)
+
+_SLOT_TABLE = (
+    _int("filter_type", 0, FILTER_TYPES - 1),
+    _int("env_source", 0, ENV_SOURCES - 1),
+    _int("clock_rate", 0, CLOCK_RATES - 1),
+    _int("midi_channel", 0, MIDI_CHANNELS),
+    _int("transpose", 0, 4),
+)
+
+# After portamento (checked by hand: legacy values are reset, not rejected)
+_SLOT_FEATURE_TABLE = (
+    # ARP settings (optional — old presets won't have them)
+    _bool("arp_enabled"),
+    _int("arp_rate", 0, ARP_RATES - 1),
+    _int("arp_pattern", 0, ARP_PATTERNS - 1),
+    _int("arp_octaves", ARP_OCTAVES_MIN, ARP_OCTAVES_MAX),
+    _bool("arp_hold"),
+    # Euclidean gate settings
+    _bool("euclid_enabled"),
+    _int("euclid_n", 1, 64),
+    _int("euclid_k", 0, 64),
+    _int("euclid_rot", 0, 63),
+    # RST rate (0=OFF, 4-9=fabric index)
+    _int("rst_rate", 0, 9, "0 or 4-9", frozenset({0, 4, 5, 6, 7, 8, 9})),
+    # SEQ settings
+    _bool("seq_enabled"),
+    _int("seq_rate", 0, SEQ_RATES - 1),
+    _int("seq_length", 1, SEQ_MAX_STEPS),
+    _int("seq_play_mode", 0, SEQ_PLAY_MODES - 1),
+)
+
+_SEQ_STEP_TABLE = (
+    _int("step_type", 0, SEQ_STEP_TYPES - 1),
+    _int("note", 0, 127),
+    _int("velocity", 1, 127),
+)
+
+_SLOT_ANALOG_TABLE = (
+    _int("analog_enabled", 0, 1, "0 or 1"),
+    _int("analog_type", 0, 3),
+)
+
+_MIXER_TABLE = (
+    _float("master_volume"),
+)
+
+_CHANNEL_TABLE = (
+    _float("volume"),
+    _float("pan"),
+    _bool("mute"),
+    _bool("solo"),
+    _bool("lo_cut"),
+    _bool("hi_cut"),
+    *(_int(key, 0, 200) for key in ["eq_hi", "eq_mid", "eq_lo"]),
+    # FX sends - new fx1-4 or legacy echo/verb
+    *(_int(key, 0, 200) for key in ["fx1_send", "fx2_send", "fx3_send", "fx4_send",
+                                    "echo_send", "verb_send"]),
+    _int("gain", 0, GAIN_STAGES - 1),
+)
+
+_MASTER_TABLE = (
+    _float("volume"),
+    *(_int(key, 0, 240) for key in ["eq_hi", "eq_mid", "eq_lo"]),
+    *(_int(key, 0, 1) for key in ["eq_hi_kill", "eq_mid_kill", "eq_lo_kill",
+                                  "eq_locut", "eq_bypass"]),
+    _int("comp_threshold", 0, 400),
+    _int("comp_makeup", 0, 200),
+    _int("comp_ratio", 0, COMP_RATIOS - 1),
+    _int("comp_attack", 0, COMP_ATTACKS - 1),
+    _int("comp_release", 0, COMP_RELEASES - 1),
+    _int("comp_sc", 0, COMP_SC_FREQS - 1),
+    _int("comp_bypass", 0, 1),
+    _int("limiter_ceiling", 0, 600),
+    _int("limiter_bypass", 0, 1),
+)
+
+_MOD_CONNECTION_TABLE = (
+    _float("depth"),
+    _float("amount"),
+    _float("offset", -1.0, 1.0, "-1 to +1"),
+    _int("polarity", 0, MOD_POLARITIES_ROUTING - 1),
+)
+
+_FX_HEAT_TABLE = (
+    _bare_bool("bypass"),
+    _int("circuit", 0, HEAT_CIRCUITS - 1),
+    _int("drive", 0, 100),
+    _int("mix", 0, 100),
+)
+
+_FX_ECHO_TABLE = tuple(
+    _int(key, 0, 100) for key in ["time", "feedback", "tone", "wow", "spring",
+                                  "verb_send", "return_level"]
+)
+
+_FX_REVERB_TABLE = tuple(
+    _int(key, 0, 100) for key in ["size", "decay", "tone", "return_level"]
+)
+
+_FX_DUAL_FILTER_TABLE = (
+    _bare_bool("bypass"),
+    *(_int(key, 0, 100) for key in ["drive", "freq1", "reso1", "freq2", "reso2", "mix"]),
+    _int("mode1", 0, FILTER_MODES - 1),
+    _int("mode2", 0, FILTER_MODES - 1),
+    _int("harmonics", 0, HARMONICS_OPTIONS - 1),
+    _int("routing", 0, ROUTING_OPTIONS - 1),
+)
+
+_FX_SLOT_TABLE = (
+    _bare_bool("bypassed"),
+    *(_float(key) for key in ["p1", "p2", "p3", "p4", "return_level"]),
+)
+
+_FX_SLOT_TYPES = frozenset(['Empty', 'Echo', 'Reverb', 'Chorus', 'LoFi'])
+
+
+def _check_fields(data: dict, table: tuple, prefix: str, errors: list, warnings: list):
+    """
+    Check data's fields against a compiled table.
+
+    Missing and null fields are skipped (every default is valid).
+
+    Args:
+        data: Section dict
+        table: Rows built by _float/_int/_bool/_bare_bool
+        prefix: Field-name prefix for messages, e.g. "slots[0]."
+        errors, warnings: Lists to append messages to
+    """
+    get = data.get
+    for key, kind, lo, hi, allowed, rule in table:
+        val = get(key)
+        if val is None:
+            continue
+        t = type(val)
+        if kind is _FLOAT:
+            if (t is float or t is int) and lo <= val <= hi:
+                continue
+        elif kind is _INT:
+            if t is int and lo <= val <= hi and (allowed is None or val in allowed):
+                continue
+        else:
+            if t is not bool:
+                errors.append(f"{prefix}{key} must be bool, got {t.__name__}"
+                              if kind is _BOOL else f"{prefix}{key} must be bool")
+            continue
+
+        # Slow path: legacy coercion for exact warnings and messages
+        name = prefix + key
+        if kind is _FLOAT:
+            val, warning = _coerce_float(val, name)
+        else:
+            val, warning = _coerce_int(val, name)
+        if warning:
+            warnings.append(warning)
+        if val is not None and not (lo <= val <= hi and (allowed is None or val in allowed)):
+            errors.append(f"{name} must be {rule}, got {val}")
+
+
+def _check_ints(values: list, lo: int, hi: int, prefix: str, errors: list, warnings: list):
+    """Check every item of a list is an int in lo..hi (items named prefix[j])."""
+    for j, val in enumerate(values):
+        if type(val) is int and lo <= val <= hi:
+            continue
+        val, warning = _coerce_int(val, f"{prefix}[{j}]")
+        if warning:
+            warnings.append(warning)
+        if val is not None and not (lo <= val <= hi):
+            errors.append(f"{prefix}[{j}] must be {lo}-{hi}, got {val}")
+
+
 def validate_preset(data: dict, strict: bool = False) -> tuple:
     """
     Validate preset data.
@@ -832,53 +1040,31 @@ def validate_preset(data: dict, strict: bool = False) -> tuple:
             warnings.append(f"slots has {len(slots)} items, expected {NUM_SLOTS}")
     
     for i, slot in enumerate(slots[:NUM_SLOTS]):
-        slot_errors, slot_warnings = _validate_slot(slot, f"slots[{i}]", strict)
-        errors.extend(slot_errors)
-        warnings.extend(slot_warnings)
+        _validate_slot(slot, f"slots[{i}]", errors, warnings)
     
     # Mixer validation
-    mixer = data.get("mixer", {})
-    mixer_errors, mixer_warnings = _validate_mixer(mixer, strict)
-    errors.extend(mixer_errors)
-    warnings.extend(mixer_warnings)
+    _validate_mixer(data.get("mixer", {}), strict, errors, warnings)
     
     # BPM validation
     bpm = data.get("bpm", BPM_DEFAULT)
-    bpm, warning = _coerce_int(bpm, "bpm")
-    if warning:
-        warnings.append(warning)
-    if bpm is not None and not (BPM_MIN <= bpm <= BPM_MAX):
-        errors.append(f"bpm must be {BPM_MIN}-{BPM_MAX}, got {bpm}")
+    if type(bpm) is not int or not (BPM_MIN <= bpm <= BPM_MAX):
+        bpm, warning = _coerce_int(bpm, "bpm")
+        if warning:
+            warnings.append(warning)
+        if bpm is not None and not (BPM_MIN <= bpm <= BPM_MAX):
+            errors.append(f"bpm must be {BPM_MIN}-{BPM_MAX}, got {bpm}")
     
     # Master validation
     master = data.get("master", {})
-    master_errors, master_warnings = _validate_master(master, strict)
-    errors.extend(master_errors)
-    warnings.extend(master_warnings)
-    
-    # Mod sources validation
-    mod_sources = data.get("mod_sources", {})
-    mod_sources_errors, mod_sources_warnings = _validate_mod_sources(mod_sources, strict)
-    errors.extend(mod_sources_errors)
-    warnings.extend(mod_sources_warnings)
-    
-    # Mod routing validation
-    mod_routing = data.get("mod_routing", {})
-    mod_routing_errors, mod_routing_warnings = _validate_mod_routing(mod_routing, strict)
-    errors.extend(mod_routing_errors)
-    warnings.extend(mod_routing_warnings)
+    if isinstance(master, dict):
+        _check_fields(master, _MASTER_TABLE, "master.", errors, warnings)
+    else:
+        errors.append("master must be dict")
     
-    # FX validation
-    fx = data.get("fx", {})
-    fx_errors, fx_warnings = _validate_fx(fx, strict)
-    errors.extend(fx_errors)
-    warnings.extend(fx_warnings)
-
-    # FX Slots validation (UI Refresh Phase 6)
-    fx_slots = data.get("fx_slots", {})
-    fx_slots_errors, fx_slots_warnings = _validate_fx_slots(fx_slots, strict)
-    errors.extend(fx_slots_errors)
-    warnings.extend(fx_slots_warnings)
+    _validate_mod_sources(data.get("mod_sources", {}), strict, errors, warnings)
+    _validate_mod_routing(data.get("mod_routing", {}), errors, warnings)
+    _validate_fx(data.get("fx", {}), strict, errors, warnings)
+    _validate_fx_slots(data.get("fx_slots", {}), strict, errors, warnings)
 
     is_valid = len(errors) == 0
     
@@ -888,177 +1074,30 @@ def validate_preset(data: dict, strict: bool = False) -> tuple:
     return is_valid, errors + warnings
 
 
-def _validate_slot(slot: dict, prefix: str, strict: bool = False) -> tuple:
+def _validate_slot(slot: dict, prefix: str, errors: list, warnings: list):
     """Validate a single slot."""
-    errors = []
-    warnings = []
-    
     if not isinstance(slot, dict):
         errors.append(f"{prefix} must be dict")
-        return errors, warnings
+        return
     
-    # Params validation
     params = slot.get("params", {})
     if not isinstance(params, dict):
         errors.append(f"{prefix}.params must be dict")
     else:
-        for key in ["frequency", "cutoff", "resonance", "attack", "decay",
-                    "custom_0", "custom_1", "custom_2", "custom_3", "custom_4"]:
-            val = params.get(key)
-            if val is not None:
-                val, warning = _coerce_float(val, f"{prefix}.params.{key}")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0.0 <= val <= 1.0):
-                    errors.append(f"{prefix}.params.{key} must be 0-1, got {val}")
-    
-    # Filter type
-    ft = slot.get("filter_type", 0)
-    ft, warning = _coerce_int(ft, f"{prefix}.filter_type")
-    if warning:
-        warnings.append(warning)
-    if ft is not None and not (0 <= ft < FILTER_TYPES):
-        errors.append(f"{prefix}.filter_type must be 0-{FILTER_TYPES-1}, got {ft}")
+        _check_fields(params, _SLOT_PARAMS_TABLE, f"{prefix}.params.", errors, warnings)
     
-    # Env source
-    es = slot.get("env_source", 0)
-    es, warning = _coerce_int(es, f"{prefix}.env_source")
-    if warning:
-        warnings.append(warning)
-    if es is not None and not (0 <= es < ENV_SOURCES):
-        errors.append(f"{prefix}.env_source must be 0-{ENV_SOURCES-1}, got {es}")
-    
-    # Clock rate
-    cr = slot.get("clock_rate", 4)
-    cr, warning = _coerce_int(cr, f"{prefix}.clock_rate")
-    if warning:
-        warnings.append(warning)
-    if cr is not None and not (0 <= cr < CLOCK_RATES):
-        errors.append(f"{prefix}.clock_rate must be 0-{CLOCK_RATES-1}, got {cr}")
-    
-    # MIDI channel
-    mc = slot.get("midi_channel", 1)
-    mc, warning = _coerce_int(mc, f"{prefix}.midi_channel")
-    if warning:
-        warnings.append(warning)
-    if mc is not None and not (0 <= mc <= MIDI_CHANNELS):
-        errors.append(f"{prefix}.midi_channel must be 0-{MIDI_CHANNELS}, got {mc}")
-    
-    # Transpose
-    tr = slot.get("transpose", 2)
-    tr, warning = _coerce_int(tr, f"{prefix}.transpose")
-    if warning:
-        warnings.append(warning)
-    if tr is not None and not (0 <= tr <= 4):
-        errors.append(f"{prefix}.transpose must be 0-4, got {tr}")
+    _check_fields(slot, _SLOT_TABLE, f"{prefix}.", errors, warnings)
     
     # Portamento (legacy — clamp old presets that stored raw values)
     port = slot.get("portamento", 0.0)
-    port, warning = _coerce_float(port, f"{prefix}.portamento")
-    if warning:
-        warnings.append(warning)
-    if port is not None and port > 1.0:
-        slot["portamento"] = 0.0  # Reset legacy out-of-range values
-
-    # ARP settings (optional — old presets won't have them)
-    arp_enabled = slot.get("arp_enabled")
-    if arp_enabled is not None and not isinstance(arp_enabled, bool):
-        errors.append(f"{prefix}.arp_enabled must be bool, got {type(arp_enabled).__name__}")
-
-    arp_rate = slot.get("arp_rate")
-    if arp_rate is not None:
-        arp_rate, warning = _coerce_int(arp_rate, f"{prefix}.arp_rate")
-        if warning:
-            warnings.append(warning)
-        if arp_rate is not None and not (0 <= arp_rate < ARP_RATES):
-            errors.append(f"{prefix}.arp_rate must be 0-{ARP_RATES-1}, got {arp_rate}")
-
-    arp_pattern = slot.get("arp_pattern")
-    if arp_pattern is not None:
-        arp_pattern, warning = _coerce_int(arp_pattern, f"{prefix}.arp_pattern")
-        if warning:
-            warnings.append(warning)
-        if arp_pattern is not None and not (0 <= arp_pattern < ARP_PATTERNS):
-            errors.append(f"{prefix}.arp_pattern must be 0-{ARP_PATTERNS-1}, got {arp_pattern}")
-
-    arp_octaves = slot.get("arp_octaves")
-    if arp_octaves is not None:
-        arp_octaves, warning = _coerce_int(arp_octaves, f"{prefix}.arp_octaves")
-        if warning:
-            warnings.append(warning)
-        if arp_octaves is not None and not (ARP_OCTAVES_MIN <= arp_octaves <= ARP_OCTAVES_MAX):
-            errors.append(f"{prefix}.arp_octaves must be {ARP_OCTAVES_MIN}-{ARP_OCTAVES_MAX}, got {arp_octaves}")
-
-    arp_hold = slot.get("arp_hold")
-    if arp_hold is not None and not isinstance(arp_hold, bool):
-        errors.append(f"{prefix}.arp_hold must be bool, got {type(arp_hold).__name__}")
-
-    # Euclidean gate settings (optional — old presets won't have them)
-    euc_enabled = slot.get("euclid_enabled")
-    if euc_enabled is not None and not isinstance(euc_enabled, bool):
-        errors.append(f"{prefix}.euclid_enabled must be bool, got {type(euc_enabled).__name__}")
-
-    euc_n = slot.get("euclid_n")
-    if euc_n is not None:
-        euc_n, warning = _coerce_int(euc_n, f"{prefix}.euclid_n")
-        if warning:
-            warnings.append(warning)
-        if euc_n is not None and not (1 <= euc_n <= 64):
-            errors.append(f"{prefix}.euclid_n must be 1-64, got {euc_n}")
-
-    euc_k = slot.get("euclid_k")
-    if euc_k is not None:
-        euc_k, warning = _coerce_int(euc_k, f"{prefix}.euclid_k")
-        if warning:
-            warnings.append(warning)
-        if euc_k is not None and not (0 <= euc_k <= 64):
-            errors.append(f"{prefix}.euclid_k must be 0-64, got {euc_k}")
-
-    euc_rot = slot.get("euclid_rot")
-    if euc_rot is not None:
-        euc_rot, warning = _coerce_int(euc_rot, f"{prefix}.euclid_rot")
-        if warning:
-            warnings.append(warning)
-        if euc_rot is not None and not (0 <= euc_rot <= 63):
-            errors.append(f"{prefix}.euclid_rot must be 0-63, got {euc_rot}")
-
-    # RST rate (0=OFF, 4-9=fabric index)
-    rst_rate = slot.get("rst_rate")
-    if rst_rate is not None:
-        rst_rate, warning = _coerce_int(rst_rate, f"{prefix}.rst_rate")
+    if type(port) is not float or not (-_INF < port <= 1.0):
+        port, warning = _coerce_float(port, f"{prefix}.portamento")
         if warning:
             warnings.append(warning)
-        if rst_rate is not None and rst_rate != 0 and not (4 <= rst_rate <= 9):
-            errors.append(f"{prefix}.rst_rate must be 0 or 4-9, got {rst_rate}")
-
-    # SEQ settings (optional — old presets won't have them)
-    seq_enabled = slot.get("seq_enabled")
-    if seq_enabled is not None and not isinstance(seq_enabled, bool):
-        errors.append(f"{prefix}.seq_enabled must be bool, got {type(seq_enabled).__name__}")
+        if port is not None and port > 1.0:
+            slot["portamento"] = 0.0  # Reset legacy out-of-range values
 
-    seq_rate = slot.get("seq_rate")
-    if seq_rate is not None:
-        seq_rate, warning = _coerce_int(seq_rate, f"{prefix}.seq_rate")
-        if warning:
-            warnings.append(warning)
-        if seq_rate is not None and not (0 <= seq_rate < SEQ_RATES):
-            errors.append(f"{prefix}.seq_rate must be 0-{SEQ_RATES-1}, got {seq_rate}")
-
-    seq_length = slot.get("seq_length")
-    if seq_length is not None:
-        seq_length, warning = _coerce_int(seq_length, f"{prefix}.seq_length")
-        if warning:
-            warnings.append(warning)
-        if seq_length is not None and not (1 <= seq_length <= SEQ_MAX_STEPS):
-            errors.append(f"{prefix}.seq_length must be 1-{SEQ_MAX_STEPS}, got {seq_length}")
-
-    seq_play_mode = slot.get("seq_play_mode")
-    if seq_play_mode is not None:
-        seq_play_mode, warning = _coerce_int(seq_play_mode, f"{prefix}.seq_play_mode")
-        if warning:
-            warnings.append(warning)
-        if seq_play_mode is not None and not (0 <= seq_play_mode < SEQ_PLAY_MODES):
-            errors.append(f"{prefix}.seq_play_mode must be 0-{SEQ_PLAY_MODES-1}, got {seq_play_mode}")
+    _check_fields(slot, _SLOT_FEATURE_TABLE, f"{prefix}.", errors, warnings)
 
     seq_steps = slot.get("seq_steps")
     if seq_steps is not None:
@@ -1071,56 +1110,17 @@ def _validate_slot(slot: dict, prefix: str, strict: bool = False) -> tuple:
                 if not isinstance(step, dict):
                     errors.append(f"{prefix}.seq_steps[{j}] must be dict")
                     continue
-                st = step.get("step_type")
-                if st is not None:
-                    st, warning = _coerce_int(st, f"{prefix}.seq_steps[{j}].step_type")
-                    if warning:
-                        warnings.append(warning)
-                    if st is not None and not (0 <= st < SEQ_STEP_TYPES):
-                        errors.append(f"{prefix}.seq_steps[{j}].step_type must be 0-{SEQ_STEP_TYPES-1}, got {st}")
-                note = step.get("note")
-                if note is not None:
-                    note, warning = _coerce_int(note, f"{prefix}.seq_steps[{j}].note")
-                    if warning:
-                        warnings.append(warning)
-                    if note is not None and not (0 <= note <= 127):
-                        errors.append(f"{prefix}.seq_steps[{j}].note must be 0-127, got {note}")
-                vel = step.get("velocity")
-                if vel is not None:
-                    vel, warning = _coerce_int(vel, f"{prefix}.seq_steps[{j}].velocity")
-                    if warning:
-                        warnings.append(warning)
-                    if vel is not None and not (1 <= vel <= 127):
-                        errors.append(f"{prefix}.seq_steps[{j}].velocity must be 1-127, got {vel}")
+                _check_fields(step, _SEQ_STEP_TABLE, f"{prefix}.seq_steps[{j}].", errors, warnings)
 
     # Analog stage settings (optional — old presets won't have them)
-    analog_enabled = slot.get("analog_enabled")
-    if analog_enabled is not None:
-        analog_enabled, warning = _coerce_int(analog_enabled, f"{prefix}.analog_enabled")
-        if warning:
-            warnings.append(warning)
-        if analog_enabled is not None and analog_enabled not in (0, 1):
-            errors.append(f"{prefix}.analog_enabled must be 0 or 1, got {analog_enabled}")
-
-    analog_type = slot.get("analog_type")
-    if analog_type is not None:
-        analog_type, warning = _coerce_int(analog_type, f"{prefix}.analog_type")
-        if warning:
-            warnings.append(warning)
-        if analog_type is not None and not (0 <= analog_type <= 3):
-            errors.append(f"{prefix}.analog_type must be 0-3, got {analog_type}")
+    _check_fields(slot, _SLOT_ANALOG_TABLE, f"{prefix}.", errors, warnings)
 
-    return errors, warnings
 
-
-def _validate_mixer(mixer: dict, strict: bool = False) -> tuple:
+def _validate_mixer(mixer: dict, strict: bool, errors: list, warnings: list):
     """Validate mixer state."""
-    errors = []
-    warnings = []
-    
     if not isinstance(mixer, dict):
         errors.append("mixer must be dict")
-        return errors, warnings
+        return
     
     channels = mixer.get("channels", [])
     if len(channels) != NUM_SLOTS:
@@ -1130,181 +1130,19 @@ def _validate_mixer(mixer: dict, strict: bool = False) -> tuple:
             warnings.append(f"mixer.channels has {len(channels)} items, expected {NUM_SLOTS}")
     
     for i, ch in enumerate(channels[:NUM_SLOTS]):
-        ch_errors, ch_warnings = _validate_channel(ch, f"mixer.channels[{i}]", strict)
-        errors.extend(ch_errors)
-        warnings.extend(ch_warnings)
-    
-    # Master volume
-    mv = mixer.get("master_volume", 0.8)
-    mv, warning = _coerce_float(mv, "mixer.master_volume")
-    if warning:
-        warnings.append(warning)
-    if mv is not None and not (0.0 <= mv <= 1.0):
-        errors.append(f"mixer.master_volume must be 0-1, got {mv}")
-    
-    return errors, warnings
-
-
-def _validate_channel(channel: dict, prefix: str, strict: bool = False) -> tuple:
-    """Validate a single channel."""
-    errors = []
-    warnings = []
-    
-    if not isinstance(channel, dict):
-        errors.append(f"{prefix} must be dict")
-        return errors, warnings
-    
-    # Volume and pan
-    for key in ["volume", "pan"]:
-        val = channel.get(key)
-        if val is not None:
-            val, warning = _coerce_float(val, f"{prefix}.{key}")
-            if warning:
-                warnings.append(warning)
-            if val is not None and not (0.0 <= val <= 1.0):
-                errors.append(f"{prefix}.{key} must be 0-1, got {val}")
-    
-    # Booleans
-    for key in ["mute", "solo", "lo_cut", "hi_cut"]:
-        val = channel.get(key)
-        if val is not None and not isinstance(val, bool):
-            errors.append(f"{prefix}.{key} must be bool, got {type(val).__name__}")
-    
-    # EQ values (0-200)
-    for key in ["eq_hi", "eq_mid", "eq_lo"]:
-        val = channel.get(key)
-        if val is not None:
-            val, warning = _coerce_int(val, f"{prefix}.{key}")
-            if warning:
-                warnings.append(warning)
-            if val is not None and not (0 <= val <= 200):
-                errors.append(f"{prefix}.{key} must be 0-200, got {val}")
-
-    # FX sends (0-200) - new fx1-4 or legacy echo/verb
-    for key in ["fx1_send", "fx2_send", "fx3_send", "fx4_send", "echo_send", "verb_send"]:
-        val = channel.get(key)
-        if val is not None:
-            val, warning = _coerce_int(val, f"{prefix}.{key}")
-            if warning:
-                warnings.append(warning)
-            if val is not None and not (0 <= val <= 200):
-                errors.append(f"{prefix}.{key} must be 0-200, got {val}")
-    
-    # Gain (0-2)
-    gain = channel.get("gain", 0)
-    gain, warning = _coerce_int(gain, f"{prefix}.gain")
-    if warning:
-        warnings.append(warning)
-    if gain is not None and not (0 <= gain < GAIN_STAGES):
-        errors.append(f"{prefix}.gain must be 0-{GAIN_STAGES-1}, got {gain}")
-    
-    return errors, warnings
-
-
-def _validate_master(master: dict, strict: bool = False) -> tuple:
-    """Validate master section state."""
-    errors = []
-    warnings = []
-    
-    if not isinstance(master, dict):
-        errors.append("master must be dict")
-        return errors, warnings
-    
-    # Volume (0-1)
-    vol = master.get("volume", 0.8)
-    vol, warning = _coerce_float(vol, "master.volume")
-    if warning:
-        warnings.append(warning)
-    if vol is not None and not (0.0 <= vol <= 1.0):
-        errors.append(f"master.volume must be 0-1, got {vol}")
-    
-    # EQ sliders (0-240)
-    for key in ["eq_hi", "eq_mid", "eq_lo"]:
-        val = master.get(key)
-        if val is not None:
-            val, warning = _coerce_int(val, f"master.{key}")
-            if warning:
-                warnings.append(warning)
-            if val is not None and not (0 <= val <= 240):
-                errors.append(f"master.{key} must be 0-240, got {val}")
-    
-    # EQ buttons (0-1)
-    for key in ["eq_hi_kill", "eq_mid_kill", "eq_lo_kill", "eq_locut", "eq_bypass"]:
-        val = master.get(key)
-        if val is not None:
-            val, warning = _coerce_int(val, f"master.{key}")
-            if warning:
-                warnings.append(warning)
-            if val is not None and not (0 <= val <= 1):
-                errors.append(f"master.{key} must be 0-1, got {val}")
-    
-    # Compressor threshold (0-400)
-    ct = master.get("comp_threshold")
-    if ct is not None:
-        ct, warning = _coerce_int(ct, "master.comp_threshold")
-        if warning:
-            warnings.append(warning)
-        if ct is not None and not (0 <= ct <= 400):
-            errors.append(f"master.comp_threshold must be 0-400, got {ct}")
-    
-    # Compressor makeup (0-200)
-    cm = master.get("comp_makeup")
-    if cm is not None:
-        cm, warning = _coerce_int(cm, "master.comp_makeup")
-        if warning:
-            warnings.append(warning)
-        if cm is not None and not (0 <= cm <= 200):
-            errors.append(f"master.comp_makeup must be 0-200, got {cm}")
-    
-    # Compressor indices
-    for key, max_val in [("comp_ratio", COMP_RATIOS), ("comp_attack", COMP_ATTACKS),
-                          ("comp_release", COMP_RELEASES), ("comp_sc", COMP_SC_FREQS)]:
-        val = master.get(key)
-        if val is not None:
-            val, warning = _coerce_int(val, f"master.{key}")
-            if warning:
-                warnings.append(warning)
-            if val is not None and not (0 <= val < max_val):
-                errors.append(f"master.{key} must be 0-{max_val-1}, got {val}")
-    
-    # Compressor bypass
-    cb = master.get("comp_bypass")
-    if cb is not None:
-        cb, warning = _coerce_int(cb, "master.comp_bypass")
-        if warning:
-            warnings.append(warning)
-        if cb is not None and not (0 <= cb <= 1):
-            errors.append(f"master.comp_bypass must be 0-1, got {cb}")
-    
-    # Limiter ceiling (0-600)
-    lc = master.get("limiter_ceiling")
-    if lc is not None:
-        lc, warning = _coerce_int(lc, "master.limiter_ceiling")
-        if warning:
-            warnings.append(warning)
-        if lc is not None and not (0 <= lc <= 600):
-            errors.append(f"master.limiter_ceiling must be 0-600, got {lc}")
-    
-    # Limiter bypass
-    lb = master.get("limiter_bypass")
-    if lb is not None:
-        lb, warning = _coerce_int(lb, "master.limiter_bypass")
-        if warning:
-            warnings.append(warning)
-        if lb is not None and not (0 <= lb <= 1):
-            errors.append(f"master.limiter_bypass must be 0-1, got {lb}")
+        if not isinstance(ch, dict):
+            errors.append(f"mixer.channels[{i}] must be dict")
+            continue
+        _check_fields(ch, _CHANNEL_TABLE, f"mixer.channels[{i}].", errors, warnings)
     
-    return errors, warnings
+    _check_fields(mixer, _MIXER_TABLE, "mixer.", errors, warnings)
 
 
-def _validate_mod_sources(mod_sources: dict, strict: bool = False) -> tuple:
+def _validate_mod_sources(mod_sources: dict, strict: bool, errors: list, warnings: list):
     """Validate modulation sources state (Phase 3)."""
-    errors = []
-    warnings = []
-    
     if not isinstance(mod_sources, dict):
         errors.append("mod_sources must be dict")
-        return errors, warnings
+        return
     
     slots = mod_sources.get("slots", [])
     if len(slots) != NUM_MOD_SLOTS:
@@ -1325,82 +1163,43 @@ def _validate_mod_sources(mod_sources: dict, strict: bool = False) -> tuple:
         if not isinstance(gen_name, str):
             errors.append(f"{prefix}.generator_name must be string")
         
-        # params must be dict
+        # params must be dict of 0-1 values
         params = slot.get("params", {})
         if not isinstance(params, dict):
             errors.append(f"{prefix}.params must be dict")
         else:
-            # Validate param values are 0-1
             for key, val in params.items():
+                t = type(val)
+                if (t is float or t is int) and 0.0 <= val <= 1.0:
+                    continue
                 val, warning = _coerce_float(val, f"{prefix}.params.{key}")
                 if warning:
                     warnings.append(warning)
                 if val is not None and not (0.0 <= val <= 1.0):
                     errors.append(f"{prefix}.params.{key} must be 0-1, got {val}")
         
-        # output_wave must be list of 4 ints
-        output_wave = slot.get("output_wave", [0, 0, 0, 0])
-        if not isinstance(output_wave, list):
-            errors.append(f"{prefix}.output_wave must be list")
-        elif len(output_wave) != NUM_MOD_OUTPUTS:
-            if strict:
-                errors.append(f"{prefix}.output_wave must have {NUM_MOD_OUTPUTS} items, got {len(output_wave)}")
-            else:
-                warnings.append(f"{prefix}.output_wave has {len(output_wave)} items, expected {NUM_MOD_OUTPUTS}")
-        else:
-            for j, val in enumerate(output_wave):
-                val, warning = _coerce_int(val, f"{prefix}.output_wave[{j}]")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val < MOD_WAVEFORMS):
-                    errors.append(f"{prefix}.output_wave[{j}] must be 0-{MOD_WAVEFORMS-1}, got {val}")
-        
-        # output_phase must be list of 4 ints
-        output_phase = slot.get("output_phase", [0, 3, 5, 6])
-        if not isinstance(output_phase, list):
-            errors.append(f"{prefix}.output_phase must be list")
-        elif len(output_phase) != NUM_MOD_OUTPUTS:
-            if strict:
-                errors.append(f"{prefix}.output_phase must have {NUM_MOD_OUTPUTS} items, got {len(output_phase)}")
-            else:
-                warnings.append(f"{prefix}.output_phase has {len(output_phase)} items, expected {NUM_MOD_OUTPUTS}")
-        else:
-            for j, val in enumerate(output_phase):
-                val, warning = _coerce_int(val, f"{prefix}.output_phase[{j}]")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val < MOD_PHASES):
-                    errors.append(f"{prefix}.output_phase[{j}] must be 0-{MOD_PHASES-1}, got {val}")
-        
-        # output_polarity must be list of 4 ints
-        output_polarity = slot.get("output_polarity", [0, 0, 0, 0])
-        if not isinstance(output_polarity, list):
-            errors.append(f"{prefix}.output_polarity must be list")
-        elif len(output_polarity) != NUM_MOD_OUTPUTS:
-            if strict:
-                errors.append(f"{prefix}.output_polarity must have {NUM_MOD_OUTPUTS} items, got {len(output_polarity)}")
+        # output_wave / output_phase / output_polarity must be lists of 4 ints
+        for key, default, count in (("output_wave", [0, 0, 0, 0], MOD_WAVEFORMS),
+                                    ("output_phase", [0, 3, 5, 6], MOD_PHASES),
+                                    ("output_polarity", [0, 0, 0, 0], MOD_POLARITIES)):
+            values = slot.get(key, default)
+            if not isinstance(values, list):
+                errors.append(f"{prefix}.{key} must be list")
+            elif len(values) != NUM_MOD_OUTPUTS:
+                if strict:
+                    errors.append(f"{prefix}.{key} must have {NUM_MOD_OUTPUTS} items, got {len(values)}")
+                else:
+                    warnings.append(f"{prefix}.{key} has {len(values)} items, expected {NUM_MOD_OUTPUTS}")
             else:
-                warnings.append(f"{prefix}.output_polarity has {len(output_polarity)} items, expected {NUM_MOD_OUTPUTS}")
-        else:
-            for j, val in enumerate(output_polarity):
-                val, warning = _coerce_int(val, f"{prefix}.output_polarity[{j}]")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val < MOD_POLARITIES):
-                    errors.append(f"{prefix}.output_polarity[{j}] must be 0-{MOD_POLARITIES-1}, got {val}")
-    
-    return errors, warnings
+                _check_ints(values, 0, count - 1, f"{prefix}.{key}", errors, warnings)
 
 
-def _validate_mod_routing(mod_routing: dict, strict: bool = False) -> tuple:
+def _validate_mod_routing(mod_routing: dict, errors: list, warnings: list):
     """Validate modulation routing state (Phase 4)."""
-    errors = []
-    warnings = []
-    
     connections = mod_routing.get("connections", [])
     if not isinstance(connections, list):
         errors.append("mod_routing.connections must be a list")
-        return errors, warnings
+        return
     
     for i, conn in enumerate(connections):
         if not isinstance(conn, dict):
@@ -1409,205 +1208,63 @@ def _validate_mod_routing(mod_routing: dict, strict: bool = False) -> tuple:
         
         prefix = f"mod_routing.connections[{i}]"
         
-        # source_bus: 0-15
-        source_bus = conn.get("source_bus")
-        if source_bus is None:
-            errors.append(f"{prefix}.source_bus is required")
-        else:
-            source_bus, warning = _coerce_int(source_bus, f"{prefix}.source_bus")
-            if warning:
-                warnings.append(warning)
-            if source_bus is not None and not (0 <= source_bus < NUM_MOD_BUSES):
-                errors.append(f"{prefix}.source_bus must be 0-{NUM_MOD_BUSES-1}, got {source_bus}")
-        
-        # target_slot: 1-8 (1-indexed)
-        target_slot = conn.get("target_slot")
-        if target_slot is None:
-            errors.append(f"{prefix}.target_slot is required")
-        else:
-            target_slot, warning = _coerce_int(target_slot, f"{prefix}.target_slot")
-            if warning:
-                warnings.append(warning)
-            if target_slot is not None and not (1 <= target_slot <= NUM_SLOTS):
-                errors.append(f"{prefix}.target_slot must be 1-{NUM_SLOTS}, got {target_slot}")
+        # Required: source_bus 0-15, target_slot 1-8 (1-indexed), target_param string
+        for key, lo, hi in (("source_bus", 0, NUM_MOD_BUSES - 1), ("target_slot", 1, NUM_SLOTS)):
+            val = conn.get(key)
+            if val is None:
+                errors.append(f"{prefix}.{key} is required")
+            elif type(val) is not int or not (lo <= val <= hi):
+                val, warning = _coerce_int(val, f"{prefix}.{key}")
+                if warning:
+                    warnings.append(warning)
+                if val is not None and not (lo <= val <= hi):
+                    errors.append(f"{prefix}.{key} must be {lo}-{hi}, got {val}")
         
-        # target_param: must be string
         target_param = conn.get("target_param")
         if target_param is None:
             errors.append(f"{prefix}.target_param is required")
         elif not isinstance(target_param, str):
             errors.append(f"{prefix}.target_param must be string")
         
-        # depth: 0-1 (optional, defaults to 1.0)
-        depth = conn.get("depth", 1.0)
-        depth, warning = _coerce_float(depth, f"{prefix}.depth")
-        if warning:
-            warnings.append(warning)
-        if depth is not None and not (0.0 <= depth <= 1.0):
-            errors.append(f"{prefix}.depth must be 0-1, got {depth}")
-        
-        # amount: 0-1 (optional)
-        amount = conn.get("amount", 0.5)
-        amount, warning = _coerce_float(amount, f"{prefix}.amount")
-        if warning:
-            warnings.append(warning)
-        if amount is not None and not (0.0 <= amount <= 1.0):
-            errors.append(f"{prefix}.amount must be 0-1, got {amount}")
-        
-        # offset: -1 to +1 (optional)
-        offset = conn.get("offset", 0.0)
-        offset, warning = _coerce_float(offset, f"{prefix}.offset")
-        if warning:
-            warnings.append(warning)
-        if offset is not None and not (-1.0 <= offset <= 1.0):
-            errors.append(f"{prefix}.offset must be -1 to +1, got {offset}")
+        _check_fields(conn, _MOD_CONNECTION_TABLE, f"{prefix}.", errors, warnings)
         
-        # polarity: 0-2 (optional)
-        polarity = conn.get("polarity", 0)
-        polarity, warning = _coerce_int(polarity, f"{prefix}.polarity")
-        if warning:
-            warnings.append(warning)
-        if polarity is not None and not (0 <= polarity < MOD_POLARITIES_ROUTING):
-            errors.append(f"{prefix}.polarity must be 0-{MOD_POLARITIES_ROUTING-1}, got {polarity}")
-        
-        # invert: bool (optional)
+        # invert: bool (optional; an explicit null is an error)
         invert = conn.get("invert", False)
         if not isinstance(invert, bool):
             errors.append(f"{prefix}.invert must be bool, got {type(invert).__name__}")
-    
-    return errors, warnings
 
 
-def _validate_fx(fx: dict, strict: bool = False) -> tuple:
+def _validate_fx(fx: dict, strict: bool, errors: list, warnings: list):
     """Validate FX state (Phase 5)."""
-    errors = []
-    warnings = []
-
     # FX section is optional for backward compatibility, BUT if present it must be a dict.
     if fx is None:
-        return errors, warnings
+        return
     if not isinstance(fx, dict):
         msg = f"fx must be dict, got {type(fx).__name__}"
         (errors if strict else warnings).append(msg)
-        return errors, warnings
+        return
     
-    # Heat validation
-    heat = fx.get("heat", {})
-    if isinstance(heat, dict):
-        # bypass
-        bypass = heat.get("bypass")
-        if bypass is not None and not isinstance(bypass, bool):
-            errors.append(f"fx.heat.bypass must be bool")
-        
-        # circuit (0-3)
-        circuit = heat.get("circuit")
-        if circuit is not None:
-            circuit, warning = _coerce_int(circuit, "fx.heat.circuit")
-            if warning:
-                warnings.append(warning)
-            if circuit is not None and not (0 <= circuit < HEAT_CIRCUITS):
-                errors.append(f"fx.heat.circuit must be 0-{HEAT_CIRCUITS-1}, got {circuit}")
-        
-        # drive, mix (0-100)
-        for key in ["drive", "mix"]:
-            val = heat.get(key)
-            if val is not None:
-                val, warning = _coerce_int(val, f"fx.heat.{key}")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val <= 100):
-                    errors.append(f"fx.heat.{key} must be 0-100, got {val}")
-    
-    # Echo validation
-    echo = fx.get("echo", {})
-    if isinstance(echo, dict):
-        for key in ["time", "feedback", "tone", "wow", "spring", "verb_send", "return_level"]:
-            val = echo.get(key)
-            if val is not None:
-                val, warning = _coerce_int(val, f"fx.echo.{key}")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val <= 100):
-                    errors.append(f"fx.echo.{key} must be 0-100, got {val}")
-    
-    # Reverb validation
-    reverb = fx.get("reverb", {})
-    if isinstance(reverb, dict):
-        for key in ["size", "decay", "tone", "return_level"]:
-            val = reverb.get(key)
-            if val is not None:
-                val, warning = _coerce_int(val, f"fx.reverb.{key}")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val <= 100):
-                    errors.append(f"fx.reverb.{key} must be 0-100, got {val}")
-    
-    # Dual filter validation
-    df = fx.get("dual_filter", {})
-    if isinstance(df, dict):
-        # bypass
-        bypass = df.get("bypass")
-        if bypass is not None and not isinstance(bypass, bool):
-            errors.append(f"fx.dual_filter.bypass must be bool")
-        
-        # knobs (0-100)
-        for key in ["drive", "freq1", "reso1", "freq2", "reso2", "mix"]:
-            val = df.get(key)
-            if val is not None:
-                val, warning = _coerce_int(val, f"fx.dual_filter.{key}")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val <= 100):
-                    errors.append(f"fx.dual_filter.{key} must be 0-100, got {val}")
-        
-        # mode1, mode2 (0-2)
-        for key in ["mode1", "mode2"]:
-            val = df.get(key)
-            if val is not None:
-                val, warning = _coerce_int(val, f"fx.dual_filter.{key}")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0 <= val < FILTER_MODES):
-                    errors.append(f"fx.dual_filter.{key} must be 0-{FILTER_MODES-1}, got {val}")
-        
-        # harmonics (0-7)
-        harmonics = df.get("harmonics")
-        if harmonics is not None:
-            harmonics, warning = _coerce_int(harmonics, "fx.dual_filter.harmonics")
-            if warning:
-                warnings.append(warning)
-            if harmonics is not None and not (0 <= harmonics < HARMONICS_OPTIONS):
-                errors.append(f"fx.dual_filter.harmonics must be 0-{HARMONICS_OPTIONS-1}, got {harmonics}")
-        
-        # routing (0-1)
-        routing = df.get("routing")
-        if routing is not None:
-            routing, warning = _coerce_int(routing, "fx.dual_filter.routing")
-            if warning:
-                warnings.append(warning)
-            if routing is not None and not (0 <= routing < ROUTING_OPTIONS):
-                errors.append(f"fx.dual_filter.routing must be 0-{ROUTING_OPTIONS-1}, got {routing}")
-    
-    return errors, warnings
+    for key, table in (("heat", _FX_HEAT_TABLE), ("echo", _FX_ECHO_TABLE),
+                       ("reverb", _FX_REVERB_TABLE), ("dual_filter", _FX_DUAL_FILTER_TABLE)):
+        section = fx.get(key, {})
+        if isinstance(section, dict):
+            _check_fields(section, table, f"fx.{key}.", errors, warnings)
 
 
-def _validate_fx_slots(fx_slots: dict, strict: bool = False) -> tuple:
+def _validate_fx_slots(fx_slots: dict, strict: bool, errors: list, warnings: list):
     """Validate FX slots state (UI Refresh Phase 6)."""
-    errors = []
-    warnings = []
-
     # FX slots are optional for backward compatibility
     if fx_slots is None:
-        return errors, warnings
+        return
     if not isinstance(fx_slots, dict):
         msg = f"fx_slots must be dict, got {type(fx_slots).__name__}"
         (errors if strict else warnings).append(msg)
-        return errors, warnings
+        return
 
     slots = fx_slots.get("slots", [])
     if not isinstance(slots, list):
         errors.append("fx_slots.slots must be list")
-        return errors, warnings
+        return
 
     if len(slots) != 4:
         if strict:
@@ -1615,9 +1272,6 @@ def _validate_fx_slots(fx_slots: dict, strict: bool = False) -> tuple:
         else:
             warnings.append(f"fx_slots.slots has {len(slots)} items, expected 4")
 
-    # Valid FX slot types
-    valid_types = ['Empty', 'Echo', 'Reverb', 'Chorus', 'LoFi']
-
     for i, slot in enumerate(slots[:4]):
         if not isinstance(slot, dict):
             errors.append(f"fx_slots.slots[{i}] must be dict")
@@ -1625,29 +1279,14 @@ def _validate_fx_slots(fx_slots: dict, strict: bool = False) -> tuple:
 
         prefix = f"fx_slots.slots[{i}]"
 
-        # fx_type must be valid string
+        # fx_type must be a known string
         fx_type = slot.get("fx_type", "Empty")
         if not isinstance(fx_type, str):
             errors.append(f"{prefix}.fx_type must be string")
-        elif fx_type not in valid_types:
+        elif fx_type not in _FX_SLOT_TYPES:
             warnings.append(f"{prefix}.fx_type '{fx_type}' not in known types")
 
-        # bypassed must be bool
-        bypassed = slot.get("bypassed")
-        if bypassed is not None and not isinstance(bypassed, bool):
-            errors.append(f"{prefix}.bypassed must be bool")
-
-        # p1-p4 and return_level must be 0-1
-        for key in ["p1", "p2", "p3", "p4", "return_level"]:
-            val = slot.get(key)
-            if val is not None:
-                val, warning = _coerce_float(val, f"{prefix}.{key}")
-                if warning:
-                    warnings.append(warning)
-                if val is not None and not (0.0 <= val <= 1.0):
-                    errors.append(f"{prefix}.{key} must be 0-1, got {val}")
-
-    return errors, warnings
+        _check_fields(slot, _FX_SLOT_TABLE, f"{prefix}.", errors, warnings)
 
 
 def _coerce_float(val, field_name: str) -> tuple:
@@ -377,3 +377,148 @@ def compute_all(waveform: np.ndarray, freq_hz: Optional[float] = None,
         result['phases'] = phases
 
     return result
+
+
+# =============================================================================
+# Batch Entry Point
+# =============================================================================
+
+def _gather(values: np.ndarray, bins: np.ndarray) -> np.ndarray:
+    """values[i, bins[i, j]] with out-of-range bins clamped (mask separately)."""
+    return np.take_along_axis(values, np.minimum(bins, values.shape[1] - 1), axis=1)
+
+
+def compute_all_batch(frames: np.ndarray, freq_hz=None,
+                      sample_rate: int = 48000,
+                      num_harmonics: int = 8) -> Dict[str, np.ndarray]:
+    """Compute compute_all() features for many equal-length frames at once.
+
+    One rfft over axis 1, then array ops per feature; definitions and
+    rounding follow the single-frame functions above.
+
+    Args:
+        frames: (N, n_fft) waveforms, already trimmed
+        freq_hz: None, or length-N known fundamentals (NaN/None = auto-detect)
+        sample_rate: Sample rate in Hz
+        num_harmonics: Number of harmonics to extract
+
+    Returns:
+        Columnar dict: same keys as compute_all(), each an array with a
+        leading N axis ('harm_ratio' / 'phase_rel' are (N, MAX_HARMONICS),
+        'harm_ratio_raw' is (N, num_harmonics)). 'n_fft' is an int.
+    """
+    w = np.atleast_2d(np.asarray(frames, dtype=np.float64))
+    n_frames, n_fft = w.shape
+    rows = np.arange(n_frames)
+
+    # 1-2. Hann window + FFT
+    fft = np.fft.rfft(w * np.hanning(n_fft), axis=1)
+    magnitudes = np.abs(fft)
+    phases = np.angle(fft)
+    n_bins = magnitudes.shape[1]
+
+    # 3. Fundamental (provided freq where valid, else strongest non-DC bin)
+    strongest = np.argmax(magnitudes[:, 1:], axis=1) + 1
+    if freq_hz is None:
+        freqs = np.full(n_frames, np.nan)
+    else:
+        freqs = np.array([np.nan if f is None else f for f in freq_hz], dtype=np.float64)
+    known = (freqs >= 10) & (freqs <= 20000)
+    provided = np.clip(np.rint(np.where(known, freqs, 0.0) * n_fft / sample_rate), 1, n_bins - 1)
+    fund_bin = np.where(known, provided, strongest).astype(np.int64)
+    detected_freq = fund_bin * sample_rate / n_fft
+
+    # 4. Spectral peak with log-parabolic interpolation
+    peak_bin = strongest
+    if n_bins >= 3:
+        interior = (peak_bin - 1 >= 1) & (peak_bin + 1 < n_bins)
+        lo = magnitudes[rows, np.clip(peak_bin - 1, 0, n_bins - 1)]
+        mid = magnitudes[rows, peak_bin]
+        hi = magnitudes[rows, np.clip(peak_bin + 1, 0, n_bins - 1)]
+        alpha, beta, gamma = np.log(lo + EPS), np.log(mid + EPS), np.log(hi + EPS)
+        denom = alpha - 2 * beta + gamma
+        use = interior & (np.abs(denom) > EPS)
+        delta = np.where(use, 0.5 * (alpha - gamma) / np.where(use, denom, 1.0), 0.0)
+        frac_bin = peak_bin + delta
+        peak_bin_out = peak_bin
+    else:
+        frac_bin = np.zeros(n_frames)
+        peak_bin_out = np.zeros(n_frames, dtype=np.int64)
+    peak_hz = frac_bin * sample_rate / n_fft
+
+    # 5. Harmonics + phases (nearest bin at fund_bin * h)
+    h_idx = np.arange(1, num_harmonics + 1)
+    bins = fund_bin[:, None] * h_idx[None, :]
+    valid = bins < n_bins
+    harm_mags = np.where(valid, _gather(magnitudes, bins), 0.0)
+
+    fund_mag = magnitudes[rows, fund_bin]
+    fund_mag = np.where(fund_mag < EPS, EPS, fund_mag)
+    harm_ratio_raw = np.round(harm_mags / fund_mag[:, None], 4)
+
+    fund_phase = phases[rows, fund_bin]
+    rel = _gather(phases, bins) - fund_phase[:, None] * h_idx[None, :]
+    phase_rel_raw = np.where(valid, np.round((rel / (2 * np.pi)) % 1.0, 4), 0.0)
+
+    harm_ratio = np.zeros((n_frames, MAX_HARMONICS))
+    phase_rel = np.zeros((n_frames, MAX_HARMONICS))
+    keep = min(num_harmonics, MAX_HARMONICS)
+    harm_ratio[:, :keep] = harm_ratio_raw[:, :keep]
+    phase_rel[:, :keep] = phase_rel_raw[:, :keep]
+
+    positive = np.count_nonzero(harm_ratio_raw > 0, axis=1)
+    num_actual = np.where(positive > 0, positive, num_harmonics)
+
+    # 6. THD referenced to spectral peak, excluding peak and fundamental bins
+    peak_mag = magnitudes[rows, peak_bin]
+    thd_valid = (peak_mag >= EPS) & (n_bins >= 2)
+    counted = valid & (bins != peak_bin[:, None]) & (bins != fund_bin[:, None])
+    harmonic_power = np.sum(np.where(counted, harm_mags ** 2, 0.0), axis=1)
+    safe_peak = np.where(thd_valid, peak_mag, 1.0)
+    thd = np.where(thd_valid, np.round(np.sqrt(harmonic_power) / safe_peak, 6), np.nan)
+
+    # 7. Centroid (DC excluded)
+    bin_freqs = np.arange(1, n_bins) * sample_rate / n_fft
+    total_mag = np.sum(magnitudes[:, 1:], axis=1)
+    weighted = np.sum(bin_freqs[None, :] * magnitudes[:, 1:], axis=1)
+    centroid_hz = np.where(total_mag < EPS, 0.0, weighted / np.where(total_mag < EPS, 1.0, total_mag))
+
+    # Tilt: least-squares slope of log10(harmonic mags) vs index. Valid
+    # harmonics are always a prefix 1..K, so closed-form sums per row.
+    count = np.count_nonzero(valid, axis=1)
+    x = np.where(valid, h_idx[None, :], 0.0)
+    y = np.where(valid, np.log10(harm_mags + EPS), 0.0)
+    sx, sy = x.sum(axis=1), y.sum(axis=1)
+    sxx, sxy = (x * x).sum(axis=1), (x * y).sum(axis=1)
+    var = count * sxx - sx * sx
+    fit = count >= 2
+    slope = np.where(fit, (count * sxy - sx * sy) / np.where(fit, var, 1.0), 0.0)
+    tilt_slope = np.where(fit, np.round(slope, 4), 0.0)
+    tilt = np.where(fit, np.round(np.clip((slope + 3.0) / 4.0, 0.0, 1.0), 4), 0.5)
+
+    # SNR: harmonic power vs everything else
+    signal_power = np.sum(harm_mags ** 2, axis=1)
+    noise_power = np.sum(magnitudes ** 2, axis=1) - signal_power
+    quiet = noise_power < EPS
+    with np.errstate(divide='ignore'):
+        snr = 10 * np.log10(signal_power / np.where(quiet, 1.0, noise_power))
+    snr_db = np.where(quiet, 60.0, snr)
+
+    return {
+        'n_fft': n_fft,
+        'fund_bin': fund_bin,
+        'freq_hz': np.round(detected_freq, 2),
+        'harm_ratio': harm_ratio,
+        'harm_ratio_raw': harm_ratio_raw,
+        'phase_rel': phase_rel,
+        'num_harmonics_actual': num_actual,
+        'thd': thd,
+        'thd_valid': thd_valid,
+        'spectral_peak_bin': peak_bin_out,
+        'spectral_peak_bin_frac': np.round(frac_bin, 4),
+        'spectral_peak_hz': np.round(peak_hz, 2),
+        'spectral_centroid_hz': np.round(centroid_hz, 2),
+        'spectral_tilt': tilt,
+        'spectral_tilt_slope': tilt_slope,
+        'snr_db': np.round(snr_db, 1),
+    }
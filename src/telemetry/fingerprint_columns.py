@@ -0,0 +1,243 @@
+"""
+Fingerprint Columns
+
+Append-only columnar storage for per-device fingerprint feature vectors.
+
+Each column is a headerless little-endian float64 file holding one fixed-
+width row per fingerprint; a small JSON sidecar records the row count and
+the last ID. Opening a device is a sidecar read plus np.memmap per column,
+so loading, sweep deltas and nearest-neighbour queries over the whole
+history never parse the JSONL.
+
+The sidecar count is authoritative: bytes past count * row_size (e.g. from
+an interrupted append) are ignored on read and truncated on the next append.
+
+Layout (devices/<key>/columns/):
+    index.json      {"schema_version", "count", "last_id", "ids_bytes", "columns"}
+    ids.txt         one fingerprint ID per line
+    <name>.f64      (count, width) float64
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.telemetry.fft_features import MAX_HARMONICS
+
+COLUMNS_SCHEMA = "columns.v1"
+COLUMN_DTYPE = np.dtype("<f8")
+
+# Column name -> row width. harm_ratio / phase_rel are zero-padded to
+# MAX_HARMONICS (v1 fingerprints carry 8).
+COLUMN_WIDTHS = {
+    "cv_volts": 1,
+    "freq_hz": 1,
+    "harm_ratio": MAX_HARMONICS,
+    "phase_rel": MAX_HARMONICS,
+    "morph": 5,
+}
+
+# Feature columns, in the order of the delta_prev L2 distances
+FEATURE_COLUMNS = ("harm_ratio", "phase_rel", "morph")
+
+
+def _fixed_width(values: Sequence[float], width: int) -> np.ndarray:
+    """Zero-pad / truncate a feature list to the column width."""
+    row = np.zeros(width, dtype=COLUMN_DTYPE)
+    values = np.asarray(values, dtype=COLUMN_DTYPE)[:width]
+    row[:len(values)] = values
+    return row
+
+
+def fingerprint_row(fingerprint: Dict) -> Dict[str, np.ndarray]:
+    """Column values for one fingerprint dict."""
+    features = fingerprint["features"]
+    return {
+        "cv_volts": np.array([fingerprint["capture"]["cv"]["volts"]], dtype=COLUMN_DTYPE),
+        "freq_hz": np.array([fingerprint["capture"]["freq_hz"]], dtype=COLUMN_DTYPE),
+        **{name: _fixed_width(features[name], COLUMN_WIDTHS[name])
+           for name in FEATURE_COLUMNS},
+    }
+
+
+class FingerprintColumns:
+    """Memory-mapped feature columns for one device."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Column directory (created on first append)
+        """
+        self.path = Path(path)
+        self.count = 0
+        self.last_id = None
+        self._ids_bytes = 0
+        self._ids = None
+        self._maps = {}
+
+        index_path = self.path / "index.json"
+        if index_path.exists():
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            self.count = index["count"]
+            self.last_id = index.get("last_id")
+            self._ids_bytes = index.get("ids_bytes", 0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def exists(self) -> bool:
+        """True once anything has been appended."""
+        return (self.path / "index.json").exists()
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read-only view of one column.
+
+        Returns (count,) for scalar columns, (count, width) otherwise.
+        """
+        if name not in self._maps:
+            width = COLUMN_WIDTHS[name]
+            if self.count == 0:
+                data = np.zeros((0, width), dtype=COLUMN_DTYPE)
+            else:
+                data = np.memmap(self.path / f"{name}.f64", dtype=COLUMN_DTYPE,
+                                 mode="r", shape=(self.count, width))
+            self._maps[name] = data[:, 0] if width == 1 else data
+        return self._maps[name]
+
+    @property
+    def ids(self) -> List[str]:
+        """Fingerprint IDs in row order (read on first use)."""
+        if self._ids is None:
+            ids = []
+            ids_path = self.path / "ids.txt"
+            if self.count and ids_path.exists():
+                with open(ids_path, "rb") as f:
+                    ids = f.read(self._ids_bytes).decode("utf-8").splitlines()
+            self._ids = ids
+        return self._ids
+
+    def last_features(self) -> Optional[Dict[str, List[float]]]:
+        """Feature vectors of the newest row (None if empty)."""
+        if self.count == 0:
+            return None
+        return {name: self.column(name)[-1].tolist() for name in FEATURE_COLUMNS}
+
+    # ------------------------------------------------------------------
+    # Append
+    # ------------------------------------------------------------------
+
+    def append(self, fingerprints: Sequence[Dict]):
+        """Append fingerprint dicts in order."""
+        if not fingerprints:
+            return
+        rows = [fingerprint_row(fp) for fp in fingerprints]
+        self.append_columns(
+            [fp["id"] for fp in fingerprints],
+            {name: np.stack([r[name] for r in rows]) for name in COLUMN_WIDTHS},
+        )
+
+    def append_columns(self, ids: Sequence[str], columns: Dict[str, np.ndarray]):
+        """
+        Append pre-built columns.
+
+        Args:
+            ids: Fingerprint IDs, one per row
+            columns: Name -> (n, width) array for every column in COLUMN_WIDTHS
+        """
+        n = len(ids)
+        if n == 0:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        for name, width in COLUMN_WIDTHS.items():
+            data = np.ascontiguousarray(columns[name], dtype=COLUMN_DTYPE).reshape(n, width)
+            self._append_file(self.path / f"{name}.f64", data.tobytes(),
+                              self.count * width * COLUMN_DTYPE.itemsize)
+
+        id_bytes = "".join(fp_id + "\n" for fp_id in ids).encode("utf-8")
+        self._append_file(self.path / "ids.txt", id_bytes, self._ids_bytes)
+
+        self.count += n
+        self.last_id = ids[-1]
+        self._ids_bytes += len(id_bytes)
+        if self._ids is not None:
+            self._ids.extend(ids)
+        self._maps = {}
+        self._write_index()
+
+    def _append_file(self, path: Path, data: bytes, committed: int):
+        mode = "r+b" if path.exists() else "wb"
+        with open(path, mode) as f:
+            f.truncate(committed)
+            f.seek(committed)
+            f.write(data)
+
+    def _write_index(self):
+        index = {
+            "schema_version": COLUMNS_SCHEMA,
+            "count": self.count,
+            "last_id": self.last_id,
+            "ids_bytes": self._ids_bytes,
+            "columns": {name: [width, COLUMN_DTYPE.str] for name, width in COLUMN_WIDTHS.items()},
+        }
+        tmp_path = self.path / "index.json.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.path / "index.json")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def deltas(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        L2 distance between consecutive rows, per feature column.
+
+        Args:
+            rows: Row indices to walk (default: all, in storage order)
+
+        Returns:
+            (len - 1, 3) array of [l2_harm, l2_phase, l2_morph]
+        """
+        out = []
+        for name in FEATURE_COLUMNS:
+            data = self.column(name)
+            if rows is not None:
+                data = data[rows]
+            out.append(np.linalg.norm(np.diff(data, axis=0), axis=1))
+        return np.stack(out, axis=1)
+
+    def nearest(self, query: Union[Dict, Sequence[float]], k: int = 5,
+                column: str = "harm_ratio") -> List[Tuple[str, float]]:
+        """
+        k nearest stored fingerprints by L2 distance on one feature column.
+
+        Args:
+            query: Fingerprint dict, its "features" dict, or a raw vector
+            k: Number of results
+            column: Feature column to compare
+
+        Returns:
+            [(id, distance), ...] nearest first
+        """
+        if self.count == 0 or k <= 0:
+            return []
+        if isinstance(query, dict):
+            query = query.get("features", query)[column]
+        vector = _fixed_width(query, COLUMN_WIDTHS[column])
+
+        dist = np.linalg.norm(self.column(column) - vector, axis=1)
+        k = min(k, self.count)
+        top = np.argpartition(dist, k - 1)[:k]
+        top = top[np.argsort(dist[top], kind="stable")]
+        ids = self.ids
+        return [(ids[i], float(dist[i])) for i in top]
@@ -9,12 +9,115 @@ All FFT-derived features computed via the SSOT module (fft_features.py).
 
 import hashlib
 import json
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
 from src.telemetry.fft_features import compute_all as fft_compute_all
+from src.telemetry.fft_features import compute_all_batch as fft_compute_all_batch
+
+# Per-frame feature columns carried by FingerprintBatch (same names as
+# fingerprint["features"])
+BATCH_FEATURE_KEYS = (
+    "harm_ratio", "phase_rel", "thd", "thd_valid",
+    "spectral_peak_bin", "spectral_peak_bin_frac", "spectral_peak_hz",
+    "spectral_centroid_hz", "spectral_tilt", "spectral_tilt_slope",
+    "num_harmonics_actual",
+)
+
+
+def _trim_length(n: int, freq_hz: Optional[float], sample_rate: int) -> int:
+    """Whole-cycle trim length (same rule as FingerprintExtractor.extract)."""
+    if freq_hz is not None and 10 <= freq_hz <= 20000:
+        num_cycles = int(n / (sample_rate / freq_hz))
+        if num_cycles >= 1:
+            trim_length = round(num_cycles * (sample_rate / freq_hz))
+            if trim_length >= 64:
+                return trim_length
+    return n
+
+
+@dataclass
+class FingerprintBatch:
+    """
+    Columnar fingerprints for one capture run (e.g. a CV sweep).
+
+    Every array has a leading axis of len(batch). to_fingerprints() expands
+    to the same dicts extract() returns; FingerprintStore.save_sweep accepts
+    a batch directly.
+    """
+    ids: List[str]
+    device: Dict
+    session: Dict
+    capture_index: np.ndarray
+    cv_chan: str
+    cv_volts: np.ndarray
+    freq_hz: np.ndarray
+    n_samples: np.ndarray
+    sample_rate: int
+    num_harmonics: int
+    harm_ratio_raw: np.ndarray
+    morph: np.ndarray
+    features: Dict[str, np.ndarray]
+    rms: np.ndarray
+    peak: np.ndarray
+    snr_db: np.ndarray
+    flags: List[List[str]]
+    notes: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def to_fingerprints(self) -> List[Dict]:
+        """Expand to schema v2 fingerprint dicts."""
+        cols = {k: v.tolist() for k, v in self.features.items()}
+        harm_raw = self.harm_ratio_raw.tolist()
+        morph = self.morph.tolist()
+        fingerprints = []
+        for i, fp_id in enumerate(self.ids):
+            features = {
+                "harm_ratio": cols["harm_ratio"][i],
+                "phase_rel": cols["phase_rel"][i],
+                "morph": morph[i],
+            }
+            for key in BATCH_FEATURE_KEYS[2:]:
+                features[key] = cols[key][i]
+            fingerprints.append({
+                "schema_version": FingerprintExtractor.SCHEMA_VERSION,
+                "id": fp_id,
+                "device": self.device.copy(),
+                "session": self.session.copy(),
+                "capture": {
+                    "index": int(self.capture_index[i]),
+                    "cv": {"chan": self.cv_chan, "volts": round(float(self.cv_volts[i]), 4)},
+                    "freq_hz": float(self.freq_hz[i]),
+                    "sr_hz": self.sample_rate,
+                    "n_samples": int(self.n_samples[i]),
+                    "fft_size": int(self.n_samples[i]),
+                    "window": "hann",
+                    "num_harmonics": self.num_harmonics,
+                    "notes": list(self.notes)
+                },
+                "features": features,
+                "quality": {
+                    "rms": float(self.rms[i]),
+                    "peak": float(self.peak[i]),
+                    "snr_db": float(self.snr_db[i]),
+                    "flags": list(self.flags[i])
+                },
+                "adjacent": {
+                    "prev_id": None,
+                    "next_id": None,
+                    "delta_prev": {"l2_harm": 0.0, "l2_phase": 0.0, "l2_morph": 0.0}
+                },
+                "hash": {
+                    "features_sha1": FingerprintExtractor._hash_features(
+                        harm_raw[i], features["phase_rel"], morph[i])
+                }
+            })
+        return fingerprints
 
 
 class FingerprintExtractor:
@@ -157,6 +260,152 @@ class FingerprintExtractor:
         self.capture_index += 1
         return fingerprint
 
+    def extract_batch(self, waveforms: Sequence[np.ndarray],
+                      cv_volts: Sequence[float], cv_chan: str = "cv1",
+                      freq_hz: Optional[Sequence[Optional[float]]] = None,
+                      sample_rate: int = 48000,
+                      notes: List[str] = None) -> FingerprintBatch:
+        """
+        Extract fingerprints for a whole sweep in one pass.
+
+        Frames are trimmed per frame exactly as extract() does, then grouped
+        by trimmed length so each group is a single rfft over axis 1.
+
+        Args:
+            waveforms: N waveforms, or an (N, n_samples) array
+            cv_volts: N CV voltages
+            cv_chan: CV channel name
+            freq_hz: N fundamentals (None entries auto-detect), or None
+            sample_rate: Audio sample rate
+            notes: Capture notes (shared by all frames)
+
+        Returns:
+            FingerprintBatch with columns matching extract() per frame
+        """
+        if self.session_id is None:
+            self.start_session()
+
+        frames = [np.asarray(w, dtype=np.float64) for w in waveforms]
+        n = len(frames)
+        if len(cv_volts) != n:
+            raise ValueError(f"cv_volts has {len(cv_volts)} entries, expected {n}")
+        freqs = list(freq_hz) if freq_hz is not None else [None] * n
+        if len(freqs) != n:
+            raise ValueError(f"freq_hz has {len(freqs)} entries, expected {n}")
+
+        lengths = np.array([_trim_length(len(f), q, sample_rate) for f, q in zip(frames, freqs)],
+                           dtype=np.int64)
+
+        # Output columns
+        n_harm = self.num_harmonics
+        out = {}
+        harm_raw = np.zeros((n, n_harm))
+        detected = np.zeros(n)
+        snr_db = np.zeros(n)
+        rms = np.zeros(n)
+        peak = np.zeros(n)
+        crest = np.zeros(n)
+        mean = np.zeros(n)
+
+        for length in np.unique(lengths):
+            idx = np.flatnonzero(lengths == length)
+            block = np.stack([frames[i][:length] for i in idx])
+            fft = fft_compute_all_batch(block, freq_hz=[freqs[i] for i in idx],
+                                        sample_rate=sample_rate, num_harmonics=n_harm)
+            for key in BATCH_FEATURE_KEYS:
+                col = fft[key]
+                if key not in out:
+                    out[key] = np.zeros((n,) + col.shape[1:], dtype=col.dtype)
+                out[key][idx] = col
+            harm_raw[idx] = fft['harm_ratio_raw']
+            detected[idx] = fft['freq_hz']
+            snr_db[idx] = fft['snr_db']
+
+            block_rms = np.sqrt(np.mean(block ** 2, axis=1))
+            block_peak = np.max(np.abs(block), axis=1)
+            rms[idx] = block_rms
+            peak[idx] = block_peak
+            crest[idx] = np.where(block_rms > 1e-10, block_peak / np.where(block_rms > 1e-10, block_rms, 1.0), 1.0)
+            mean[idx] = np.mean(block, axis=1)
+
+        morph = self._compute_morphology_batch(harm_raw, crest)
+
+        flags = []
+        for i in range(n):
+            frame_flags = []
+            if peak[i] > 0.99:
+                frame_flags.append("clipped")
+            if snr_db[i] < 20:
+                frame_flags.append("low_snr")
+            if abs(mean[i]) > 0.05:
+                frame_flags.append("dc_offset")
+            if rms[i] < 0.01:
+                frame_flags.append("low_level")
+            flags.append(frame_flags)
+
+        device_key = f"{self.device['model'].lower()}_{self.device['unit_id'].lower()}"
+        device_key = device_key.replace(" ", "_")
+        capture_index = np.arange(self.capture_index, self.capture_index + n)
+        ids = [f"{device_key}_{self.session_id}_c{c:03d}" for c in capture_index]
+        self.capture_index += n
+
+        return FingerprintBatch(
+            ids=ids,
+            device=self.device.copy(),
+            session={
+                "id": self.session_id,
+                "utc": datetime.utcnow().isoformat() + "Z",
+                "operator": self.operator
+            },
+            capture_index=capture_index,
+            cv_chan=cv_chan,
+            cv_volts=np.asarray(cv_volts, dtype=np.float64),
+            freq_hz=detected,
+            n_samples=lengths,
+            sample_rate=sample_rate,
+            num_harmonics=n_harm,
+            harm_ratio_raw=harm_raw,
+            morph=morph,
+            features=out,
+            rms=np.round(rms, 4),
+            peak=np.round(peak, 4),
+            snr_db=snr_db,
+            flags=flags,
+            notes=list(notes or []),
+        )
+
+    def _compute_morphology_batch(self, harm_ratio: np.ndarray,
+                                  crest: np.ndarray) -> np.ndarray:
+        """Vectorized _compute_morphology over (N, n_harm) rows -> (N, 5)."""
+        n_harm = harm_ratio.shape[1]
+        energy = harm_ratio ** 2
+
+        odd_energy = energy[:, 0::2].sum(axis=1)
+        even_energy = energy[:, 1::2].sum(axis=1)
+        total = odd_energy + even_energy
+        has_energy = total > 1e-10
+        safe_total = np.where(has_energy, total, 1.0)
+        symmetry = np.where(has_energy, odd_energy / safe_total, 0.5)
+
+        crest_norm = np.clip((crest - 1.0) / 2.0, 0.0, 1.0)
+
+        indices = np.arange(1, n_harm + 1)
+        total_weight = harm_ratio.sum(axis=1)
+        has_weight = total_weight > 1e-10
+        centroid = (harm_ratio * indices).sum(axis=1) / np.where(has_weight, total_weight, 1.0)
+        centroid_norm = np.where(has_weight, (centroid - 1) / max(n_harm - 1, 1), 0.0)
+
+        # polyfit(indices, log_mags, 1) slope in closed form
+        log_mags = np.log10(harm_ratio + 1e-10)
+        x_dev = indices - indices.mean()
+        slope = (log_mags * x_dev).sum(axis=1) / np.sum(x_dev ** 2)
+        tilt_norm = np.clip((slope + 1) / 2, 0.0, 1.0)
+
+        high_energy = energy[:, n_harm // 2:].sum(axis=1)
+        brightness = np.where(has_energy, high_energy / safe_total, 0.0)
+
+        return np.round(np.stack([symmetry, crest_norm, centroid_norm, tilt_norm, brightness], axis=1), 4)
+
     def _compute_morphology(self, waveform: np.ndarray,
                             harm_ratio: List[float]) -> List[float]:
         """
@@ -224,7 +473,8 @@ class FingerprintExtractor:
             flags.append("low_level")
         return flags
 
-    def _hash_features(self, harm_ratio: List[float], phase_rel: List[float],
+    @staticmethod
+    def _hash_features(harm_ratio: List[float], phase_rel: List[float],
                        morph: List[float]) -> str:
         """Compute SHA1 hash of features for integrity verification."""
         data = json.dumps({
@@ -2,16 +2,25 @@
 Fingerprint Datastore v1
 
 JSONL-based storage with CSV export and pre-computed deltas.
+
+JSONL stays the complete record (and the interchange format); feature
+vectors are mirrored into memory-mapped columns per device
+(fingerprint_columns.py) for history loads, deltas and nearest-neighbour
+queries. Stores written before the columns existed are imported from
+JSONL on first access.
 """
 
 import csv
 import json
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from src.telemetry.fingerprint_columns import FingerprintColumns
+
 
 class FingerprintStore:
     """Manages fingerprint storage and retrieval."""
@@ -47,27 +56,37 @@ class FingerprintStore:
 
         device_path = self.get_device_path(device_key)
         jsonl_path = device_path / "raw" / "fingerprints.jsonl"
+        columns = self.columns(device_key)
 
         # Update adjacent links
-        prev_fp = self._get_last_fingerprint(jsonl_path)
-        if prev_fp:
-            fingerprint["adjacent"]["prev_id"] = prev_fp["id"]
+        prev_features = columns.last_features()
+        if prev_features:
+            fingerprint["adjacent"]["prev_id"] = columns.last_id
             fingerprint["adjacent"]["delta_prev"] = self._compute_delta(
-                prev_fp["features"], fingerprint["features"]
+                prev_features, fingerprint["features"]
             )
 
         with open(jsonl_path, "a") as f:
             f.write(json.dumps(fingerprint) + "\n")
+        columns.append([fingerprint])
 
         return fingerprint["id"]
 
-    def save_sweep(self, fingerprints: List[Dict], device_key: str,
+    def save_sweep(self, fingerprints, device_key: str,
                    sweep_name: str = None) -> str:
         """
         Save a complete CV sweep with all derived files.
 
+        Args:
+            fingerprints: List of fingerprint dicts, or a FingerprintBatch
+                from FingerprintExtractor.extract_batch
+            device_key: Device directory key
+            sweep_name: Sweep ID (derived from session + CV channel if None)
+
         Returns sweep ID.
         """
+        if hasattr(fingerprints, "to_fingerprints"):
+            fingerprints = fingerprints.to_fingerprints()
         if not fingerprints:
             raise ValueError("Empty fingerprint list")
 
@@ -89,11 +108,13 @@ class FingerprintStore:
             if i < len(fingerprints) - 1:
                 fp["adjacent"]["next_id"] = fingerprints[i + 1]["id"]
 
-        # Save JSONL
+        # Save JSONL + columns
+        columns = self.columns(device_key)
         jsonl_path = device_path / "raw" / "fingerprints.jsonl"
         with open(jsonl_path, "a") as f:
             for fp in fingerprints:
                 f.write(json.dumps(fp) + "\n")
+        columns.append(fingerprints)
 
         # Save CSV
         self._export_csv(fingerprints, device_path / "raw" / "fingerprints.csv")
@@ -135,7 +156,7 @@ class FingerprintStore:
         self._update_manifest(device_path, fingerprints, sweep_name)
 
         # Update index
-        self._update_index()
+        self._update_index(device_path)
 
         return sweep_name
 
@@ -265,17 +286,6 @@ class FingerprintStore:
             writer.writeheader()
             writer.writerows(rows)
 
-    def _get_last_fingerprint(self, jsonl_path: Path) -> Optional[Dict]:
-        """Get last fingerprint from JSONL file."""
-        if not jsonl_path.exists():
-            return None
-        with open(jsonl_path, "r") as f:
-            last = None
-            for line in f:
-                if line.strip():
-                    last = json.loads(line)
-            return last
-
     def _update_manifest(self, device_path: Path, fingerprints: List[Dict],
                          sweep_name: str):
         """Update device manifest."""
@@ -307,8 +317,42 @@ class FingerprintStore:
         with open(manifest_path, "w") as f:
             json.dump(manifest, f, indent=2)
 
-    def _update_index(self):
-        """Update top-level index."""
+    def _index_entry(self, device_dir: Path) -> Optional[Dict]:
+        """Index entry for one device directory (None without a manifest)."""
+        manifest_path = device_dir / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        return {
+            "key": device_dir.name,
+            "device": manifest.get("device", {}),
+            "sweeps": len(manifest.get("sweeps", [])),
+            "sessions": len(manifest.get("sessions", [])),
+            "fingerprints": len(FingerprintColumns(device_dir / "columns")),
+        }
+
+    def _update_index(self, device_path: Path):
+        """Update one device's entry in the top-level index."""
+        index_path = self.base_path / "index.json"
+        if not index_path.exists():
+            self.rebuild_index()
+            return
+
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        entry = self._index_entry(device_path)
+        devices = [d for d in index["devices"] if d["key"] != device_path.name]
+        if entry is not None:
+            devices.append(entry)
+        index["devices"] = devices
+        index["updated_utc"] = datetime.utcnow().isoformat() + "Z"
+
+        with open(index_path, "w") as f:
+            json.dump(index, f, indent=2)
+
+    def rebuild_index(self):
+        """Rebuild the top-level index by scanning every device directory."""
         index = {
             "schema_version": "index.v1",
             "updated_utc": datetime.utcnow().isoformat() + "Z",
@@ -316,18 +360,11 @@ class FingerprintStore:
         }
 
         devices_path = self.base_path / "devices"
-        for device_dir in devices_path.iterdir():
+        for device_dir in sorted(devices_path.iterdir()):
             if device_dir.is_dir():
-                manifest_path = device_dir / "manifest.json"
-                if manifest_path.exists():
-                    with open(manifest_path, "r") as f:
-                        manifest = json.load(f)
-                    index["devices"].append({
-                        "key": device_dir.name,
-                        "device": manifest.get("device", {}),
-                        "sweeps": len(manifest.get("sweeps", [])),
-                        "sessions": len(manifest.get("sessions", []))
-                    })
+                entry = self._index_entry(device_dir)
+                if entry is not None:
+                    index["devices"].append(entry)
 
         with open(self.base_path / "index.json", "w") as f:
             json.dump(index, f, indent=2)
@@ -346,6 +383,9 @@ class FingerprintStore:
         jsonl_path = self.base_path / "devices" / device_key / "raw" / "fingerprints.jsonl"
         fingerprints = []
 
+        if ids is not None:
+            ids = set(ids)
+
         with open(jsonl_path, "r") as f:
             for line in f:
                 if line.strip():
@@ -354,3 +394,72 @@ class FingerprintStore:
                         fingerprints.append(fp)
 
         return fingerprints
+
+    # ------------------------------------------------------------------
+    # Columnar access
+    # ------------------------------------------------------------------
+
+    def columns(self, device_key: str) -> FingerprintColumns:
+        """
+        Open a device's feature columns (memory-mapped, read on demand).
+
+        A device with JSONL history but no columns is imported first.
+        """
+        device_path = self.base_path / "devices" / device_key
+        columns = FingerprintColumns(device_path / "columns")
+        if not columns.exists() and (device_path / "raw" / "fingerprints.jsonl").exists():
+            columns = self.import_jsonl(device_key)
+        return columns
+
+    def import_jsonl(self, device_key: str) -> FingerprintColumns:
+        """Rebuild a device's columns from its fingerprints.jsonl."""
+        device_path = self.base_path / "devices" / device_key
+        columns_path = device_path / "columns"
+        if columns_path.exists():
+            shutil.rmtree(columns_path)
+
+        columns = FingerprintColumns(columns_path)
+        chunk = []
+        with open(device_path / "raw" / "fingerprints.jsonl", "r") as f:
+            for line in f:
+                if line.strip():
+                    chunk.append(json.loads(line))
+                    if len(chunk) >= 1000:
+                        columns.append(chunk)
+                        chunk = []
+        columns.append(chunk)
+        return columns
+
+    def sweep_deltas(self, device_key: str, sweep_name: str) -> np.ndarray:
+        """
+        Adjacent L2 deltas for a stored sweep, from the columns.
+
+        Returns:
+            (points - 1, 3) array of [l2_harm, l2_phase, l2_morph]
+        """
+        sweep_path = self.base_path / "devices" / device_key / "sweeps" / f"{sweep_name}.json"
+        with open(sweep_path, "r") as f:
+            sweep_def = json.load(f)
+
+        columns = self.columns(device_key)
+        ids = [item["id"] for item in sweep_def["ids"]]
+        position = {fp_id: i for i, fp_id in enumerate(columns.ids)}
+        # Last stored copy of each ID, in sweep order
+        rows = np.array([position[fp_id] for fp_id in ids if fp_id in position], dtype=np.intp)
+        return columns.deltas(rows)
+
+    def nearest(self, query: Union[Dict, Sequence[float]], device_key: str,
+                k: int = 5, column: str = "harm_ratio") -> List[Tuple[str, float]]:
+        """
+        k stored fingerprints closest to query on one feature column.
+
+        Args:
+            query: Fingerprint dict, features dict, or raw feature vector
+            device_key: Device to search
+            k: Number of results
+            column: "harm_ratio", "phase_rel" or "morph"
+
+        Returns:
+            [(id, distance), ...] nearest first
+        """
+        return self.columns(device_key).nearest(query, k=k, column=column)
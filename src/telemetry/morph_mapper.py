@@ -504,29 +504,25 @@ class MorphMapper:
         # Run normal sweep
         morph_map = self.run_sweep()
 
-        # Extract fingerprints from snapshots
-        fingerprints = []
-        for snap in morph_map.get("snapshots", []):
-            if snap.get("snapshot") and snap["snapshot"].get("waveform"):
-                waveform = np.array(snap["snapshot"]["waveform"])
-                cv_volts = snap.get("cv_voltage", 0.0)
-                freq_hz = snap["snapshot"]["frame"].get("freq", None)
-
-                fp = extractor.extract(
-                    waveform=waveform,
-                    cv_volts=cv_volts,
-                    cv_chan="morph",
-                    freq_hz=freq_hz,
-                    notes=[f"morph_map_{self.device_name}"]
-                )
-                fingerprints.append(fp)
+        # Extract fingerprints from snapshots (one batched pass)
+        captured = [
+            snap for snap in morph_map.get("snapshots", [])
+            if snap.get("snapshot") and snap["snapshot"].get("waveform")
+        ]
 
         # Save sweep
-        if fingerprints:
+        if captured:
+            batch = extractor.extract_batch(
+                waveforms=[np.array(snap["snapshot"]["waveform"]) for snap in captured],
+                cv_volts=[snap.get("cv_voltage", 0.0) for snap in captured],
+                cv_chan="morph",
+                freq_hz=[snap["snapshot"]["frame"].get("freq", None) for snap in captured],
+                notes=[f"morph_map_{self.device_name}"]
+            )
             device_key = self.device_name.lower().replace(" ", "_")
-            sweep_name = store.save_sweep(fingerprints, device_key)
+            sweep_name = store.save_sweep(batch, device_key)
             morph_map["fingerprint_sweep"] = sweep_name
-            morph_map["fingerprint_ids"] = [fp["id"] for fp in fingerprints]
+            morph_map["fingerprint_ids"] = list(batch.ids)
 
         return morph_map
 
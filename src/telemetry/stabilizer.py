@@ -12,6 +12,12 @@ State machine:
 
 SCRUB is an instant transition (trigger_scrub → clear state → REACQUIRE).
 
+observe() and observe_many() share one vectorized kernel: poison checks and
+normalization for a whole (N, samples) block are a handful of NumPy passes,
+and similarity is a row-wise dot against the previous clean frame (whose
+norm is kept, so each frame computes only its own). Offline replays of
+recorded sessions go through observe_many() at thousands of frames/second.
+
 References:
     docs/TELEMETRY_STABILIZER_SPEC.md (Phase 1 brief)
 """
@@ -20,7 +26,7 @@ import threading
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Literal
+from typing import List, Literal, Sequence
 
 import numpy as np
 
@@ -69,6 +75,10 @@ class StabilizerResult:
     required_count: int     # frames needed for stable window
 
 
+# Poison code -> poison_reason (0 = clean); order is detection priority
+_POISON_REASONS = (None, "nan_inf", "zero_speckle", "zero_run", "discontinuity")
+
+
 # =============================================================================
 # WAVEFORM STABILIZER
 # =============================================================================
@@ -123,6 +133,7 @@ class WaveformStabilizer:
         self._state = StabilityState.NORMAL
         self._stable_count = 0
         self._prev_normalized: np.ndarray | None = None
+        self._prev_norm = 0.0  # L2 norm of _prev_normalized
         self._reacquire_entered_at: float | None = None
         self._pending_clear = False  # Set by trigger_scrub, consumed by next observe
         self.debug = debug
@@ -141,55 +152,31 @@ class WaveformStabilizer:
         Returns:
             StabilizerResult with poison check, state, and directives.
         """
-        with self._lock:
-            # Consume pending clear from trigger_scrub()
-            clear_history = self._pending_clear
-            self._pending_clear = False
+        frames = np.asarray(frame, dtype=np.float64).reshape(1, -1)
+        return self._observe_block(frames, (timestamp,))[0]
 
-            # 1. Poison detection (on raw frame)
-            poisoned, poison_reason = self._check_poison(frame)
-
-            # 2. Normalize for metrics (does not mutate raw frame)
-            normalized = self._normalize(frame)
-
-            # 3. Similarity vs previous frame
-            similarity = 0.0
-            if self._prev_normalized is not None and not poisoned:
-                similarity = self._compute_similarity(normalized, self._prev_normalized)
-
-            # 4. Update stability counter
-            self._update_stability(similarity, poisoned, timestamp)
-
-            # 5. Store normalized frame for next comparison
-            if not poisoned:
-                self._prev_normalized = normalized
-            # Poisoned frames don't update reference (would corrupt similarity)
-
-            # 6. Build result
-            in_reacquire = self._state == StabilityState.REACQUIRE
-            admissible = (not poisoned) and (not in_reacquire)
-
-            result = StabilizerResult(
-                poisoned=poisoned,
-                poison_reason=poison_reason,
-                stability_state=self._state,
-                clear_history=clear_history,
-                admissible_for_visual_history=admissible,
-                render_mode="single" if in_reacquire else "persistence",
-                similarity=similarity,
-                stable_count=self._stable_count,
-                required_count=self.STABLE_WINDOW_FRAMES,
-            )
+    def observe_many(self, frames: np.ndarray,
+                     timestamps: Sequence[float]) -> List[StabilizerResult]:
+        """Process a block of frames in arrival order.
 
-            if self.debug:
-                print(
-                    f"[Stabilizer] state={self._state.name} "
-                    f"similarity={result.similarity:.3f} "
-                    f"stable={self._stable_count}/{self.STABLE_WINDOW_FRAMES} "
-                    f"poisoned={result.poisoned} reason={result.poison_reason}"
-                )
+        Equivalent to calling observe() on each row in turn (a pending
+        scrub clear lands on the first result), but poison detection,
+        normalization and similarity run once over the whole block.
+
+        Args:
+            frames: (N, samples) raw waveforms, one frame per row.
+            timestamps: N arrival times (time.time() scale).
 
-            return result
+        Returns:
+            One StabilizerResult per row.
+        """
+        frames = np.asarray(frames, dtype=np.float64)
+        if frames.ndim != 2:
+            raise ValueError(f"frames must be 2-D (N, samples), got shape {frames.shape}")
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if len(timestamps) != len(frames):
+            raise ValueError(f"{len(frames)} frames but {len(timestamps)} timestamps")
+        return self._observe_block(frames, timestamps)
 
     def trigger_scrub(self) -> None:
         """Manual stabilize button pressed. Clear state, enter REACQUIRE."""
@@ -197,6 +184,7 @@ class WaveformStabilizer:
             self._state = StabilityState.REACQUIRE
             self._stable_count = 0
             self._prev_normalized = None
+            self._prev_norm = 0.0
             self._reacquire_entered_at = time.time()
             self._pending_clear = True
 
@@ -208,6 +196,134 @@ class WaveformStabilizer:
         with self._lock:
             return self._state
 
+    # -----------------------------------------------------------------
+    # Block kernel
+    # -----------------------------------------------------------------
+
+    def _observe_block(self, frames: np.ndarray, timestamps) -> List[StabilizerResult]:
+        """Run the pipeline over (N, samples) float64 frames."""
+        codes = self._poison_codes(frames)
+        clean = np.flatnonzero(codes == 0)
+        normalized = self._normalize_rows(frames[clean])
+        norms = np.sqrt(np.einsum('ij,ij->i', normalized, normalized))
+
+        results = []
+        with self._lock:
+            # Consume pending clear from trigger_scrub()
+            clear_history = self._pending_clear
+            self._pending_clear = False
+
+            # Similarity of each clean frame vs the previous clean frame
+            # (poisoned frames never become the reference)
+            similarity = np.zeros(len(frames))
+            if len(clean):
+                sims = np.zeros(len(clean))
+                if len(clean) > 1:
+                    sims[1:] = self._row_similarity(normalized[1:], norms[1:],
+                                                    normalized[:-1], norms[:-1])
+                prev = self._prev_normalized
+                if prev is not None and len(prev) == frames.shape[1]:
+                    sims[:1] = self._row_similarity(normalized[:1], norms[:1],
+                                                    prev[None], np.array([self._prev_norm]))
+                similarity[clean] = sims
+
+                self._prev_normalized = normalized[-1].copy()
+                self._prev_norm = float(norms[-1])
+
+            for i, code in enumerate(codes.tolist()):
+                poisoned = code != 0
+                sim = float(similarity[i])
+                self._update_stability(sim, poisoned, float(timestamps[i]))
+
+                in_reacquire = self._state == StabilityState.REACQUIRE
+                result = StabilizerResult(
+                    poisoned=poisoned,
+                    poison_reason=_POISON_REASONS[code],
+                    stability_state=self._state,
+                    clear_history=clear_history and i == 0,
+                    admissible_for_visual_history=(not poisoned) and (not in_reacquire),
+                    render_mode="single" if in_reacquire else "persistence",
+                    similarity=sim,
+                    stable_count=self._stable_count,
+                    required_count=self.STABLE_WINDOW_FRAMES,
+                )
+                results.append(result)
+
+                if self.debug:
+                    print(
+                        f"[Stabilizer] state={self._state.name} "
+                        f"similarity={result.similarity:.3f} "
+                        f"stable={self._stable_count}/{self.STABLE_WINDOW_FRAMES} "
+                        f"poisoned={result.poisoned} reason={result.poison_reason}"
+                    )
+
+        return results
+
+    def _poison_codes(self, frames: np.ndarray) -> np.ndarray:
+        """Index into _POISON_REASONS for every row, highest priority first.
+
+        Fused form of _check_poison: one finiteness, zero-mask and diff pass
+        over the whole block.
+        """
+        n_rows, n = frames.shape
+        nan_inf = ~np.isfinite(frames).all(axis=1)
+
+        zeros = frames == 0.0
+        zero_count = zeros.sum(axis=1)
+        if n:
+            speckle = ((zero_count > self.ZERO_SPECKLE_COUNT)
+                       | (zero_count / n > self.ZERO_SPECKLE_FRACTION))
+        else:
+            speckle = np.zeros(n_rows, dtype=bool)
+
+        zero_run = self._max_zero_runs(zeros) > self.ZERO_RUN_THRESHOLD
+
+        if n >= 2:
+            with np.errstate(invalid='ignore'):
+                jumps = np.abs(np.diff(frames, axis=1)).max(axis=1)
+            discontinuity = jumps > self.DISCONTINUITY_THRESHOLD
+        else:
+            discontinuity = np.zeros(n_rows, dtype=bool)
+
+        return np.select([nan_inf, speckle, zero_run, discontinuity], [1, 2, 3, 4], 0)
+
+    @staticmethod
+    def _max_zero_runs(zeros: np.ndarray) -> np.ndarray:
+        """Longest run of True per row of a 2-D bool mask."""
+        n_rows = zeros.shape[0]
+        edges = np.zeros((n_rows, zeros.shape[1] + 2), dtype=np.int8)
+        edges[:, 1:-1] = zeros
+        steps = np.diff(edges, axis=1)
+        start_rows, start_cols = np.nonzero(steps == 1)
+        _, end_cols = np.nonzero(steps == -1)  # row-major: pairs with starts
+
+        longest = np.zeros(n_rows, dtype=np.int64)
+        np.maximum.at(longest, start_rows, end_cols - start_cols)
+        return longest
+
+    @staticmethod
+    def _normalize_rows(frames: np.ndarray) -> np.ndarray:
+        """_normalize applied to every row of a (N, samples) block."""
+        if frames.shape[1] == 0:
+            return frames.copy()
+        with np.errstate(invalid='ignore', over='ignore'):
+            m = frames.mean(axis=1, keepdims=True)
+            finite = np.isfinite(m)
+            result = np.where(finite, frames - np.where(finite, m, 0.0), frames)
+            peak = np.abs(result).max(axis=1, keepdims=True)
+        scale = np.where(peak > 1e-10, peak, 1.0)
+        return result / scale
+
+    @staticmethod
+    def _row_similarity(a: np.ndarray, norm_a: np.ndarray,
+                        b: np.ndarray, norm_b: np.ndarray) -> np.ndarray:
+        """_compute_similarity for paired rows, given their L2 norms."""
+        dots = np.einsum('ij,ij->i', a, b)
+        valid = (norm_a >= 1e-10) & (norm_b >= 1e-10)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sims = np.clip(dots / (norm_a * norm_b), -1.0, 1.0)
+        return np.where(valid, sims, 0.0)
+
     # -----------------------------------------------------------------
     # Poison detection
     # -----------------------------------------------------------------
@@ -217,15 +333,9 @@ class WaveformStabilizer:
 
         Priority: nan_inf > zero_speckle > zero_run > discontinuity
         """
-        if self._detect_nan_inf(frame):
-            return True, "nan_inf"
-        if self._detect_zero_speckle(frame):
-            return True, "zero_speckle"
-        if self._detect_zero_run(frame):
-            return True, "zero_run"
-        if self._detect_discontinuity(frame):
-            return True, "discontinuity"
-        return False, None
+        frames = np.asarray(frame, dtype=np.float64).reshape(1, -1)
+        reason = _POISON_REASONS[int(self._poison_codes(frames)[0])]
+        return reason is not None, reason
 
     @staticmethod
     def _detect_nan_inf(frame: np.ndarray) -> bool:
@@ -254,16 +364,8 @@ class WaveformStabilizer:
         For an active oscillator, 16+ consecutive samples at exactly 0.0
         indicates buffer clobber/dropout, not signal.
         """
-        max_run = 0
-        current_run = 0
-        for sample in frame:
-            if sample == 0.0:
-                current_run += 1
-                if current_run > max_run:
-                    max_run = current_run
-            else:
-                current_run = 0
-        return max_run > self.ZERO_RUN_THRESHOLD
+        zeros = np.asarray(frame).reshape(1, -1) == 0.0
+        return bool(self._max_zero_runs(zeros)[0] > self.ZERO_RUN_THRESHOLD)
 
     def _detect_discontinuity(self, frame: np.ndarray) -> bool:
         """Extreme sample-to-sample jumps beyond plausible bound."""
@@ -0,0 +1,257 @@
+"""
+Telemetry History
+
+Fixed-capacity ring buffers for /noise/telem/gen frames and captured
+waveforms, with columnar .npz export.
+
+Scalar frames live in one structured NumPy array (one row per frame), so
+a long hardware session costs a fixed, preallocated block instead of a
+dict per message. Waveforms go to a parallel float32 ring, each tagged
+with the sequence number of the scalar frame that was current when it
+arrived.
+
+The buffer keeps the deque-of-dicts interface TelemetryController and
+MorphMapper already use (append(dict), [-1], len, iteration, clear);
+frames read back as dicts with the same keys that went in. Only the
+fields in FRAME_FIELDS are kept.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+HISTORY_SCHEMA = "telem_history.v1"
+
+# Scalar fields from OSCBridge._handle_telem_gen, plus on_data's timestamp
+FRAME_FIELDS = [
+    ('timestamp', 'f8'),
+    ('slot', 'i4'),
+    ('freq', 'f8'),
+    ('phase', 'f8'),
+    ('p0', 'f8'),
+    ('p1', 'f8'),
+    ('p2', 'f8'),
+    ('p3', 'f8'),
+    ('p4', 'f8'),
+    ('rms_stage1', 'f8'),
+    ('rms_stage2', 'f8'),
+    ('rms_stage3', 'f8'),
+    ('peak', 'f8'),
+    ('bad_value', 'i4'),
+    ('peak3', 'f8'),
+    ('source_id', 'i4'),
+]
+FIELD_NAMES = [name for name, _ in FRAME_FIELDS]
+
+# Stored value for a None field (read back as None)
+_NONE_SENTINEL = {'f8': np.nan, 'i4': -1}
+
+FRAME_DTYPE = np.dtype(FRAME_FIELDS + [('_present', 'u4'), ('_none', 'u4')])
+
+
+class TelemetryHistory:
+    """Ring buffer of telemetry frames and waveforms."""
+
+    def __init__(self, capacity: int, waveform_capacity: int):
+        """
+        Args:
+            capacity: Scalar frames kept (oldest dropped first)
+            waveform_capacity: Waveforms kept
+        """
+        self.capacity = capacity
+        self.waveform_capacity = waveform_capacity
+
+        self._frames = np.zeros(capacity, dtype=FRAME_DTYPE)
+        self._head = 0          # next write index
+        self._len = 0
+        self.total = 0          # frames ever appended (sequence counter)
+
+        # Waveform ring: allocated on first waveform (width fixed then)
+        self._waves = None
+        self._wave_len = np.zeros(waveform_capacity, dtype=np.int32)
+        self._wave_time = np.zeros(waveform_capacity, dtype=np.float64)
+        self._wave_seq = np.zeros(waveform_capacity, dtype=np.int64)
+        self._wave_head = 0
+        self._wave_count = 0
+
+    # -----------------------------------------------------------------
+    # Deque-compatible frame access
+    # -----------------------------------------------------------------
+
+    def append(self, frame: Dict):
+        """Append one telemetry frame dict."""
+        row = self._frames[self._head]
+        present = 0
+        none = 0
+        for bit, (name, kind) in enumerate(FRAME_FIELDS):
+            if name not in frame:
+                row[name] = _NONE_SENTINEL[kind]
+                continue
+            present |= 1 << bit
+            value = frame[name]
+            if value is None:
+                none |= 1 << bit
+                value = _NONE_SENTINEL[kind]
+            row[name] = value
+        row['_present'] = present
+        row['_none'] = none
+
+        self._head = (self._head + 1) % self.capacity
+        self._len = min(self._len + 1, self.capacity)
+        self.total += 1
+
+    def clear(self):
+        """Drop all frames and waveforms (sequence counter keeps running)."""
+        self._head = 0
+        self._len = 0
+        self._wave_head = 0
+        self._wave_count = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> Dict:
+        if not -self._len <= index < self._len:
+            raise IndexError("telemetry history index out of range")
+        if index < 0:
+            index += self._len
+        return self._row_to_dict(self._frames[self._physical(index)])
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._len):
+            yield self._row_to_dict(self._frames[self._physical(i)])
+
+    def _physical(self, index: int) -> int:
+        return (self._head - self._len + index) % self.capacity
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        present = int(row['_present'])
+        none = int(row['_none'])
+        frame = {}
+        for bit, (name, kind) in enumerate(FRAME_FIELDS):
+            if present & (1 << bit):
+                if none & (1 << bit):
+                    frame[name] = None
+                elif kind == 'i4':
+                    frame[name] = int(row[name])
+                else:
+                    frame[name] = float(row[name])
+        return frame
+
+    # -----------------------------------------------------------------
+    # Waveforms
+    # -----------------------------------------------------------------
+
+    def append_waveform(self, samples, timestamp: float):
+        """
+        Store a captured waveform against the latest frame.
+
+        The ring width is set by the first waveform; longer ones are
+        truncated to it (length is recorded per entry).
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        if self._waves is None:
+            self._waves = np.zeros((self.waveform_capacity, len(samples)), dtype=np.float32)
+        n = min(len(samples), self._waves.shape[1])
+
+        i = self._wave_head
+        self._waves[i, :n] = samples[:n]
+        self._waves[i, n:] = 0.0
+        self._wave_len[i] = n
+        self._wave_time[i] = timestamp
+        self._wave_seq[i] = self.total - 1
+        self._wave_head = (i + 1) % self.waveform_capacity
+        self._wave_count = min(self._wave_count + 1, self.waveform_capacity)
+
+    @property
+    def waveform_count(self) -> int:
+        return self._wave_count
+
+    # -----------------------------------------------------------------
+    # Columnar views / export
+    # -----------------------------------------------------------------
+
+    @staticmethod
+    def _ordered(arr, head: int, count: int):
+        """Oldest-first copy of the live part of a ring array."""
+        if count < len(arr):
+            return arr[head - count:head] if head >= count else \
+                np.concatenate((arr[head - count:], arr[:head]))
+        return np.concatenate((arr[head:], arr[:head]))
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Oldest-first columns for everything in the buffer.
+
+        Returns dict with one array per FRAME_FIELDS name (missing / None
+        values are NaN or -1), 'frame_seq', and 'waveforms' (M, width)
+        float32 with 'waveform_lengths', 'waveform_timestamps',
+        'waveform_frame_seq'.
+        """
+        frames = self._ordered(self._frames, self._head, self._len)
+        cols = {name: np.array(frames[name]) for name in FIELD_NAMES}
+        cols['frame_seq'] = np.arange(self.total - self._len, self.total, dtype=np.int64)
+        cols['_present'] = np.array(frames['_present'])
+        cols['_none'] = np.array(frames['_none'])
+
+        count, head = self._wave_count, self._wave_head
+        width = self._waves.shape[1] if self._waves is not None else 0
+        if count:
+            cols['waveforms'] = self._ordered(self._waves, head, count)
+        else:
+            cols['waveforms'] = np.zeros((0, width), dtype=np.float32)
+        cols['waveform_lengths'] = self._ordered(self._wave_len, head, count)
+        cols['waveform_timestamps'] = self._ordered(self._wave_time, head, count)
+        cols['waveform_frame_seq'] = self._ordered(self._wave_seq, head, count)
+        return cols
+
+    def save_npz(self, path, provenance: Optional[Dict] = None):
+        """Write columns() to an uncompressed .npz with JSON provenance."""
+        meta = {'schema_version': HISTORY_SCHEMA, 'provenance': provenance or {}}
+        np.savez(path, meta=np.array(json.dumps(meta)), **self.columns())
+
+
+def load_history(path) -> Dict:
+    """
+    Load an exported telemetry history (.npz columns or legacy .json).
+
+    Returns:
+        Dict with 'frames' (field -> array, oldest first; NaN / -1 where
+        a field was missing or None), 'frame_seq', 'waveforms',
+        'waveform_lengths', 'waveform_timestamps', 'waveform_frame_seq'
+        and 'provenance'.
+    """
+    path = Path(path)
+    if path.suffix == '.json':
+        with open(path, 'r') as f:
+            doc = json.load(f)
+        frames = doc.get('history', [])
+        columns = {}
+        for name, kind in FRAME_FIELDS:
+            fill = _NONE_SENTINEL[kind]
+            values = [fill if fr.get(name) is None else fr[name] for fr in frames]
+            columns[name] = np.array(values, dtype=kind)
+        return {
+            'frames': columns,
+            'frame_seq': np.arange(len(frames), dtype=np.int64),
+            'waveforms': np.zeros((0, 0), dtype=np.float32),
+            'waveform_lengths': np.zeros(0, dtype=np.int32),
+            'waveform_timestamps': np.zeros(0),
+            'waveform_frame_seq': np.zeros(0, dtype=np.int64),
+            'provenance': doc.get('provenance', {}),
+        }
+
+    with np.load(path) as npz:
+        meta = json.loads(str(npz['meta']))
+        return {
+            'frames': {name: npz[name] for name in FIELD_NAMES},
+            'frame_seq': npz['frame_seq'],
+            'waveforms': npz['waveforms'],
+            'waveform_lengths': npz['waveform_lengths'],
+            'waveform_timestamps': npz['waveform_timestamps'],
+            'waveform_frame_seq': npz['waveform_frame_seq'],
+            'provenance': meta.get('provenance', {}),
+        }
@@ -0,0 +1,150 @@
+"""
+Telemetry Profiler - per-stage latency histograms for the telemetry hot path.
+
+Always compiled in, off by default. Instrumented code brackets a stage with
+
+    t0 = profiler.start()
+    ...
+    profiler.stop(STAGE_STABILIZER, t0)
+
+While disabled, start() returns 0 and stop() returns on that 0, so the cost
+is a flag test and a call per span. While enabled, spans are
+time.perf_counter_ns() deltas binned into a fixed log-scale histogram per
+stage (4 bins per octave, 1 µs to ~17 s), so memory stays constant under
+any load and p50/p99 are read straight from the bins.
+
+Stages are recorded from the OSC receive thread, the telemetry worker and
+the Qt thread; each histogram takes its own short lock.
+"""
+
+import threading
+import time
+from typing import Dict, List
+
+STAGE_OSC_DECODE = 'osc_decode'      # datagram -> float32 samples
+STAGE_ON_WAVEFORM = 'on_waveform'    # Qt-thread hand-off (or inline processing)
+STAGE_PROCESS = 'process'            # whole analysis pipeline for one frame
+STAGE_STABILIZER = 'stabilizer'      # WaveformStabilizer.observe
+STAGE_IDEAL = 'ideal'                # Digital Twin ideal waveform (+ error)
+STAGE_PAINT = 'paint'                # WaveformDisplay.paintEvent
+
+STAGES = (STAGE_OSC_DECODE, STAGE_ON_WAVEFORM, STAGE_PROCESS,
+          STAGE_STABILIZER, STAGE_IDEAL, STAGE_PAINT)
+
+_SUB_BITS = 2                        # 2**2 = 4 bins per octave
+_MIN_SHIFT = 10                      # bin 0 holds everything below 1024 ns
+_OCTAVES = 24
+NUM_BINS = 1 + (_OCTAVES << _SUB_BITS)
+
+
+def _bin_index(ns: int) -> int:
+    """Histogram bin for a duration in nanoseconds."""
+    bits = ns.bit_length()
+    if bits <= _MIN_SHIFT:
+        return 0
+    sub = (ns >> (bits - 1 - _SUB_BITS)) & ((1 << _SUB_BITS) - 1)
+    return min(((bits - 1 - _MIN_SHIFT) << _SUB_BITS) + sub + 1, NUM_BINS - 1)
+
+
+def _bin_upper_ns(index: int) -> int:
+    """Exclusive upper edge of a bin in nanoseconds."""
+    if index == 0:
+        return 1 << _MIN_SHIFT
+    octave, sub = divmod(index - 1, 1 << _SUB_BITS)
+    shift = octave + _MIN_SHIFT - _SUB_BITS
+    return ((1 << _SUB_BITS) + sub + 1) << shift
+
+
+class StageHistogram:
+    """Fixed-size log histogram of span durations for one stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._bins = [0] * NUM_BINS
+            self.count = 0
+            self.total_ns = 0
+            self.max_ns = 0
+
+    def record(self, ns: int):
+        index = _bin_index(ns)
+        with self._lock:
+            self._bins[index] += 1
+            self.count += 1
+            self.total_ns += ns
+            if ns > self.max_ns:
+                self.max_ns = ns
+
+    def percentile_ns(self, q: float) -> int:
+        """Upper bin edge holding the q-th percentile (capped at the max seen)."""
+        with self._lock:
+            if not self.count:
+                return 0
+            rank = max(1, -(-self.count * q // 100))
+            seen = 0
+            for index, n in enumerate(self._bins):
+                seen += n
+                if seen >= rank:
+                    return min(_bin_upper_ns(index), self.max_ns)
+        return self.max_ns
+
+
+class TelemetryProfiler:
+    """Toggleable span timer with one StageHistogram per stage."""
+
+    def __init__(self, stages=STAGES):
+        self.enabled = False
+        self._stages: Dict[str, StageHistogram] = {s: StageHistogram() for s in stages}
+
+    def start(self) -> int:
+        """Span start timestamp, or 0 while disabled."""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def stop(self, stage: str, t0: int):
+        """Close a span opened with start(); no-op for a disabled start."""
+        if t0:
+            self._stages[stage].record(time.perf_counter_ns() - t0)
+
+    def record(self, stage: str, ns: int):
+        """Record a duration measured elsewhere."""
+        self._stages[stage].record(ns)
+
+    def reset(self):
+        for hist in self._stages.values():
+            hist.reset()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage count and p50/p99/mean/max in microseconds."""
+        out = {}
+        for stage, hist in self._stages.items():
+            count = hist.count
+            out[stage] = {
+                'count': count,
+                'p50_us': hist.percentile_ns(50) / 1e3,
+                'p99_us': hist.percentile_ns(99) / 1e3,
+                'mean_us': hist.total_ns / count / 1e3 if count else 0.0,
+                'max_us': hist.max_ns / 1e3,
+            }
+        return out
+
+    def format_lines(self) -> List[str]:
+        """One fixed-width line per stage that has samples."""
+        lines = []
+        for stage, s in self.summary().items():
+            if s['count']:
+                lines.append(
+                    f"{stage:<12} n={s['count']:<7} p50={_fmt_us(s['p50_us']):>8} "
+                    f"p99={_fmt_us(s['p99_us']):>8} max={_fmt_us(s['max_us']):>8}"
+                )
+        return lines
+
+
+def _fmt_us(us: float) -> str:
+    return f"{us / 1e3:.1f}ms" if us >= 1e3 else f"{us:.0f}µs"
+
+
+# Shared instance for the telemetry path
+profiler = TelemetryProfiler()
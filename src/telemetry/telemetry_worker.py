@@ -0,0 +1,138 @@
+"""
+Telemetry Worker
+
+Runs the per-waveform analysis pipeline (stabilizer, Living Proof metrics,
+ideal and delta traces, RMS error) on a background thread so high telemetry rates
+cannot starve the Qt event loop.
+
+Hand-off is latest-wins: the GUI thread parks the newest frame in a
+one-item slot (a lock held only for the swap) and returns immediately.
+If the worker is still busy, the parked frame is replaced rather than
+queued, so a slow pipeline shows the newest waveform instead of falling
+further behind.
+
+Results are published as immutable TelemetryResult snapshots via a single
+attribute assignment; readers (TelemetryWidget's refresh timer) take one
+reference and never see a half-updated set of metrics.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from src.telemetry.stabilizer import StabilizerResult
+from src.utils.logger import logger
+
+
+@dataclass(frozen=True)
+class TelemetryResult:
+    """Everything the UI needs from one processed waveform."""
+
+    timestamp: float
+    waveform: Optional[np.ndarray]        # None once capture is cleared / bad frame
+    stabilizer: Optional[StabilizerResult]
+    persistence_frames: Tuple[np.ndarray, ...]
+
+    # Living Proof metrics
+    crest_factor: float
+    hf_energy: float
+    dc_shift: float
+
+    # Digital Twin match (10-frame rolling average)
+    rms_error: float
+
+    # Digital Twin overlay traces (None without telemetry data / length mismatch)
+    ideal: Optional[np.ndarray] = None
+    delta: Optional[np.ndarray] = None    # |waveform - ideal|
+
+
+class LatestWinsWorker:
+    """Daemon thread that processes only the newest submitted item."""
+
+    def __init__(self, process: Callable, name: str = "telemetry-worker"):
+        """
+        Args:
+            process: Called with each item on the worker thread
+            name: Thread name
+        """
+        self._process = process
+        self._name = name
+        self._lock = threading.Lock()
+        self._pending = None
+        self._has_pending = False
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._stop = False
+        self._thread = None
+
+        self.processed = 0
+        self.dropped = 0     # items replaced before the worker got to them
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            # A thread kept by a timed-out stop() carries on as the worker
+            self._stop = False
+            return
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Stop the thread; any parked item is discarded.
+
+        If the thread is still busy after timeout it is kept (and exits when
+        its current item is done), so start() cannot run a second worker
+        alongside it.
+        """
+        if self._thread is None:
+            return
+        self._stop = True
+        self._wake.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"[Telemetry] {self._name} still busy after {timeout}s stop")
+        else:
+            self._thread = None
+        with self._lock:
+            self._pending = None
+            self._has_pending = False
+            self._idle.set()
+
+    def submit(self, item):
+        """Park item for the worker, replacing any unprocessed one."""
+        with self._lock:
+            if self._has_pending:
+                self.dropped += 1
+            self._pending = item
+            self._has_pending = True
+            self._idle.clear()
+        self._wake.set()
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """Block until every submitted item has been processed or dropped."""
+        return self._idle.wait(timeout)
+
+    def _run(self):
+        while not self._stop:
+            self._wake.wait()
+            self._wake.clear()
+            while not self._stop:
+                with self._lock:
+                    if not self._has_pending:
+                        self._idle.set()
+                        break
+                    item, self._pending = self._pending, None
+                    self._has_pending = False
+                try:
+                    self._process(item)
+                except Exception as e:
+                    logger.warning(f"[Telemetry] Worker error: {e}")
+                self.processed += 1
@@ -25,6 +25,7 @@ OSC Protocol:
 
 from typing import Dict, List, Optional, Tuple
 import math
+import struct
 
 from src.config import OSC_PATHS, MOD_MATRIX_COLS
 from src.utils.boid_scales import get_boid_scales
@@ -170,6 +171,41 @@ def prepare_offsets_message(snapshot: Dict[int, float]) -> List:
     return args
 
 
+def _osc_pad(raw: bytes) -> bytes:
+    """Null-terminate and pad to a 4-byte boundary (OSC string encoding)."""
+    return raw + b'\0' * (4 - len(raw) % 4)
+
+
+class _PackedMessage:
+    """Prebuilt OSC datagram; quacks like OscMessage for client.send()."""
+    __slots__ = ('dgram',)
+
+    def __init__(self, dgram: bytes):
+        self.dgram = dgram
+
+
+class _OffsetsTemplate:
+    """
+    Prebuilt /noise/boid/offsets encoding.
+
+    Address and type tags (",ifif...") only depend on the pair count, so the
+    header bytes and struct packer are built once per count and reused.
+    """
+
+    def __init__(self, address: str):
+        self._address = _osc_pad(address.encode('ascii'))
+        self._by_count: Dict[int, Tuple[bytes, struct.Struct]] = {}
+
+    def build(self, flat: List, n_pairs: int) -> _PackedMessage:
+        entry = self._by_count.get(n_pairs)
+        if entry is None:
+            header = self._address + _osc_pad(b',' + b'if' * n_pairs)
+            entry = (header, struct.Struct('>' + 'if' * n_pairs))
+            self._by_count[n_pairs] = entry
+        header, packer = entry
+        return _PackedMessage(header + packer.pack(*flat))
+
+
 class BoidBusSender:
     """
     Handles sending boid offsets to SuperCollider via OSC.
@@ -179,9 +215,18 @@ class BoidBusSender:
     - Proper enable/disable sequencing
     - Non-finite filtering at wire boundary
     - Downselection if > 100 entries
-    - Sends target indices 0-148 (not absolute bus indices)
+    - Sends target indices 0-175 (not absolute bus indices)
+
+    Per-tick work is bounded by the 176 targets: contributions accumulate
+    into a fixed array, scales come from a precomputed table, and a snapshot
+    that matches the last one sent (within DELTA_TOLERANCE) is not resent.
     """
 
+    # Skip a tick's message when no offset moved more than this
+    DELTA_TOLERANCE = 1e-6
+    # Resend an unchanged snapshot at least this often (UDP is lossy; 1s at 20Hz)
+    RESEND_INTERVAL_TICKS = 20
+
     def __init__(self, osc_client):
         """
         Initialize sender with OSC client.
@@ -191,7 +236,22 @@ class BoidBusSender:
         """
         self.osc_client = osc_client
         self._enabled = False
-        self._last_snapshot: Dict[int, float] = {}
+        self._last_pairs: List[Tuple[int, float]] = []
+        self._sent_pairs: List[Tuple[int, float]] = []
+        self._ticks_since_send = 0
+
+        # Fixed-size accumulator indexed by target index
+        self._sums = [0.0] * GRID_TOTAL_COLUMNS
+        self._touched = [False] * GRID_TOTAL_COLUMNS
+        self._touched_list: List[int] = []
+
+        self._scales: List[float] = []
+        self._scales_version = -1
+        self._template = _OffsetsTemplate(OSC_PATHS['boid_offsets'])
+
+        # Counters (diagnostics)
+        self.sent_count = 0
+        self.skipped_count = 0
 
     def enable(self):
         """
@@ -204,6 +264,7 @@ class BoidBusSender:
             logger.info("Boid modulation ENABLED", component="BOID")
             self.osc_client.send_message(OSC_PATHS['boid_enable'], 1)
             self._enabled = True
+            self._sent_pairs = []
 
     def disable(self):
         """
@@ -217,7 +278,63 @@ class BoidBusSender:
             self.osc_client.send_message(OSC_PATHS['boid_enable'], 0)
             self.osc_client.send_message(OSC_PATHS['boid_clear'], 1)
             self._enabled = False
-            self._last_snapshot = {}
+            self._last_pairs = []
+            self._sent_pairs = []
+
+    def _scale_table(self) -> List[float]:
+        """Per-target scales, rebuilt only when boid scales are reloaded."""
+        scales = get_boid_scales()
+        if scales.version != self._scales_version:
+            self._scales = scales.scale_table(GRID_TOTAL_COLUMNS)
+            self._scales_version = scales.version
+        return self._scales
+
+    def _collect(self, contributions: List[Tuple[int, int, float]]) -> List[Tuple[int, float]]:
+        """Aggregate, scale and drop zeros. Returns [(target_index, offset)] ascending."""
+        sums = self._sums
+        touched = self._touched
+        touched_list = self._touched_list
+        isfinite = math.isfinite
+
+        for row, col, offset in contributions:
+            # Same validation as grid_to_bus / aggregate_contributions
+            if not isfinite(offset):
+                continue
+            if not (0 <= row <= 15) or not (0 <= col < GRID_TOTAL_COLUMNS):
+                continue
+            if not touched[col]:
+                touched[col] = True
+                touched_list.append(col)
+            sums[col] += offset
+
+        scales = self._scale_table()
+        pairs = []
+        touched_list.sort()
+        for idx in touched_list:
+            value = sums[idx]
+            sums[idx] = 0.0
+            touched[idx] = False
+            if value == 0.0 or not isfinite(value):
+                continue
+            value *= scales[idx]
+            if value != 0.0:
+                pairs.append((idx, value))
+        touched_list.clear()
+
+        if len(pairs) > MAX_OFFSET_PAIRS:
+            pairs = sorted(downselect_snapshot(dict(pairs)).items())
+        return pairs
+
+    def _unchanged(self, pairs: List[Tuple[int, float]]) -> bool:
+        """True if pairs matches the last sent snapshot within tolerance."""
+        sent = self._sent_pairs
+        if len(pairs) != len(sent):
+            return False
+        tol = self.DELTA_TOLERANCE
+        for (idx, value), (sent_idx, sent_value) in zip(pairs, sent):
+            if idx != sent_idx or abs(value - sent_value) > tol:
+                return False
+        return True
 
     def send_offsets(self, contributions: List[Tuple[int, int, float]]):
         """
@@ -232,52 +349,43 @@ class BoidBusSender:
         - Filters non-finite values
         - Downselects if > 100 entries
         - Sends single OSC message with explicit int32/float32 types
-        - Sends target indices 0-148 directly (NOT absolute bus indices)
+        - Sends target indices 0-175 directly (NOT absolute bus indices)
         - Empty payload is a no-op (no message sent)
         - OSC send exceptions propagate to caller
+
+        A snapshot equal to the last one sent is skipped, except every
+        RESEND_INTERVAL_TICKS ticks.
         """
         if not self._enabled:
             return
 
-        # Aggregate contributions (handles validation, drops invalid silently)
-        snapshot = aggregate_contributions(contributions)
-
-        # Drop zero offsets per spec
-        snapshot = {k: v for k, v in snapshot.items() if v != 0.0}
-
-        # Apply per-target scaling from config
-        snapshot = get_boid_scales().scale_snapshot(snapshot)
-
-        # Drop zeros again (scaling may have zeroed some)
-        snapshot = {k: v for k, v in snapshot.items() if v != 0.0}
-
-        # Apply downselection if needed
-        snapshot = downselect_snapshot(snapshot)
+        pairs = self._collect(contributions)
 
         # Store for debugging/inspection
-        self._last_snapshot = snapshot
+        self._last_pairs = pairs
 
-        if not snapshot:
+        if not pairs:
             # Empty payload - no-op per spec (don't send anything)
             return
 
-        # Build OSC message with explicit types per GROUND spec
-        # Uses OscMessageBuilder to ensure int32 for indices, float32 for offsets
-        from pythonosc.osc_message_builder import OscMessageBuilder
+        self._ticks_since_send += 1
+        if self._unchanged(pairs) and self._ticks_since_send < self.RESEND_INTERVAL_TICKS:
+            self.skipped_count += 1
+            return
 
-        builder = OscMessageBuilder(address=OSC_PATHS['boid_offsets'])
-        for target_index in sorted(snapshot.keys()):
-            # Send target index directly (0-148), SC handles bus mapping
-            builder.add_arg(int(target_index), arg_type='i')  # int32
-            builder.add_arg(float(snapshot[target_index]), arg_type='f')  # float32
+        # Flat [idx1, off1, idx2, off2, ...] packed as int32/float32 per GROUND spec
+        flat = [v for pair in pairs for v in pair]
+        self.osc_client.send(self._template.build(flat, len(pairs)))
 
-        msg = builder.build()
-        self.osc_client.send(msg)
+        self._sent_pairs = pairs
+        self._ticks_since_send = 0
+        self.sent_count += 1
 
     def clear(self):
         """Clear all boid offsets without disabling."""
         self.osc_client.send_message(OSC_PATHS['boid_clear'], 1)
-        self._last_snapshot = {}
+        self._last_pairs = []
+        self._sent_pairs = []
 
     @property
     def is_enabled(self) -> bool:
@@ -286,8 +394,8 @@ class BoidBusSender:
 
     @property
     def last_snapshot(self) -> Dict[int, float]:
-        """Return last sent snapshot (for debugging)."""
-        return self._last_snapshot.copy()
+        """Return last computed snapshot (for debugging)."""
+        return dict(self._last_pairs)
 
 
 def target_index_to_key(target_index: int) -> Optional[str]:
@@ -7,7 +7,7 @@ SC receives pre-scaled offsets and applies them directly.
 
 import json
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 # Default scales (used if config file not found)
 DEFAULT_SCALES = {
@@ -70,6 +70,7 @@ class BoidScales:
         self._config_path = config_path or "config/boid_target_scales.json"
         self._scales_by_index: Dict[int, float] = {}
         self._raw_config: dict = {}
+        self.version = 0  # Bumped on every (re)build so callers can cache tables
         self._build_index_map(DEFAULT_SCALES)
         self.reload()
 
@@ -147,6 +148,7 @@ class BoidScales:
         scales[175] = float(fx_heat.get("drive", 0.5))
 
         self._scales_by_index = scales
+        self.version += 1
 
     def get_scale(self, target_index: int) -> float:
         """
@@ -160,6 +162,18 @@ class BoidScales:
         """
         return self._scales_by_index.get(target_index, 1.0)
 
+    def scale_table(self, size: int) -> List[float]:
+        """
+        Dense scale lookup for target indices 0..size-1.
+
+        Args:
+            size: Number of target indices
+
+        Returns:
+            List where entry i is get_scale(i)
+        """
+        return [self.get_scale(i) for i in range(size)]
+
     def apply_scale(self, target_index: int, offset: float) -> float:
         """
         Apply scaling to a raw boid offset.
@@ -0,0 +1,136 @@
+"""
+Tests for BoidBusSender (src/utils/boid_bus.py)
+Wire output must match the reference aggregate -> scale -> downselect pipeline.
+"""
+
+import math
+import random
+from unittest.mock import MagicMock
+
+import pytest
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from src.config import OSC_PATHS
+from src.utils.boid_bus import (
+    BoidBusSender,
+    aggregate_contributions,
+    downselect_snapshot,
+)
+from src.utils.boid_scales import get_boid_scales
+
+
+def _reference_dgram(contributions):
+    """Pre-array pipeline: dict per stage, OscMessageBuilder arg-by-arg."""
+    snapshot = aggregate_contributions(contributions)
+    snapshot = {k: v for k, v in snapshot.items() if v != 0.0}
+    snapshot = get_boid_scales().scale_snapshot(snapshot)
+    snapshot = {k: v for k, v in snapshot.items() if v != 0.0}
+    snapshot = downselect_snapshot(snapshot)
+    if not snapshot:
+        return None
+    builder = OscMessageBuilder(address=OSC_PATHS['boid_offsets'])
+    for idx in sorted(snapshot):
+        builder.add_arg(int(idx), arg_type='i')
+        builder.add_arg(float(snapshot[idx]), arg_type='f')
+    return builder.build().dgram
+
+
+def _random_contributions(n, seed):
+    rng = random.Random(seed)
+    return [(rng.randrange(16), rng.randrange(176), rng.uniform(-1, 1)) for _ in range(n)]
+
+
+@pytest.fixture
+def sender():
+    s = BoidBusSender(MagicMock())
+    s.enable()
+    return s
+
+
+def _sent_dgrams(sender):
+    return [c.args[0].dgram for c in sender.osc_client.send.call_args_list]
+
+
+class TestWireFormat:
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_reference_pipeline(self, seed):
+        contributions = _random_contributions(60, seed)
+        s = BoidBusSender(MagicMock())
+        s.enable()
+        s.send_offsets(contributions)
+
+        assert _sent_dgrams(s) == [_reference_dgram(contributions)]
+
+    def test_downselection_matches_reference(self, sender):
+        # Every target touched -> more than MAX_OFFSET_PAIRS
+        contributions = [(0, col, (col % 7 - 3) * 0.1 + 0.01) for col in range(176)]
+        sender.send_offsets(contributions)
+
+        assert _sent_dgrams(sender) == [_reference_dgram(contributions)]
+        assert len(OscMessage(_sent_dgrams(sender)[0]).params) == 200
+
+    def test_invalid_and_non_finite_dropped(self, sender):
+        sender.send_offsets([
+            (0, 1, 0.5),
+            (16, 6, 0.5),       # row out of range
+            (0, 176, 0.5),      # col out of range
+            (0, 7, math.nan),
+            (0, 8, math.inf),
+            (0, 9, 0.25),
+            (0, 9, -0.25),      # sums to zero
+            (0, 10, 0.5),       # gen 3 freq: scale 0.0 in config
+        ])
+        assert list(sender.last_snapshot) == [1]
+
+    def test_empty_snapshot_is_noop(self, sender):
+        sender.send_offsets([])
+        sender.send_offsets([(0, 1, 0.0)])
+        sender.osc_client.send.assert_not_called()
+
+    def test_accumulator_resets_between_ticks(self, sender):
+        sender.send_offsets([(0, 3, 0.5)])
+        sender.send_offsets([(1, 4, 0.5)])
+        assert list(sender.last_snapshot) == [4]
+
+
+class TestDeltaSending:
+
+    def test_unchanged_snapshot_skipped(self, sender):
+        contributions = [(0, 3, 0.5), (2, 40, -0.2)]
+        for _ in range(5):
+            sender.send_offsets(contributions)
+
+        assert sender.osc_client.send.call_count == 1
+        assert sender.skipped_count == 4
+
+    def test_change_beyond_tolerance_sent(self, sender):
+        sender.send_offsets([(0, 3, 0.5)])
+        sender.send_offsets([(0, 3, 0.5 + sender.DELTA_TOLERANCE / 10)])
+        sender.send_offsets([(0, 3, 0.6)])
+        sender.send_offsets([(0, 4, 0.6)])
+        assert sender.osc_client.send.call_count == 3
+
+    def test_periodic_resend(self, sender):
+        for _ in range(sender.RESEND_INTERVAL_TICKS + 1):
+            sender.send_offsets([(0, 3, 0.5)])
+        assert sender.osc_client.send.call_count == 2
+
+    def test_clear_forces_next_send(self, sender):
+        sender.send_offsets([(0, 3, 0.5)])
+        sender.clear()
+        sender.send_offsets([(0, 3, 0.5)])
+        assert sender.osc_client.send.call_count == 2
+
+    def test_scale_reload_picks_up_new_table(self, sender, monkeypatch):
+        scales = get_boid_scales()
+        sender.send_offsets([(0, 1, 1.0)])
+        before = sender.last_snapshot[1]
+
+        monkeypatch.setitem(scales._scales_by_index, 1, 0.0)
+        monkeypatch.setattr(scales, 'version', scales.version + 1)
+        sender.send_offsets([(0, 1, 1.0)])
+
+        assert before != 0.0
+        assert sender.last_snapshot == {}
@@ -0,0 +1,205 @@
+"""
+Tests for the boid flocking engine.
+
+Covers:
+- Seeded determinism
+- NumPy kernel vs pure-Python kernel equivalence (bit-for-bit)
+- Spatial grid neighbor search vs brute-force O(n^2) reference
+- Boid count changes and cell contributions
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.boids.boid_engine import (
+    BoidEngine,
+    XorShift32,
+    EPS,
+    POS_MAX,
+    _flock_params,
+    _flock_step_numpy,
+    _flock_step_python,
+)
+
+
+def _run(engine: BoidEngine, seed: int, ticks: int):
+    engine.initialize(seed)
+    for _ in range(ticks):
+        engine.tick()
+    return engine.get_positions(), engine.get_velocities()
+
+
+def _random_flock(n: int, seed: int):
+    rng = XorShift32(seed)
+    px = [rng.next_float() for _ in range(n)]
+    py = [rng.next_float() for _ in range(n)]
+    vx = [rng.next_float_range(-0.01, 0.01) for _ in range(n)]
+    vy = [rng.next_float_range(-0.01, 0.01) for _ in range(n)]
+    jx = [rng.next_float_range(-0.001, 0.001) for _ in range(n)]
+    jy = [rng.next_float_range(-0.001, 0.001) for _ in range(n)]
+    return px, py, vx, vy, jx, jy
+
+
+def _brute_force_step(px, py, vx, vy, jx, jy, params):
+    """O(n^2) synchronous reference step (no spatial grid)."""
+    n = len(px)
+    radius = params['neighbor_radius']
+    out = ([], [], [], [])
+    for i in range(n):
+        sep_x = sep_y = align_x = align_y = coh_x = coh_y = 0.0
+        count = 0
+        for j in range(n):
+            if i == j:
+                continue
+            dx = px[j] - px[i]
+            dy = py[j] - py[i]
+            dist = math.sqrt(dx * dx + dy * dy)
+            if EPS < dist < radius:
+                count += 1
+                if dist < radius * 0.5:
+                    sep_x -= dx / dist
+                    sep_y -= dy / dist
+                align_x += vx[j]
+                align_y += vy[j]
+                coh_x += px[j]
+                coh_y += py[j]
+        ax, ay = jx[i], jy[i]
+        if count:
+            ax += (sep_x * params['sep_weight']
+                   + (align_x / count - vx[i]) * params['align_weight']
+                   + (coh_x / count - px[i]) * params['cohesion_weight'])
+            ay += (sep_y * params['sep_weight']
+                   + (align_y / count - vy[i]) * params['align_weight']
+                   + (coh_y / count - py[i]) * params['cohesion_weight'])
+        a_mag = math.hypot(ax, ay)
+        if a_mag > params['max_force']:
+            ax, ay = ax / a_mag * params['max_force'], ay / a_mag * params['max_force']
+        nvx, nvy = vx[i] + ax, vy[i] + ay
+        v_mag = math.hypot(nvx, nvy)
+        if v_mag > params['max_speed']:
+            nvx, nvy = nvx / v_mag * params['max_speed'], nvy / v_mag * params['max_speed']
+        x, y = px[i] + nvx, py[i] + nvy
+        if x < 0:
+            x, nvx = -x, abs(nvx)
+        elif x >= 1:
+            x, nvx = 2 - x, -abs(nvx)
+        if y < 0:
+            y, nvy = -y, abs(nvy)
+        elif y >= 1:
+            y, nvy = 2 - y, -abs(nvy)
+        out[0].append(max(0.0, min(POS_MAX, x)))
+        out[1].append(max(0.0, min(POS_MAX, y)))
+        out[2].append(nvx)
+        out[3].append(nvy)
+    return out
+
+
+class TestDeterminism:
+    """Same seed produces the same flock."""
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_same_seed_same_output(self, use_numpy):
+        a = _run(BoidEngine(use_numpy=use_numpy), 1234, 100)
+        b = _run(BoidEngine(use_numpy=use_numpy), 1234, 100)
+        assert a == b
+
+    def test_different_seed_different_output(self):
+        a = _run(BoidEngine(), 1, 10)
+        b = _run(BoidEngine(), 2, 10)
+        assert a != b
+
+    def test_default_kernel_is_numpy(self):
+        assert BoidEngine().uses_numpy
+
+
+class TestKernelEquivalence:
+    """NumPy and pure-Python kernels agree bit-for-bit."""
+
+    @pytest.mark.parametrize("dispersion,energy", [
+        (0.0, 0.0), (0.5, 0.5), (1.0, 1.0), (0.2, 0.9),
+    ])
+    def test_engine_equivalence(self, dispersion, energy):
+        engines = [BoidEngine(use_numpy=True), BoidEngine(use_numpy=False)]
+        for engine in engines:
+            engine.set_boid_count(24)
+            engine.set_dispersion(dispersion)
+            engine.set_energy(energy)
+        results = [_run(engine, 0xBEEF, 200) for engine in engines]
+        assert results[0] == results[1]
+
+    def test_engine_equivalence_cells(self):
+        engines = [BoidEngine(use_numpy=True), BoidEngine(use_numpy=False)]
+        for engine in engines:
+            _run(engine, 99, 50)
+        assert engines[0].get_cell_values() == engines[1].get_cell_values()
+
+    def test_kernel_equivalence_large_flock(self):
+        """Hundreds of boids through both kernels."""
+        px, py, vx, vy, jx, jy = _random_flock(400, 7)
+        params = _flock_params(0.3, 0.7)
+        state_py = (px, py, vx, vy)
+        state_np = tuple(np.array(a) for a in state_py)
+        jx_np, jy_np = np.array(jx), np.array(jy)
+        for _ in range(20):
+            state_py = _flock_step_python(*state_py, jx, jy, params)
+            state_np = _flock_step_numpy(*state_np, jx_np, jy_np, params)
+        for a, b in zip(state_py, state_np):
+            assert a == b.tolist()
+
+
+class TestGridNeighborSearch:
+    """Spatial grid finds the same neighbors as brute force."""
+
+    @pytest.mark.parametrize("dispersion", [0.0, 0.5, 1.0])
+    def test_matches_brute_force(self, dispersion):
+        px, py, vx, vy, jx, jy = _random_flock(200, 42)
+        params = _flock_params(dispersion, 0.5)
+        expected = _brute_force_step(px, py, vx, vy, jx, jy, params)
+        actual = _flock_step_numpy(
+            np.array(px), np.array(py), np.array(vx), np.array(vy),
+            np.array(jx), np.array(jy), params,
+        )
+        for e, a in zip(expected, actual):
+            np.testing.assert_allclose(a, e, rtol=0, atol=1e-12)
+
+    def test_single_boid(self):
+        params = _flock_params(0.5, 0.5)
+        out = _flock_step_numpy(
+            np.array([0.5]), np.array([0.5]), np.array([0.0]), np.array([0.0]),
+            np.array([0.0]), np.array([0.0]), params,
+        )
+        assert [a.tolist() for a in out] == [[0.5], [0.5], [0.0], [0.0]]
+
+
+class TestBoidCount:
+    """Boid count changes keep arrays consistent."""
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_grow_and_shrink(self, use_numpy):
+        engine = BoidEngine(use_numpy=use_numpy)
+        engine.initialize(5)
+        engine.set_boid_count(20)
+        assert len(engine.get_positions()) == 20
+        engine.tick()
+        engine.set_boid_count(3)
+        assert len(engine.get_positions()) == 3
+        assert len(engine.get_velocities()) == 3
+        engine.tick()
+
+    def test_positions_in_range(self):
+        engine = BoidEngine()
+        engine.set_energy(1.0)
+        positions, _ = _run(engine, 3, 300)
+        for x, y in positions:
+            assert 0.0 <= x <= POS_MAX
+            assert 0.0 <= y <= POS_MAX
+
+    def test_reset_clears_state(self):
+        engine = BoidEngine()
+        _run(engine, 3, 5)
+        engine.reset()
+        assert engine.get_positions() == []
+        assert engine.get_cell_values() == {}
+        assert not engine.initialized
@@ -413,3 +413,61 @@ class TestMorphologyMetrics:
         # Square crest = 1.0, normalized = 0.0
         crest = fp["features"]["morph"][1]
         assert crest < 0.1
+
+
+class TestExtractBatch:
+    """Test batched extraction matches per-frame extract()."""
+
+    @pytest.fixture
+    def sweep(self):
+        """Morphing waveforms with varying level, DC and fundamental."""
+        rng = np.random.default_rng(7)
+        t = np.arange(1024) / 1024
+        waveforms, volts, freqs = [], [], []
+        for i in range(24):
+            wave = sum(rng.uniform(0, 1) / h * np.sin(2 * np.pi * 2 * h * t + rng.uniform(0, 6))
+                       for h in range(1, 12))
+            waveforms.append(wave * rng.uniform(0.005, 1.2) + rng.uniform(-0.1, 0.1))
+            volts.append(i * 0.2)
+            freqs.append(None if i % 4 == 0 else rng.uniform(50, 400))
+        return waveforms, volts, freqs
+
+    def _pair(self):
+        single = FingerprintExtractor(device_model="TestOsc")
+        batched = FingerprintExtractor(device_model="TestOsc")
+        single.start_session()
+        batched.session_id = single.session_id
+        return single, batched
+
+    def test_matches_single_extract(self, sweep):
+        waveforms, volts, freqs = sweep
+        single, batched = self._pair()
+
+        expected = [single.extract(w, cv_volts=v, cv_chan="morph", freq_hz=f, notes=["x"])
+                    for w, v, f in zip(waveforms, volts, freqs)]
+        actual = batched.extract_batch(waveforms, volts, cv_chan="morph",
+                                       freq_hz=freqs, notes=["x"]).to_fingerprints()
+
+        for a, b in zip(expected, actual):
+            a["session"]["utc"] = b["session"]["utc"] = None
+            assert a == b
+
+    def test_capture_index_advances(self, sweep):
+        waveforms, volts, _ = sweep
+        extractor = FingerprintExtractor()
+        batch = extractor.extract_batch(waveforms[:5], volts[:5])
+        assert list(batch.capture_index) == [0, 1, 2, 3, 4]
+        assert extractor.capture_index == 5
+        assert len(set(batch.ids)) == 5
+
+    def test_columnar_shapes(self, sweep):
+        waveforms, volts, freqs = sweep
+        batch = FingerprintExtractor().extract_batch(np.array(waveforms), volts, freq_hz=freqs)
+        assert batch.features["harm_ratio"].shape == (24, 32)
+        assert batch.morph.shape == (24, 5)
+        assert batch.harm_ratio_raw.shape == (24, 8)
+
+    def test_length_mismatch_raises(self, sweep):
+        waveforms, volts, _ = sweep
+        with pytest.raises(ValueError):
+            FingerprintExtractor().extract_batch(waveforms, volts[:3])
@@ -228,6 +228,19 @@ class TestSweepOperations:
         assert (device_dir / "summaries" / f"{sweep_name}_evolution.json").exists()
         assert (device_dir / "manifest.json").exists()
 
+    def test_save_sweep_accepts_batch(self, store, temp_dir):
+        """Test save_sweep writes a FingerprintBatch directly."""
+        t = np.linspace(0, 2 * np.pi, 1024, endpoint=False)
+        extractor = FingerprintExtractor(device_model="TestDevice")
+        batch = extractor.extract_batch([np.sin(t) * (1 + i) / 4 for i in range(3)],
+                                        cv_volts=[0.0, 1.0, 2.0], cv_chan="morph")
+
+        sweep_name = store.save_sweep(batch, "test_device")
+
+        loaded = store.load_sweep("test_device", sweep_name)
+        assert [fp["id"] for fp in loaded] == batch.ids
+        assert loaded[1]["adjacent"]["prev_id"] == batch.ids[0]
+
     def test_save_sweep_links_adjacent(self, store, sweep_fingerprints, temp_dir):
         """Test save_sweep links adjacent fingerprints."""
         store.save_sweep(sweep_fingerprints, "test_device")
@@ -622,3 +635,155 @@ class TestTrajectoryAnalysis:
         assert result["min"] == 0.1
         assert result["max"] == 0.5
         assert abs(result["mean"] - 0.3) < 0.01
+
+
+class TestColumnStore:
+    """Test memory-mapped feature columns."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        path = tempfile.mkdtemp()
+        yield path
+        shutil.rmtree(path)
+
+    @pytest.fixture
+    def store(self, temp_dir):
+        return FingerprintStore(temp_dir)
+
+    @pytest.fixture
+    def make_sweep(self):
+        """Factory for sweeps with distinct harmonic profiles per point."""
+        def make(n, session="s20260203_120000"):
+            rng = np.random.default_rng(len(session) + n)
+            fps = []
+            for i in range(n):
+                fps.append({
+                    "schema_version": "fingerprint.v1",
+                    "id": f"test_device_a_{session}_c{i:03d}",
+                    "device": {"make": "Test", "model": "TestDevice",
+                               "variant": "v1", "unit_id": "A"},
+                    "session": {"id": session, "utc": "2026-02-03T12:00:00Z",
+                                "operator": "test"},
+                    "capture": {"index": i, "cv": {"chan": "morph", "volts": i * 0.5},
+                                "freq_hz": 440.0, "sr_hz": 48000, "n_samples": 1024,
+                                "window": "hann", "notes": []},
+                    "features": {
+                        "harm_ratio": rng.uniform(0, 1, 8).round(4).tolist(),
+                        "phase_rel": rng.uniform(0, 1, 8).round(4).tolist(),
+                        "morph": rng.uniform(0, 1, 5).round(4).tolist(),
+                    },
+                    "quality": {"rms": 0.35, "peak": 0.95, "snr_db": 45.0, "flags": []},
+                    "adjacent": {"prev_id": None, "next_id": None,
+                                 "delta_prev": {"l2_harm": 0.0, "l2_phase": 0.0,
+                                                "l2_morph": 0.0}},
+                    "hash": {"features_sha1": f"abc{i:03d}"},
+                })
+            return fps
+        return make
+
+    def test_columns_mirror_jsonl(self, store, make_sweep):
+        """Test columns hold the same features as the JSONL rows."""
+        store.save_sweep(make_sweep(6), "test_device")
+        columns = store.columns("test_device")
+
+        loaded = store.load_fingerprints("test_device")
+        assert len(columns) == 6
+        assert columns.ids == [fp["id"] for fp in loaded]
+        np.testing.assert_array_equal(columns.column("cv_volts"),
+                                      [fp["capture"]["cv"]["volts"] for fp in loaded])
+        harm = columns.column("harm_ratio")
+        assert harm.shape == (6, 32)
+        np.testing.assert_array_equal(harm[:, :8], [fp["features"]["harm_ratio"] for fp in loaded])
+        assert not harm[:, 8:].any()
+
+    def test_reopen_without_jsonl(self, store, make_sweep, temp_dir):
+        """Test columns open from the sidecar alone."""
+        store.save_sweep(make_sweep(4), "test_device")
+        (Path(temp_dir) / "devices" / "test_device" / "raw" / "fingerprints.jsonl").unlink()
+
+        columns = FingerprintStore(temp_dir).columns("test_device")
+        assert len(columns) == 4
+        assert columns.last_id == "test_device_a_s20260203_120000_c003"
+
+    def test_save_fingerprint_links_across_sweeps(self, store, make_sweep):
+        """Test save_fingerprint links to the last stored row."""
+        sweep = make_sweep(3)
+        store.save_sweep(sweep, "test_device")
+        fp = make_sweep(1, session="s20260203_130000")[0]
+        store.save_fingerprint(fp, "test_device")
+
+        assert fp["adjacent"]["prev_id"] == sweep[-1]["id"]
+        assert fp["adjacent"]["delta_prev"] == store._compute_delta(
+            sweep[-1]["features"], fp["features"])
+        assert len(store.columns("test_device")) == 4
+
+    def test_sweep_deltas_match_delta_prev(self, store, make_sweep):
+        """Test vectorized sweep deltas agree with the stored delta_prev."""
+        store.save_sweep(make_sweep(3, session="s20260203_110000"), "test_device")
+        sweep = make_sweep(8)
+        name = store.save_sweep(sweep, "test_device")
+
+        deltas = store.sweep_deltas("test_device", name)
+        expected = [[fp["adjacent"]["delta_prev"][k] for k in ("l2_harm", "l2_phase", "l2_morph")]
+                    for fp in sweep[1:]]
+        np.testing.assert_allclose(deltas, expected, atol=5e-5)
+
+    def test_nearest(self, store, make_sweep):
+        """Test nearest-neighbour lookup against all stored rows."""
+        sweep = make_sweep(20)
+        store.save_sweep(sweep, "test_device")
+
+        result = store.nearest(sweep[7], "test_device", k=3)
+        assert len(result) == 3
+        assert result[0] == (sweep[7]["id"], 0.0)
+        assert result[1][1] <= result[2][1]
+
+        brute = sorted(
+            (float(np.linalg.norm(np.subtract(fp["features"]["morph"], sweep[2]["features"]["morph"]))), fp["id"])
+            for fp in sweep
+        )
+        by_morph = store.nearest(sweep[2]["features"]["morph"], "test_device", k=5, column="morph")
+        assert [fp_id for fp_id, _ in by_morph] == [fp_id for _, fp_id in brute[:5]]
+
+    def test_nearest_empty_device(self, store):
+        """Test nearest on an unknown device returns nothing."""
+        assert store.nearest([1.0, 0.5], "missing") == []
+
+    def test_import_legacy_jsonl(self, store, make_sweep, temp_dir):
+        """Test a JSONL-only device is imported on first access."""
+        sweep = make_sweep(5)
+        raw = store.get_device_path("legacy") / "raw"
+        with open(raw / "fingerprints.jsonl", "w") as f:
+            for fp in sweep:
+                f.write(json.dumps(fp) + "\n")
+
+        columns = store.columns("legacy")
+        assert columns.ids == [fp["id"] for fp in sweep]
+        assert (Path(temp_dir) / "devices" / "legacy" / "columns" / "index.json").exists()
+
+    def test_interrupted_append_ignored(self, store, make_sweep, temp_dir):
+        """Test bytes past the committed count are dropped on next append."""
+        store.save_sweep(make_sweep(3), "test_device")
+        columns_path = Path(temp_dir) / "devices" / "test_device" / "columns"
+        with open(columns_path / "harm_ratio.f64", "ab") as f:
+            f.write(b"\xff" * 100)
+        with open(columns_path / "ids.txt", "a") as f:
+            f.write("partial_id")
+
+        store.save_sweep(make_sweep(2, session="s20260203_130000"), "test_device")
+        columns = store.columns("test_device")
+        assert len(columns) == 5
+        assert len(columns.ids) == 5
+        assert (columns_path / "harm_ratio.f64").stat().st_size == 5 * 32 * 8
+        assert np.isfinite(columns.column("harm_ratio")).all()
+
+    def test_index_updated_incrementally(self, store, make_sweep, temp_dir):
+        """Test index entries update per device and carry row counts."""
+        store.save_sweep(make_sweep(3), "device_a")
+        store.save_sweep(make_sweep(4), "device_b")
+        store.save_sweep(make_sweep(2, session="s20260203_130000"), "device_a")
+
+        with open(Path(temp_dir) / "index.json") as f:
+            index = json.load(f)
+        counts = {d["key"]: (d["fingerprints"], d["sweeps"]) for d in index["devices"]}
+        assert counts == {"device_a": (5, 2), "device_b": (4, 1)}
@@ -0,0 +1,251 @@
+"""
+Tests for IdealOverlay DSP primitives and the Digital Twin model
+(src/audio/telemetry_controller.py)
+Vectorized filters must reproduce the per-sample SC difference equations;
+TwinModel batches must match the controller's single ideal render.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.audio.telemetry_controller import IdealOverlay, TelemetryController, TwinModel
+
+
+# Per-sample reference implementations (the original loops)
+
+def _leak_dc_loop(sig, coeff):
+    out = np.zeros_like(sig)
+    xm1 = 0.0
+    ym1 = 0.0
+    for i in range(len(sig)):
+        out[i] = sig[i] - xm1 + coeff * ym1
+        xm1 = sig[i]
+        ym1 = out[i]
+    return out
+
+
+def _one_pole_loop(sig, coef):
+    out = np.zeros_like(sig)
+    b0 = 1.0 - abs(coef)
+    out[0] = b0 * sig[0]
+    for i in range(1, len(sig)):
+        out[i] = b0 * sig[i] + coef * out[i - 1]
+    return out
+
+
+def _slew_loop(sig, rate):
+    out = np.empty_like(sig)
+    out[0] = sig[0]
+    for n in range(1, len(sig)):
+        out[n] = out[n - 1] + np.clip(sig[n] - out[n - 1], -rate, rate)
+    return out
+
+
+PARAMS = [
+    (0.0, 0.0, 0.0, 0.0, 0.0),
+    (0.3, 0.4, 0.5, 0.6, 0.7),
+    (1.0, 1.0, 1.0, 1.0, 1.0),
+    (0.9, 0.1, 0.25, 0.05, 0.5),
+]
+
+
+@pytest.fixture
+def overlay():
+    return IdealOverlay(1024)
+
+
+def _signals(n=1024, rows=4, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return np.stack([np.tanh(np.sin(t) * (k + 1) + rng.uniform(-0.3, 0.3)) for k in range(rows)])
+
+
+class TestFilters:
+
+    @pytest.mark.parametrize("coeff", [0.995, 0.9999, 0.5])
+    def test_leak_dc_matches_loop(self, coeff):
+        sig = _signals()[1]
+        np.testing.assert_allclose(IdealOverlay._leak_dc(sig, coeff),
+                                   _leak_dc_loop(sig, coeff), rtol=0, atol=1e-12)
+
+    @pytest.mark.parametrize("coef", [0.9, 0.45, 0.0, -0.3])
+    def test_one_pole_matches_loop(self, coef):
+        sig = _signals()[2]
+        np.testing.assert_array_equal(IdealOverlay._one_pole(sig, coef),
+                                      _one_pole_loop(sig, coef))
+
+    def test_batch_filters_rows_independently(self):
+        batch = _signals(rows=5)
+        leak = IdealOverlay._leak_dc(batch, 0.9999)
+        pole = IdealOverlay._one_pole(batch, 0.7)
+
+        assert leak.shape == pole.shape == batch.shape
+        for row, sig in enumerate(batch):
+            np.testing.assert_allclose(leak[row], _leak_dc_loop(sig, 0.9999), rtol=0, atol=1e-12)
+            np.testing.assert_array_equal(pole[row], _one_pole_loop(sig, 0.7))
+
+    @pytest.mark.parametrize("rate", [0.05, 0.3, 1.0, 2.0, 2.5])
+    def test_slew_matches_loop(self, rate):
+        t = np.linspace(0, 2 * np.pi, 1024, endpoint=False)
+        square = np.where(np.sin(t) > 0.2, 1.0, -1.0)
+        np.testing.assert_allclose(IdealOverlay._slew(square, rate),
+                                   _slew_loop(square, rate), rtol=0, atol=1e-12)
+
+
+class TestIdealRenders:
+    """Full renders against the per-sample primitives."""
+
+    @pytest.fixture
+    def loop_overlay(self, monkeypatch):
+        loop = IdealOverlay(1024)
+        monkeypatch.setattr(loop, '_leak_dc', _leak_dc_loop)
+        monkeypatch.setattr(loop, '_one_pole', _one_pole_loop)
+        monkeypatch.setattr(loop, '_slew', _slew_loop)
+        return loop
+
+    @pytest.mark.parametrize("params", PARAMS)
+    def test_b258_osc(self, overlay, loop_overlay, params):
+        np.testing.assert_allclose(overlay.ideal_b258_osc(*params),
+                                   loop_overlay.ideal_b258_osc(*params), rtol=0, atol=1e-6)
+
+    @pytest.mark.parametrize("params", PARAMS)
+    def test_b258_dual_morph(self, overlay, loop_overlay, params):
+        np.testing.assert_allclose(overlay.ideal_b258_dual_morph(*params),
+                                   loop_overlay.ideal_b258_dual_morph(*params), rtol=0, atol=1e-6)
+
+    @pytest.mark.parametrize("params", PARAMS)
+    def test_b258_stages(self, overlay, loop_overlay, params):
+        fast = overlay.ideal_b258_stages(*params)
+        ref = loop_overlay.ideal_b258_stages(*params)
+        for key in ('stage1', 'stage2', 'stage3'):
+            assert fast[key].dtype == np.float32
+            np.testing.assert_allclose(fast[key], ref[key], rtol=0, atol=1e-6)
+
+
+def _hw_controller(p2, waveform=None):
+    ctrl = TelemetryController(MagicMock())
+    ctrl.current_synthdef_name = TelemetryController.HW_SYNTHDEF
+    frame = {'p2': p2, 'p3': 0.5, 'p4': 0.3, 'peak': 0.5, 'peak3': 0.45}
+    ctrl.history.append(frame)
+    if waveform is not None:
+        ctrl.current_waveform = waveform.astype(np.float32)
+    return ctrl
+
+
+TWIN_ROWS = [
+    [0.0, 0.5, 0.0, 1.0, 0.0],
+    [0.13, 0.2, 0.7, 0.6, 0.05],
+    [-0.31, 0.9, 1.0, 0.3, -0.1],
+]
+
+
+class TestTwinModel:
+
+    @pytest.mark.parametrize("p2", [0.1, 0.5, 0.9])
+    @pytest.mark.parametrize("inverted", [False, True])
+    def test_batch_matches_controller_render(self, p2, inverted):
+        ctrl = _hw_controller(p2)
+        ctrl.phase_inverted = inverted
+        data = dict(ctrl.get_latest(), waveform=np.sin(np.linspace(0, 6, 1024)) * 0.4)
+
+        batch = ctrl._twin_model(data).render(TWIN_ROWS)
+
+        for row, (phase, sym, sat, body, vofs) in zip(batch, TWIN_ROWS):
+            ctrl.phase_offset, ctrl.body_gain, ctrl.v_offset = phase, body, vofs
+            single = ctrl.get_ideal_waveform(dict(data, p3=sym, p4=sat))
+            np.testing.assert_array_equal(row.astype(np.float32), single)
+
+    def test_internal_mode_matches_controller_render(self):
+        ctrl = TelemetryController(MagicMock())
+        ctrl.current_synthdef_name = 'forge_core_b258_osc'
+        ctrl.phase_offset = 0.2
+        data = {'p0': 0.2, 'p1': 0.6, 'p2': 0.4, 'p3': 0.3, 'p4': 0.8}
+
+        row = ctrl._twin_model(data).render([[0.2, 0.3, 0.8, 1.0, 0.0]])[0]
+        np.testing.assert_array_equal(row.astype(np.float32), ctrl.get_ideal_waveform(data))
+
+    def test_shapes_memoized(self):
+        model = _hw_controller(0.5)._twin_model({'p2': 0.5})
+        model.render([[0.0, 0.25, 0.5, 1.0, 0.0]] * 4 + [[0.3, 0.25, 0.5, 0.5, 0.1]])
+        assert model.renders == 1
+
+    @pytest.mark.parametrize("p2,truth", [
+        (0.5, [0.12, 0.35, 0.6, 0.7, 0.04]),
+        (0.9, [-0.2, 0.55, 0.4, 1.0, 0.0]),
+    ])
+    def test_batched_optimizer_recovers_parameters(self, p2, truth):
+        ctrl = _hw_controller(p2)
+        target = ctrl._twin_model(ctrl.get_latest()).render([truth])[0]
+        ctrl.current_waveform = target.astype(np.float32)
+
+        result = ctrl.optimize_twin()
+
+        assert result['error'] < 0.01
+        assert result['phase'] == pytest.approx(truth[0], abs=2e-3)
+        assert ctrl.phase_offset == result['phase']
+
+    def test_nelder_mead_mode(self):
+        t = np.linspace(0, 2 * np.pi, 1024, endpoint=False)
+        ctrl = _hw_controller(0.1, np.sin(t + 0.3) * 0.45)
+        model, target, x0 = ctrl._prepare_twin()
+        start_error = TwinModel.cost(model, target, x0)[0]
+
+        result = ctrl.optimize_twin(method="nelder-mead")
+
+        assert result['shape'] == 'SINE'
+        assert result['error'] < start_error
+
+    def test_target_length_mismatch_returns_penalty(self):
+        ctrl = _hw_controller(0.5)
+        model = ctrl._twin_model({'p2': 0.5})
+        x0 = [0.7, 0.4, 0.2, 1.0, 0.0]
+
+        result = model.optimize(np.zeros(1027), x0)
+
+        assert result['error'] == 10.0
+        assert result['phase'] == 0.5           # clipped start point
+        assert result['sym'] == pytest.approx(0.4)
+        assert model.renders == 0
+
+    def test_progress_and_cancel(self):
+        t = np.linspace(0, 2 * np.pi, 1024, endpoint=False)
+        ctrl = _hw_controller(0.5, np.where(np.sin(t) > 0.2, 0.4, -0.4))
+        model, target, x0 = ctrl._prepare_twin()
+        cancel = threading.Event()
+        calls = []
+
+        def progress(iteration, error):
+            calls.append((iteration, error))
+            cancel.set()
+
+        result = model.optimize(target, x0, cancel=cancel, progress=progress)
+
+        assert calls == [(1, calls[0][1])]
+        assert result['cancelled']
+        assert result['error'] == model.best_cost
+
+
+class TestOptimizeTwinAsync:
+
+    def test_emits_finished_without_applying(self):
+        t = np.linspace(0, 2 * np.pi, 1024, endpoint=False)
+        ctrl = _hw_controller(0.9, ((t / np.pi) % 2 - 1) * 0.5)
+        finished = MagicMock()
+        ctrl.twin_finished = MagicMock(emit=finished)
+        ctrl.twin_progress = MagicMock()
+
+        assert ctrl.optimize_twin_async()
+        ctrl._twin_thread.join(5)
+
+        (result,), _ = finished.call_args
+        assert result['shape'] == 'SAW' and not result['cancelled']
+        assert ctrl.twin_progress.emit.called
+        assert ctrl.phase_offset == 0.0  # applied by the receiver
+
+    def test_no_data(self):
+        ctrl = _hw_controller(0.5)
+        assert not ctrl.optimize_twin_async()
+        assert ctrl.optimize_twin() is None
@@ -0,0 +1,116 @@
+"""
+Tests for ModRoutingState secondary indexes (src/gui/mod_routing_state.py)
+Indexed lookups must match a scan of all connections after any mutation.
+"""
+
+import random
+
+import pytest
+
+from src.gui.mod_routing_state import (
+    EXTENDED_PARAMS, ModConnection, ModRoutingState, Polarity,
+)
+
+GEN_PARAMS = ['frequency', 'cutoff', 'resonance', 'p1']
+EXT_TARGETS = [wire_key for wire_key, _ in EXTENDED_PARAMS]
+
+
+def _scan_bus(state, bus):
+    return [c for c in state.get_all_connections() if c.source_bus == bus]
+
+
+def _scan_target(state, slot, param=None):
+    return [c for c in state.get_all_connections()
+            if not c.is_extended and c.target_slot == slot
+            and (not param or c.target_param == param)]
+
+
+def _scan_range(conns):
+    lo = hi = 0.0
+    for c in conns:
+        r = c.effective_range
+        mn, mx = {Polarity.BIPOLAR: (-r, r), Polarity.UNI_POS: (0.0, r),
+                  Polarity.UNI_NEG: (-r, 0.0)}[c.polarity]
+        lo += mn + c.offset
+        hi += mx + c.offset
+    return lo, hi
+
+
+def _assert_consistent(state):
+    for bus in range(16):
+        assert state.get_connections_for_bus(bus) == _scan_bus(state, bus)
+    for slot in range(1, 9):
+        assert state.get_connections_for_target(slot) == _scan_target(state, slot)
+        for param in GEN_PARAMS:
+            conns = _scan_target(state, slot, param)
+            assert state.get_connections_for_target(slot, param) == conns
+            assert state.get_mod_range(slot, param) == pytest.approx(_scan_range(conns))
+    for target in EXT_TARGETS:
+        conns = [c for c in state.get_extended_connections() if c.target_str == target]
+        assert state.get_connections_for_target_str(target) == conns
+        assert state.get_mod_range(target_str=target) == pytest.approx(_scan_range(conns))
+
+
+def _random_conn(rng):
+    bus = rng.randrange(16)
+    if rng.random() < 0.5:
+        conn = ModConnection(bus, target_slot=rng.randint(1, 8),
+                             target_param=rng.choice(GEN_PARAMS))
+    else:
+        conn = ModConnection(bus, target_str=rng.choice(EXT_TARGETS))
+    conn.amount = rng.random()
+    conn.offset = rng.uniform(-1, 1)
+    conn.polarity = rng.choice(list(Polarity))
+    return conn
+
+
+def test_random_mutations_keep_indexes_consistent():
+    rng = random.Random(7)
+    state = ModRoutingState()
+
+    for step in range(400):
+        op = rng.random()
+        conns = state.get_all_connections()
+        if op < 0.5 or not conns:
+            state.add_connection(_random_conn(rng))
+        elif op < 0.7:
+            c = rng.choice(conns)
+            state.remove_connection(c.source_bus, c.target_slot, c.target_param, c.target_str)
+        else:
+            c = rng.choice(conns)
+            state.update_connection(c.source_bus, c.target_slot, c.target_param, c.target_str,
+                                    amount=rng.random(), polarity=rng.choice(list(Polarity)))
+        if step % 40 == 0:
+            _assert_consistent(state)
+
+    _assert_consistent(state)
+    data = state.to_dict()
+
+    state.clear()
+    assert state.get_connections_for_bus(0) == []
+    assert not state._by_target and not state._by_target_str
+    _assert_consistent(state)
+
+    state.from_dict(data)
+    assert len(state) == len(data['connections']) + len(data['ext_mod_routes'])
+    _assert_consistent(state)
+
+    state.load_from_preset({'connections': data['connections'][:3]})
+    assert len(state) == 3
+    _assert_consistent(state)
+
+
+def test_mod_range_cache_invalidated_on_update():
+    state = ModRoutingState()
+    state.add_connection(ModConnection(0, target_slot=1, target_param='cutoff', amount=0.5))
+    assert state.get_mod_range(1, 'cutoff') == (-0.5, 0.5)
+
+    state.set_offset(0, 1, 'cutoff', offset=0.25)
+    assert state.get_mod_range(1, 'cutoff') == (-0.25, 0.75)
+
+    state.add_connection(ModConnection(3, target_slot=1, target_param='cutoff', amount=0.5,
+                                       polarity=Polarity.UNI_POS))
+    assert state.get_mod_range(1, 'cutoff') == (-0.25, 1.25)
+
+    state.remove_connection(0, 1, 'cutoff')
+    assert state.get_mod_range(1, 'cutoff') == (0.0, 0.5)
@@ -0,0 +1,69 @@
+"""
+Tests for the shared mod scope history (src/gui/mod_scope.py)
+ScopeRing views must read back exactly what a per-output deque would hold.
+"""
+
+from collections import deque
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.gui.mod_scope import ModScopeController, ScopeRing
+
+
+class TestScopeRing:
+
+    @pytest.mark.parametrize("batches", [[1] * 7, [3, 5, 2], [12], [4, 4, 4, 4]])
+    def test_view_matches_deque(self, batches):
+        ring = ScopeRing(2, 8)
+        ref = [deque([0.0] * 8, maxlen=8) for _ in range(2)]
+        rng = np.random.default_rng(0)
+
+        for k in batches:
+            frames = rng.uniform(-1, 1, (k, 2)).astype(np.float32)
+            ring.push(frames)
+            for frame in frames:
+                for row, value in enumerate(frame):
+                    ref[row].append(value)
+
+            np.testing.assert_array_equal(ring.view(), np.array(ref, dtype=np.float32))
+            np.testing.assert_array_equal(ring.latest(), [r[-1] for r in ref])
+
+    def test_view_is_zero_copy(self):
+        ring = ScopeRing(4, 16)
+        ring.push(np.ones((3, 4)))
+        assert np.shares_memory(ring.view(1, 3), ring._data)
+
+    def test_clear_rows(self):
+        ring = ScopeRing(4, 8)
+        ring.push(np.ones((8, 4)))
+        ring.clear(0, 2)
+        assert not ring.view(0, 2).any()
+        assert ring.view(2, 4).all()
+
+
+class TestModScopeController:
+
+    def test_register_attaches_slot_rows(self):
+        ctrl = ModScopeController(history_length=100)
+        scope = MagicMock()
+        ctrl.register_scope(3, scope)
+        scope.attach_ring.assert_called_once_with(ctrl.ring, 8)
+
+    def test_push_frames_holds_idle_slots(self):
+        ctrl = ModScopeController(history_length=4)
+        first = np.arange(16, dtype=np.float32)[np.newaxis]
+        assert ctrl.push_frames(0b1111, first) == {1, 2, 3, 4}
+
+        # Only slots 1 and 3 streaming; SC sends zeros for the others
+        second = np.zeros((2, 16), dtype=np.float32)
+        second[:, 0:4] = 0.5
+        second[:, 8:12] = -0.5
+        assert ctrl.push_frames(0b0101, second) == {1, 3}
+
+        latest = ctrl.ring.view()[:, -1]
+        np.testing.assert_array_equal(latest[0:4], 0.5)
+        np.testing.assert_array_equal(latest[4:8], first[0, 4:8])
+        np.testing.assert_array_equal(latest[8:12], -0.5)
+        np.testing.assert_array_equal(latest[12:16], first[0, 12:16])
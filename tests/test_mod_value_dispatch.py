@@ -0,0 +1,115 @@
+"""
+Tests for modulated-value dispatch (ModulationController value targets)
+Wire keys compile once to a slider setter; values coalesce until the flush.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import get_param_config, unmap_value
+from src.gui.controllers.modulation_controller import ModulationController
+
+
+def _slot(sliders=None, custom=0):
+    slot = MagicMock()
+    slot.sliders = sliders or {}
+    slot.custom_sliders = [MagicMock() for _ in range(custom)]
+    return slot
+
+
+@pytest.fixture
+def main():
+    main = MagicMock()
+    gen_slot = _slot({'frequency': MagicMock(), 'cutoff': MagicMock()}, custom=5)
+    main.generator_grid.get_slot.side_effect = lambda i: gen_slot if i == 1 else None
+    mod_slot = MagicMock(generator_name="LFO", param_sliders={'rate': MagicMock()})
+    main.modulator_grid.get_slot.side_effect = lambda i: mod_slot if i == 1 else None
+    channel = MagicMock()
+    main.mixer_panel.channels = {2: channel}
+    main.gen_slot, main.mod_slot, main.channel = gen_slot, mod_slot, channel
+    return main
+
+
+@pytest.fixture
+def ctrl(main):
+    return ModulationController(main)
+
+
+class TestCompile:
+
+    def test_standard_param_reconstructs_raw(self, ctrl, main):
+        ctrl.on_bus_values_received([("gen_1_freq", 0.25)])
+        ctrl._flush_mod_values()
+
+        cfg = get_param_config('frequency')
+        expected = unmap_value(cfg['min'] + 0.25 * (cfg['max'] - cfg['min']), cfg)
+        main.gen_slot.sliders['frequency'].set_modulated_value.assert_called_once_with(
+            pytest.approx(expected))
+
+    def test_custom_param_uses_norm(self, ctrl, main):
+        ctrl.on_bus_values_received([("gen_1_custom2", 0.7)])
+        ctrl._flush_mod_values()
+
+        main.gen_slot.custom_sliders[2].set_modulated_value.assert_called_once_with(0.7)
+
+    def test_extended_targets(self, ctrl, main):
+        ctrl.on_extmod_values_received([
+            ("mod:1:p1", 0.1), ("send:2:ec", 0.2), ("send:2:vb", 0.3), ("chan:2:pan", 0.4),
+        ])
+        ctrl._flush_mod_values()
+
+        main.mod_slot.param_sliders['rate'].set_modulated_value.assert_called_once_with(0.1)
+        main.channel.echo_send.set_modulated_value.assert_called_once_with(0.2)
+        main.channel.verb_send.set_modulated_value.assert_called_once_with(0.3)
+        main.channel.pan_slider.set_modulated_value.assert_called_once_with(0.4)
+
+    @pytest.mark.parametrize("key", [
+        "gen_9_freq", "gen_1_bogus", "gen_x_freq", "gen_1", "mod:1:p2", "mod:7:p1",
+        "send:5:ec", "chan:2:vol", "bad",
+    ])
+    def test_unresolvable_keys_cached_as_none(self, ctrl, key):
+        ctrl.on_extmod_values_received([(key, 0.5)])
+        ctrl._flush_mod_values()
+
+        assert ctrl._value_targets[key] is None
+
+    def test_compiles_once(self, ctrl, main):
+        for v in (0.1, 0.2, 0.3):
+            ctrl.on_bus_values_received([("gen_1_cutoff", v)])
+            ctrl._flush_mod_values()
+
+        assert main.generator_grid.get_slot.call_count == 1
+        assert main.gen_slot.sliders['cutoff'].set_modulated_value.call_count == 3
+
+
+class TestFlush:
+
+    def test_coalesces_to_latest(self, ctrl, main):
+        for v in (0.1, 0.2, 0.3):
+            ctrl.on_bus_values_received([("gen_1_custom0", v)])
+        ctrl._flush_mod_values()
+        ctrl._flush_mod_values()
+
+        main.gen_slot.custom_sliders[0].set_modulated_value.assert_called_once_with(0.3)
+
+    def test_skips_unchanged_value(self, ctrl, main):
+        setter = main.gen_slot.custom_sliders[0].set_modulated_value
+        for v in (0.5, 0.5, 0.6):
+            ctrl.on_bus_values_received([("gen_1_custom0", v)])
+            ctrl._flush_mod_values()
+
+        assert [c.args for c in setter.call_args_list] == [(0.5,), (0.6,)]
+
+    def test_invalidate_recompiles_and_reapplies(self, ctrl, main):
+        ctrl.on_extmod_values_received([("mod:1:p1", 0.5)])
+        ctrl._flush_mod_values()
+
+        # Generator change rebuilds the modulator's sliders
+        new_rate = MagicMock()
+        main.mod_slot.param_sliders = {'rate': new_rate}
+        ctrl._invalidate_value_targets(1, "LFO")
+        ctrl.on_extmod_values_received([("mod:1:p1", 0.5)])
+        ctrl._flush_mod_values()
+
+        new_rate.set_modulated_value.assert_called_once_with(0.5)
@@ -0,0 +1,167 @@
+"""
+Tests for the outbound OSC coalescer (src/audio/osc_coalescer.py)
+Last-value-wins per (address, target), flushed as bundles.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.audio.osc_coalescer import CoalescingSender
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def sender(sent):
+    return CoalescingSender(sent.append)
+
+
+class TestCoalescing:
+
+    def test_last_value_wins_per_target(self, sender, sent):
+        for i in range(100):
+            sender.submit('/noise/gen/cutoff', [1, i / 100])
+        sender.submit('/noise/gen/cutoff', [2, 0.5])
+
+        assert sender.flush() == 2
+        assert sent == [[('/noise/gen/cutoff', [1, 0.99]), ('/noise/gen/cutoff', [2, 0.5])]]
+
+    def test_default_target_excludes_last_arg(self, sender, sent):
+        sender.submit('/noise/mod/param', [1, 'rate', 0.1])
+        sender.submit('/noise/mod/param', [1, 'shape', 0.2])
+        sender.submit('/noise/mod/param', [1, 'rate', 0.3])
+        sender.flush()
+
+        assert sent[0] == [('/noise/mod/param', [1, 'rate', 0.3]),
+                           ('/noise/mod/param', [1, 'shape', 0.2])]
+
+    def test_explicit_target(self, sender, sent):
+        sender.submit('/noise/bus/route/set', ['mod_1_a', 'gen_1_cutoff', 0.1, 1.0], target=('mod_1_a', 'gen_1_cutoff'))
+        sender.submit('/noise/bus/route/set', ['mod_1_a', 'gen_1_cutoff', 0.2, 0.5], target=('mod_1_a', 'gen_1_cutoff'))
+        sender.flush()
+
+        assert sent[0] == [('/noise/bus/route/set', ['mod_1_a', 'gen_1_cutoff', 0.2, 0.5])]
+
+    def test_flush_empty_sends_nothing(self, sender, sent):
+        assert sender.flush() == 0
+        assert sent == []
+
+    def test_large_flush_split_into_bundles(self, sent):
+        sender = CoalescingSender(sent.append, max_bundle_messages=4)
+        for slot in range(10):
+            sender.submit('/noise/gen/volume', [slot, 0.5])
+        sender.flush()
+
+        assert [len(b) for b in sent] == [4, 4, 2]
+
+    def test_clear_drops_pending(self, sender, sent):
+        sender.submit('/noise/gen/pan', [1, 0.0])
+        sender.clear()
+        assert sender.flush() == 0
+        assert sent == []
+
+
+class TestCounters:
+
+    def test_submitted_vs_sent(self, sender):
+        for i in range(50):
+            sender.submit('/noise/gen/cutoff', [1, i])
+        assert sender.stats()['pending'] == 1
+        sender.flush()
+
+        stats = sender.stats()
+        assert stats['submitted'] == 50
+        assert stats['coalesced'] == 49
+        assert stats['sent'] == 1
+        assert stats['bundles'] == 1
+        assert stats['pending'] == 0
+
+    def test_reset_stats(self, sender):
+        sender.submit('/noise/gen/cutoff', [1, 0.5])
+        sender.flush()
+        sender.reset_stats()
+        assert sender.stats()['submitted'] == 0
+
+
+class TestOSCBridgeCoalescing:
+
+    @pytest.fixture
+    def bridge(self):
+        from src.audio.osc_bridge import OSCBridge
+        bridge = OSCBridge()
+        bridge.client = MagicMock()
+        bridge.connected = True
+        return bridge
+
+    def test_send_coalesced_flushes_one_bundle(self, bridge):
+        for i in range(20):
+            bridge.send_coalesced('/noise/gen/cutoff', [1, i / 20])
+        bridge.flush_coalesced()
+
+        assert bridge.client.send.call_count == 1
+        assert bridge.client.send_message.call_count == 0
+
+    def test_dropped_while_disconnected(self, bridge):
+        bridge.connected = False
+        bridge.send_coalesced('/noise/gen/cutoff', [1, 0.5])
+        assert bridge.coalescer.pending == 0
+
+    def test_shutdown_discards_pending(self, bridge):
+        bridge.send_coalesced('/noise/gen/cutoff', [1, 0.5])
+        bridge._shutdown = True
+        bridge.flush_coalesced()
+        assert bridge.client.send.call_count == 0
+        assert bridge.coalescer.pending == 0
+
+
+class TestOSCBridgeBundled:
+
+    @pytest.fixture
+    def bridge(self):
+        from src.audio.osc_bridge import OSCBridge
+        bridge = OSCBridge()
+        bridge.client = MagicMock()
+        bridge.connected = True
+        return bridge
+
+    def test_block_sends_bundles_in_order(self, bridge):
+        bridge.coalescer.max_bundle_messages = 4
+        real = bridge.client
+        with bridge.bundled() as batch:
+            for i in range(6):
+                bridge.client.send_message('/noise/gen/cutoff', [1, i])
+            bridge.send_bundle([('/noise/gen/start', [2, 'fm'])])
+            bridge.send_coalesced('/noise/gen/pan', [1, 0.5])
+            assert real.send.call_count == 0
+
+        assert bridge.client is real
+        assert real.send_message.call_count == 0
+        assert batch.sent == 8 and batch.bundles == 2
+        assert real.send.call_count == 2
+        assert batch.messages[6] == ('/noise/gen/start', [2, 'fm'])
+        assert batch.messages[7] == ('/noise/gen/pan', [1, 0.5])
+
+    def test_scalar_args_match_client(self, bridge):
+        with bridge.bundled() as batch:
+            bridge.client.send_message('/a', 0.5)
+            bridge.client.send_message('/b', 'name')
+            bridge.client.send_message('/c', None)
+        assert batch.messages == [('/a', [0.5]), ('/b', ['name']), ('/c', [])]
+
+    def test_pending_coalesced_sent_before_block(self, bridge):
+        bridge.send_coalesced('/noise/gen/cutoff', [1, 0.1])
+        with bridge.bundled() as batch:
+            bridge.client.send_message('/noise/gen/cutoff', [1, 0.9])
+        assert batch.messages == [('/noise/gen/cutoff', [1, 0.9])]
+        assert bridge.client.send.call_count == 2
+
+    def test_disconnected_block_is_passthrough(self, bridge):
+        bridge.connected = False
+        with bridge.bundled() as batch:
+            pass
+        assert batch.sent == 0 and batch.bundles == 0
+        assert bridge._capture is None
@@ -0,0 +1,169 @@
+"""
+Tests for the OSC float-array fast path (src/audio/osc_fast_path.py)
+Fast-path decoding must agree with python-osc's generic parser.
+"""
+
+import numpy as np
+import pytest
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from src.audio.osc_fast_path import FastPathDispatcher, decode_float_message
+from src.config import OSC_PATHS
+
+
+def _dgram(address, *args):
+    builder = OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+def _samples(n=1024, seed=0):
+    return np.random.default_rng(seed).uniform(-1, 1, n).astype(np.float32)
+
+
+class TestDecodeFloatMessage:
+    """decode_float_message vs OscMessage."""
+
+    def test_matches_generic_parser(self):
+        samples = _samples()
+        dgram = _dgram(OSC_PATHS['scope_data'], *samples.tolist())
+
+        address, head, decoded = decode_float_message(dgram)
+        generic = OscMessage(dgram)
+
+        assert address == generic.address
+        assert head == ()
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(decoded, np.asarray(generic.params, dtype=np.float32))
+
+    def test_head_scalars(self):
+        samples = _samples(64)
+        dgram = _dgram(OSC_PATHS['telem_wave'], 3, *samples.tolist())
+
+        address, head, decoded = decode_float_message(dgram, n_head=1)
+
+        assert address == OSC_PATHS['telem_wave']
+        assert head == (3,)
+        np.testing.assert_array_equal(decoded, samples)
+
+    def test_result_is_writable_copy(self):
+        dgram = _dgram('/noise/scope/data', 0.5, 0.25)
+        _, _, decoded = decode_float_message(dgram)
+        decoded[0] = 1.0  # must not raise (not a view of the bytes)
+        assert decoded.flags.owndata
+
+    @pytest.mark.parametrize("args,n_head", [
+        (('name', 0.5), 0),   # string arg
+        ((1, 0.5), 0),        # int where a float is expected
+        ((0.5,), 1),          # no floats after the head
+        (('x', 0.5), 1),      # unsupported head type
+    ])
+    def test_declines_other_shapes(self, args, n_head):
+        assert decode_float_message(_dgram('/noise/scope/data', *args), n_head) is None
+
+    def test_declines_bundle_and_truncated(self):
+        builder = OscBundleBuilder(IMMEDIATELY)
+        builder.add_content(OscMessageBuilder('/noise/scope/data').build())
+        assert decode_float_message(builder.build().dgram) is None
+
+        dgram = _dgram('/noise/scope/data', 0.5, 0.25)
+        assert decode_float_message(dgram[:-4]) is None
+        assert decode_float_message(b'') is None
+
+
+class TestFastPathDispatcher:
+    """Routing between fast path and generic Dispatcher."""
+
+    def test_fast_route_gets_array(self):
+        calls = []
+        d = FastPathDispatcher()
+        d.map_float_array('/noise/scope/data', lambda addr, s: calls.append(('fast', s)))
+        d.map('/noise/scope/data', lambda addr, *a: calls.append(('generic', a)))
+
+        d.call_handlers_for_packet(_dgram('/noise/scope/data', 0.5, -0.5), ('127.0.0.1', 0))
+
+        assert len(calls) == 1
+        kind, samples = calls[0]
+        assert kind == 'fast'
+        np.testing.assert_array_equal(samples, [0.5, -0.5])
+
+    def test_declined_payload_falls_back(self):
+        calls = []
+        d = FastPathDispatcher()
+        d.map_float_array('/noise/scope/data', lambda addr, s: calls.append('fast'))
+        d.map('/noise/scope/data', lambda addr, *a: calls.append(('generic', a)))
+
+        d.call_handlers_for_packet(_dgram('/noise/scope/data', 7, 0.5), ('127.0.0.1', 0))
+
+        assert calls == [('generic', (7, 0.5))]
+
+    def test_prefix_must_match_exactly(self):
+        calls = []
+        d = FastPathDispatcher()
+        d.map_float_array('/noise/telem/wave', lambda *a: calls.append('fast'))
+        d.map('/noise/telem/wave/enable', lambda addr, *a: calls.append('generic'))
+
+        d.call_handlers_for_packet(_dgram('/noise/telem/wave/enable', 0.5), ('127.0.0.1', 0))
+
+        assert calls == ['generic']
+
+
+class TestOSCBridgeArrays:
+    """OSCBridge delivers numpy arrays on both paths."""
+
+    @pytest.fixture
+    def bridge(self):
+        from src.audio.osc_bridge import OSCBridge
+        bridge = OSCBridge()
+        bridge.scope_data_received.emit.reset_mock()
+        bridge.telem_waveform_received.emit.reset_mock()
+        bridge.mod_bus_values_received.emit.reset_mock()
+        return bridge
+
+    def test_scope_paths_agree(self, bridge):
+        samples = _samples()
+        bridge._handle_scope_array(OSC_PATHS['scope_data'], samples)
+        bridge._handle_scope_data(OSC_PATHS['scope_data'], *samples.tolist())
+
+        (fast,), (generic,) = [c.args for c in bridge.scope_data_received.emit.call_args_list]
+        assert isinstance(generic, np.ndarray)
+        np.testing.assert_array_equal(fast, generic)
+
+    def test_telem_wave_paths_agree(self, bridge):
+        samples = _samples(256)
+        bridge._handle_telem_wave_array(OSC_PATHS['telem_wave'], 2, samples)
+        bridge._handle_telem_wave(OSC_PATHS['telem_wave'], 2, *samples.tolist())
+
+        (slot_a, fast), (slot_b, generic) = [
+            c.args for c in bridge.telem_waveform_received.emit.call_args_list
+        ]
+        assert slot_a == slot_b == 2
+        assert isinstance(generic, np.ndarray)
+        np.testing.assert_array_equal(fast, generic)
+
+    def test_mod_bus_values_paths_agree(self, bridge):
+        values = _samples(32)
+        dgram = _dgram(OSC_PATHS['mod_bus_values'], 5, *values.tolist())
+        _, (mask,), decoded = decode_float_message(dgram, n_head=1)
+        bridge._handle_mod_bus_values_array(OSC_PATHS['mod_bus_values'], mask, decoded)
+        bridge._handle_mod_bus_values(OSC_PATHS['mod_bus_values'], 5, *values.tolist())
+        bridge._handle_mod_bus_values(OSC_PATHS['mod_bus_values'], 5, *values[:15].tolist())
+
+        (mask_a, fast), (mask_b, generic) = [
+            c.args for c in bridge.mod_bus_values_received.emit.call_args_list
+        ]
+        assert mask_a == mask_b == 5
+        assert fast.shape == (2, 16)
+        np.testing.assert_array_equal(fast, generic)
+
+    def test_scope_payload_decodes_array(self):
+        from unittest.mock import MagicMock
+        from src.audio.scope_controller import ScopeController
+        ctrl = ScopeController(MagicMock())
+        samples = _samples()
+        phase, buf = ctrl.decode_scope_payload(samples)
+        assert phase is None
+        assert buf is samples
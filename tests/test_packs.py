@@ -522,3 +522,104 @@ class TestCorePacks:
         assert "rlyeh" in packs
         assert packs["rlyeh"]["enabled"] is True
         assert len(packs["rlyeh"]["generators"]) == 8
+
+
+class TestConfigCache:
+    """Test the startup cache of pack and generator configs."""
+
+    @pytest.fixture
+    def temp_packs_dir(self, tmp_path, monkeypatch):
+        """Temporary packs/ with one core generator and one pack generator."""
+        packs_dir = tmp_path / "packs"
+        core_dir = packs_dir / "core" / "generators"
+        core_dir.mkdir(parents=True)
+        (core_dir / "core_gen.json").write_text(json.dumps({
+            "name": "Core Gen",
+            "synthdef": "core_synthdef",
+            "custom_params": [{"key": "a", "label": "A", "default": 0.5}],
+        }))
+
+        gen_dir = packs_dir / "cached_pack" / "generators"
+        gen_dir.mkdir(parents=True)
+        (gen_dir.parent / "manifest.json").write_text(json.dumps({
+            "pack_format": 1,
+            "name": "Cached Pack",
+            "enabled": True,
+            "generators": ["pack_gen"],
+        }))
+        (gen_dir / "pack_gen.json").write_text(json.dumps({
+            "name": "Pack Gen",
+            "synthdef": "pack_synthdef",
+            "custom_params": [{"key": "b", "label": "B", "default": 0.1}],
+        }))
+
+        import src.config
+        original_file = src.config.__file__
+
+        fake_config = tmp_path / "src" / "config"
+        fake_config.mkdir(parents=True)
+        monkeypatch.setattr(src.config, '__file__', str(fake_config / "__init__.py"))
+
+        yield packs_dir
+
+        # Put the real packs back for later tests
+        monkeypatch.setattr(src.config, '__file__', original_file)
+        src.config._load_config()
+
+    def test_second_load_is_served_from_cache(self, temp_packs_dir):
+        """An unchanged packs/ is restored from the cache with the same state."""
+        from src.config import (
+            _load_config, _GENERATOR_CONFIGS, _GENERATOR_SOURCES, get_enabled_packs,
+            CONFIG_CACHE_FILENAME,
+        )
+
+        assert _load_config() is False
+        assert (temp_packs_dir.parent / CONFIG_CACHE_FILENAME).exists()
+        scanned = (list(_GENERATOR_CONFIGS), dict(_GENERATOR_SOURCES))
+
+        assert _load_config() is True
+        assert (list(_GENERATOR_CONFIGS), dict(_GENERATOR_SOURCES)) == scanned
+        assert _GENERATOR_SOURCES["Pack Gen"] == "cached_pack"
+        assert get_enabled_packs()[0]["loaded_generators"] == ["Pack Gen"]
+
+    def test_custom_params_load_on_first_use(self, temp_packs_dir):
+        """Cached configs read custom_params from the generator JSON when asked."""
+        from src.config import (
+            _load_config, _GENERATOR_CONFIGS, get_generator_custom_params,
+            get_generator_synthdef,
+        )
+
+        _load_config()
+        assert _load_config() is True
+        assert "custom_params" not in _GENERATOR_CONFIGS["Pack Gen"]
+        assert get_generator_synthdef("Pack Gen") == "pack_synthdef"
+
+        assert get_generator_custom_params("Pack Gen")[0]["key"] == "b"
+        assert get_generator_custom_params("Core Gen")[0]["key"] == "a"
+        assert get_generator_custom_params("Empty") == []
+
+    def test_edited_generator_invalidates_cache(self, temp_packs_dir):
+        """A generator JSON changed in place forces a rescan."""
+        from src.config import _load_config, get_generator_synthdef
+
+        _load_config()
+        gen_json = temp_packs_dir / "cached_pack" / "generators" / "pack_gen.json"
+        data = json.loads(gen_json.read_text())
+        data["synthdef"] = "pack_synthdef_v2"
+        gen_json.write_text(json.dumps(data))
+        stat = gen_json.stat()
+        os.utime(gen_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert _load_config() is False
+        assert get_generator_synthdef("Pack Gen") == "pack_synthdef_v2"
+
+    def test_corrupt_cache_falls_back_to_scan(self, temp_packs_dir):
+        """An unreadable cache file is ignored and rewritten."""
+        from src.config import _load_config, CONFIG_CACHE_FILENAME
+
+        _load_config()
+        cache = temp_packs_dir.parent / CONFIG_CACHE_FILENAME
+        cache.write_text("{not json")
+
+        assert _load_config() is False
+        assert _load_config() is True
@@ -0,0 +1,115 @@
+"""
+Tests for diff-based preset application (src/presets/preset_diff.py)
+Only slots, channels and sections that differ from the live state are
+applied, and the OSC they trigger goes out as bundles.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.presets.preset_diff import (
+    SECTION_BPM, SECTION_MASTER_VOLUME, SECTION_MOD_ROUTING, SECTIONS, diff_presets,
+)
+from src.presets.preset_schema import PresetState
+
+
+def _incoming(live: PresetState) -> PresetState:
+    """An independent copy of live (as if loaded from disk)."""
+    return PresetState.from_dict(live.to_dict())
+
+
+class TestDiffPresets:
+
+    def test_identical_state_is_empty(self):
+        live = PresetState()
+        diff = diff_presets(live, _incoming(live))
+        assert diff.empty
+        assert not any(diff.changed(s) for s in SECTIONS)
+
+    def test_reports_changed_slots_channels_and_sections(self):
+        live = PresetState()
+        incoming = _incoming(live)
+        incoming.slots[2].generator = "FM"
+        incoming.mixer.channels[7].pan = 0.1
+        incoming.mixer.master_volume = 0.3
+        incoming.bpm = 140
+        incoming.mod_routing = {"connections": [{"source_bus": 0}]}
+
+        diff = diff_presets(live, incoming)
+
+        assert diff.slots == {3}
+        assert diff.channels == {8}
+        assert diff.sections == {SECTION_MASTER_VOLUME, SECTION_BPM, SECTION_MOD_ROUTING}
+        assert diff.slot_changed(3) and not diff.slot_changed(1)
+
+    def test_no_live_state_applies_everything(self):
+        diff = diff_presets(None, PresetState())
+        assert diff.full and not diff.empty
+        assert diff.slot_changed(5) and diff.channel_changed(1)
+        assert all(diff.changed(s) for s in SECTIONS)
+
+
+@pytest.fixture
+def controller():
+    from src.audio.osc_bridge import OSCBridge
+    from src.gui.controllers.preset_controller import PresetController
+
+    main = MagicMock()
+    main.osc = OSCBridge()
+    main.osc.client = MagicMock()
+    main.osc.connected = True
+    main.osc_connected = True
+    main.generator_grid.slots = {i: MagicMock() for i in range(1, 9)}
+    main.mixer_panel.channels = {i: MagicMock() for i in range(1, 9)}
+    main.midi_selector.get_current_device.return_value = None
+
+    # Every slot apply fires a handful of OSC messages, as the widgets do
+    def apply_state(slot_state, slot_id):
+        for param in ("generator", "cutoff", "resonance"):
+            main.osc.client.send_message(f"/noise/gen/{param}", [slot_id, 0.5])
+    for slot_id, slot in main.generator_grid.slots.items():
+        slot.apply_state.side_effect = lambda s, slot_id=slot_id: apply_state(s, slot_id)
+
+    ctrl = PresetController.__new__(PresetController)
+    ctrl.main = main
+    ctrl.last_apply_stats = None
+    ctrl._morph = None
+    return ctrl
+
+
+class TestApplyPreset:
+
+    def test_applies_only_changes_as_bundle(self, controller):
+        live = PresetState()
+        controller._collect_state = lambda name: live
+        incoming = _incoming(live)
+        incoming.slots[1].cutoff = 0.2
+
+        controller._apply_preset(incoming)
+
+        slots = controller.main.generator_grid.slots
+        assert slots[2].apply_state.call_count == 1
+        assert all(slots[i].apply_state.call_count == 0 for i in slots if i != 2)
+        assert all(ch.set_state.call_count == 0
+                   for ch in controller.main.mixer_panel.channels.values())
+        controller.main.master_section.set_volume.assert_not_called()
+
+        stats = controller.last_apply_stats
+        assert not stats['full']
+        assert (stats['slots'], stats['channels'], stats['sections']) == (1, 0, [])
+        assert (stats['messages'], stats['bundles']) == (3, 1)
+        assert controller.main.osc.client.send.call_count == 1
+        assert controller.main.osc.client.send_message.call_count == 0
+
+    def test_unavailable_live_state_applies_in_full(self, controller):
+        def fail(name):
+            raise RuntimeError("Save-path missing SlotState fields")
+        controller._collect_state = fail
+
+        controller._apply_preset(PresetState())
+
+        assert all(s.apply_state.call_count == 1
+                   for s in controller.main.generator_grid.slots.values())
+        assert controller.last_apply_stats['full']
+        assert controller.last_apply_stats['messages'] == 24
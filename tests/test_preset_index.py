@@ -0,0 +1,107 @@
+"""
+Tests for the preset metadata index (src/presets/preset_index.py)
+Only new or changed files are loaded; writes and deletes keep it current.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.presets.preset_index import INDEX_FILENAME, PresetIndex
+from src.presets.preset_manager import PresetManager, PresetError
+from src.presets.preset_schema import PresetState
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PresetManager(presets_dir=tmp_path)
+
+
+def _names(refresh):
+    return sorted(e.name for e in refresh.entries)
+
+
+def _fresh_index(manager, calls):
+    """A new session's index (reads the persisted file) with a counting loader."""
+    def load(path):
+        calls.append(path.name)
+        return manager.load(path)
+    return PresetIndex(manager.presets_dir, load, (PresetError, OSError))
+
+
+class TestPresetIndex:
+
+    def test_save_and_delete_keep_index_current(self, manager):
+        a = manager.save(PresetState(rating=3), name="Alpha")
+        manager.save(PresetState(), name="Beta")
+
+        refresh = manager.index.refresh()
+        assert _names(refresh) == ["Alpha", "Beta"]
+        assert refresh.reloaded == 0  # both recorded on write
+        assert {e.rating for e in refresh.entries} == {0, 3}
+
+        manager.delete(a)
+        assert _names(manager.index.refresh()) == ["Beta"]
+
+    def test_new_session_reuses_persisted_entries(self, manager):
+        for i in range(5):
+            manager.save(PresetState(), name=f"P{i}")
+        assert (manager.presets_dir / INDEX_FILENAME).exists()
+
+        calls = []
+        refresh = _fresh_index(manager, calls).refresh()
+
+        assert calls == []
+        assert len(refresh.entries) == 5
+
+    def test_external_changes_reload_only_changed_files(self, manager):
+        for i in range(3):
+            manager.save(PresetState(), name=f"P{i}")
+        path = manager.presets_dir / "P1.json"
+        data = json.loads(path.read_text())
+        data["name"] = "Edited elsewhere"
+        path.write_text(json.dumps(data, indent=4))
+        (manager.presets_dir / "P2.json").unlink()
+        (manager.presets_dir / "dropped_in.json").write_text(
+            json.dumps(PresetState(name="Dropped").to_dict()))
+
+        calls = []
+        refresh = _fresh_index(manager, calls).refresh()
+
+        assert sorted(calls) == ["P1.json", "dropped_in.json"]
+        assert _names(refresh) == ["Dropped", "Edited elsewhere", "P0"]
+
+    def test_invalid_presets_skipped_until_changed(self, manager):
+        bad = manager.presets_dir / "bad.json"
+        bad.write_text("{not json")
+        calls = []
+        index = _fresh_index(manager, calls)
+
+        assert index.refresh().entries == []
+        assert index.refresh().entries == []
+        assert calls == ["bad.json"]
+
+        bad.write_text(json.dumps(PresetState(name="Fixed").to_dict()))
+        os.utime(bad, ns=(1, 1))  # force a different mtime
+        assert _names(index.refresh()) == ["Fixed"]
+
+    def test_placeholders_reported_not_indexed(self, manager):
+        (manager.presets_dir / "reserved.json").write_bytes(b"")
+        refresh = manager.index.refresh()
+        assert [p.name for p in refresh.placeholders] == ["reserved.json"]
+        assert refresh.entries == []
+
+    def test_corrupt_index_rebuilds(self, manager):
+        manager.save(PresetState(), name="Keep")
+        (manager.presets_dir / INDEX_FILENAME).write_text("garbage")
+
+        calls = []
+        assert _names(_fresh_index(manager, calls).refresh()) == ["Keep"]
+        assert calls == ["Keep.json"]
+
+    def test_search_key_normalized(self, manager):
+        manager.save(PresetState(name="Ｃafé BASS"), name="cafe")
+        (entry,) = manager.index.refresh().entries
+        assert "café bass" in entry.search_key or "café" not in entry.search_key
+        assert entry.search_key == entry.search_key.casefold()
@@ -0,0 +1,135 @@
+"""
+Tests for preset morphing (src/presets/preset_morph.py)
+Continuous params glide along flat start/end vectors; discrete fields
+switch once; the streamer sends only values that changed.
+"""
+
+import pytest
+
+from src.config import OSC_PATHS
+from src.presets import preset_morph
+from src.presets.preset_morph import (
+    MORPH_RESOLUTION, PresetMorph, build_morph_plan,
+)
+from src.presets.preset_schema import PresetState
+
+
+def _pair():
+    a = PresetState()
+    b = PresetState.from_dict(a.to_dict())
+    b.slots[0].cutoff = 0.2
+    b.slots[0].filter_type = 2
+    b.mixer.channels[1].pan = 1.0
+    b.mixer.channels[1].fx1_send = 200
+    b.mixer.master_volume = 0.4
+    return a, b
+
+
+def _by_field(plan):
+    return {(p.section, p.index, p.field): i for i, p in enumerate(plan.params)}
+
+
+class TestMorphPlan:
+
+    def test_only_differing_continuous_params(self):
+        a, b = _pair()
+        plan = build_morph_plan(a, b)
+        assert set(_by_field(plan)) == {
+            ('slot', 0, 'cutoff'), ('channel', 1, 'pan'),
+            ('channel', 1, 'fx1_send'), ('master', 0, 'master_volume'),
+        }
+
+    def test_osc_values_use_control_encoding(self):
+        a, b = _pair()
+        plan = build_morph_plan(a, b)
+        idx = _by_field(plan)
+        end = plan.osc_values_at(1.0)
+
+        cutoff = plan.params[idx[('slot', 0, 'cutoff')]]
+        assert (cutoff.path, cutoff.head) == ('/noise/bus/base', ('gen_1_cutoff',))
+        assert end[idx[('slot', 0, 'cutoff')]] == pytest.approx(0.2)
+        assert end[idx[('channel', 1, 'pan')]] == pytest.approx(1.0)          # 0..1 -> -1..1
+        assert end[idx[('channel', 1, 'fx1_send')]] == pytest.approx(1.0)     # 0-200 -> 0-1
+        assert plan.osc_values_at(0.5)[idx[('channel', 1, 'pan')]] == pytest.approx(0.5)
+        assert plan.params[idx[('master', 0, 'master_volume')]].path == OSC_PATHS['master_volume']
+
+    def test_custom_params_glide_only_within_same_generator(self, monkeypatch):
+        monkeypatch.setattr(preset_morph, 'get_generator_custom_params',
+                            lambda name: [{'key': 'p'}, {'key': 'mode', 'steps': 3}])
+        a = PresetState()
+        b = PresetState.from_dict(a.to_dict())
+        for state in (a, b):
+            state.slots[0].generator = "Modal"
+        a.slots[1].generator = "Modal"
+        for slot in (0, 1):
+            b.slots[slot].custom_0 = 0.9
+            b.slots[slot].custom_1 = 1.0
+
+        fields = set(_by_field(build_morph_plan(a, b)))
+
+        assert ('slot', 0, 'custom_0') in fields
+        assert ('slot', 0, 'custom_1') not in fields   # stepped
+        assert not any(f[1] == 1 for f in fields)     # generator changed
+
+    def test_state_at_has_target_discrete_and_interpolated_continuous(self):
+        a, b = _pair()
+        mid = build_morph_plan(a, b).state_at(0.5)
+
+        assert mid.slots[0].filter_type == 2
+        assert mid.slots[0].cutoff == pytest.approx(0.6)
+        assert mid.mixer.channels[1].fx1_send == 100
+        assert isinstance(mid.mixer.channels[1].fx1_send, int)
+        assert b.slots[0].cutoff == pytest.approx(0.2)  # target untouched
+
+
+class TestPresetMorph:
+
+    def _morph(self, sent, events, switch_at=0.5):
+        a, b = _pair()
+        return PresetMorph(
+            build_morph_plan(a, b), lambda path, args: sent.append((path, args)),
+            seconds=1.0, switch_at=switch_at,
+            on_switch=lambda t: events.append(('switch', t)),
+            on_finished=lambda: events.append(('finished',)),
+        )
+
+    def test_steps_send_changes_and_fire_callbacks_once(self):
+        sent, events = [], []
+        morph = self._morph(sent, events)
+
+        morph.step(0.0)
+        assert len(sent) == 4 and events == []
+        morph.step(0.0)
+        morph.step(0.0001)            # below one progress step
+        assert len(sent) == 4
+
+        morph.step(0.6)
+        morph.step(0.7)
+        assert events == [('switch', 0.6)]
+
+        morph.step(1.5)
+        assert events[-1] == ('finished',)
+        assert ('/noise/bus/base', ['gen_1_cutoff', pytest.approx(0.2)]) in sent[-4:]
+        assert morph.sent == len(sent) == 16
+
+    def test_thread_runs_to_completion(self):
+        sent, events = [], []
+        morph = self._morph(sent, events)
+        morph.seconds = 0.05
+        morph.start()
+        morph._thread.join(2)
+
+        assert not morph.running
+        assert [e[0] for e in events] == ['switch', 'finished']
+        assert morph.progress == 1.0
+        assert len(sent) <= 4 * (MORPH_RESOLUTION + 1)
+
+    def test_cancel_stops_before_callbacks(self):
+        sent, events = [], []
+        morph = self._morph(sent, events, switch_at=1.0)
+        morph.seconds = 60.0
+        morph.start()
+        morph.cancel()
+
+        assert not morph.running
+        assert events == []
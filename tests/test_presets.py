@@ -155,6 +155,25 @@ class TestValidation:
         assert not is_valid
         assert any("filter_type" in e for e in errors)
 
+    def test_messages_in_field_order_with_coercion_warnings(self):
+        """Errors come in field order, then coercion warnings."""
+        data = PresetState().to_dict()
+        slot = data["slots"][0]
+        slot["clock_rate"] = 99
+        slot["filter_type"] = 1.0
+        slot["arp_enabled"] = 1
+        slot["rst_rate"] = 2
+        data["mixer"]["channels"][0]["pan"] = float("nan")
+        is_valid, messages = validate_preset(data)
+        assert not is_valid
+        assert messages == [
+            "slots[0].clock_rate must be 0-12, got 99",
+            "slots[0].arp_enabled must be bool, got int",
+            "slots[0].rst_rate must be 0 or 4-9, got 2",
+            "slots[0].filter_type: coerced float 1.0 to int",
+            "mixer.channels[0].pan: NaN rejected",
+        ]
+
 
 class TestPresetManager:
     """Tests for PresetManager save/load operations."""
@@ -495,6 +495,79 @@ class TestThreadSafety:
         assert result.clear_history is True
 
 
+# =============================================================================
+# BATCH MODE
+# =============================================================================
+
+def _mixed_session(n=200, seed=3):
+    """Recorded-session stand-in: drifting sines with every poison kind mixed in."""
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 2 * np.pi, 1024)
+    frames = np.array([np.sin(t + 0.02 * i) * (0.5 + 0.1 * np.sin(i))
+                       + rng.normal(0, 0.002, 1024) for i in range(n)])
+    frames[::17, 400] = np.nan
+    frames[5::23, 100:120] = 0.0                 # zero_speckle (shadows run)
+    frames[9::31, 200] = 3.0                     # discontinuity
+    frames[11::29, ::40] = 0.0                   # scattered zeros
+    frames[40:46] = np.sin(t * 3)                # shape change
+    return frames, 1000.0 + np.arange(n) * 0.1
+
+
+def _reference_zero_run(frame):
+    """Per-sample loop the vectorized zero-run detector replaced."""
+    max_run = current = 0
+    for sample in frame:
+        current = current + 1 if sample == 0.0 else 0
+        max_run = max(max_run, current)
+    return max_run
+
+
+class TestBatchMode:
+
+    @pytest.mark.parametrize("scrub", [False, True])
+    def test_matches_sequential_observe(self, scrub):
+        frames, stamps = _mixed_session()
+        single, batch = WaveformStabilizer(), WaveformStabilizer()
+        if scrub:
+            for stab in (single, batch):
+                stab.trigger_scrub()
+                stab._reacquire_entered_at = stamps[0]
+
+        expected = [single.observe(f, ts) for f, ts in zip(frames, stamps)]
+        got = batch.observe_many(frames[:70], stamps[:70]) + batch.observe_many(
+            frames[70:], stamps[70:])
+
+        for e, g in zip(expected, got):
+            assert g.similarity == pytest.approx(e.similarity, abs=1e-12)
+            assert (g.poisoned, g.poison_reason, g.stability_state, g.clear_history,
+                    g.stable_count, g.render_mode) == (
+                e.poisoned, e.poison_reason, e.stability_state, e.clear_history,
+                e.stable_count, e.render_mode)
+        assert {r.poison_reason for r in got} >= {
+            None, "nan_inf", "zero_speckle", "discontinuity"}
+        assert got[0].clear_history is scrub
+
+    def test_zero_run_matches_loop(self, stabilizer):
+        rng = np.random.default_rng(0)
+        frames = np.where(rng.random((50, 256)) < 0.7, 0.0, 1.0)
+        frames[0] = 0.0
+        frames[1] = 1.0
+        runs = stabilizer._max_zero_runs(frames == 0.0)
+        assert list(runs) == [_reference_zero_run(f) for f in frames]
+
+    def test_continues_from_observe_reference(self, stabilizer, clean_sine):
+        stabilizer.observe(clean_sine, time.time())
+        results = stabilizer.observe_many(np.array([clean_sine] * 3), [time.time()] * 3)
+        assert all(r.similarity > 0.99 for r in results)
+        assert results[-1].stable_count == 3
+
+    def test_rejects_mismatched_timestamps(self, stabilizer, clean_sine):
+        with pytest.raises(ValueError):
+            stabilizer.observe_many(np.array([clean_sine] * 2), [0.0])
+        with pytest.raises(ValueError):
+            stabilizer.observe_many(clean_sine, [0.0])
+
+
 # =============================================================================
 # EDGE CASES
 # =============================================================================
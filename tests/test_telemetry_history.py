@@ -0,0 +1,154 @@
+"""
+Tests for TelemetryHistory (src/telemetry/telemetry_history.py)
+Frames must read back as the dicts that went in; exports must round-trip.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.audio.telemetry_controller import TelemetryController
+from src.telemetry.telemetry_history import TelemetryHistory, load_history
+
+
+def _frame(i, **overrides):
+    frame = {
+        'timestamp': 1000.0 + i, 'slot': 0, 'freq': 440.0, 'phase': 0.25,
+        'p0': 0.1, 'p1': 0.2, 'p2': 0.5, 'p3': i / 100, 'p4': 0.3,
+        'rms_stage1': 0.5, 'rms_stage2': 0.4, 'rms_stage3': 0.3,
+        'peak': 0.7, 'bad_value': 0, 'peak3': None, 'source_id': None,
+    }
+    frame.update(overrides)
+    return frame
+
+
+@pytest.fixture
+def history():
+    return TelemetryHistory(capacity=8, waveform_capacity=3)
+
+
+class TestFrames:
+
+    def test_round_trip_keeps_keys_and_none(self, history):
+        history.append(_frame(0))
+        history.append({'p2': 0.9, 'peak': None})
+
+        assert history[0] == _frame(0)
+        assert history[-1] == {'p2': 0.9, 'peak': None}
+        assert isinstance(history[0]['slot'], int)
+
+    def test_wraparound_drops_oldest(self, history):
+        for i in range(20):
+            history.append(_frame(i))
+
+        assert len(history) == 8
+        assert history.total == 20
+        assert [f['p3'] for f in history] == [i / 100 for i in range(12, 20)]
+        assert history[-1]['timestamp'] == 1019.0
+
+    def test_index_out_of_range(self, history):
+        history.append(_frame(0))
+        with pytest.raises(IndexError):
+            history[1]
+        with pytest.raises(IndexError):
+            history[-2]
+
+    def test_clear(self, history):
+        for i in range(3):
+            history.append(_frame(i))
+            history.append_waveform(np.ones(16), 0.0)
+        history.clear()
+
+        assert len(history) == 0
+        assert list(history) == []
+        assert history.waveform_count == 0
+        assert len(history.columns()['frame_seq']) == 0
+
+
+class TestWaveforms:
+
+    def test_waveforms_tagged_with_frame_seq(self, history):
+        for i in range(10):
+            history.append(_frame(i))
+            if i % 2:
+                history.append_waveform(np.full(16, i, dtype=np.float64), 2000.0 + i)
+
+        cols = history.columns()
+        assert cols['waveforms'].dtype == np.float32
+        assert cols['waveforms'].shape == (3, 16)
+        assert list(cols['waveform_frame_seq']) == [5, 7, 9]
+        assert list(cols['waveforms'][:, 0]) == [5.0, 7.0, 9.0]
+        assert list(cols['frame_seq']) == list(range(2, 10))
+
+    def test_width_fixed_by_first_waveform(self, history):
+        history.append(_frame(0))
+        history.append_waveform(np.ones(8), 0.0)
+        history.append_waveform(np.ones(12), 0.0)
+        history.append_waveform(np.ones(4), 0.0)
+
+        cols = history.columns()
+        assert cols['waveforms'].shape == (3, 8)
+        assert list(cols['waveform_lengths']) == [8, 8, 4]
+        assert list(cols['waveforms'][2]) == [1.0] * 4 + [0.0] * 4
+
+
+class TestExport:
+
+    def test_npz_round_trip(self, history, tmp_path):
+        for i in range(12):
+            history.append(_frame(i))
+            history.append_waveform(np.sin(np.arange(32) + i), 3000.0 + i)
+        path = tmp_path / 'h.npz'
+        history.save_npz(path, {'synthdef': 'forge_core_b258_osc'})
+
+        loaded = load_history(path)
+
+        cols = history.columns()
+        np.testing.assert_array_equal(loaded['frames']['p3'], cols['p3'])
+        assert np.isnan(loaded['frames']['peak3']).all()
+        np.testing.assert_array_equal(loaded['waveforms'], cols['waveforms'])
+        np.testing.assert_array_equal(loaded['waveform_frame_seq'], [9, 10, 11])
+        assert loaded['provenance'] == {'synthdef': 'forge_core_b258_osc'}
+
+    def test_legacy_json(self, tmp_path):
+        path = tmp_path / 'h.json'
+        path.write_text(json.dumps({'history': [_frame(0), _frame(1, freq=None)]}))
+
+        loaded = load_history(path)
+
+        assert list(loaded['frames']['p3']) == [0.0, 0.01]
+        assert np.isnan(loaded['frames']['freq'][1])
+        assert list(loaded['frames']['source_id']) == [-1, -1]
+        assert loaded['waveforms'].shape == (0, 0)
+
+
+class TestControllerExport:
+
+    @pytest.fixture
+    def ctrl(self):
+        ctrl = TelemetryController(MagicMock())
+        ctrl._get_git_hash = lambda: 'abc123'
+        for i in range(5):
+            ctrl.on_data(0, _frame(i))
+        ctrl.history.append_waveform(np.zeros(64), 0.0)
+        return ctrl
+
+    def test_export_npz(self, ctrl, tmp_path):
+        path = tmp_path / 'session.npz'
+        ctrl.export_history(str(path))
+
+        loaded = load_history(path)
+        assert len(loaded['frame_seq']) == 5
+        assert loaded['waveforms'].shape == (1, 64)
+        assert loaded['provenance']['git_hash'] == 'abc123'
+
+    def test_export_json_unchanged(self, ctrl, tmp_path):
+        path = tmp_path / 'session.json'
+        ctrl.export_history(str(path))
+
+        doc = json.loads(path.read_text())
+        assert len(doc['history']) == 5
+        assert doc['history'][-1]['p3'] == 0.04
+        assert doc['history'][-1]['peak3'] is None
@@ -0,0 +1,127 @@
+"""
+Tests for telemetry stage timing (src/telemetry/telemetry_profiler.py)
+Disabled spans must record nothing; percentiles must land within one bin.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from src.audio.osc_fast_path import FastPathDispatcher
+from src.audio.telemetry_controller import TelemetryController
+from src.telemetry import telemetry_profiler
+from src.telemetry.telemetry_profiler import (
+    NUM_BINS, STAGE_OSC_DECODE, STAGE_ON_WAVEFORM, STAGE_PROCESS, STAGE_STABILIZER,
+    StageHistogram, TelemetryProfiler, _bin_index, _bin_upper_ns,
+)
+
+
+@pytest.fixture
+def shared_profiler():
+    """The module-level profiler, enabled and emptied for one test."""
+    prof = telemetry_profiler.profiler
+    prof.reset()
+    prof.enabled = True
+    yield prof
+    prof.enabled = False
+    prof.reset()
+
+
+class TestBins:
+
+    @pytest.mark.parametrize("ns", [0, 1, 1023, 1024, 1279, 1280, 2047, 5000, 10**6, 10**9])
+    def test_value_inside_its_bin(self, ns):
+        index = _bin_index(ns)
+        lower = _bin_upper_ns(index - 1) if index else 0
+        assert lower <= ns < _bin_upper_ns(index)
+
+    def test_huge_values_clamp_to_last_bin(self):
+        assert _bin_index(10**15) == NUM_BINS - 1
+
+
+class TestStageHistogram:
+
+    def test_percentiles_within_bin_resolution(self):
+        rng = np.random.default_rng(0)
+        samples = rng.lognormal(np.log(50_000), 0.8, 5000).astype(np.int64)
+        hist = StageHistogram()
+        for ns in samples:
+            hist.record(int(ns))
+
+        for q in (50, 99):
+            exact = np.percentile(samples, q)
+            assert exact <= hist.percentile_ns(q) <= exact * 1.3
+        assert hist.percentile_ns(100) == hist.max_ns == samples.max()
+        assert hist.count == 5000
+
+    def test_empty(self):
+        assert StageHistogram().percentile_ns(50) == 0
+
+    def test_concurrent_records(self):
+        hist = StageHistogram()
+
+        def work():
+            for _ in range(2000):
+                hist.record(3000)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert hist.count == 8000
+
+
+class TestProfiler:
+
+    def test_disabled_records_nothing(self):
+        prof = TelemetryProfiler()
+        t0 = prof.start()
+        prof.stop(STAGE_PROCESS, t0)
+        assert t0 == 0
+        assert prof.summary()[STAGE_PROCESS]['count'] == 0
+        assert prof.format_lines() == []
+
+    def test_enabled_span(self):
+        prof = TelemetryProfiler()
+        prof.enabled = True
+        prof.stop(STAGE_PROCESS, prof.start())
+        prof.record(STAGE_STABILIZER, 2_500_000)
+
+        summary = prof.summary()
+        assert summary[STAGE_PROCESS]['count'] == 1
+        assert summary[STAGE_STABILIZER]['p99_us'] == pytest.approx(2500.0)
+        lines = prof.format_lines()
+        assert len(lines) == 2 and '2.5ms' in lines[1]
+
+        prof.reset()
+        assert prof.summary()[STAGE_PROCESS]['count'] == 0
+
+
+class TestInstrumentation:
+
+    def test_fast_path_decode_stage(self, shared_profiler):
+        builder = OscMessageBuilder(address='/noise/telem/wave')
+        builder.add_arg(0)
+        for v in (0.1, 0.2, 0.3):
+            builder.add_arg(v)
+        d = FastPathDispatcher()
+        d.map_float_array('/noise/telem/wave', lambda *a: None, n_head=1, stage=STAGE_OSC_DECODE)
+
+        d.call_handlers_for_packet(builder.build().dgram, ('127.0.0.1', 0))
+
+        assert shared_profiler.summary()[STAGE_OSC_DECODE]['count'] == 1
+
+    def test_controller_stages(self, shared_profiler):
+        ctrl = TelemetryController(MagicMock())
+        ctrl.enabled = True
+        ctrl.target_slot = 0
+
+        ctrl.on_waveform(0, tuple(np.sin(np.linspace(0, 2 * np.pi, 1024))))
+
+        summary = shared_profiler.summary()
+        for stage in (STAGE_ON_WAVEFORM, STAGE_PROCESS, STAGE_STABILIZER):
+            assert summary[stage]['count'] == 1
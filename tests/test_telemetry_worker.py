@@ -0,0 +1,169 @@
+"""
+Tests for the telemetry processing worker (src/telemetry/telemetry_worker.py)
+and TelemetryController's threaded waveform path.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.audio.telemetry_controller import TelemetryController
+from src.telemetry.telemetry_worker import LatestWinsWorker, TelemetryResult
+
+
+class TestLatestWinsWorker:
+
+    def test_busy_worker_keeps_only_newest(self):
+        release = threading.Event()
+        seen = []
+
+        def process(item):
+            if item == 0:
+                release.wait(2)
+            seen.append(item)
+
+        worker = LatestWinsWorker(process)
+        worker.start()
+        try:
+            worker.submit(0)
+            while worker._has_pending:  # wait until 0 is being processed
+                pass
+            for i in range(1, 6):
+                worker.submit(i)
+            release.set()
+            assert worker.wait_idle(2)
+        finally:
+            worker.stop()
+
+        assert seen == [0, 5]
+        assert worker.dropped == 4
+        assert worker.processed == 2
+
+    def test_survives_process_error(self):
+        seen = []
+
+        def process(item):
+            if item == 'bad':
+                raise ValueError(item)
+            seen.append(item)
+
+        worker = LatestWinsWorker(process)
+        worker.start()
+        try:
+            worker.submit('bad')
+            assert worker.wait_idle(2)
+            worker.submit('good')
+            assert worker.wait_idle(2)
+        finally:
+            worker.stop()
+
+        assert seen == ['good']
+        assert not worker.running
+
+    def test_stop_timeout_keeps_busy_thread(self):
+        release = threading.Event()
+        worker = LatestWinsWorker(lambda item: release.wait(2))
+        worker.start()
+        worker.submit(0)
+        while worker._has_pending:
+            pass
+
+        worker.stop(timeout=0.05)
+        busy = worker._thread
+        assert busy is not None and busy.is_alive()
+
+        worker.start()                      # reuses the busy thread
+        assert worker._thread is busy
+        release.set()
+        worker.stop()
+        assert not worker.running
+
+
+def _sine(n=1024, amp=0.5):
+    return tuple(np.sin(np.linspace(0, 2 * np.pi, n, endpoint=False)) * amp)
+
+
+@pytest.fixture
+def controller():
+    ctrl = TelemetryController(MagicMock())
+    ctrl.enable(0)
+    yield ctrl
+    ctrl.disable()
+
+
+class TestControllerWorker:
+
+    def test_enable_starts_and_disable_stops_worker(self, controller):
+        assert controller._worker.running
+        controller.disable()
+        assert not controller._worker.running
+        assert controller.current_waveform is None
+
+    def test_waveform_processed_off_thread(self, controller):
+        main = threading.get_ident()
+        threads = []
+        process = controller._process_waveform
+        controller._worker._process = lambda item: (threads.append(threading.get_ident()),
+                                                    process(item))
+        controller.on_data(0, {'p2': 0.5, 'p3': 0.5, 'freq': 440.0})
+
+        controller.on_waveform(0, _sine())
+        assert controller._worker.wait_idle(2)
+
+        result = controller.latest_result
+        assert isinstance(result, TelemetryResult)
+        assert threads and threads[0] != main
+        assert result.crest_factor == pytest.approx(np.sqrt(2), rel=1e-3)
+        assert result.persistence_frames[-1] is result.waveform
+        assert controller.current_waveform is result.waveform
+        assert not result.waveform.flags.writeable
+        assert controller.history.waveform_count == 1
+        np.testing.assert_allclose(result.delta, np.abs(result.waveform - result.ideal), atol=1e-6)
+        assert not result.ideal.flags.writeable
+
+    def test_bad_frame_keeps_metrics(self, controller):
+        controller.on_waveform(0, _sine())
+        assert controller._worker.wait_idle(2)
+        before = controller.latest_result
+
+        controller.on_waveform(0, _sine(amp=500.0))
+        assert controller._worker.wait_idle(2)
+
+        after = controller.latest_result
+        assert after.waveform is None and controller.current_waveform is None
+        assert after.delta is None and after.ideal is before.ideal
+        assert after.crest_factor == before.crest_factor
+        assert after.stabilizer is before.stabilizer
+
+    def test_stabilize_clears_published_persistence(self, controller):
+        for _ in range(3):
+            controller.on_waveform(0, _sine())
+            assert controller._worker.wait_idle(2)
+        assert len(controller.latest_result.persistence_frames) == 3
+
+        controller.stabilize()
+
+        assert controller.latest_result.persistence_frames == ()
+        assert controller.latest_result.stabilizer is None
+
+    def test_result_from_before_a_clear_is_dropped(self, controller):
+        release = threading.Event()
+        process = controller._process_waveform
+
+        def blocked(item):
+            release.wait(2)
+            process(item)
+        controller._worker._process = blocked
+
+        controller.on_waveform(0, _sine())
+        while controller._worker._has_pending:
+            pass
+        controller.stabilize()
+        release.set()
+        assert controller._worker.wait_idle(2)
+
+        assert controller.latest_result is None
+        assert controller.current_waveform is None
+        assert controller.history.waveform_count == 0
@@ -0,0 +1,85 @@
+"""
+Tests for trace point mapping (src/gui/trace_render.py)
+Undecimated points must match the per-sample paint loops; decimation must
+keep every pixel column's extremes in sample order.
+"""
+
+import numpy as np
+import pytest
+
+from src.gui import trace_render
+from src.gui.trace_render import TraceCache, trace_points
+
+
+def _loop_points(data, w, mid_y, scale, y_min, y_max, endpoint):
+    """Per-sample mapping from the original paint loops."""
+    n = len(data)
+    out = []
+    for i in range(n):
+        x = w * i / (n - 1) if endpoint else i * w / n
+        val = float(data[i])
+        if not np.isfinite(val):
+            val = 0.0
+        out.append((x, max(y_min, min(y_max, mid_y - val * scale))))
+    return np.array(out)
+
+
+def _signal(n=1024):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return (np.sin(t) * 0.8 + 0.3 * np.sin(t * 37)).astype(np.float32)
+
+
+class TestTracePoints:
+
+    @pytest.mark.parametrize("endpoint", [True, False])
+    def test_matches_loop_without_decimation(self, endpoint):
+        data = _signal()
+        data[10] = np.nan
+        data[20] = np.inf
+        data[30] = 4.0
+
+        points = trace_points(data, 600, 100.0, 90.0, 0.0, 199.0, endpoint=endpoint)
+
+        np.testing.assert_allclose(
+            points, _loop_points(data, 600, 100.0, 90.0, 0.0, 199.0, endpoint), atol=1e-9)
+
+    def test_decimation_keeps_column_extremes(self):
+        data = _signal(4096)
+        w = 300
+
+        points = trace_points(data, w, 50.0, 50.0, -1e9, 1e9)
+        full = _loop_points(data, w, 50.0, 50.0, -1e9, 1e9, True)
+
+        assert len(points) <= 2 * (w + 1) + 2
+        assert np.all(np.diff(points[:, 0]) > 0)  # still in sample order
+        np.testing.assert_array_equal(points[[0, -1]], full[[0, -1]])
+        columns = full[:, 0].astype(int)
+        for col in (0, 17, 150, w - 1):
+            ys = full[columns == col, 1]
+            kept = points[points[:, 0].astype(int) == col, 1]
+            assert kept.min() == ys.min() and kept.max() == ys.max()
+
+    def test_no_decimation_at_two_samples_per_pixel(self):
+        assert len(trace_points(_signal(), 512, 0.0, 1.0, -2.0, 2.0)) == 1024
+
+
+class TestTraceCache:
+
+    def test_rebuilds_on_new_array_or_size(self, monkeypatch):
+        monkeypatch.setattr(trace_render, 'to_polygon', lambda points: object())  # Qt is mocked
+        cache = TraceCache()
+        calls = []
+
+        def build(d):
+            calls.append(d)
+            return np.zeros((2, 2))
+
+        a, b = _signal(), _signal()
+        cache.polygon('t', a, (10, 10), build)
+        cache.polygon('t', a, (10, 10), build)
+        cache.polygon('t', b, (10, 10), build)
+        cache.polygon('t', b, (20, 10), build)
+        cache.invalidate()
+        cache.polygon('t', b, (20, 10), build)
+
+        assert len(calls) == 4
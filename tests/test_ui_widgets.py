@@ -349,8 +349,8 @@ class TestChannelStripOSC:
         block = m.group(1)
         assert "OSC_PATHS['gen_pan']" in block, \
             "Pan handler must use OSC_PATHS['gen_pan']"
-        assert "send_message" in block, \
-            "Pan handler must call send_message"
+        assert "send_message" in block or "send_coalesced" in block, \
+            "Pan handler must send OSC (send_message or send_coalesced)"
     
     def test_eq_sends_osc_on_change(self, project_root):
         """EQ change handler must send OSC messages via SSOT path."""
@@ -366,8 +366,8 @@ class TestChannelStripOSC:
         # Must use OSC_PATHS, not hardcoded path
         assert "OSC_PATHS['gen_strip_eq_base']" in block, \
             "EQ handler must use OSC_PATHS['gen_strip_eq_base']"
-        assert "send_message" in block, \
-            "EQ handler must call send_message"
+        assert "send_message" in block or "send_coalesced" in block, \
+            "EQ handler must send OSC (send_message or send_coalesced)"
     
     def test_mixer_signals_connected(self, project_root):
         """MixerPanel pan/EQ signals must be connected in main_frame."""
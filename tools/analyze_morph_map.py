@@ -28,6 +28,13 @@ Usage:
     # Patch missing spectral fields back into morph map JSON
     python tools/analyze_morph_map.py maps/sweep.json --patch-json
 
+    # Telemetry Monitor history export (.npz, or legacy .json): one point
+    # per captured waveform, x-axis from a frame field (default: time)
+    python tools/analyze_morph_map.py telem_history.npz --x-field p3
+
+    # ...skipping waveforms the stabilizer flags as poisoned
+    python tools/analyze_morph_map.py telem_history.npz --drop-poisoned
+
 Depends on: numpy, src.telemetry.fft_features (SSOT), matplotlib (--plot only)
 """
 
@@ -47,6 +54,8 @@ from src.telemetry.fft_features import (
     normalize_harmonics,
     MAX_HARMONICS,
 )
+from src.telemetry.stabilizer import WaveformStabilizer
+from src.telemetry.telemetry_history import load_history
 
 # Numerical safety constant
 EPS = 1e-12
@@ -75,10 +84,97 @@ ANALYSIS_VERSION = "fft_features.v1"
 # JSON Loading with Fallbacks
 # =============================================================================
 
-def load_morph_map(filepath: str) -> dict:
-    """Load morph map from JSON file."""
+def load_morph_map(filepath: str, x_field: str = 'timestamp',
+                   drop_poisoned: bool = False) -> dict:
+    """Load morph map from JSON file (or a telemetry history export)."""
+    if filepath.endswith('.npz'):
+        return load_telemetry_history(filepath, x_field, drop_poisoned)
     with open(filepath, 'r') as f:
-        return json.load(f)
+        morph_map = json.load(f)
+    if 'history' in morph_map and 'snapshots' not in morph_map:
+        return load_telemetry_history(filepath, x_field, drop_poisoned)
+    return morph_map
+
+
+def poisoned_waveforms(waveforms: np.ndarray, lengths: np.ndarray,
+                       timestamps: np.ndarray) -> np.ndarray:
+    """
+    Replay stored waveforms through the stabilizer; True where poisoned.
+
+    Full-width rows go through observe_many() in one block. Rows shorter
+    than the storage width (zero padded) are checked one by one on their
+    own samples; poison detection is per frame, so order doesn't matter.
+    """
+    poisoned = np.zeros(len(waveforms), dtype=bool)
+    if not len(waveforms):
+        return poisoned
+    full = lengths == waveforms.shape[1]
+    stabilizer = WaveformStabilizer()
+    results = stabilizer.observe_many(waveforms[full], timestamps[full])
+    poisoned[full] = [r.poisoned for r in results]
+    for i in np.flatnonzero(~full):
+        poisoned[i] = stabilizer.observe(waveforms[i, :lengths[i]], timestamps[i]).poisoned
+    return poisoned
+
+
+def load_telemetry_history(filepath: str, x_field: str = 'timestamp',
+                           drop_poisoned: bool = False) -> dict:
+    """
+    Adapt a Telemetry Monitor history export to the morph map layout.
+
+    One snapshot per captured waveform (paired with the scalar frame that
+    was current when it arrived), or per frame when the export has no
+    waveforms. cv_voltage carries x_field ('timestamp' is made relative
+    to the first frame); midi_cc_value is the point index. drop_poisoned
+    skips waveforms the stabilizer flags (NaN, zero runs, discontinuities).
+    """
+    history = load_history(filepath)
+    frames = history['frames']
+    frame_seq = history['frame_seq']
+    n_frames = len(frame_seq)
+
+    def frame_at(i):
+        return {k: (None if isinstance(v[i], float) and math.isnan(v[i]) else v[i].item())
+                for k, v in frames.items()}
+
+    x_values = frames[x_field].astype(np.float64)
+    if x_field == 'timestamp' and n_frames:
+        x_values = x_values - x_values[0]
+
+    snapshots = []
+    if len(history['waveforms']):
+        # waveform_frame_seq -> row in the frame columns
+        rows = np.searchsorted(frame_seq, history['waveform_frame_seq'])
+        if drop_poisoned:
+            poisoned = poisoned_waveforms(history['waveforms'], history['waveform_lengths'],
+                                          history['waveform_timestamps'])
+        for i, (wave, n, row) in enumerate(zip(history['waveforms'],
+                                               history['waveform_lengths'], rows)):
+            if row >= n_frames or frame_seq[row] != history['waveform_frame_seq'][i]:
+                continue  # frame already rotated out of the ring
+            if drop_poisoned and poisoned[i]:
+                continue
+            snapshots.append({
+                'cv_voltage': float(x_values[row]),
+                'midi_cc_value': len(snapshots),
+                'snapshot': {'frame': frame_at(row), 'waveform': wave[:n].tolist()},
+            })
+    else:
+        for row in range(n_frames):
+            snapshots.append({
+                'cv_voltage': float(x_values[row]),
+                'midi_cc_value': row,
+                'snapshot': {'frame': frame_at(row)},
+            })
+
+    provenance = history['provenance']
+    return {
+        'device_name': provenance.get('synthdef') or provenance.get('generator_id') or 'Unknown',
+        'device_type': 'oscillator',
+        'format_version': 'telem_history',
+        'cv_range': [float(x_values.min()), float(x_values.max())] if n_frames else [0.0, 0.0],
+        'snapshots': snapshots,
+    }
 
 
 def get_field(data: dict, path: str, default: Any = None) -> Any:
@@ -665,7 +761,7 @@ def print_header(filepath: str, metadata: dict, points: List[dict]):
     print(f"Points: {metadata['captured_points']} captured, {metadata['points']} requested")
     print(f"Waveforms: {waveform_count}/{len(points)} present ({missing_count} missing)")
     fv = metadata['format_version']
-    print(f"Format: {fv}" if fv == 'unknown' else f"Format: v{fv}")
+    print(f"Format: v{fv}" if str(fv)[:1].isdigit() else f"Format: {fv}")
     print()
 
 
@@ -1357,6 +1453,10 @@ Examples:
                        help='Suppress theoretical crest guides on plot')
     parser.add_argument('--patch-json', action='store_true',
                        help='Write computed spectral fields back into morph map JSON (P0.5)')
+    parser.add_argument('--x-field', default='timestamp',
+                       help='Telemetry history only: frame field used as the sweep axis')
+    parser.add_argument('--drop-poisoned', action='store_true',
+                       help='Telemetry history only: skip waveforms the stabilizer flags')
 
     args = parser.parse_args()
 
@@ -1379,7 +1479,7 @@ Examples:
     all_metadata = []
 
     for fp in filepaths:
-        morph_map = load_morph_map(str(fp))
+        morph_map = load_morph_map(str(fp), args.x_field, args.drop_poisoned)
         metadata = extract_metadata(morph_map)
 
         # Device-aware harmonic count (P0.7)
@@ -1417,6 +1517,9 @@ Examples:
     if args.patch_json:
         defaults = DEVICE_DEFAULTS.get(device_type, DEVICE_DEFAULTS['oscillator'])
         for i, fp in enumerate(filepaths):
+            if all_morph_maps[i].get('format_version') == 'telem_history':
+                print(f"Skipping --patch-json for telemetry history: {fp}")
+                continue
             patch_morph_map(fp, all_morph_maps[i], all_points[i],
                           defaults['num_harmonics'])
 
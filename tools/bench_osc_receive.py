@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+OSC Receive Benchmark
+Messages/sec for the high-rate SC -> Python addresses, generic python-osc
+Dispatcher vs the float-array fast path (src/audio/osc_fast_path.py).
+
+Measures decode + handler dispatch only (no socket, no Qt), with handlers
+that produce what the UI consumes: a float32 numpy array.
+
+Usage:
+    python3 tools/bench_osc_receive.py
+    python3 tools/bench_osc_receive.py --seconds 2 --samples 1024
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from pythonosc.dispatcher import Dispatcher
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.audio.osc_fast_path import FastPathDispatcher
+
+CLIENT = ('127.0.0.1', 57120)
+
+
+def build(address, args):
+    builder = OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+def rate(dispatcher, dgram, seconds):
+    """Messages/sec for call_handlers_for_packet on one datagram."""
+    n = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        for _ in range(50):
+            dispatcher.call_handlers_for_packet(dgram, CLIENT)
+        n += 50
+    return n / seconds
+
+
+def generic_dispatcher(address, n_head):
+    d = Dispatcher()
+    d.map(address, lambda addr, *args: np.asarray(args[n_head:], dtype=np.float32))
+    return d
+
+
+def fast_dispatcher(address, n_head):
+    d = FastPathDispatcher()
+    d.map_float_array(address, lambda addr, *args: args[-1], n_head=n_head)
+    return d
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--seconds', type=float, default=1.0, help='time per measurement')
+    parser.add_argument('--samples', type=int, default=1024, help='floats per message')
+    args = parser.parse_args()
+
+    samples = np.random.default_rng(0).uniform(-1, 1, args.samples).astype(np.float32).tolist()
+    cases = [
+        ('/noise/scope/data', 0, samples),
+        ('/noise/telem/wave', 1, [0] + samples),
+    ]
+
+    print(f"{'address':<22} {'generic msg/s':>14} {'fast msg/s':>12} {'speedup':>8}")
+    for address, n_head, payload in cases:
+        dgram = build(address, payload)
+        before = rate(generic_dispatcher(address, n_head), dgram, args.seconds)
+        after = rate(fast_dispatcher(address, n_head), dgram, args.seconds)
+        print(f"{address:<22} {before:>14,.0f} {after:>12,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Preset Validation Benchmark
+validate_preset() and full PresetManager.load() time per preset, over every
+preset document in the repo (pack presets) plus any directories given.
+
+Also times a fully populated PresetState (every optional field present),
+which is what presets saved by the current app look like.
+
+Usage:
+    python3 tools/bench_preset_validate.py
+    python3 tools/bench_preset_validate.py ~/noise-engine/presets --seconds 2
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.presets.preset_manager import PresetManager
+from src.presets.preset_schema import PresetState, validate_preset
+
+REPO = Path(__file__).parent.parent
+
+
+def find_presets(dirs):
+    """(path, dict) for every *.json that looks like a preset (slots + mixer)."""
+    found = []
+    for d in dirs:
+        for path in sorted(Path(d).rglob('*.json')):
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict) and 'slots' in data and 'mixer' in data:
+                found.append((path, data))
+    return found
+
+
+def per_call_us(fn, items, seconds):
+    """Mean microseconds per fn(item), cycling through items."""
+    n = 0
+    start = time.perf_counter()
+    end = start + seconds
+    while time.perf_counter() < end:
+        for item in items:
+            fn(item)
+        n += len(items)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('dirs', nargs='*', help='extra preset directories')
+    parser.add_argument('--seconds', type=float, default=1.0, help='time per measurement')
+    args = parser.parse_args()
+
+    presets = find_presets([REPO / 'packs', *args.dirs])
+    if not presets:
+        print("No presets found")
+        return
+    docs = [data for _, data in presets]
+    manager = PresetManager(presets_dir=REPO)
+    full = PresetState().to_dict()
+
+    invalid = [path for path, data in presets if not validate_preset(data)[0]]
+    print(f"{len(presets)} presets, {len(invalid)} invalid")
+    for path in invalid:
+        print(f"  invalid: {path.relative_to(REPO) if REPO in path.parents else path}")
+
+    print(f"{'case':<28} {'us/preset':>10} {'presets/s':>12}")
+    for label, fn, items in [
+        ('validate_preset (repo)', validate_preset, docs),
+        ('validate_preset (full)', validate_preset, [full]),
+        ('PresetManager.load (repo)', manager.load, [path for path, _ in presets]),
+    ]:
+        us = per_call_us(fn, items, args.seconds)
+        print(f"{label:<28} {us:>10.1f} {1e6 / us:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
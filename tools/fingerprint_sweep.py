@@ -18,6 +18,8 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -44,36 +46,33 @@ def extract_from_morph_map(map_path: str, output_dir: str = "fingerprints"):
 
     extractor.start_session()
 
-    # Extract fingerprints from snapshots
-    fingerprints = []
+    # Extract fingerprints from snapshots (one batched pass)
     snapshots = morph_map.get("snapshots", [])
+    captured = []
 
     for i, snap in enumerate(snapshots):
         if snap.get("snapshot") and snap["snapshot"].get("waveform"):
-            import numpy as np
-            waveform = np.array(snap["snapshot"]["waveform"])
-            cv_volts = snap.get("cv_voltage", 0.0)
-            freq_hz = snap["snapshot"]["frame"].get("freq", None)
-
-            fp = extractor.extract(
-                waveform=waveform,
-                cv_volts=cv_volts,
-                cv_chan="morph",
-                freq_hz=freq_hz,
-                notes=[f"from_{Path(map_path).stem}"]
-            )
-            fingerprints.append(fp)
-            print(f"  [{i + 1}/{len(snapshots)}] CV={cv_volts:.3f}V → {fp['id']}")
+            captured.append(snap)
         else:
             print(f"  [{i + 1}/{len(snapshots)}] SKIPPED (no waveform)")
 
-    if fingerprints:
+    if captured:
+        batch = extractor.extract_batch(
+            waveforms=[np.array(snap["snapshot"]["waveform"]) for snap in captured],
+            cv_volts=[snap.get("cv_voltage", 0.0) for snap in captured],
+            cv_chan="morph",
+            freq_hz=[snap["snapshot"]["frame"].get("freq", None) for snap in captured],
+            notes=[f"from_{Path(map_path).stem}"]
+        )
+        for i, fp_id in enumerate(batch.ids):
+            print(f"  [{i + 1}/{len(batch)}] CV={batch.cv_volts[i]:.3f}V → {fp_id}")
+
         device_key = device_name.lower().replace(" ", "_")
-        sweep_name = store.save_sweep(fingerprints, device_key)
+        sweep_name = store.save_sweep(batch, device_key)
         print(f"\n{'=' * 60}")
         print(f"EXTRACTION COMPLETE")
         print(f"{'=' * 60}")
-        print(f"Fingerprints extracted: {len(fingerprints)}")
+        print(f"Fingerprints extracted: {len(batch)}")
         print(f"Sweep ID: {sweep_name}")
         print(f"Device key: {device_key}")
         print(f"\nFiles created in: {output_dir}/devices/{device_key}/")